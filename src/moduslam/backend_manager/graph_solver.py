@@ -1,12 +1,24 @@
+import heapq
 import logging
 
 import gtsam
 
+from moduslam.frontend_manager.main_graph.edges.noise_models import isotropic_n_dim
 from moduslam.frontend_manager.main_graph.graph import Graph
+from moduslam.frontend_manager.main_graph.vertices.base import OptimizableVertex
+from moduslam.frontend_manager.main_graph.vertices.custom import (
+    ImuBias,
+    LinearVelocity,
+    NavState,
+    Point3D,
+    Pose,
+)
 from moduslam.logger.logging_config import backend_manager
 
 logger = logging.getLogger(backend_manager)
 
+fixing_variance: float = 1e-12  # variance of the priors fixing the vertices outside the window.
+
 
 class GraphSolver:
     """Factor graph solver."""
@@ -33,3 +45,116 @@ class GraphSolver:
         error = optimizer.error()
         logger.debug(f"optimization error: {error}")
         return result, error
+
+    def solve_local(self, graph: Graph, num_clusters: int) -> tuple[gtsam.Values, float]:
+        """Solves the sub-graph with the edges of the latest vertex clusters.
+
+        The vertices of the sub-graph outside the latest clusters are fixed with tight
+        priors at their current estimates, so the cost does not depend on the size of
+        the graph.
+
+        Args:
+            graph: contains factor graph to be solved.
+
+            num_clusters: number of the latest clusters to optimize.
+
+        Returns:
+            calculated GTSAM values of the vertices in the latest clusters and the error
+            of the sub-graph (without the fixing priors).
+        """
+        window = get_window_vertices(graph, num_clusters)
+        sub_graph, fixed = create_sub_graph(graph, window)
+
+        values = gtsam.Values()
+        for vertex in (*window, *fixed):
+            values.insert(vertex.backend_index, vertex.backend_instance)
+
+        constrained = gtsam.NonlinearFactorGraph(sub_graph)
+        for vertex in fixed:
+            constrained.add(create_fixing_prior(vertex))
+
+        optimizer = gtsam.LevenbergMarquardtOptimizer(constrained, values, self._params)
+        optimizer.optimizeSafely()
+        result = optimizer.values()
+        error = sub_graph.error(result)
+
+        for vertex in fixed:
+            result.erase(vertex.backend_index)
+
+        logger.debug(f"local optimization error: {error}")
+        return result, error
+
+
+def get_window_vertices(graph: Graph, num_clusters: int) -> list[OptimizableVertex]:
+    """Gets optimizable vertices of the latest clusters.
+
+    Args:
+        graph: a graph.
+
+        num_clusters: number of the latest clusters.
+
+    Returns:
+        optimizable vertices.
+    """
+    clusters = graph.vertex_storage.clusters
+    latest = heapq.nlargest(num_clusters, clusters, key=lambda c: c.time_range.start)
+
+    return [v for c in latest for v in c.vertices if isinstance(v, OptimizableVertex)]
+
+
+def create_sub_graph(
+    graph: Graph, window: list[OptimizableVertex]
+) -> tuple[gtsam.NonlinearFactorGraph, list[OptimizableVertex]]:
+    """Creates the factor graph with the edges of the window vertices.
+
+    Args:
+        graph: a graph.
+
+        window: vertices to optimize.
+
+    Returns:
+        factor graph and the vertices of its edges outside the window.
+    """
+    window_set = set(window)
+    fixed: dict[OptimizableVertex, None] = {}
+    edges = {edge: None for v in window for edge in graph.get_connected_edges(v)}
+    sub_graph = gtsam.NonlinearFactorGraph()
+
+    for edge in sorted(edges, key=lambda e: e.index):  # type: ignore
+        sub_graph.add(edge.factor)
+
+        for vertex in edge.vertices:
+            if isinstance(vertex, OptimizableVertex) and vertex not in window_set:
+                fixed[vertex] = None
+
+    return sub_graph, list(fixed)
+
+
+def create_fixing_prior(vertex: OptimizableVertex) -> gtsam.NonlinearFactor:
+    """Creates a tight prior at the current estimate of the vertex.
+
+    Args:
+        vertex: an optimizable vertex.
+
+    Returns:
+        GTSAM prior factor.
+
+    Raises:
+        TypeError: if the vertex type is not supported.
+    """
+    key, instance = vertex.backend_index, vertex.backend_instance
+
+    match vertex:
+        case Pose():
+            return gtsam.PriorFactorPose3(key, instance, isotropic_n_dim(6, fixing_variance))
+        case NavState():
+            return gtsam.PriorFactorNavState(key, instance, isotropic_n_dim(9, fixing_variance))
+        case ImuBias():
+            noise = isotropic_n_dim(6, fixing_variance)
+            return gtsam.PriorFactorConstantBias(key, instance, noise)
+        case LinearVelocity():
+            return gtsam.PriorFactorVector(key, instance, isotropic_n_dim(3, fixing_variance))
+        case Point3D():
+            return gtsam.PriorFactorPoint3(key, instance, isotropic_n_dim(3, fixing_variance))
+
+    raise TypeError(f"Unsupported vertex type: {type(vertex)}")
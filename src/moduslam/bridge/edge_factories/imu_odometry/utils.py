@@ -1,5 +1,5 @@
 import logging
-from typing import Sequence, TypeVar
+from typing import TypeVar
 
 import gtsam
 import numpy as np
@@ -16,7 +16,11 @@ from moduslam.frontend_manager.main_graph.vertices.custom import (
     Pose,
 )
 from moduslam.logger.logging_config import frontend_manager
-from moduslam.measurement_storage.measurements.imu import ContinuousImu, ProcessedImu
+from moduslam.measurement_storage.measurements.imu import (
+    ContinuousImu,
+    ImuBlock,
+    ProcessedImu,
+)
 
 V = TypeVar("V", bound=Vertex)
 
@@ -42,36 +46,23 @@ def create_edge(
     return edge
 
 
-def compute_covariance(
-    measurements: Sequence[ProcessedImu],
-) -> tuple[Matrix3x3, Matrix3x3]:
+def compute_covariance(block: ImuBlock) -> tuple[Matrix3x3, Matrix3x3]:
     """Computes the covariance of the accelerometer and gyroscope measurements [x,y,z].
     If only one measurement is available, the default covariance is used.
 
     Args:
-        measurements: IMU measurements.
+        block: IMU measurements.
 
     Returns:
         accelerometer and gyroscope noise covariance matrices.
-
-    Raises:
-        ValueError: if the measurements sequence is empty.
     """
-    if len(measurements) == 0:
-        msg = "Empty measurements sequence."
-        logger.critical(msg)
-        raise ValueError(msg)
-
-    elif len(measurements) == 1:
-        acc_cov = np.array(measurements[0].acceleration_covariance)
-        gyro_cov = np.array(measurements[0].angular_velocity_covariance)
+    if len(block) == 1:
+        acc_cov = np.array(block.covariance.acceleration)
+        gyro_cov = np.array(block.covariance.angular_velocity)
 
     else:
-        accelerations = np.array([m.linear_acceleration for m in measurements])
-        angular_velocities = np.array([m.angular_velocity for m in measurements])
-
-        acc_cov = np.cov(accelerations, rowvar=False)
-        gyro_cov = np.cov(angular_velocities, rowvar=False)
+        acc_cov = np.cov(block.accelerations, rowvar=False)
+        gyro_cov = np.cov(block.angular_velocities, rowvar=False)
 
     return acc_cov, gyro_cov
 
@@ -138,7 +129,7 @@ def set_parameters(
 
 def integrate_measurements(
     pim: gtsam.PreintegratedCombinedMeasurements | gtsam.PreintegratedImuMeasurements,
-    measurements: Sequence[ProcessedImu],
+    block: ImuBlock,
     timestamp: int,
     time_scale: float,
 ) -> None:
@@ -147,38 +138,24 @@ def integrate_measurements(
     Args:
         pim: gtsam pre-integrated measurement.
 
-        measurements: IMU measurements sorted by timestamp.
+        block: IMU measurements sorted by timestamp.
 
         timestamp: integration time limit.
 
         time_scale: timescale factor.
 
     Raises:
-        ValueError: if the measurements sequence is empty.
+        ValueError: if a time difference between measurements is zero.
     """
-    num_elements = len(measurements)
-
-    if num_elements == 0:
-        msg = "No measurements to integrate."
-        logger.critical(msg)
-        raise ValueError(msg)
-
-    for i, measurement in enumerate(measurements):
-
-        if i == num_elements - 1:
-            dt = timestamp - measurement.timestamp
-
-        else:
-            dt = measurements[i + 1].timestamp - measurements[i].timestamp
+    dts = np.diff(block.timestamps, append=timestamp)
 
-        acc = np.array(measurement.linear_acceleration)
-        omega = np.array(measurement.angular_velocity)
-        dt_secs = dt * time_scale
+    if np.any(dts == 0):
+        raise ValueError("Zero time difference between measurements.")
 
-        if dt == 0:
-            raise ValueError("Zero time difference between measurements.")
+    dts_secs = dts * time_scale
 
-        pim.integrateMeasurement(acc, omega, dt_secs)
+    for acc, omega, dt in zip(block.accelerations, block.angular_velocities, dts_secs.tolist()):
+        pim.integrateMeasurement(acc, omega, dt)
 
 
 def get_combined_integrated_measurement(
@@ -204,12 +181,12 @@ def get_combined_integrated_measurement(
     Returns:
         pre-integrated combined IMU measurement (gtsam.PreintegratedCombinedMeasurements).
     """
-    first_m = measurement.items[0]
-    tf = np.array(first_m.tf_base_sensor)
-    accel_sample_covariance, ang_vel_sample_covariance = compute_covariance(measurement.items)
-    integration_noise_covariance = np.array(first_m.integration_noise_covariance)
-    accel_bias_covariance = np.array(first_m.accelerometer_bias_covariance)
-    gyro_bias_covariance = np.array(first_m.gyroscope_bias_covariance)
+    block = measurement.block
+    tf = np.array(block.tf_base_sensor)
+    accel_sample_covariance, ang_vel_sample_covariance = compute_covariance(block)
+    integration_noise_covariance = np.array(block.covariance.integration_noise)
+    accel_bias_covariance = np.array(block.covariance.accelerometer_bias)
+    gyro_bias_covariance = np.array(block.covariance.gyroscope_bias)
 
     set_combined_parameters(
         integration_params,
@@ -221,7 +198,7 @@ def get_combined_integrated_measurement(
         gyro_bias_covariance,
     )
     pim = PreintegratedCombinedMeasurements(integration_params, bias.backend_instance)
-    integrate_measurements(pim, measurement.items, timestamp, time_scale)
+    integrate_measurements(pim, block, timestamp, time_scale)
 
     return pim
 
@@ -249,10 +226,10 @@ def get_integrated_measurement(
     Returns:
         pre-integrated IMU measurement (gtsam.PreintegratedImuMeasurements).
     """
-    first_m = measurement.items[0]
-    accel_sample_covariance, ang_vel_sample_covariance = compute_covariance(measurement.items)
-    tf = np.array(first_m.tf_base_sensor)
-    integration_noise_covariance = np.array(first_m.integration_noise_covariance)
+    block = measurement.block
+    accel_sample_covariance, ang_vel_sample_covariance = compute_covariance(block)
+    tf = np.array(block.tf_base_sensor)
+    integration_noise_covariance = np.array(block.covariance.integration_noise)
 
     set_parameters(
         integration_params,
@@ -262,5 +239,5 @@ def get_integrated_measurement(
         integration_noise_covariance,
     )
     pim = PreintegratedImuMeasurements(integration_params, bias.backend_instance)
-    integrate_measurements(pim, measurement.items, timestamp, time_scale)
+    integrate_measurements(pim, block, timestamp, time_scale)
     return pim
@@ -18,12 +18,22 @@ logger = logging.getLogger(frontend_manager)
 
 
 class Factory:
-    """Creates suboptimal graph candidate."""
+    """Creates suboptimal graph candidate.
 
-    def __init__(self):
+    In the local mode, candidates are evaluated by solving the sub-graph of their
+    latest clusters only, and the graph of the best candidate is solved globally.
+    """
+
+    def __init__(self, num_local_clusters: int | None = None):
+        """
+        Args:
+            num_local_clusters: number of the latest clusters to solve for every
+                candidate; None to solve the whole graph.
+        """
         self._metrics_factory = MetricsFactory()
         self._metrics_storage = MetricsStorage()
         self._solver = GraphSolver()
+        self._num_local_clusters = num_local_clusters
 
     def create_candidate(
         self, graph: Graph, data: dict[type[Measurement], OrderedSet[Measurement]]
@@ -44,7 +54,12 @@ class Factory:
 
         shift = self._metrics_storage.get_timeshift_table()[best_candidate]
         mom = self._metrics_storage.get_mom_table()[best_candidate]
-        error = self._metrics_storage.get_error_table()[best_candidate]
+
+        if self._num_local_clusters is None:
+            error = self._metrics_storage.get_error_table()[best_candidate]
+        else:
+            values, error = self._solver.solve(best_candidate.graph)
+            best_candidate.graph.update_vertices(values)
         num_unused = best_candidate.num_unused_measurements
 
         secs_shift = nanosec2sec(shift)
@@ -111,7 +126,12 @@ class Factory:
 
         candidate = item.candidate
         graph = item.candidate.graph
-        values, error = self._solver.solve(graph)
+
+        if self._num_local_clusters is None:
+            values, error = self._solver.solve(graph)
+        else:
+            values, error = self._solver.solve_local(graph, self._num_local_clusters)
+
         graph.update_vertices(values)
 
         connectivity = self._metrics_factory.compute_connectivity(candidate)
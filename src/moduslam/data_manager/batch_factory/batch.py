@@ -1,5 +1,5 @@
 import logging
-from collections import deque
+from collections.abc import Sequence
 
 from moduslam.data_manager.batch_factory.data_objects import Element
 from moduslam.logger.logging_config import data_manager
@@ -13,9 +13,10 @@ class DataBatch:
 
     def __init__(self):
         self._deque_set = DequeSet[Element]()
+        self._size_bytes = 0
 
     @property
-    def data(self) -> deque[Element]:
+    def data(self) -> Sequence[Element]:
         """Elements in the data batch."""
         return self._deque_set.items
 
@@ -36,11 +37,11 @@ class DataBatch:
 
     @property
     def size_bytes(self) -> int:
-        """The size of the batch in bytes.
+        """Approximate size of the batch in bytes.
 
-        Not implemented.
+        Takes O(1) operations: the total is updated on every add/remove.
         """
-        raise NotImplementedError
+        return self._size_bytes
 
     @property
     def is_sorted(self) -> bool:
@@ -67,15 +68,23 @@ class DataBatch:
         Args:
             new_element: element to be added.
         """
+        if new_element in self._deque_set:
+            return
+
         self._deque_set.append(new_element)
+        self._size_bytes += new_element.size_bytes
 
     def remove_first(self) -> None:
         """Deletes the first(left) element of the batch."""
+        element = self._deque_set[0]
         self._deque_set.remove_first()
+        self._size_bytes -= element.size_bytes
 
     def remove_last(self) -> None:
         """Deletes the last(right) element of the batch."""
+        element = self._deque_set[-1]
         self._deque_set.remove_last()
+        self._size_bytes -= element.size_bytes
 
     def sort(self, reverse: bool = False) -> None:
         """Sorts the data batch by timestamps.
@@ -88,3 +97,4 @@ class DataBatch:
     def clear(self) -> None:
         """Deletes all elements of the batch."""
         self._deque_set.clear()
+        self._size_bytes = 0
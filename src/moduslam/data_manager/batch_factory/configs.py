@@ -20,6 +20,23 @@ class DataRegimeConfig:
     stop: str = field(kw_only=True, default=MISSING)
 
 
+@dataclass
+class ImageDecodingConfig:
+    """Decoding of the image files."""
+
+    num_workers: int = field(
+        default=2, metadata={"help": "Number of decoding threads (0: decode in the reader thread)."}
+    )
+    prefetch: int = field(
+        default=4, metadata={"help": "Number of upcoming images to decode in advance."}
+    )
+    cache_size: int = field(default=16, metadata={"help": "Maximum number of decoded images."})
+    max_size: int = field(
+        default=0, metadata={"help": "Maximum side of the decoded image [px] (0: full size)."}
+    )
+    grayscale: bool = field(default=False, metadata={"help": "Convert images to grayscale."})
+
+
 @dataclass
 class DatasetConfig:
     """Base dataset configuration."""
@@ -39,3 +56,12 @@ class BatchFactoryConfig:
     batch_memory_percent: float = field(
         default=90.0, metadata={"help": "RAM-memory percent used for the data batch."}
     )
+    batch_size_bytes: int | None = field(
+        default=None, metadata={"help": "Maximum size of the data batch in bytes."}
+    )
+    memory_sampling_interval: int = field(
+        default=1000, metadata={"help": "Number of elements between RAM-memory samples."}
+    )
+    memory_sampling_period: float = field(
+        default=100.0, metadata={"help": "Time between RAM-memory samples [ms]."}
+    )
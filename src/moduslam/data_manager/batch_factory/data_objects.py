@@ -1,23 +1,135 @@
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cached_property
+from threading import Lock
 from typing import Any
 
+import numpy as np
+from PIL import ImageMode
+from PIL.Image import Image
+
 from moduslam.data_manager.batch_factory.data_readers.locations import Location
 from moduslam.sensors_factory.sensors import Sensor
 
+element_overhead: int = 256  # approximate size of Element, RawMeasurement & Location [bytes].
+
+
+class LazyValues:
+    """Raw values decoded on the first access.
+
+    The source (raw bytes or a file reference) is passed to the decoder once, the
+    result is memoized and the source is released.
+    """
+
+    def __init__(self, source: Any, decoder: Callable[[Any], Any], size_bytes: int = 0):
+        """
+        Args:
+            source: raw bytes or a file reference.
+
+            decoder: function decoding the source into the values.
+
+            size_bytes: approximate size of the decoded values in bytes.
+        """
+        self._source = source
+        self._decoder = decoder
+        self._size_bytes = size_bytes
+        self._value: Any = None
+        self._loaded = False
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._loaded else f"source={self._source!r}"
+        return f"LazyValues({state})"
+
+    def __getstate__(self) -> dict[str, Any]:
+        """The lock can not be copied or pickled: it is dropped from the state."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Checks if the values have been decoded."""
+        return self._loaded
+
+    @property
+    def size_bytes(self) -> int:
+        """Estimated size of the decoded values in bytes.
+
+        The estimate is used before and after decoding: the size of an element is
+        computed once, when it is added to a data batch.
+        """
+        return self._size_bytes
+
+    def get(self) -> Any:
+        """Decodes the values on the first call.
+
+        Returns:
+            values.
+        """
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._value = self._decoder(self._source)
+                    self._source = None
+                    self._loaded = True
+
+        return self._value
+
 
-@dataclass(frozen=True, eq=True)
 class RawMeasurement:
     """Raw sensor measurement.
 
+    The values might be given as LazyValues: they are decoded on the first access.
+
     Hash() calculation ignores values because some of them might not be hashable, i.e.
     PIL.Image.
     """
 
-    sensor: Sensor
-    values: Any
+    __slots__ = ("_sensor", "_values")
+
+    def __init__(self, sensor: Sensor, values: Any):
+        """
+        Args:
+            sensor: sensor of the measurement.
+
+            values: raw values or LazyValues.
+        """
+        self._sensor = sensor
+        self._values = values
 
     def __hash__(self) -> int:
-        return hash(self.sensor)
+        return hash(self._sensor)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RawMeasurement):
+            return NotImplemented
+        return (self.sensor, self.values) == (other.sensor, other.values)
+
+    def __repr__(self) -> str:
+        return f"RawMeasurement(sensor={self._sensor!r}, values={self._values!r})"
+
+    @property
+    def sensor(self) -> Sensor:
+        """Sensor of the measurement."""
+        return self._sensor
+
+    @property
+    def values(self) -> Any:
+        """Raw values (decoded on the first access if lazy)."""
+        if isinstance(self._values, LazyValues):
+            return self._values.get()
+        return self._values
+
+    @property
+    def payload(self) -> Any:
+        """Raw values or LazyValues without decoding."""
+        return self._values
 
 
 @dataclass(frozen=True, eq=True)
@@ -27,3 +139,64 @@ class Element:
     timestamp: int
     measurement: RawMeasurement
     location: Location
+
+    @cached_property
+    def size_bytes(self) -> int:
+        """Approximate size of the element with its payload in bytes.
+
+        Computed once: the payload of the element is immutable.
+        """
+        return element_overhead + get_payload_size(self.measurement.payload)
+
+
+def get_image_size(mode: str, size: tuple[int, int]) -> int:
+    """Computes the size of the decoded image in bytes.
+
+    Args:
+        mode: PIL image mode, i.e. "RGB", "I;16", "F".
+
+        size: width and height of the image.
+
+    Returns:
+        size in bytes.
+    """
+    descriptor = ImageMode.getmode(mode)
+    pixel_size = np.dtype(descriptor.typestr).itemsize * len(descriptor.bands)
+    return size[0] * size[1] * pixel_size
+
+
+def get_payload_size(values: Any) -> int:
+    """Computes approximate size of raw measurement values in bytes: arrays and images
+    are measured by their buffers, sequences of numbers are extrapolated from the
+    1-st item, other sequences are measured item by item.
+
+    Args:
+        values: raw measurement values.
+
+    Returns:
+        size in bytes.
+    """
+    if values is None:
+        return 0
+
+    if isinstance(values, LazyValues):
+        return values.size_bytes
+
+    if isinstance(values, np.ndarray):
+        return values.nbytes
+
+    if isinstance(values, Image):
+        return get_image_size(values.mode, values.size)
+
+    if isinstance(values, tuple | list):
+        size = sys.getsizeof(values)
+
+        if not values:
+            return size
+
+        if isinstance(values[0], int | float):
+            return size + len(values) * sys.getsizeof(values[0])
+
+        return size + sum(get_payload_size(item) for item in values)
+
+    return sys.getsizeof(values)
@@ -10,6 +10,9 @@ from typing import TextIO
 from moduslam.data_manager.batch_factory.data_readers.directory_iterator import (
     DirectoryIterator,
 )
+from moduslam.data_manager.batch_factory.data_readers.image_decoder import (
+    ImageDecoder,
+)
 from moduslam.utils.exceptions import ClosedSourceError
 
 
@@ -26,6 +29,18 @@ class Source(ABC):
     def close(self, *args, **kwargs) -> None:
         """Closes and resets the source."""
 
+    def skip(self, num: int) -> None:
+        """Skips the given number of data elements.
+
+        Args:
+            num: number of elements to skip.
+
+        Raises:
+            StopIteration: if the source has exhausted.
+        """
+        for _ in range(num):
+            next(self)
+
 
 class CsvData(Source):
     """CSV data source."""
@@ -84,6 +99,14 @@ class PointCloudData(Source):
         """Point cloud data file."""
         return self._iter.file
 
+    def skip(self, num: int) -> None:
+        """Skips the given number of point cloud files without iterating over them."""
+        self._iter.skip(num)
+
+    def seek(self, timestamp: int) -> None:
+        """Moves to the first file with the timestamp in the name >= the given one."""
+        self._iter.seek(timestamp)
+
     def open(self) -> None:
         self._iter.reset_index()
 
@@ -95,26 +118,72 @@ class PointCloudData(Source):
 class StereoImageData(Source):
     """Source of stereo images data."""
 
-    def __init__(self, left_images_dir: Path, right_images_dir: Path, file_extension: str) -> None:
+    def __init__(
+        self,
+        left_images_dir: Path,
+        right_images_dir: Path,
+        file_extension: str,
+        decoder: ImageDecoder | None = None,
+    ) -> None:
+        """
+        Args:
+            left_images_dir: directory with left images.
+
+            right_images_dir: directory with right images.
+
+            file_extension: extension of the image files.
+
+            decoder: decoder to prefetch the upcoming images with.
+        """
         self._left_images = DirectoryIterator(left_images_dir, file_extension)
         self._right_images = DirectoryIterator(right_images_dir, file_extension)
+        self._decoder = decoder
 
     def __next__(self):
         left_image = next(self._left_images)
         right_image = next(self._right_images)
+        self._prefetch()
         return left_image, right_image
 
+    @property
+    def decoder(self) -> ImageDecoder | None:
+        """Decoder of the images."""
+        return self._decoder
+
     @property
     def files(self) -> tuple[Path, Path]:
         """Stereo image files."""
         return self._left_images.file, self._right_images.file
 
+    def skip(self, num: int) -> None:
+        """Skips the given number of image pairs without iterating over them."""
+        self._left_images.skip(num)
+        self._right_images.skip(num)
+
+    def seek(self, timestamp: int) -> None:
+        """Moves to the first image pair with the timestamp in the names >= the given
+        one."""
+        self._left_images.seek(timestamp)
+        self._right_images.seek(timestamp)
+
     def open(self) -> None:
         self._reset()
 
     def close(self) -> None:
-        """Resets directory iterators."""
+        """Resets directory iterators and stops the decoder."""
         self._reset()
+        if self._decoder is not None:
+            self._decoder.close()
+
+    def _prefetch(self) -> None:
+        """Starts decoding the current and the upcoming image pairs."""
+        if self._decoder is None or self._decoder.prefetch_depth == 0:
+            return
+
+        num = self._decoder.prefetch_depth
+        left = [self._left_images.file, *self._left_images.upcoming(num)]
+        right = [self._right_images.file, *self._right_images.upcoming(num)]
+        self._decoder.prefetch(file for pair in zip(left, right) for file in pair)
 
     def _reset(self):
         self._left_images.reset_index()
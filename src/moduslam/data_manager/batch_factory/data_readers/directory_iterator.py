@@ -1,17 +1,75 @@
 """Iterates over files in a directory with a given extension.
 
-TODO: add tests.
+The sorted listing of the directory (file names and the numbers parsed from them) is
+cached in a hidden .npz file next to the directory and reused until the modification
+time of the directory changes (i.e. files are added, removed or renamed).
 """
 
 import logging
+import os
 from pathlib import Path
 
+import numpy as np
+
 from moduslam.logger.logging_config import data_manager
-from moduslam.utils.auxiliary_methods import sort_files_numerically
+from moduslam.utils.auxiliary_methods import extract_number, numeric_sort_key
 
 logger = logging.getLogger(data_manager)
 
 
+def list_directory(
+    directory: Path, file_extension: str, cache_dir: Path | None = None
+) -> tuple[list[str], np.ndarray]:
+    """Lists the files with the given extension sorted by the numbers in their names.
+
+    Args:
+        directory: directory to list.
+
+        file_extension: extension of the files.
+
+        cache_dir: a directory for the cache file (the parent of the directory by
+            default).
+
+    Returns:
+        sorted file names, numbers parsed from the names [N] (int64).
+    """
+    cache_file = (cache_dir or directory.parent) / f".{directory.name}{file_extension}.listing.npz"
+    stat = directory.stat()
+    signature = np.array([stat.st_mtime_ns, stat.st_ino], dtype=np.int64)
+
+    if cache_file.exists():
+        try:
+            with np.load(cache_file) as cache:
+                if np.array_equal(cache["signature"], signature):
+                    return cache["names"].tolist(), cache["timestamps"]
+        except (OSError, ValueError, KeyError):
+            logger.warning(f"Corrupted directory listing cache: {cache_file}.")
+
+    with os.scandir(directory) as entries:
+        names = sorted(
+            (
+                entry.name
+                for entry in entries
+                if entry.name.endswith(file_extension)
+                and not entry.name.startswith(".")
+                and not entry.is_dir()
+            ),
+            key=numeric_sort_key,
+        )
+
+    timestamps = np.fromiter((extract_number(name) for name in names), np.int64, len(names))
+
+    try:
+        with cache_file.open("wb") as f:
+            np.savez(
+                f, names=np.array(names, dtype=np.str_), timestamps=timestamps, signature=signature
+            )
+    except OSError:
+        pass  # read-only dataset: the directory is listed every time.
+
+    return names, timestamps
+
+
 class DirectoryIterator:
 
     _start_index = -1
@@ -19,9 +77,8 @@ class DirectoryIterator:
     def __init__(self, directory: Path, file_extension: str):
         self._directory = directory
         self._extension = file_extension
-        self._files: list[Path] = list(directory.glob(f"*{file_extension}"))
-        self._files = sort_files_numerically(self._files)
-        self._num_files: int = len(self._files)
+        self._names, self._timestamps = list_directory(directory, file_extension)
+        self._num_files: int = len(self._names)
         self._index: int = self._start_index
 
     def __iter__(self):
@@ -31,7 +88,7 @@ class DirectoryIterator:
         if self._num_files == 0 or self._index == self._num_files - 1:
             raise StopIteration
         self._index += 1
-        return self._files[self._index]
+        return self._directory / self._names[self._index]
 
     @property
     def index(self) -> int:
@@ -68,7 +125,7 @@ class DirectoryIterator:
             logger.error(msg)
             raise FileExistsError(msg)
         try:
-            file = self._files[self.index]
+            file = self._directory / self._names[self.index]
         except IndexError:
             msg = "No iteration has been done yet."
             logger.error(msg)
@@ -76,6 +133,50 @@ class DirectoryIterator:
 
         return file
 
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Numbers parsed from the sorted file names [N] (int64)."""
+        return self._timestamps
+
+    def upcoming(self, num: int) -> list[Path]:
+        """Files to be returned by the next num calls of next().
+
+        Args:
+            num: number of files.
+
+        Returns:
+            files.
+        """
+        start = self._index + 1
+        return [self._directory / name for name in self._names[start : start + num]]
+
+    def skip(self, num: int) -> None:
+        """Moves the iterator forward as num calls of next() would do.
+
+        Args:
+            num: number of files to skip.
+
+        Raises:
+            StopIteration: if less than num files remain.
+        """
+        if num <= 0:
+            return
+
+        if self._index + num > self._num_files - 1:
+            self._index = self._num_files - 1
+            raise StopIteration
+        self._index += num
+
+    def seek(self, timestamp: int) -> None:
+        """Moves the iterator so that next() returns the first file with the number
+        greater than or equal to the timestamp (binary search).
+
+        Args:
+            timestamp: timestamp to seek.
+        """
+        position = int(np.searchsorted(self._timestamps, timestamp, side="left"))
+        self._index = position - 1
+
     def reset_index(self) -> None:
         """Resets the index to the initial state."""
         self._index = self._start_index
@@ -0,0 +1,266 @@
+"""Decoding of image files with prefetching in a thread pool.
+
+PIL releases the GIL while decoding, so the upcoming images of a sequence are decoded
+in parallel with the reader thread. The decoded images are kept in a bounded cache.
+"""
+
+import logging
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import PIL
+from PIL.Image import Image
+
+from moduslam.data_manager.batch_factory.configs import ImageDecodingConfig
+from moduslam.data_manager.batch_factory.data_objects import get_image_size
+from moduslam.logger.logging_config import data_manager
+from moduslam.utils.exceptions import ExternalModuleException
+
+logger = logging.getLogger(data_manager)
+
+
+def decode_image(
+    source: Path | BinaryIO, config: ImageDecodingConfig = ImageDecodingConfig()
+) -> Image:
+    """Decodes the image.
+
+    With the maximum size set, JPEG images are decoded at a reduced scale (draft mode)
+    and the result is downscaled to fit the size.
+
+    Args:
+        source: file with the image or a binary buffer.
+
+        config: decoding configuration.
+
+    Returns:
+        PIL image.
+
+    Raises:
+        ExternalModuleException: PIL.Image failed to read an image.
+    """
+    try:
+        image = PIL.Image.open(source)
+
+        if config.max_size > 0:
+            mode = "L" if config.grayscale else image.mode
+            image.draft(mode, (config.max_size, config.max_size))
+
+        image.load()
+
+        if config.max_size > 0:
+            image.thumbnail((config.max_size, config.max_size))
+
+        if config.grayscale and image.mode != "L":
+            image = image.convert("L")
+
+    except (OSError, ValueError, PIL.UnidentifiedImageError) as e:
+        msg = f"PIL.image module failed to read: {source}. Error: {str(e)}"
+        logger.critical(msg)
+        raise ExternalModuleException(msg) from e
+
+    return image
+
+
+def estimate_image_size(file: Path, config: ImageDecodingConfig = ImageDecodingConfig()) -> int:
+    """Estimates the size of the decoded image in bytes by the header of the file
+    (without decoding the image).
+
+    Args:
+        file: file with the image.
+
+        config: decoding configuration.
+
+    Returns:
+        size in bytes (0 if the header can not be read).
+    """
+    try:
+        with PIL.Image.open(file) as image:
+            mode, (width, height) = image.mode, image.size
+    except (OSError, ValueError, PIL.UnidentifiedImageError):
+        logger.warning(f"Failed to read the header of the image: {file}.")
+        return 0
+
+    if config.max_size > 0:
+        scale = min(1.0, config.max_size / max(width, height, 1))
+        width, height = round(width * scale), round(height * scale)
+
+    if config.grayscale:
+        mode = "L"
+
+    return get_image_size(mode, (width, height))
+
+
+class ImageDecoder:
+    """Decodes image files in a thread pool and caches the decoded images."""
+
+    def __init__(self, config: ImageDecodingConfig = ImageDecodingConfig()):
+        """
+        Args:
+            config: decoding configuration.
+        """
+        self._config = config
+        self._executor: ThreadPoolExecutor | None = None
+        self._cache: OrderedDict[Path, Future] = OrderedDict()
+
+    @property
+    def config(self) -> ImageDecodingConfig:
+        """Decoding configuration."""
+        return self._config
+
+    @property
+    def prefetch_depth(self) -> int:
+        """Number of upcoming images to decode in advance."""
+        return self._config.prefetch if self._config.num_workers > 0 else 0
+
+    def estimate_size(self, file: Path) -> int:
+        """Estimates the size of the decoded image in bytes.
+
+        Args:
+            file: image file.
+
+        Returns:
+            size in bytes.
+        """
+        return estimate_image_size(file, self._config)
+
+    def prefetch(self, files: Iterable[Path]) -> None:
+        """Starts decoding the files in the background (in the given order).
+
+        Args:
+            files: image files.
+        """
+        if self._config.num_workers <= 0:
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self._config.num_workers)
+
+        for file in files:
+            future = self._cache.get(file)
+            if future is None or future.cancelled():
+                self._put(file, self._executor.submit(decode_image, file, self._config))
+            else:
+                self._cache.move_to_end(file)
+
+    def request(self, file: Path) -> Future | None:
+        """Gets the future of the image decoded in the background (starts decoding if
+        the image has not been prefetched).
+
+        Args:
+            file: image file.
+
+        Returns:
+            future of the image or None if the images are decoded in the reader thread.
+        """
+        if self._config.num_workers <= 0:
+            return None
+
+        self.prefetch((file,))
+        return self._cache.get(file)
+
+    def get(self, file: Path) -> Image:
+        """Gets the decoded image.
+
+        Args:
+            file: image file.
+
+        Returns:
+            PIL image.
+
+        Raises:
+            ExternalModuleException: PIL.Image failed to read an image.
+        """
+        future = self._cache.get(file)
+
+        if future is None or future.cancelled():
+            future = Future()
+            try:
+                future.set_result(decode_image(file, self._config))
+            except ExternalModuleException as e:
+                future.set_exception(e)
+            self._put(file, future)
+        else:
+            self._cache.move_to_end(file)
+
+        return future.result()
+
+    def close(self) -> None:
+        """Stops the decoding threads and drops the images which are not decoded."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+        for file, future in list(self._cache.items()):
+            if not future.done() or future.cancelled():
+                del self._cache[file]
+
+    def _put(self, file: Path, future: Future) -> None:
+        """Adds the image to the cache and evicts the least recently used ones.
+
+        The evicted images are not cancelled: they might be awaited by PendingImage.
+        """
+        self._cache[file] = future
+
+        while len(self._cache) > max(self._config.cache_size, 1):
+            self._cache.popitem(last=False)
+
+
+class PendingImage:
+    """Image file being decoded in the background.
+
+    Holds the future of the decoding: the image is decoded once even if it has been
+    evicted from the cache of the decoder before the access.
+    """
+
+    def __init__(self, file: Path, decoder: ImageDecoder | None = None):
+        """
+        Args:
+            file: image file.
+
+            decoder: decoder of the image (the image is decoded on the access if None).
+        """
+        self._file = file
+        self._decoder = decoder
+        self._config = decoder.config if decoder else ImageDecodingConfig()
+        self._future = decoder.request(file) if decoder else None
+
+    def __repr__(self) -> str:
+        return f"PendingImage({self._file!r})"
+
+    def __getstate__(self) -> dict[str, Any]:
+        """The decoder and the future can not be copied or pickled: the copy decodes
+        the file itself."""
+        return {"_file": self._file, "_config": self._config}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._decoder = None
+        self._future = None
+
+    @property
+    def file(self) -> Path:
+        """Image file."""
+        return self._file
+
+    def get(self) -> Image:
+        """Gets the decoded image (waits for the decoding thread if needed).
+
+        Returns:
+            PIL image.
+
+        Raises:
+            ExternalModuleException: PIL.Image failed to read an image.
+        """
+        if self._future is not None:
+            try:
+                return self._future.result()
+            except CancelledError:
+                self._future = None
+
+        if self._decoder is not None:
+            return self._decoder.get(self._file)
+
+        return decode_image(self._file, self._config)
@@ -3,7 +3,11 @@ from pathlib import Path
 
 from omegaconf import MISSING
 
-from moduslam.data_manager.batch_factory.configs import DataReaders, DatasetConfig
+from moduslam.data_manager.batch_factory.configs import (
+    DataReaders,
+    DatasetConfig,
+    ImageDecodingConfig,
+)
 from moduslam.data_manager.batch_factory.data_readers.kaist.configs.paths import (
     KaistDatasetPathConfig as KaistPaths,
 )
@@ -63,3 +67,5 @@ class KaistConfig(DatasetConfig):
     stereo_data_dirs: list[Path] = field(
         default_factory=lambda: [KaistPaths.stereo_left_data_dir, KaistPaths.stereo_right_data_dir],
     )
+
+    image_decoding: ImageDecodingConfig = field(default_factory=ImageDecodingConfig)
@@ -3,12 +3,16 @@
 import logging
 from collections.abc import Callable
 
+from moduslam.data_manager.batch_factory.data_objects import LazyValues
 from moduslam.data_manager.batch_factory.data_readers.data_sources import (
     CsvData,
     PointCloudData,
     Source,
     StereoImageData,
 )
+from moduslam.data_manager.batch_factory.data_readers.image_decoder import (
+    PendingImage,
+)
 from moduslam.data_manager.batch_factory.data_readers.kaist.utils import (
     get_csv_message_by_location,
     get_pointcloud_message_by_location,
@@ -23,7 +27,7 @@ from moduslam.data_manager.batch_factory.data_readers.locations import (
 )
 from moduslam.data_manager.batch_factory.data_readers.utils import (
     get_csv_message,
-    get_images,
+    get_images_size,
 )
 from moduslam.logger.logging_config import data_manager
 from moduslam.utils.auxiliary_dataclasses import Message
@@ -121,7 +125,7 @@ def get_pointcloud_measurement(source: PointCloudData) -> tuple[Message, BinaryD
         raise
 
     timestamp = file.stem
-    data = read_binary(file)
+    data = LazyValues(file, read_binary, file.stat().st_size)
     message = Message(timestamp, data)
     location = BinaryDataLocation(file)
     return message, location
@@ -146,7 +150,10 @@ def get_stereo_measurement(source: StereoImageData) -> tuple[Message, StereoImag
         raise
 
     timestamp_left, _ = left_image_file.stem, right_image_file.stem
-    images = get_images(left_image_file, right_image_file)
+    decoder = source.decoder
+    size = get_images_size(left_image_file, right_image_file, decoder)
+    pair = (PendingImage(left_image_file, decoder), PendingImage(right_image_file, decoder))
+    images = LazyValues(pair, lambda images: (images[0].get(), images[1].get()), size)
     message = Message(timestamp_left, images)
     location = StereoImagesLocation(source.files)
     return message, location
@@ -15,6 +15,9 @@ from moduslam.data_manager.batch_factory.data_readers.data_sources import (
     Source,
     StereoImageData,
 )
+from moduslam.data_manager.batch_factory.data_readers.image_decoder import (
+    ImageDecoder,
+)
 from moduslam.data_manager.batch_factory.data_readers.kaist.configs.base import (
     KaistConfig,
 )
@@ -112,7 +115,10 @@ class KaistReader(DataReader):
             self._lidar3D_left: PointCloudData(self._lidar_data_dirs[self._lidar3D_left], ext),
             self._lidar3D_right: PointCloudData(self._lidar_data_dirs[self._lidar3D_right], ext),
             self._stereo: StereoImageData(
-                self._stereo_data_dirs[0], self._stereo_data_dirs[1], self._image_extension
+                self._stereo_data_dirs[0],
+                self._stereo_data_dirs[1],
+                self._image_extension,
+                ImageDecoder(dataset_params.image_decoding),
             ),
         }
 
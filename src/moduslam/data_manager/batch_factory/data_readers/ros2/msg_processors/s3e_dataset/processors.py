@@ -1,15 +1,16 @@
 from io import BytesIO
 
-from PIL import Image as ImageIO
 from PIL.Image import Image
 
 from moduslam.custom_types.aliases import Vector6
+from moduslam.data_manager.batch_factory.data_readers.image_decoder import (
+    decode_image,
+)
 from moduslam.data_manager.batch_factory.data_readers.ros2.utils.point_cloud2_processor import (
     filter_nans,
     pointcloud2_to_array,
     structured_to_regular_array,
 )
-from moduslam.utils.exceptions import ExternalModuleException
 
 
 def get_image(raw_msg) -> Image:
@@ -19,15 +20,11 @@ def get_image(raw_msg) -> Image:
 
     Returns:
         image.
-    """
-    buffer = BytesIO(raw_msg.data)
-    try:
-        img = ImageIO.open(buffer)
 
-    except Exception as e:
-        raise ExternalModuleException(e)
-
-    return img
+    Raises:
+        ExternalModuleException: PIL.Image failed to read an image.
+    """
+    return decode_image(BytesIO(raw_msg.data))
 
 
 def get_navsat_fix(raw_msg) -> Vector6:
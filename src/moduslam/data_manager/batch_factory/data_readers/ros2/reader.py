@@ -7,7 +7,11 @@ from rosbags.interfaces import Connection
 from rosbags.rosbag2 import Reader
 from rosbags.typesys import get_typestore
 
-from moduslam.data_manager.batch_factory.data_objects import Element, RawMeasurement
+from moduslam.data_manager.batch_factory.data_objects import (
+    Element,
+    LazyValues,
+    RawMeasurement,
+)
 from moduslam.data_manager.batch_factory.data_readers.locations import (
     Location,
     Ros2DataLocation,
@@ -144,18 +148,15 @@ class Ros2Reader(DataReader):
 
         try:
             connection, timestamp, raw_data = next(self._all_messages_gen)
-            msg = self._type_store.deserialize_cdr(raw_data, connection.msgtype)
 
         except StopIteration:
             return None
 
-        processed_data = self._msg_processor.process(msg, connection.msgtype)
-
         topic = connection.topic
         sensor = self._topic_sensor_table[topic]
 
         location = Ros2DataLocation(topic)
-        measurement = RawMeasurement(sensor, processed_data)
+        measurement = RawMeasurement(sensor, self._lazy_values(raw_data, connection.msgtype))
 
         return Element(timestamp, measurement, location)
 
@@ -182,15 +183,12 @@ class Ros2Reader(DataReader):
 
         try:
             connection, timestamp, raw_data = next(messages_gen)
-            msg = self._type_store.deserialize_cdr(raw_data, connection.msgtype)
 
         except StopIteration:
             return None
 
-        processed_data = self._msg_processor.process(msg, connection.msgtype)
-
         location = Ros2DataLocation(connection.topic)
-        measurement = RawMeasurement(sensor, processed_data)
+        measurement = RawMeasurement(sensor, self._lazy_values(raw_data, connection.msgtype))
 
         return Element(timestamp, measurement, location)
 
@@ -231,13 +229,28 @@ class Ros2Reader(DataReader):
             logger.critical(error)
             raise ItemNotFoundError(error)
 
-        msg = self._type_store.deserialize_cdr(raw_data, connection.msgtype)
+        values = self._lazy_values(raw_data, connection.msgtype)
+        measurement = RawMeasurement(element.measurement.sensor, values)
 
-        processed_data = self._msg_processor.process(msg, connection.msgtype)
+        return Element(t, measurement, element.location)
 
-        measurement = RawMeasurement(element.measurement.sensor, processed_data)
+    def _lazy_values(self, raw_data: bytes, msgtype: str) -> LazyValues:
+        """Creates values which are deserialized and processed on the first access.
 
-        return Element(t, measurement, element.location)
+        Args:
+            raw_data: serialized message.
+
+            msgtype: type of the message.
+
+        Returns:
+            lazy values.
+        """
+
+        def decode(data: bytes):
+            msg = self._type_store.deserialize_cdr(data, msgtype)
+            return self._msg_processor.process(msg, msgtype)
+
+        return LazyValues(raw_data, decode, len(raw_data))
 
     @staticmethod
     def _get_topic_name(location: Location) -> str:
@@ -3,7 +3,11 @@ from pathlib import Path
 
 from omegaconf import MISSING
 
-from moduslam.data_manager.batch_factory.configs import DataReaders, DatasetConfig
+from moduslam.data_manager.batch_factory.configs import (
+    DataReaders,
+    DatasetConfig,
+    ImageDecodingConfig,
+)
 from moduslam.data_manager.batch_factory.data_readers.tum_vie.configs.paths import (
     TumVieDatasetPathConfig as TumPaths,
 )
@@ -35,3 +39,5 @@ class TumVieConfig(DatasetConfig):
     stereo_data_dirs: list[Path] = field(
         default_factory=lambda: [TumPaths.stereo_left_images, TumPaths.stereo_right_images],
     )
+
+    image_decoding: ImageDecodingConfig = field(default_factory=ImageDecodingConfig)
@@ -115,7 +115,7 @@ def get_stereo_measurement(source: TumVieStereoImageData) -> tuple[Message, Ster
     except StopIteration:
         raise
 
-    images = get_images(left_img_file, right_img_file)
+    images = get_images(left_img_file, right_img_file, source.decoder)
     message = Message(timestamp=timestamp, data=images)
     location = StereoImagesLocation(source.files)
     return message, location
@@ -10,6 +10,9 @@ from plum import dispatch
 
 from moduslam.data_manager.batch_factory.data_objects import Element, RawMeasurement
 from moduslam.data_manager.batch_factory.data_readers.data_sources import Source
+from moduslam.data_manager.batch_factory.data_readers.image_decoder import (
+    ImageDecoder,
+)
 from moduslam.data_manager.batch_factory.data_readers.reader_ABC import (
     DataReader,
 )
@@ -84,6 +87,7 @@ class TumVieReader(DataReader):
                 self._stereo_data_dirs[0],
                 self._stereo_data_dirs[1],
                 self._image_file_extension,
+                ImageDecoder(dataset_params.image_decoding),
             ),
         }
 
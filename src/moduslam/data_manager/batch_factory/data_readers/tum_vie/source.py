@@ -5,6 +5,9 @@ from moduslam.data_manager.batch_factory.data_readers.data_sources import (
     CsvData,
     StereoImageData,
 )
+from moduslam.data_manager.batch_factory.data_readers.image_decoder import (
+    ImageDecoder,
+)
 from moduslam.utils.exceptions import ClosedSourceError
 
 
@@ -30,8 +33,9 @@ class TumVieStereoImageData(StereoImageData):
         left_images_dir: Path,
         right_images_dir: Path,
         file_extension: str,
+        decoder: ImageDecoder | None = None,
     ) -> None:
-        super().__init__(left_images_dir, right_images_dir, file_extension)
+        super().__init__(left_images_dir, right_images_dir, file_extension, decoder)
         self._timestamp_file = timestamp_file
         self._timestamps: TextIO | None = None
 
@@ -42,8 +46,17 @@ class TumVieStereoImageData(StereoImageData):
         right_image = next(self._right_images)
         line = next(self._timestamps)
         timestamp = line.split()[0]
+        self._prefetch()
         return left_image, right_image, timestamp
 
+    def skip(self, num: int) -> None:
+        """Skips the given number of image pairs and their timestamps."""
+        if self._timestamps is None:
+            raise ClosedSourceError("Timestamp file is closed")
+        super().skip(num)
+        for _ in range(num):
+            next(self._timestamps)
+
     def open(self) -> None:
         """Opens file with timestamps and skips header."""
         self._reset()
@@ -51,7 +64,10 @@ class TumVieStereoImageData(StereoImageData):
         next(self._timestamps)  # Skip header
 
     def close(self) -> None:
-        """Closes file with timestamps and resets directory iterators."""
+        """Closes file with timestamps, resets directory iterators and stops the
+        decoder."""
         self._reset()
         if self._timestamps is not None:
             self._timestamps.close()
+        if self._decoder is not None:
+            self._decoder.close()
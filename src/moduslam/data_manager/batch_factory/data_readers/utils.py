@@ -3,10 +3,14 @@ import logging
 from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
 
-import PIL
 from PIL.Image import Image
 
 from moduslam.data_manager.batch_factory.data_readers.data_sources import Source
+from moduslam.data_manager.batch_factory.data_readers.image_decoder import (
+    ImageDecoder,
+    decode_image,
+    estimate_image_size,
+)
 from moduslam.data_manager.batch_factory.data_readers.reader_ABC import (
     configuration_error_msg,
     context_error_msg,
@@ -15,7 +19,6 @@ from moduslam.logger.logging_config import data_manager
 from moduslam.utils.auxiliary_dataclasses import Message
 from moduslam.utils.exceptions import (
     DataReaderConfigurationError,
-    ExternalModuleException,
     FileNotValid,
     ItemNotFoundError,
 )
@@ -42,8 +45,7 @@ def set_state(
     """
     for t, name, position in data_sequence:
         if t == timestamp and name == sensor_name:
-            for _ in range(position - 1):
-                next(source)
+            source.skip(position - 1)
             return
 
     msg = (
@@ -183,28 +185,29 @@ def get_csv_message(line: str, separator: str = " ") -> Message:
     return Message(timestamp, values)
 
 
-def get_image(file_path: Path) -> Image:
+def get_image(file_path: Path, decoder: ImageDecoder | None = None) -> Image:
     """Gets the image from the given path.
 
     Args:
         file_path: file with the image.
 
+        decoder: decoder with prefetched images (the image is decoded in place if None).
+
     Returns:
         PIL image.
 
     Raises:
         ExternalModuleException: PIL.Image failed to read an image.
     """
-    try:
-        image = PIL.Image.open(file_path)
-        return image
-    except (FileNotFoundError, PermissionError, PIL.UnidentifiedImageError) as e:
-        msg = f"PIL.image module failed to read: {file_path}. Error: {str(e)}"
-        logger.critical(msg)
-        raise ExternalModuleException(msg) from e
+    if decoder is None:
+        return decode_image(file_path)
+
+    return decoder.get(file_path)
 
 
-def get_images(left_image_file: Path, right_image_file) -> tuple[Image, Image]:
+def get_images(
+    left_image_file: Path, right_image_file: Path, decoder: ImageDecoder | None = None
+) -> tuple[Image, Image]:
     """Gets stereo images.
 
     Args:
@@ -212,15 +215,41 @@ def get_images(left_image_file: Path, right_image_file) -> tuple[Image, Image]:
 
         right_image_file: right image file.
 
+        decoder: decoder with prefetched images: both images are decoded in parallel.
+
     Returns:
         message: a message with stereo images.
     """
+    if decoder is not None:
+        decoder.prefetch((left_image_file, right_image_file))
 
-    left_img = get_image(left_image_file)
-    right_img = get_image(right_image_file)
+    left_img = get_image(left_image_file, decoder)
+    right_img = get_image(right_image_file, decoder)
     return left_img, right_img
 
 
+def get_images_size(
+    left_image_file: Path, right_image_file: Path, decoder: ImageDecoder | None = None
+) -> int:
+    """Estimates the size of the decoded stereo images in bytes by the headers of the
+    files.
+
+    Args:
+        left_image_file: left image file.
+
+        right_image_file: right image file.
+
+        decoder: decoder of the images.
+
+    Returns:
+        size in bytes.
+    """
+    files = (left_image_file, right_image_file)
+    if decoder is None:
+        return sum(estimate_image_size(file) for file in files)
+    return sum(decoder.estimate_size(file) for file in files)
+
+
 def filter_table(table: Mapping[str, Source], sensors: set[str]) -> dict[str, Source]:
     """Filters "sensor <-> source" table by the given sensors.
 
@@ -244,6 +273,4 @@ def apply_state(sensor_source_table: dict[str, Source], state: dict[str, int]) -
         state: a dictionary of current state for each sensor.
     """
     for sensor, source in sensor_source_table.items():
-        num_steps = state[sensor]
-        for _ in range(num_steps):
-            next(source)
+        source.skip(state[sensor])
@@ -20,7 +20,8 @@ class BatchFactory:
     def __init__(self, config: BatchFactoryConfig) -> None:
         self._all_data_processed = False
         self._batch = DataBatch()
-        self._memory_analyzer = MemoryAnalyzer(config.batch_memory_percent)
+        self._batch_size_limit = config.batch_size_bytes
+        self._memory_analyzer = MemoryAnalyzer.from_config(config)
         self._data_reader, regime = create(config.dataset, config.regime)
         sensors = SensorsFactory.get_sensors()
         self._data_reader.configure(regime, sensors)
@@ -106,6 +107,7 @@ class BatchFactory:
         sensor = request.sensor
         start, stop = request.period.start, request.period.stop
         elements: list[Element] = []
+        elements_size: int = 0
         current_timestamp: int = -1
 
         try:
@@ -115,11 +117,12 @@ class BatchFactory:
 
         while current_timestamp < stop:
 
-            self._check_memory()
+            self._check_memory(elements_size)
             element = reader.get_next_element(sensor)
 
             if element:
                 elements.append(element)
+                elements_size += element.size_bytes
                 current_timestamp = element.timestamp
             else:
                 logger.error(
@@ -130,14 +133,25 @@ class BatchFactory:
 
         return elements
 
-    def _check_memory(self) -> None:
-        """Checks if the memory limit is exceeded.
+    def _check_memory(self, pending_size: int = 0) -> None:
+        """Checks if the batch size limit or the memory limit is exceeded.
+
+        Args:
+            pending_size: size of elements [bytes] to be added to the batch.
 
         Raises:
-            MemoryError: memory limit is exceeded.
+            MemoryError: batch size limit or memory limit is exceeded.
         """
-        msg = "Memory limit is exceeded."
-        if not self._memory_analyzer.enough_memory:
+        size = self._batch.size_bytes + pending_size
+        limit = self._batch_size_limit
+
+        if limit is not None and size > limit:
+            msg = f"Batch size limit is exceeded: {size} > {limit} bytes."
+            logger.error(msg)
+            raise MemoryError(msg)
+
+        if not self._memory_analyzer.check_memory():
+            msg = "Memory limit is exceeded."
             logger.error(msg)
             raise MemoryError(msg)
 
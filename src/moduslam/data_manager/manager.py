@@ -3,6 +3,7 @@ from collections.abc import Sequence
 
 from moduslam.data_manager.batch_factory.batch import Element
 from moduslam.data_manager.batch_factory.config_factory import get_config
+from moduslam.data_manager.batch_factory.configs import DatasetConfig
 from moduslam.data_manager.batch_factory.factory import BatchFactory
 from moduslam.logger.logging_config import data_manager
 from moduslam.utils.auxiliary_dataclasses import PeriodicDataRequest
@@ -15,9 +16,15 @@ class DataManager:
 
     def __init__(self) -> None:
         config = get_config()
+        self._dataset = config.dataset
         self._batch_factory = BatchFactory(config)
         logger.debug("Data Manager has been configured.")
 
+    @property
+    def dataset(self) -> DatasetConfig:
+        """Configuration of the dataset."""
+        return self._dataset
+
     @property
     def batch_factory(self) -> BatchFactory:
         """Batch factory."""
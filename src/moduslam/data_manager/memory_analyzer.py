@@ -1,7 +1,9 @@
 import logging
+import time
 
 import psutil
 
+from moduslam.data_manager.batch_factory.configs import BatchFactoryConfig
 from moduslam.logger.logging_config import data_manager
 
 logger = logging.getLogger(data_manager)
@@ -10,12 +12,42 @@ logger = logging.getLogger(data_manager)
 class MemoryAnalyzer:
     """Analyzes current memory usage."""
 
-    def __init__(self, batch_memory_percent: float = 50.0) -> None:
+    def __init__(
+        self,
+        batch_memory_percent: float = 50.0,
+        sampling_interval: int = 1,
+        sampling_period: float = 0.0,
+    ) -> None:
         """
         Args:
             batch_memory_percent: permissible memory usage in percentage.
+
+            sampling_interval: a number of checks between memory usage samples.
+
+            sampling_period: time between memory usage samples [ms].
         """
         self._batch_memory_percent = batch_memory_percent
+        self._sampling_interval = sampling_interval
+        self._sampling_period = sampling_period * 1e-3
+        self._num_checks = 0
+        self._last_sample_time = float("-inf")
+        self._last_status = True
+
+    @classmethod
+    def from_config(cls, config: BatchFactoryConfig) -> "MemoryAnalyzer":
+        """Creates the analyzer with the memory limits of the batch factory.
+
+        Args:
+            config: batch factory configuration.
+
+        Returns:
+            memory analyzer.
+        """
+        return cls(
+            config.batch_memory_percent,
+            config.memory_sampling_interval,
+            config.memory_sampling_period,
+        )
 
     @property
     def total_memory(self) -> int:
@@ -44,3 +76,24 @@ class MemoryAnalyzer:
         if self.used_memory_percent < self.permissible_memory_percent:
             return True
         return False
+
+    def check_memory(self) -> bool:
+        """Checks if the memory usage is within the permissible limits. The memory usage
+        is sampled only every N-th check or if T ms have passed since the last sample,
+        otherwise the last status is returned.
+
+        Returns:
+            memory usage status.
+        """
+        self._num_checks += 1
+        now = time.monotonic()
+
+        if (
+            self._num_checks >= self._sampling_interval
+            or now - self._last_sample_time >= self._sampling_period
+        ):
+            self._num_checks = 0
+            self._last_sample_time = now
+            self._last_status = self.enough_memory
+
+        return self._last_status
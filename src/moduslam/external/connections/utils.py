@@ -3,8 +3,8 @@ from moduslam.bridge.auxiliary_dataclasses import (
     ClustersWithLeftovers,
 )
 from moduslam.external.connections.connections_factory import Factory
-from moduslam.external.utils import copy_cluster, create_copy, get_subsequence
-from moduslam.measurement_storage.cluster import MeasurementCluster
+from moduslam.external.utils import create_views, get_subsequence
+from moduslam.measurement_storage.cluster import ClusterView, MeasurementCluster
 from moduslam.measurement_storage.measurements.auxiliary import FakeMeasurement
 from moduslam.measurement_storage.measurements.imu import ContinuousImu, Imu
 
@@ -150,7 +150,7 @@ def create_and_fill_connections(
     for clusters in clusters_combinations:
 
         if len(clusters) == 1:
-            cluster = copy_cluster(clusters[0])
+            cluster = ClusterView(clusters[0])
             num_unused, leftovers = fill_one_connection(cluster, measurements, left_limit_t)
             variants.append(ClustersWithLeftovers([cluster], leftovers, num_unused))
 
@@ -161,8 +161,8 @@ def create_and_fill_connections(
             combinations = Factory.create_combinations(clusters)
 
             for connections in combinations:
-                clusters_copy, connections_copy = create_copy(clusters, connections)
-                item = ClustersWithConnections(clusters_copy, connections_copy)
+                views, connections_views = create_views(clusters, connections)
+                item = ClustersWithConnections(views, connections_views)
                 new_clusters, leftovers, unused = fill_multiple_connections(item, measurements)
                 v = ClustersWithLeftovers(new_clusters, leftovers, unused)
                 variants.append(v)
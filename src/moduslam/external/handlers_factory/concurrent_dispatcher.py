@@ -0,0 +1,144 @@
+import logging
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from moduslam.data_manager.batch_factory.batch import DataBatch, Element
+from moduslam.external.handlers_factory.dispatcher import (
+    Dispatcher,
+    batch_chunk_size,
+)
+from moduslam.external.handlers_factory.handlers.handler_protocol import (
+    BatchHandler,
+    Handler,
+)
+from moduslam.logger.logging_config import frontend_manager
+from moduslam.measurement_storage.measurements.base import Measurement
+from moduslam.utils.exceptions import ValidationError
+
+logger = logging.getLogger(frontend_manager)
+
+
+class ConcurrentDispatcher:
+    """Processes elements of the data batch ahead in per-handler worker threads and
+    yields the measurements in the order of the elements.
+
+    Every worker has a single thread: the elements of a sensor are processed in their
+    order, so stateful handlers (e.g. scan matchers) produce the same measurements as
+    with the sequential Dispatcher. Batch handlers are cheap and are called in the
+    consuming thread with chunks of consecutive elements of their sensors.
+    """
+
+    def __init__(self, dispatcher: Dispatcher, read_ahead: int = 1024):
+        """
+        Args:
+            dispatcher: a dispatcher of elements to handlers.
+
+            read_ahead: max number of elements submitted ahead of the consumed one.
+        """
+        self._dispatcher = dispatcher
+        self._read_ahead = read_ahead
+        self._queue: deque[tuple[Element, Future | None]] = deque()
+        self._executors: dict[Handler, ThreadPoolExecutor] = {
+            handler: ThreadPoolExecutor(max_workers=1, thread_name_prefix=handler.sensor_name)
+            for handler in dispatcher.handlers
+            if not isinstance(handler, BatchHandler)
+        }
+
+    def __enter__(self) -> "ConcurrentDispatcher":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def measurements(self, data: DataBatch) -> Iterator[Measurement | None]:
+        """Processes the elements of the data batch: the first element is removed from
+        the batch right before its measurement (or None) is yielded.
+
+        If the iteration stops earlier, the elements being processed stay in the batch
+        and their measurements are yielded by the next call (the measurements of the
+        remaining elements of a batch handler chunk are computed again).
+
+        Args:
+            data: a data batch with elements.
+
+        Yields:
+            new measurement or None for every element.
+
+        Raises:
+            ValidationError: if the batch has been modified outside the dispatcher.
+        """
+        while not data.empty:
+            self._submit(data)
+            element, future = self._queue[0]
+            check_first(data, element)
+
+            if future:
+                results = [future.result()]
+            elif self._dispatcher.supports_batch(element.measurement.sensor):
+                results = self._dispatcher.process_batch(self._get_batch_chunk())
+            else:
+                results = [self._dispatcher.process(element)]
+
+            for measurement in results:
+                element, _ = self._queue.popleft()
+                check_first(data, element)
+                data.remove_first()
+                yield measurement
+
+    def close(self) -> None:
+        """Waits for the submitted elements and stops the workers."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=True)
+        self._queue.clear()
+
+    def _get_batch_chunk(self) -> list[Element]:
+        """Gets consecutive not submitted elements of the sensor of the first queued
+        element from the beginning of the queue.
+
+        Returns:
+            elements (at most batch_chunk_size).
+        """
+        sensor = self._queue[0][0].measurement.sensor
+        chunk: list[Element] = []
+
+        for element, future in self._queue:
+            if future or element.measurement.sensor != sensor or len(chunk) == batch_chunk_size:
+                break
+            chunk.append(element)
+
+        return chunk
+
+    def _submit(self, data: DataBatch) -> None:
+        """Submits the elements following the already submitted ones to the workers.
+
+        Args:
+            data: a data batch with elements.
+        """
+        start = len(self._queue)
+
+        for element in data.data[start : self._read_ahead]:
+            handler = self._dispatcher.get_handler(element.measurement.sensor)
+            executor = self._executors.get(handler) if handler else None
+
+            if handler and executor:
+                self._queue.append((element, executor.submit(handler.process, element)))
+            else:
+                self._queue.append((element, None))
+
+
+def check_first(data: DataBatch, element: Element) -> None:
+    """Checks that the element is the first one in the data batch.
+
+    Args:
+        data: a data batch with elements.
+
+        element: the element expected to be the first.
+
+    Raises:
+        ValidationError: if the batch has been modified outside the dispatcher.
+    """
+    if element is not data.first:
+        msg = "The data batch has been modified while processing its elements."
+        logger.error(msg)
+        raise ValidationError(msg)
@@ -0,0 +1,164 @@
+import logging
+from collections.abc import Iterable, Iterator, Sequence
+from typing import cast
+
+from moduslam.data_manager.batch_factory.batch import DataBatch, Element
+from moduslam.external.handlers_factory.handlers.handler_protocol import (
+    BatchHandler,
+    Handler,
+)
+from moduslam.logger.logging_config import frontend_manager
+from moduslam.measurement_storage.measurements.base import Measurement
+from moduslam.sensors_factory.sensors import Sensor
+from moduslam.utils.exceptions import ValidationError
+
+logger = logging.getLogger(frontend_manager)
+
+HandlerKey = tuple[type[Sensor], str]
+
+batch_chunk_size: int = 256  # max number of elements processed by a batch handler at once.
+
+
+class Dispatcher:
+    """Distributes elements to handlers with a table: (sensor type, sensor name) ->
+    handler."""
+
+    def __init__(self, handlers: Iterable[Handler]):
+        """
+        Args:
+            handlers: handlers to distribute elements to.
+
+        Raises:
+            ValidationError: if several handlers process the same sensor.
+        """
+        self._table: dict[HandlerKey, Handler] = {}
+        self._batch_handlers: set[Handler] = set()
+
+        for handler in handlers:
+            key = (handler.sensor_type, handler.sensor_name)
+
+            if key in self._table:
+                msg = f"Several handlers for the sensor {handler.sensor_name!r}."
+                logger.error(msg)
+                raise ValidationError(msg)
+
+            self._table[key] = handler
+            if isinstance(handler, BatchHandler):
+                self._batch_handlers.add(handler)
+
+    @property
+    def handlers(self) -> list[Handler]:
+        """All handlers."""
+        return list(self._table.values())
+
+    def get_handler(self, sensor: Sensor) -> Handler | None:
+        """Gets the handler for the sensor.
+
+        Args:
+            sensor: a sensor.
+
+        Returns:
+            handler or None if the sensor is not handled.
+        """
+        return self._table.get((type(sensor), sensor.name))
+
+    def supports_batch(self, sensor: Sensor) -> bool:
+        """Checks if the measurements of the sensor can be processed in batches.
+
+        Args:
+            sensor: a sensor.
+
+        Returns:
+            batch processing status.
+        """
+        return self.get_handler(sensor) in self._batch_handlers
+
+    def process(self, element: Element) -> Measurement | None:
+        """Processes the element with the appropriate handler.
+
+        Args:
+            element: element to be processed.
+
+        Returns:
+            new measurement or None.
+        """
+        handler = self.get_handler(element.measurement.sensor)
+        return handler.process(element) if handler else None
+
+    def process_batch(self, elements: Sequence[Element]) -> list[Measurement | None]:
+        """Processes the elements: consecutive elements of the same sensor are processed
+        at once if the handler supports it.
+
+        Args:
+            elements: elements to be processed.
+
+        Returns:
+            new measurements (or None) for each element.
+        """
+        results: list[Measurement | None] = []
+        start = 0
+
+        while start < len(elements):
+            sensor = elements[start].measurement.sensor
+            stop = start + 1
+            while stop < len(elements) and elements[stop].measurement.sensor == sensor:
+                stop += 1
+
+            handler = self.get_handler(sensor)
+            chunk = elements[start:stop]
+
+            if handler is None:
+                results.extend([None] * len(chunk))
+            elif handler in self._batch_handlers:
+                results.extend(cast(BatchHandler, handler).process_batch(chunk))
+            else:
+                results.extend(handler.process(element) for element in chunk)
+
+            start = stop
+
+        return results
+
+    def measurements(self, data: DataBatch) -> Iterator[Measurement | None]:
+        """Processes the elements of the data batch one by one: the first element is
+        removed from the batch right before its measurement (or None) is yielded.
+
+        Consecutive elements of a sensor with batch handler are processed in chunks: if
+        the iteration stops earlier, the measurements of the remaining elements of the
+        chunk are discarded and the elements stay in the batch.
+
+        Args:
+            data: a data batch with elements.
+
+        Yields:
+            new measurement or None for every element.
+        """
+        while not data.empty:
+            element = data.first
+            sensor = element.measurement.sensor
+
+            if self.supports_batch(sensor):
+                results = self.process_batch(get_sensor_chunk(data, sensor))
+            else:
+                results = [self.process(element)]
+
+            for measurement in results:
+                data.remove_first()
+                yield measurement
+
+
+def get_sensor_chunk(data: DataBatch, sensor: Sensor) -> list[Element]:
+    """Gets consecutive elements of the sensor from the beginning of the data batch.
+
+    Args:
+        data: a data batch with elements.
+
+        sensor: a sensor of the elements.
+
+    Returns:
+        elements (at most batch_chunk_size).
+    """
+    elements = list(data.data[:batch_chunk_size])
+    for i, element in enumerate(elements):
+        if element.measurement.sensor != sensor:
+            return elements[:i]
+    return elements
@@ -6,6 +6,7 @@ from hydra import compose, initialize
 from hydra.core.config_store import ConfigStore
 from omegaconf import MISSING
 
+from moduslam.external.handlers_factory.dispatcher import Dispatcher
 from moduslam.external.handlers_factory.handlers.handler_protocol import Handler
 from moduslam.external.handlers_factory.handlers.imu.config import (
     ImuHandlerConfig,
@@ -64,12 +65,15 @@ class Factory:
     """Initializes and stores measurement handlers."""
 
     _handlers: set[Handler] = set()
+    _dispatcher: Dispatcher = Dispatcher(())
+    _config: Handlers | None = None
 
     @classmethod
     def init_handlers(cls) -> None:
         """Initializes handlers."""
 
         config = get_config()
+        cls._config = config
 
         scan_matcher1 = ScanMatcher(config.scan_matcher1)
         # scan_matcher2 = ScanMatcher(config.scan_matcher2)
@@ -83,6 +87,7 @@ class Factory:
             # vrs_gps_preprocessor,
             # visual_odometry,
         }
+        cls._dispatcher = Dispatcher(cls._handlers)
 
         logger.debug("All handlers have been initialized.")
 
@@ -94,3 +99,21 @@ class Factory:
             handlers.
         """
         return cls._handlers
+
+    @classmethod
+    def get_config(cls) -> Handlers | None:
+        """Gets the configuration of the initialized handlers.
+
+        Returns:
+            configuration or None if the handlers have not been initialized.
+        """
+        return cls._config
+
+    @classmethod
+    def get_dispatcher(cls) -> Dispatcher:
+        """Gets the dispatcher of elements to the handlers.
+
+        Returns:
+            dispatcher.
+        """
+        return cls._dispatcher
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Protocol, runtime_checkable
 
@@ -32,3 +33,22 @@ class Handler(Protocol):
         Returns:
             new measurement if created.
         """
+
+
+@runtime_checkable
+class BatchHandler(Handler, Protocol):
+    """Handler which can process multiple elements at once.
+
+    The result for an element must not depend on the other elements: the measurements
+    of unused elements might be discarded.
+    """
+
+    def process_batch(self, elements: Sequence[Element]) -> list[Measurement | None]:
+        """Processes the elements of the same sensor.
+
+        Args:
+            elements: elements of a data batch to be processed.
+
+        Returns:
+            new measurements (or None) for each element.
+        """
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Sequence
 
 from moduslam.data_manager.batch_factory.batch import Element
 from moduslam.external.handlers_factory.handlers.handler_protocol import Handler
@@ -6,11 +7,14 @@ from moduslam.external.handlers_factory.handlers.imu.config import (
     ImuHandlerConfig,
 )
 from moduslam.external.handlers_factory.handlers.imu.parsers import (
+    dataset_columns_mapping,
     dataset_parser_mapping,
+    parse_batch,
 )
 from moduslam.logger.logging_config import frontend_manager
 from moduslam.measurement_storage.measurements.imu import (
     ImuCovariance,
+    ImuData,
     ProcessedImu,
 )
 from moduslam.sensors_factory.sensors import Imu as ImuSensor
@@ -24,9 +28,11 @@ class ImuHandler(Handler):
 
     def __init__(self, config: ImuHandlerConfig):
         self._sensor_name = config.sensor_name
+        self._covariances: dict[ImuSensor, ImuCovariance] = {}
 
         try:
             self._parser = dataset_parser_mapping[config.data_reader]
+            self._columns = dataset_columns_mapping[config.data_reader]
         except KeyError:
             msg = f"Parser not found for {config.data_reader}"
             logger.error(msg)
@@ -67,8 +73,57 @@ class ImuHandler(Handler):
 
         return ProcessedImu(element.timestamp, imu_data, covariance, sensor.tf_base_sensor)
 
+    def process_batch(self, elements: Sequence[Element]) -> list[ProcessedImu | None]:
+        """Processes the elements with raw IMU data of the same sensor: the raw values
+        are converted to floats at once.
+
+        Args:
+            elements: elements with raw IMU data.
+
+        Returns:
+            new measurements.
+
+        Raises:
+            TypeError: If the sensor of the measurements is not an Imu.
+        """
+        if not elements:
+            return []
+
+        sensor = elements[0].measurement.sensor
+
+        if not isinstance(sensor, ImuSensor):
+            msg = f"Expected sensor of type {ImuSensor}, got {type(sensor)}"
+            logger.error(msg)
+            raise TypeError(msg)
+
+        covariance = self._get_covariance(sensor)
+        tf = sensor.tf_base_sensor
+        data = parse_batch([element.measurement.values for element in elements], self._columns)
+
+        return [
+            ProcessedImu(element.timestamp, ImuData((wx, wy, wz), (ax, ay, az)), covariance, tf)
+            for element, (wx, wy, wz, ax, ay, az) in zip(elements, data.tolist())
+        ]
+
+    def _get_covariance(self, sensor: ImuSensor) -> ImuCovariance:
+        """Gets IMU covariances of the sensor: they are created once and shared by all
+        measurements of the sensor.
+
+        Args:
+            sensor: an IMU sensor.
+
+        Returns: IMU covariance.
+        """
+        covariance = self._covariances.get(sensor)
+
+        if covariance is None:
+            covariance = self._create_covariance(sensor)
+            self._covariances[sensor] = covariance
+
+        return covariance
+
     @staticmethod
-    def _get_covariance(sensor: ImuSensor) -> ImuCovariance:
+    def _create_covariance(sensor: ImuSensor) -> ImuCovariance:
         """Creates IMU covariances using the given sensor.
 
         Args:
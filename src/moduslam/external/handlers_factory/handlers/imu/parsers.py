@@ -1,8 +1,11 @@
 """Parsers of IMU data collected with different Data Readers from different datasets."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+
+import numpy as np
 
 from moduslam.custom_types.aliases import Vector6
+from moduslam.custom_types.numpy import MatrixMxN
 from moduslam.data_manager.batch_factory.configs import DataReaders
 from moduslam.measurement_storage.measurements.imu import ImuData
 from moduslam.utils.auxiliary_methods import str_to_float
@@ -84,8 +87,31 @@ def parse_ros_message(values: Vector6) -> ImuData:
     return ImuData((w_x, w_y, w_z), (a_x, a_y, a_z))
 
 
+def parse_batch(values: Sequence[Sequence], columns: Sequence[int]) -> MatrixMxN:
+    """Extracts IMU data of multiple lines at once: the values are stacked into 1 array
+    and converted to floats in 1 pass.
+
+    Args:
+        values: lines with the values (strings or floats) of equal length.
+
+        columns: indices of the gyro x, y, z and acceleration x, y, z values in a line.
+
+    Returns:
+        array with [gyro x, gyro y, gyro z, acceleration x, acceleration y,
+        acceleration z] rows.
+    """
+    lines = np.array(values, dtype=object)  # no fixed-width unicode copy.
+    return lines.take(columns, axis=1).astype(np.float64)
+
+
 dataset_parser_mapping: dict[str, Callable[[tuple], ImuData]] = {
     DataReaders.kaist_urban: parse_kaist_urban,
     DataReaders.tum_vie: parse_tum_vie,
     DataReaders.ros2: parse_ros_message,
 }
+
+dataset_columns_mapping: dict[str, tuple[int, ...]] = {
+    DataReaders.kaist_urban: (7, 8, 9, 10, 11, 12),
+    DataReaders.tum_vie: (0, 1, 2, 3, 4, 5),
+    DataReaders.ros2: (0, 1, 2, 3, 4, 5),
+}
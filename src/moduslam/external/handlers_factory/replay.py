@@ -0,0 +1,336 @@
+"""Recording and replay of the measurements created by the handlers.
+
+The measurements are written to a binary log keyed by the dataset, the configuration of
+the handlers and the version of their code. On the next run with the same key, the
+measurements are read from the log instead of running the handlers again.
+
+Log format: a header (magic bytes, key) followed by records of the elements:
+    timestamp (int64), sensor name length (uint16), sensor name (utf-8),
+    pickled measurement length (uint32), pickled measurement (empty for None).
+
+Elements and sensors are not pickled: the measurements refer to them by
+(timestamp, sensor name) and sensor name and are bound to the elements of the
+current data batch on replay.
+
+The replayed measurements are never mixed with the measurements of the handlers: the
+handlers are stateful and have not processed the replayed elements. A run with a
+measurement which can not be pickled is not recorded, and a log without a valid record
+for an element is removed.
+"""
+
+import hashlib
+import io
+import logging
+import pickle
+import struct
+from collections import deque
+from collections.abc import Iterable, Iterator
+from importlib import metadata
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from omegaconf import OmegaConf
+
+from moduslam.data_manager.batch_factory.batch import DataBatch, Element
+from moduslam.external.handlers_factory.concurrent_dispatcher import (
+    ConcurrentDispatcher,
+)
+from moduslam.external.handlers_factory.dispatcher import Dispatcher
+from moduslam.logger.logging_config import frontend_manager
+from moduslam.measurement_storage.measurements.base import Measurement
+from moduslam.sensors_factory.sensors import Sensor
+from moduslam.utils.exceptions import ItemNotFoundError, ValidationError
+
+logger = logging.getLogger(frontend_manager)
+
+ElementKey = tuple[int, str]
+
+magic = b"MSLREPLAY1"
+record_header = struct.Struct("<qH")
+blob_header = struct.Struct("<I")
+package_directory = Path(__file__).parents[2]
+code_directories = (
+    package_directory / "external" / "handlers_factory" / "handlers",
+    package_directory / "measurement_storage" / "measurements",
+    package_directory / "data_manager" / "batch_factory" / "data_readers",
+)
+
+
+def code_version(directories: Iterable[Path] = code_directories) -> str:
+    """Version of the code creating the measurements: the package version and the hash
+    of the source files of the handlers, the measurements and the data readers.
+
+    Args:
+        directories: directories with the source files.
+
+    Returns:
+        version string.
+    """
+    try:
+        version = metadata.version("moduslam")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+
+    digest = hashlib.sha256()
+    for directory in directories:
+        for file in sorted(directory.rglob("*.py")):
+            digest.update(file.read_bytes())
+
+    return f"{version}-{digest.hexdigest()[:16]}"
+
+
+def create_key(configs: Iterable[Any], version: str | None = None) -> str:
+    """Creates the key of the log.
+
+    Args:
+        configs: configurations (dataclasses or OmegaConf objects) of the dataset and
+            the handlers.
+
+        version: version of the handlers code (current version by default).
+
+    Returns:
+        key.
+    """
+    digest = hashlib.sha256()
+    for config in configs:
+        digest.update(OmegaConf.to_yaml(config, sort_keys=True).encode())
+    digest.update((version or code_version()).encode())
+    return digest.hexdigest()[:32]
+
+
+def read_log(file: Path, key: str) -> dict[ElementKey, bytes]:
+    """Reads the records of the log. A truncated last record is ignored.
+
+    Args:
+        file: log file.
+
+        key: expected key of the log.
+
+    Returns:
+        table of "element key -> pickled measurement" (empty bytes for None).
+
+    Raises:
+        ValidationError: if the file is not a log or its key is different.
+    """
+    records: dict[ElementKey, bytes] = {}
+
+    with file.open("rb") as f:
+        if f.read(len(magic)) != magic or f.read(len(key)).decode(errors="ignore") != key:
+            msg = f"The file {file} is not a measurements log with the key {key}."
+            logger.error(msg)
+            raise ValidationError(msg)
+
+        while True:
+            header = f.read(record_header.size)
+            if len(header) < record_header.size:
+                break
+
+            timestamp, name_length = record_header.unpack(header)
+            name = f.read(name_length)
+            size = f.read(blob_header.size)
+            if len(size) < blob_header.size:
+                break
+
+            blob = f.read(blob_header.unpack(size)[0])
+            if len(blob) < blob_header.unpack(size)[0]:
+                break
+
+            records[(timestamp, name.decode())] = blob
+
+    return records
+
+
+class _Pickler(pickle.Pickler):
+    """Pickles the measurement referring to the elements and the sensors."""
+
+    def persistent_id(self, obj: Any) -> tuple | None:
+        if isinstance(obj, Element):
+            return "element", obj.timestamp, obj.measurement.sensor.name
+        if isinstance(obj, Sensor):
+            return "sensor", obj.name
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+    """Unpickles the measurement binding it to the known elements and sensors."""
+
+    def __init__(self, data: bytes, elements: dict[ElementKey, Element], sensors: dict):
+        super().__init__(io.BytesIO(data))
+        self._elements = elements
+        self._sensors = sensors
+
+    def persistent_load(self, pid: tuple) -> Element | Sensor:
+        try:
+            if pid[0] == "element":
+                return self._elements[(pid[1], pid[2])]
+            return self._sensors[pid[1]]
+        except KeyError:
+            raise ItemNotFoundError(f"Unknown object in the measurements log: {pid}.")
+
+
+class ReplayDispatcher:
+    """Replays the measurements from the log if it exists or records the measurements
+    created by the handlers to a new log otherwise.
+
+    On replay, an element missing in the log invalidates the log: it is removed and the
+    handlers process the data on the next run.
+    """
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher | ConcurrentDispatcher,
+        directory: Path,
+        key: str,
+        history: int = 16,
+    ):
+        """
+        Args:
+            dispatcher: a dispatcher of elements to handlers.
+
+            directory: directory with the logs.
+
+            key: key of the log.
+
+            history: number of recent elements per sensor the replayed measurements
+                can refer to.
+        """
+        self._dispatcher = dispatcher
+        self._key = key
+        self._file = directory / f"{key}.log"
+        self._records: dict[ElementKey, bytes] = {}
+        self._stream: BinaryIO | None = None
+        self._history = history
+        self._recent: dict[str, deque[Element]] = {}
+        self._sensors: dict[str, Sensor] = {}
+        self._replaying = self._file.exists()
+
+        if self._replaying:
+            self._records = read_log(self._file, key)
+            logger.info(f"Replaying {len(self._records)} measurements from {self._file}.")
+        else:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._stream = self._file.with_suffix(".tmp").open("wb")
+            self._stream.write(magic + key.encode())
+            logger.info(f"Recording measurements to {self._file}.")
+
+    @property
+    def replaying(self) -> bool:
+        """Checks if the measurements are replayed from the log."""
+        return self._replaying
+
+    def __enter__(self) -> "ReplayDispatcher":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def measurements(self, data: DataBatch) -> Iterator[Measurement | None]:
+        """Gets the measurements for the elements of the data batch: the first element
+        is removed from the batch right before its measurement (or None) is yielded.
+
+        Args:
+            data: a data batch with elements.
+
+        Yields:
+            new measurement or None for every element.
+        """
+        if self.replaying:
+            yield from self._replay(data)
+        else:
+            yield from self._record(data)
+
+    def close(self) -> None:
+        """Completes the log being recorded."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+            self._file.with_suffix(".tmp").replace(self._file)
+
+    def _replay(self, data: DataBatch) -> Iterator[Measurement | None]:
+        """Yields the measurements from the log.
+
+        Raises:
+            ValidationError: if the log has no valid record for an element.
+        """
+        while not data.empty:
+            element = data.first
+            self._remember(element)
+            key = (element.timestamp, element.measurement.sensor.name)
+
+            try:
+                measurement = self._load(self._records[key])
+            except (KeyError, ItemNotFoundError, pickle.UnpicklingError) as e:
+                self._file.unlink(missing_ok=True)
+                self._records.clear()
+                msg = (
+                    f"No valid measurement in the log {self._file} for the element {key}. "
+                    f"The log has been removed: restart to process the data by the handlers."
+                )
+                logger.error(msg)
+                raise ValidationError(msg) from e
+
+            data.remove_first()
+            yield measurement
+
+    def _record(self, data: DataBatch) -> Iterator[Measurement | None]:
+        """Yields the measurements of the handlers and writes them to the log."""
+        measurements = self._dispatcher.measurements(data)
+
+        while not data.empty:
+            element = data.first
+            measurement = next(measurements)
+
+            if self._stream is not None:
+                try:
+                    self._write(self._stream, element, measurement)
+                except (pickle.PicklingError, TypeError, AttributeError) as e:
+                    logger.warning(
+                        f"The measurement {measurement} can not be recorded: {e}. "
+                        f"The run is not recorded."
+                    )
+                    self._discard()
+
+            yield measurement
+
+    def _load(self, blob: bytes) -> Measurement | None:
+        """Unpickles the measurement."""
+        if not blob:
+            return None
+        return _Unpickler(blob, self._elements(), self._sensors).load()
+
+    def _write(self, stream: BinaryIO, element: Element, measurement: Measurement | None) -> None:
+        """Writes the record of the element.
+
+        Raises:
+            PicklingError, TypeError, AttributeError: if the measurement can not be pickled.
+        """
+        buffer = io.BytesIO()
+        if measurement is not None:
+            _Pickler(buffer, pickle.HIGHEST_PROTOCOL).dump(measurement)
+
+        name = element.measurement.sensor.name.encode()
+        blob = buffer.getvalue()
+        stream.write(record_header.pack(element.timestamp, len(name)) + name)
+        stream.write(blob_header.pack(len(blob)) + blob)
+
+    def _discard(self) -> None:
+        """Stops recording and removes the incomplete log."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+            self._file.with_suffix(".tmp").unlink(missing_ok=True)
+
+    def _remember(self, element: Element) -> None:
+        """Keeps the element and its sensor for the measurements to refer to."""
+        sensor = element.measurement.sensor
+        self._sensors[sensor.name] = sensor
+        recent = self._recent.setdefault(sensor.name, deque(maxlen=self._history))
+        recent.append(element)
+
+    def _elements(self) -> dict[ElementKey, Element]:
+        """Recent elements."""
+        return {
+            (element.timestamp, name): element
+            for name, elements in self._recent.items()
+            for element in elements
+        }
@@ -1,6 +1,5 @@
 """Computes the Relative Pose Error (RPE) between two trajectories using EVO package."""
 
-import csv
 from pathlib import Path
 
 import numpy as np
@@ -10,8 +9,12 @@ from evo.tools import plot
 from matplotlib import pyplot as plt
 
 from moduslam.custom_types.aliases import Matrix4x4
+from moduslam.external.metrics.evo.evaluation import (
+    evaluate_ape,
+    evaluate_rpe,
+    load_gt_array,
+)
 from moduslam.map_manager.trajectory import Trajectory, load_trajectory_from_txt
-from moduslam.utils.auxiliary_methods import str_to_float, str_to_int
 
 
 def sync_trajectories(traj1: PoseTrajectory3D, traj2: PoseTrajectory3D, max_time_diff: float):
@@ -40,23 +43,8 @@ def load_kaist_gt_trajectory(file_path: Path) -> Trajectory:
     Returns:
         timestamps with SE(3) poses.
     """
-    trajectory = []
-
-    with file_path.open("r") as f:
-        reader = csv.reader(f)
-        for row in reader:
-            timestamp = str_to_int(row[0])
-            values = list(map(str_to_float, row[1:]))
-
-            matrix = (
-                (values[0], values[1], values[2], values[3]),
-                (values[4], values[5], values[6], values[7]),
-                (values[8], values[9], values[10], values[11]),
-                (0.0, 0.0, 0.0, 1.0),
-            )
-            trajectory.append((timestamp, matrix))
-
-    return trajectory
+    timestamps, poses = load_gt_array(file_path)
+    return [(int(t), pose) for t, pose in zip(timestamps, poses)]
 
 
 def convert_to_evo_trajectory(traj: Trajectory) -> PoseTrajectory3D:
@@ -92,10 +80,10 @@ def load_and_sync_trajectories(
     Returns:
         reference & estimated trajectories.
     """
-    ref = load_kaist_gt_trajectory(file1)
+    timestamps, poses = load_gt_array(file1)
     est = load_trajectory_from_txt(file2)
 
-    ref_evo = convert_to_evo_trajectory(ref)
+    ref_evo = PoseTrajectory3D(timestamps=timestamps.astype(np.float64), poses_se3=poses)
     est_evo = convert_to_evo_trajectory(est)
 
     time_diff = est_evo.timestamps[-1] - est_evo.timestamps[0]
@@ -104,7 +92,13 @@ def load_and_sync_trajectories(
 
 
 def get_rpe(
-    ref: PoseTrajectory3D, est: PoseTrajectory3D, component: metrics.PoseRelation
+    ref: PoseTrajectory3D,
+    est: PoseTrajectory3D,
+    component: metrics.PoseRelation,
+    delta: float = 1,
+    delta_unit: metrics.Unit = metrics.Unit.frames,
+    all_pairs: bool = True,
+    exact: bool = False,
 ) -> dict[str, float]:
     """Computes Relative Pose Error.
 
@@ -115,17 +109,25 @@ def get_rpe(
 
         component: component of RPE.
 
+        delta: delta between the poses of a pair.
+
+        delta_unit: unit of the delta: frames, meters or seconds.
+
+        all_pairs: use all pairs instead of consecutive pairs.
+
+        exact: compute with EVO instead of the vectorized implementation.
+
     Returns:
         statistics.
     """
-    rpe_metric = metrics.RPE(pose_relation=component, all_pairs=True)
-    rpe_metric.process_data((ref, est))
-    stats = rpe_metric.get_all_statistics()
-    return stats
+    return evaluate_rpe(ref, est, component, delta, delta_unit, all_pairs, exact=exact)
 
 
 def get_ape(
-    ref: PoseTrajectory3D, est: PoseTrajectory3D, component: metrics.PoseRelation
+    ref: PoseTrajectory3D,
+    est: PoseTrajectory3D,
+    component: metrics.PoseRelation,
+    exact: bool = False,
 ) -> dict[str, float]:
     """Computes Absolute Pose Error.
 
@@ -136,13 +138,12 @@ def get_ape(
 
         component: component of APE.
 
+        exact: compute with EVO instead of the vectorized implementation.
+
     Returns:
         statistics.
     """
-    ape_metric = metrics.APE(pose_relation=component)
-    ape_metric.process_data((ref, est))
-    stats = ape_metric.get_all_statistics()
-    return stats
+    return evaluate_ape(ref, est, component, exact)
 
 
 def plot_trajectories_3d(ref_traj: PoseTrajectory3D, est_traj: PoseTrajectory3D):
@@ -0,0 +1,428 @@
+"""Vectorized trajectory evaluation: APE and RPE of SE(3) pose arrays in O(N).
+
+The errors follow the definitions of the EVO package: APE uses E = inv(est) @ ref,
+RPE uses E = inv(inv(ref_i) @ ref_j) @ inv(est_i) @ est_j. Pose pairs for RPE are
+selected by a delta in frames, meters of the path or seconds. Poses are
+processed in chunks to bound the memory of very long trajectories.
+
+Set exact=True to compute the errors with EVO itself.
+"""
+
+from pathlib import Path
+
+import numpy as np
+from evo.core import metrics
+from evo.core.metrics import PoseRelation, Unit
+from evo.core.trajectory import PoseTrajectory3D
+from scipy.spatial.transform import Rotation
+
+from moduslam.custom_types.numpy import VectorN
+
+default_chunk_size = 65536
+
+
+def load_gt_array(file_path: Path, cache_dir: Path | None = None) -> tuple[VectorN, np.ndarray]:
+    """Loads the ground truth trajectory from a .csv file of the Kaist Urban dataset.
+
+    The parsed arrays are cached in a binary .npz file, which is reused until the
+    modification time or the size of the .csv file changes.
+
+    Args:
+        file_path: a Path to the .csv file with rows: timestamp, 12 values of [3x4] pose.
+
+        cache_dir: a directory for the cache file (the directory of the .csv by default).
+
+    Returns:
+        timestamps [N] (int64), SE(3) poses [N, 4, 4].
+    """
+    cache_file = (cache_dir or file_path.parent) / f"{file_path.name}.npz"
+    stat = file_path.stat()
+    signature = np.array([stat.st_mtime_ns, stat.st_size], dtype=np.int64)
+
+    if cache_file.exists():
+        with np.load(cache_file) as cache:
+            if np.array_equal(cache["signature"], signature):
+                return cache["timestamps"], cache["poses"]
+
+    timestamps = np.loadtxt(file_path, delimiter=",", dtype=np.int64, usecols=0, ndmin=1)
+    values = np.loadtxt(file_path, delimiter=",", usecols=range(1, 13), ndmin=2)
+
+    poses = np.tile(np.eye(4), (len(timestamps), 1, 1))
+    poses[:, :3, :] = values.reshape(-1, 3, 4)
+
+    try:
+        with cache_file.open("wb") as f:
+            np.savez(f, timestamps=timestamps, poses=poses, signature=signature)
+    except OSError:
+        pass  # read-only dataset directory: the trajectory is parsed every time.
+
+    return timestamps, poses
+
+
+def inverse(poses: np.ndarray) -> np.ndarray:
+    """Inverts SE(3) poses.
+
+    Args:
+        poses: SE(3) poses [N, 4, 4].
+
+    Returns:
+        inverted poses [N, 4, 4].
+    """
+    rotations = np.transpose(poses[:, :3, :3], (0, 2, 1))
+    result = np.tile(np.eye(4), (poses.shape[0], 1, 1))
+    result[:, :3, :3] = rotations
+    result[:, :3, 3] = -np.einsum("nij,nj->ni", rotations, poses[:, :3, 3])
+    return result
+
+
+def relation_errors(errors: np.ndarray, relation: PoseRelation) -> VectorN:
+    """Computes scalar errors of the error poses for the pose relation.
+
+    Args:
+        errors: SE(3) error poses [N, 4, 4].
+
+        relation: a pose relation.
+
+    Returns:
+        errors [N].
+
+    Raises:
+        ValueError: if the pose relation is not supported.
+    """
+    if relation == PoseRelation.translation_part:
+        return np.linalg.norm(errors[:, :3, 3], axis=1)
+
+    if relation == PoseRelation.rotation_part:
+        return np.linalg.norm(errors[:, :3, :3] - np.eye(3), axis=(1, 2))
+
+    if relation == PoseRelation.full_transformation:
+        return np.linalg.norm(errors - np.eye(4), axis=(1, 2))
+
+    if relation in (PoseRelation.rotation_angle_rad, PoseRelation.rotation_angle_deg):
+        if errors.shape[0] == 0:
+            return np.empty(0)
+        angles = Rotation.from_matrix(errors[:, :3, :3]).magnitude()
+        return np.rad2deg(angles) if relation == PoseRelation.rotation_angle_deg else angles
+
+    raise ValueError(f"Unsupported pose relation: {relation}.")
+
+
+def compute_ape(
+    ref: np.ndarray,
+    est: np.ndarray,
+    relation: PoseRelation,
+    chunk_size: int = default_chunk_size,
+) -> VectorN:
+    """Computes Absolute Pose Errors of synchronized trajectories.
+
+    Args:
+        ref: reference SE(3) poses [N, 4, 4].
+
+        est: estimated SE(3) poses [N, 4, 4].
+
+        relation: a pose relation.
+
+        chunk_size: max number of poses processed at once.
+
+    Returns:
+        errors [N].
+
+    Raises:
+        ValueError: if the trajectories have different number of poses.
+    """
+    if len(ref) != len(est):
+        raise ValueError("Trajectories must have the same number of poses.")
+
+    if relation == PoseRelation.translation_part:
+        return np.linalg.norm(est[:, :3, 3] - ref[:, :3, 3], axis=1)
+
+    errors = [np.empty(0)]
+
+    for start in range(0, len(ref), chunk_size):
+        stop = start + chunk_size
+        error_poses = inverse(est[start:stop]) @ ref[start:stop]
+        errors.append(relation_errors(error_poses, relation))
+
+    return np.concatenate(errors)
+
+
+def get_pairs(
+    poses: np.ndarray,
+    timestamps: VectorN,
+    delta: float,
+    unit: Unit,
+    all_pairs: bool = False,
+    rel_tol: float = 0.1,
+) -> tuple[VectorN, VectorN]:
+    """Selects pose pairs with the given delta as EVO does, in O(N log N).
+
+    Consecutive pairs start where the previous pair ends; with all_pairs every pose
+    starts a pair: the end pose is the closest to the delta within the tolerance.
+
+    Args:
+        poses: SE(3) poses [N, 4, 4] to select the pairs on.
+
+        timestamps: timestamps of the poses [N] in nanoseconds (as in the trajectories
+            created by convert_to_evo_trajectory()).
+
+        delta: delta between the poses of a pair.
+
+        unit: unit of the delta: frames, meters (of the path) or seconds.
+
+        all_pairs: use all pairs instead of consecutive pairs.
+
+        rel_tol: relative tolerance of the delta for all pairs.
+
+    Returns:
+        indices of the first and the second poses of the pairs.
+
+    Raises:
+        ValueError: if the unit is not supported or no pairs are found.
+    """
+    if unit == Unit.frames:
+        first, second = index_pairs(len(poses), int(delta), all_pairs)
+    elif unit in (Unit.meters, Unit.seconds):
+        if unit == Unit.meters:
+            steps = np.linalg.norm(poses[:-1, :3, 3] - poses[1:, :3, 3], axis=1)
+            values = np.concatenate(([0.0], np.cumsum(steps)))
+        else:
+            values = (np.asarray(timestamps) - timestamps[0]) * 1e-9
+
+        if all_pairs:
+            first, second = closest_pairs(values, delta, delta * rel_tol)
+        else:
+            first, second = consecutive_pairs(values, delta)
+    else:
+        raise ValueError(f"Unsupported delta unit: {unit}.")
+
+    if len(first) == 0:
+        raise ValueError(f"delta = {delta} ({unit.value}) produced no pairs.")
+
+    return first, second
+
+
+def index_pairs(num: int, step: int, all_pairs: bool) -> tuple[VectorN, VectorN]:
+    """Selects pairs of indices with the given step.
+
+    Args:
+        num: number of poses.
+
+        step: index distance between the poses of a pair.
+
+        all_pairs: every pose starts a pair, otherwise the pairs are consecutive.
+
+    Returns:
+        indices of the first and the second poses of the pairs.
+    """
+    if all_pairs:
+        first = np.arange(max(num - step, 0))
+        return first, first + step
+
+    ids = np.arange(0, num, step)
+    return ids[:-1], ids[1:]
+
+
+def consecutive_pairs(values: VectorN, delta: float) -> tuple[VectorN, VectorN]:
+    """Selects consecutive pairs: the pair ends at the first value not less than the
+    start value + delta, and the next pair starts there.
+
+    Args:
+        values: non-decreasing values [N] (path length or time).
+
+        delta: delta between the values of a pair.
+
+    Returns:
+        indices of the first and the second elements of the pairs.
+    """
+    ids = [0]
+
+    while True:
+        i = ids[-1]
+        j = int(np.searchsorted(values, values[i] + delta, side="left"))
+        j = max(j, i + 1)
+        if j >= len(values):
+            break
+        ids.append(j)
+
+    array = np.array(ids)
+    return array[:-1], array[1:]
+
+
+def closest_pairs(values: VectorN, delta: float, tol: float) -> tuple[VectorN, VectorN]:
+    """Selects a pair for every element: the second element is the first one with the
+    value closest to the value of the first element + delta.
+
+    Args:
+        values: non-decreasing values [N] (path length or time).
+
+        delta: delta between the values of a pair.
+
+        tol: absolute tolerance of the delta.
+
+    Returns:
+        indices of the first and the second elements of the pairs.
+    """
+    num = len(values)
+    first = np.arange(num - 1)
+
+    if num < 2:
+        return first, first
+
+    last = num - 1
+    upper = np.searchsorted(values, values[:-1] + delta, side="left").clip(first + 1, last)
+    lower = (upper - 1).clip(first + 1, last)
+    lower = np.maximum(np.searchsorted(values, values[lower], side="left"), first + 1)
+
+    error_upper = np.abs(values[upper] - values[first] - delta)
+    error_lower = np.abs(values[lower] - values[first] - delta)
+    second = np.where(error_lower <= error_upper, lower, upper)
+    valid = np.minimum(error_lower, error_upper) <= tol
+
+    return first[valid], second[valid]
+
+
+def compute_rpe(
+    ref: np.ndarray,
+    est: np.ndarray,
+    pairs: tuple[VectorN, VectorN],
+    relation: PoseRelation,
+    chunk_size: int = default_chunk_size,
+) -> VectorN:
+    """Computes Relative Pose Errors of synchronized trajectories for the pose pairs.
+
+    Args:
+        ref: reference SE(3) poses [N, 4, 4].
+
+        est: estimated SE(3) poses [N, 4, 4].
+
+        pairs: indices of the first and the second poses of the pairs.
+
+        relation: a pose relation.
+
+        chunk_size: max number of pairs processed at once.
+
+    Returns:
+        errors [M] for M pairs.
+
+    Raises:
+        ValueError: if the trajectories have different number of poses.
+    """
+    if len(ref) != len(est):
+        raise ValueError("Trajectories must have the same number of poses.")
+
+    first, second = pairs
+    errors = [np.empty(0)]
+
+    for start in range(0, len(first), chunk_size):
+        i, j = first[start : start + chunk_size], second[start : start + chunk_size]
+        ref_relative = inverse(ref[i]) @ ref[j]
+        est_relative = inverse(est[i]) @ est[j]
+        errors.append(relation_errors(inverse(ref_relative) @ est_relative, relation))
+
+    return np.concatenate(errors)
+
+
+def get_statistics(errors: VectorN) -> dict[str, float]:
+    """Computes statistics of the errors as EVO does.
+
+    Args:
+        errors: errors [N].
+
+    Returns:
+        rmse, mean, median, std, min, max, sse.
+    """
+    squared = np.power(errors, 2)
+    return {
+        "rmse": float(np.sqrt(np.mean(squared))),
+        "mean": float(np.mean(errors)),
+        "median": float(np.median(errors)),
+        "std": float(np.std(errors)),
+        "min": float(np.min(errors)),
+        "max": float(np.max(errors)),
+        "sse": float(np.sum(squared)),
+    }
+
+
+def evaluate_ape(
+    ref: PoseTrajectory3D,
+    est: PoseTrajectory3D,
+    relation: PoseRelation,
+    exact: bool = False,
+    chunk_size: int = default_chunk_size,
+) -> dict[str, float]:
+    """Computes statistics of Absolute Pose Error.
+
+    Args:
+        ref: reference trajectory.
+
+        est: estimated trajectory synchronized with the reference.
+
+        relation: a pose relation.
+
+        exact: compute with EVO.
+
+        chunk_size: max number of poses processed at once.
+
+    Returns:
+        statistics.
+    """
+    if exact:
+        ape_metric = metrics.APE(pose_relation=relation)
+        ape_metric.process_data((ref, est))
+        return ape_metric.get_all_statistics()
+
+    ref_poses, est_poses = np.asarray(ref.poses_se3), np.asarray(est.poses_se3)
+    return get_statistics(compute_ape(ref_poses, est_poses, relation, chunk_size))
+
+
+def evaluate_rpe(
+    ref: PoseTrajectory3D,
+    est: PoseTrajectory3D,
+    relation: PoseRelation,
+    delta: float = 1,
+    unit: Unit = Unit.frames,
+    all_pairs: bool = False,
+    pairs_from_reference: bool = False,
+    exact: bool = False,
+    chunk_size: int = default_chunk_size,
+) -> dict[str, float]:
+    """Computes statistics of Relative Pose Error.
+
+    Args:
+        ref: reference trajectory.
+
+        est: estimated trajectory synchronized with the reference.
+
+        relation: a pose relation.
+
+        delta: delta between the poses of a pair.
+
+        unit: unit of the delta: frames, meters or seconds (not supported by EVO).
+
+        all_pairs: use all pairs instead of consecutive pairs.
+
+        pairs_from_reference: select the pairs on the reference trajectory instead of
+            the estimated one.
+
+        exact: compute with EVO.
+
+        chunk_size: max number of pairs processed at once.
+
+    Returns:
+        statistics.
+    """
+    if exact:
+        rpe_metric = metrics.RPE(
+            relation,
+            delta,
+            unit,
+            all_pairs=all_pairs,
+            pairs_from_reference=pairs_from_reference,
+        )
+        rpe_metric.process_data((ref, est))
+        return rpe_metric.get_all_statistics()
+
+    ref_poses, est_poses = np.asarray(ref.poses_se3), np.asarray(est.poses_se3)
+    pair_poses = ref_poses if pairs_from_reference else est_poses
+    pairs = get_pairs(pair_poses, np.asarray(ref.timestamps), delta, unit, all_pairs)
+    return get_statistics(compute_rpe(ref_poses, est_poses, pairs, relation, chunk_size))
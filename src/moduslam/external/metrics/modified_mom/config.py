@@ -23,6 +23,10 @@ class BaseConfig:
 
     orthogonality_trh: float, default=1e-1
         Threshold for dot-product of 2 vectors.
+
+    map_resolution: float, default=0
+        Voxel size of the aggregated map relative to knn_rad: one point per voxel is kept.
+        0 keeps all points.
     """
 
     knn_rad: float = 1.0
@@ -30,6 +34,7 @@ class BaseConfig:
     max_nn: int = 20
     eigen_scale: float = 100.0
     orthogonality_trh: float = 0.01
+    map_resolution: float = 0.0
 
 
 @dataclass
@@ -73,3 +78,48 @@ class HdbscanConfig:
     alpha: float = 1.2
     cluster_selection_epsilon: float = 0.1
     min_cluster_size: int = 3
+
+
+@dataclass
+class RansacConfig:
+    """Config for multi-plane RANSAC.
+
+    distance_threshold: float, default=0.1
+        Max distance from a point to the plane for the point to be an inlier.
+        The value is given in meters.
+
+    normal_threshold: float, default=0.9
+        Min absolute cosine between the normal of an inlier and the plane normal.
+
+    max_iterations: int, default=2000
+        Max number of hypotheses for one plane.
+
+    confidence: float, default=0.999
+        Probability of sampling at least one all-inlier hypothesis: defines the
+        number of hypotheses by the inlier ratio of the best plane (early termination).
+
+    num_score_points: int, default=20000
+        Number of randomly chosen points to score the hypotheses on.
+
+    max_batch_elements: int, default=4194304
+        Max number of point-hypothesis distances evaluated at once.
+
+    min_plane_points: int, default=50
+        Min number of inliers of a plane: the detection stops at the first smaller plane.
+
+    max_planes: int, default=20
+        Max number of planes to detect.
+
+    seed: int, default=0
+        Seed of the random generator.
+    """
+
+    distance_threshold: float = 0.1
+    normal_threshold: float = 0.9
+    max_iterations: int = 2000
+    confidence: float = 0.999
+    num_score_points: int = 20000
+    max_batch_elements: int = 2**22
+    min_plane_points: int = 50
+    max_planes: int = 20
+    seed: int = 0
@@ -0,0 +1,111 @@
+"""Aggregation of point clouds into a contiguous map array.
+
+The points are written into a preallocated buffer. With a positive voxel size, only
+the first point of every voxel is kept: points closer than the neighbourhood radius of
+the metrics are redundant for them.
+"""
+
+import numpy as np
+
+from moduslam.custom_types.numpy import Matrix4x4, MatrixNx3
+
+
+class MapAggregator:
+    """Preallocated map of points with optional voxel deduplication.
+
+    Voxels are identified by packed integer keys (21 bits per axis) kept in a sorted
+    array.
+    """
+
+    _bits: int = 21
+    _bias: int = 1 << (_bits - 1)
+
+    def __init__(self, capacity: int = 0, voxel_size: float = 0.0):
+        """
+        Args:
+            capacity: number of points to preallocate.
+
+            voxel_size: size of the voxel [m]: one point per voxel is kept; 0 keeps all
+                points.
+        """
+        self._buffer = np.empty((capacity, 3), dtype=np.float64)
+        self._size = 0
+        self._voxel_size = voxel_size
+        self._keys = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def points(self) -> MatrixNx3:
+        """Read-only contiguous view of the aggregated points [N, 3]."""
+        view = self._buffer[: self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def voxel_size(self) -> float:
+        """Size of the voxel [m] (0 if the points are not deduplicated)."""
+        return self._voxel_size
+
+    def reserve(self, capacity: int) -> None:
+        """Grows the buffer to hold at least the given number of points.
+
+        Args:
+            capacity: number of points.
+        """
+        if capacity <= self._buffer.shape[0]:
+            return
+
+        buffer = np.empty((capacity, 3), dtype=np.float64)
+        buffer[: self._size] = self._buffer[: self._size]
+        self._buffer = buffer
+
+    def add(self, points: MatrixNx3, tf: Matrix4x4 | None = None) -> None:
+        """Adds the points to the map.
+
+        Args:
+            points: points [N, 3].
+
+            tf: SE(3) transformation to apply to the points.
+
+        Raises:
+            ValueError: if a point is too far to be packed into a voxel key.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+
+        if tf is not None:
+            tf = np.asarray(tf)
+            points = points @ tf[:3, :3].T + tf[:3, 3]
+
+        if self._voxel_size > 0:
+            points = self._select_new(points)
+
+        num = points.shape[0]
+        if self._size + num > self._buffer.shape[0]:
+            self.reserve(max(self._size + num, 2 * self._buffer.shape[0]))
+
+        self._buffer[self._size : self._size + num] = points
+        self._size += num
+
+    def clear(self) -> None:
+        """Removes all points keeping the buffer."""
+        self._size = 0
+        self._keys = np.empty(0, dtype=np.int64)
+
+    def _select_new(self, points: MatrixNx3) -> MatrixNx3:
+        """Selects the first point of every voxel not occupied yet and occupies them."""
+        voxels = np.floor(points / self._voxel_size).astype(np.int64) + self._bias
+
+        if np.any(voxels < 0) or np.any(voxels >= 1 << self._bits):
+            raise ValueError("The point is too far from the origin for the voxel size.")
+
+        keys = (voxels[:, 0] << (2 * self._bits)) | (voxels[:, 1] << self._bits) | voxels[:, 2]
+        keys, first = np.unique(keys, return_index=True)
+
+        positions = np.searchsorted(self._keys, keys)
+        occupied = positions < len(self._keys)
+        occupied[occupied] = self._keys[positions[occupied]] == keys[occupied]
+
+        self._keys = np.insert(self._keys, positions[~occupied], keys[~occupied])
+        return points[np.sort(first[~occupied])]
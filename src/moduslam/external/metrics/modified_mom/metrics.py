@@ -1,22 +1,28 @@
 """TODO: add tests"""
 
-import concurrent.futures
 from collections.abc import Callable, Iterable
 from typing import TypeAlias
 
 import numpy as np
 import open3d as o3d
-from sklearn.neighbors import NearestNeighbors
 
-from moduslam.custom_types.numpy import Matrix4x4, MatrixNx3
-from moduslam.external.metrics.modified_mom.config import BaseConfig, HdbscanConfig
+from moduslam.custom_types.numpy import Matrix4x4, MatrixNx3, VectorN
+from moduslam.external.metrics.modified_mom import ransac_planes
+from moduslam.external.metrics.modified_mom.config import (
+    BaseConfig,
+    HdbscanConfig,
+    RansacConfig,
+)
 from moduslam.external.metrics.modified_mom.hdbscan_planes import (
     extract_orthogonal_subsets,
 )
+from moduslam.external.metrics.modified_mom.spatial_index import (
+    MetricsContext,
+    entropies,
+    plane_variances,
+)
 from moduslam.external.metrics.modified_mom.utils import (
     aggregate_map,
-    compute_entropy,
-    compute_plane_variance,
     compute_variances,
 )
 from moduslam.external.metrics.utils import median
@@ -24,12 +30,38 @@ from moduslam.external.metrics.utils import median
 Cloud: TypeAlias = o3d.geometry.PointCloud
 
 
+def create_context(
+    pcs: list[Cloud],
+    ts: list[Matrix4x4],
+    config: BaseConfig = BaseConfig(),
+    backend: str = "sklearn",
+) -> MetricsContext:
+    """Aggregates the map and creates the context to share its spatial index between
+    the metrics.
+
+    Args:
+        pcs: point clouds obtained from sensors.
+
+        ts: transformation matrices (i.e., Point Cloud poses).
+
+        config: scene hyperparameters: the map resolution is defined by the radius.
+
+        backend: spatial index: "sklearn", "kdtree" or "voxel".
+
+    Returns:
+        metrics context.
+    """
+    points = aggregate_map(pcs, ts, config.knn_rad * config.map_resolution)
+    return MetricsContext(points, backend)
+
+
 def mom(
     clouds: list[Cloud],
     ts: list[Matrix4x4],
     mom_config: BaseConfig,
-    plane_detection_config: HdbscanConfig,
+    plane_detection_config: HdbscanConfig | RansacConfig,
     subsets: Iterable[MatrixNx3] | None = None,
+    context: MetricsContext | None = None,
 ):
     """Mutually Orthogonal Metric.
     https://www.researchgate.net/publication/352572583_Be_your_own_Benchmark_No-Reference_Trajectory_Metric_on_Registered_Point_Clouds
@@ -41,48 +73,47 @@ def mom(
 
         mom_config: parameters for MOM metric.
 
-        plane_detection_config: parameters for plane detection algorithm.
+        plane_detection_config: parameters for plane detection algorithm: HDBSCAN of
+            normals or multi-plane RANSAC.
 
         subsets: mutually orthogonal subsets.
 
+        context: a context with the map of the clouds (created if not given).
+
     Returns:
         MOM value.
 
     TODO: add tests.
     """
-    orth_axes_stats = []
-
-    pc_map = aggregate_map(clouds, ts)
-    points = np.asarray(pc_map.points)
-    nn_model = NearestNeighbors(radius=mom_config.knn_rad)
-    nn_model.fit(points)
+    context = context or create_context(clouds, ts, mom_config)
 
     if subsets:
         orth_clouds = subsets
     else:
-        pcd = median(clouds)
-        orth_clouds = extract_orthogonal_subsets(pcd, mom_config, plane_detection_config)
+        tf = np.linalg.inv(ts[0]) @ median(ts)
+        pcd = Cloud(median(clouds)).transform(tf)
+        if isinstance(plane_detection_config, RansacConfig):
+            orth_clouds = ransac_planes.extract_orthogonal_subsets(
+                pcd, mom_config, plane_detection_config
+            )
+        else:
+            orth_clouds = extract_orthogonal_subsets(pcd, mom_config, plane_detection_config)
         # orth_clouds = extract_orthogonal_subsets(pcd, eps=0.5)
 
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        futures = [
-            executor.submit(
-                compute_variances,
-                cloud,
-                points,
-                nn_model,
-                mom_config.knn_rad,
-                mom_config.min_knn,
-            )
-            for cloud in orth_clouds
-        ]
-        for future in concurrent.futures.as_completed(futures):
-            orth_axes_stats.append(future.result())
+    orth_axes_stats = [
+        compute_variances(cloud, context, mom_config.knn_rad, mom_config.min_knn)
+        for cloud in orth_clouds
+    ]
 
     return np.sum(orth_axes_stats)
 
 
-def mme(pcs: list[Cloud], ts: list[Matrix4x4], config: BaseConfig = BaseConfig()) -> float:
+def mme(
+    pcs: list[Cloud],
+    ts: list[Matrix4x4],
+    config: BaseConfig = BaseConfig(),
+    context: MetricsContext | None = None,
+) -> float:
     """Mean Map Entropy. A no-reference metric algorithm based on entropy.
 
     Args:
@@ -92,13 +123,20 @@ def mme(pcs: list[Cloud], ts: list[Matrix4x4], config: BaseConfig = BaseConfig()
 
         config: scene hyperparameters.
 
+        context: a context with the map of the clouds (created if not given).
+
     Returns:
         mean of given metric algorithm values.
     """
-    return mean_map_metric(pcs, ts, config, compute_entropy)
+    return mean_map_metric(pcs, ts, config, entropies, context)
 
 
-def mpv(pcs: list[Cloud], ts: list[Matrix4x4], config: BaseConfig = BaseConfig()) -> float:
+def mpv(
+    pcs: list[Cloud],
+    ts: list[Matrix4x4],
+    config: BaseConfig = BaseConfig(),
+    context: MetricsContext | None = None,
+) -> float:
     """Mean Plane Variance. A no-reference metric algorithm based on plane variance.
 
     Args:
@@ -108,19 +146,23 @@ def mpv(pcs: list[Cloud], ts: list[Matrix4x4], config: BaseConfig = BaseConfig()
 
         config: scene hyperparameters
 
+        context: a context with the map of the clouds (created if not given).
+
     Returns:
         mean of given metric algorithm values
     """
-    return mean_map_metric(pcs, ts, config, compute_plane_variance)
+    return mean_map_metric(pcs, ts, config, plane_variances, context)
 
 
 def mean_map_metric(
     pcs: list[Cloud],
     ts: list[Matrix4x4],
     config: BaseConfig,
-    alg: Callable,
+    alg: Callable[[np.ndarray], VectorN],
+    context: MetricsContext | None = None,
 ) -> float:
-    """No-reference metric algorithms' helper.
+    """No-reference metric algorithms' helper: the metric is computed for the
+    neighbourhoods of all map points in batches.
 
     Args:
         pcs: point clouds obtained from sensors.
@@ -129,23 +171,17 @@ def mean_map_metric(
 
         config: scene hyperparameters.
 
-        alg: metric algorithm basis (e.g., plane variance, entropy)
+        alg: metric algorithm basis for [M, 3, 3] covariance matrices
+            (e.g., plane variance, entropy).
+
+        context: a context with the map of the clouds (created if not given).
 
     Returns:
         mean of given metric algorithm values.
     """
-    pc_map = aggregate_map(pcs, ts)
-
-    map_tree = o3d.geometry.KDTreeFlann(pc_map)
-    points = np.asarray(pc_map.points)
-    metric = []
-    for i in range(points.shape[0]):
-        point = points[i]
-        _, idx, _ = map_tree.search_radius_vector_3d(point, config.knn_rad)
-        if len(idx) > config.min_knn:
-            metric_value = alg(points[idx])
-            if metric_value is not None:
-                metric.append(metric_value)
-
-    result = 0.0 if len(metric) == 0 else np.mean(metric)
+    context = context or create_context(pcs, ts, config)
+    covariances = context.covariances(context.points, config.knn_rad, config.min_knn)
+    metric = alg(covariances)
+
+    result = 0.0 if len(metric) == 0 else float(np.mean(metric))
     return result
@@ -1,3 +1,9 @@
+"""Multi-plane RANSAC on CPU with NumPy.
+
+Plane hypotheses are sampled and scored in vectorized batches. The number of hypotheses
+adapts to the inlier ratio of the best plane found so far.
+"""
+
 from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TypeAlias
@@ -5,10 +11,10 @@ from typing import TypeAlias
 import networkx as nx
 import numpy as np
 import open3d as o3d
-import torch
-from torch_ransac3d.plane import plane_fit
 
-from moduslam.custom_types.numpy import MatrixNx3
+from moduslam.custom_types.numpy import MatrixNx3, VectorN
+from moduslam.external.metrics.modified_mom.config import BaseConfig, RansacConfig
+from moduslam.external.metrics.modified_mom.utils import estimate_normals
 
 Cloud: TypeAlias = o3d.geometry.PointCloud
 
@@ -21,90 +27,204 @@ class PlaneWithPoints:
     points: MatrixNx3
 
 
+def required_iterations(inlier_ratio: float, confidence: float) -> int:
+    """Computes the number of hypotheses to sample at least one all-inlier hypothesis
+    with the given confidence.
+
+    Args:
+        inlier_ratio: ratio of inliers in the cloud.
+
+        confidence: probability of success.
+
+    Returns:
+        number of hypotheses.
+    """
+    probability = inlier_ratio**3
+
+    if probability <= 0.0:
+        return np.iinfo(np.int64).max
+    if probability >= 1.0:
+        return 1
+
+    return int(np.ceil(np.log(1.0 - confidence) / np.log(1.0 - probability)))
+
+
+def sample_planes(cloud: MatrixNx3, num: int, rng: np.random.Generator) -> np.ndarray:
+    """Samples plane hypotheses from random point triplets.
+
+    Args:
+        cloud: a 3D point cloud [N, 3].
+
+        num: number of hypotheses.
+
+        rng: random generator.
+
+    Returns:
+        plane coefficients [K, 4] with unit normals (degenerate triplets are dropped).
+    """
+    indices = rng.integers(0, cloud.shape[0], size=(num, 3))
+    p0, p1, p2 = cloud[indices[:, 0]], cloud[indices[:, 1]], cloud[indices[:, 2]]
+
+    normals = np.cross(p1 - p0, p2 - p0)
+    norms = np.linalg.norm(normals, axis=1)
+    valid = norms > 1e-12
+
+    normals = normals[valid] / norms[valid, None]
+    offsets = -np.einsum("ij,ij->i", normals, p0[valid])
+
+    return np.column_stack((normals, offsets))
+
+
+def fit_plane(points: MatrixNx3) -> np.ndarray:
+    """Fits the plane to the points with least squares.
+
+    Args:
+        points: 3D points [N, 3], N >= 3.
+
+    Returns:
+        plane coefficients [4] with a unit normal.
+    """
+    centroid = points.mean(axis=0)
+    _, _, vh = np.linalg.svd(points - centroid, full_matrices=False)
+    normal = vh[-1]
+    return np.append(normal, -normal @ centroid)
+
+
 def detect_plane(
     cloud: MatrixNx3,
-    thresh: float = 0.05,
-    max_iterations: int = 1000,
-    iterations_per_batch: int = 200,
-    epsilon: float = 1e-6,
-    device: torch.device = torch.device("cuda"),
-) -> tuple[tuple[float, float, float, float], MatrixNx3]:
-    """Detects a plane in 3D point cloud using RANSAC.
+    config: RansacConfig,
+    rng: np.random.Generator,
+    normals: MatrixNx3 | None = None,
+) -> tuple[tuple[float, float, float, float], VectorN]:
+    """Detects the plane with the most inliers in 3D point cloud using RANSAC.
+
+    Hypotheses are scored on a random subset of the cloud; the best one is refined with
+    least squares on its inliers in the whole cloud.
 
     Args:
-        cloud: a 3D point cloud.
+        cloud: a 3D point cloud [N, 3], N >= 3.
+
+        config: RANSAC configuration.
+
+        rng: random generator.
+
+        normals: unit normals of the points [N, 3]: an inlier normal must be aligned
+            with the plane normal.
+
+    Returns:
+        coefficients of the plane equation ax + by + cz + d = 0, boolean mask of inliers.
+    """
+    num_points = cloud.shape[0]
+
+    if num_points > config.num_score_points:
+        indices = rng.choice(num_points, config.num_score_points, replace=False)
+    else:
+        indices = np.arange(num_points)
 
-        thresh: a distance threshold for inliers.
+    subset = cloud[indices]
+    subset_normals = normals[indices] if normals is not None else None
+    num_subset = subset.shape[0]
+    batch_size = max(1, config.max_batch_elements // num_subset)
+    homogeneous = np.column_stack((subset, np.ones(num_subset)))
 
-        max_iterations: a maximum number of RANSAC iterations.
+    best_plane = np.zeros(4)
+    best_count = -1
+    iterations, limit = 0, config.max_iterations
 
-        iterations_per_batch: a number of iterations per batch.
+    while iterations < limit:
+        num = min(batch_size, limit - iterations)
+        planes = sample_planes(subset, num, rng)
+        iterations += num
 
-        epsilon: a convergence tolerance for plane fitting.
+        if planes.shape[0] == 0:
+            continue
 
-        device: a device to run the computations on.
+        inliers = np.abs(homogeneous @ planes.T) < config.distance_threshold
+        if subset_normals is not None:
+            inliers &= np.abs(subset_normals @ planes[:, :3].T) > config.normal_threshold
+
+        counts = np.count_nonzero(inliers, axis=0)
+        best = int(np.argmax(counts))
+
+        if counts[best] > best_count:
+            best_count = int(counts[best])
+            best_plane = planes[best]
+            needed = required_iterations(best_count / num_subset, config.confidence)
+            limit = min(config.max_iterations, needed)
+
+    mask = get_inliers(cloud, best_plane, config, normals)
+
+    if np.count_nonzero(mask) >= 3:
+        refined = fit_plane(cloud[mask])
+        refined_mask = get_inliers(cloud, refined, config, normals)
+        if np.count_nonzero(refined_mask) >= np.count_nonzero(mask):
+            best_plane, mask = refined, refined_mask
+
+    a, b, c, d = (float(x) for x in best_plane)
+    return (a, b, c, d), mask
+
+
+def get_inliers(
+    cloud: MatrixNx3, plane: VectorN, config: RansacConfig, normals: MatrixNx3 | None
+) -> VectorN:
+    """Gets inliers of the plane.
+
+    Args:
+        cloud: a 3D point cloud [N, 3].
+
+        plane: plane coefficients [4] with a unit normal.
+
+        config: RANSAC configuration.
+
+        normals: unit normals of the points [N, 3] or None.
 
     Returns:
-        coefficients of the plane equation ax + by + cz + d = 0, inliers point coordinates.
+        boolean mask of inliers.
     """
-    tensor = torch.from_numpy(cloud).to(device)
-
-    equation, inliers = plane_fit(
-        pts=tensor,
-        thresh=thresh,
-        max_iterations=max_iterations,
-        iterations_per_batch=iterations_per_batch,
-        epsilon=epsilon,
-        device=device,
-    )
-
-    equation = equation.cpu().numpy()
-    inlier_points = tensor[inliers].cpu().numpy()
+    mask = np.abs(cloud @ plane[:3] + plane[3]) < config.distance_threshold
 
-    coefficients = (equation[0], equation[1], equation[2], equation[3])
+    if normals is not None:
+        mask &= np.abs(normals @ plane[:3]) > config.normal_threshold
 
-    return coefficients, inlier_points
+    return mask
 
 
 def detect_multiple_planes(
-    cloud: MatrixNx3,
-    thresh: float = 0.025,
-    max_iterations: int = 7000,
-    iterations_per_batch: int = 1000,
+    cloud: MatrixNx3, config: RansacConfig, normals: MatrixNx3 | None = None
 ) -> list[PlaneWithPoints]:
-    """Detects multiple planes in 3D point cloud using RANSAC.
+    """Detects multiple planes in 3D point cloud using iterative RANSAC: the inliers of
+    the detected plane are removed from the cloud before detecting the next one.
 
     Args:
-        cloud: a 3D point cloud.
-
-        thresh: a distance threshold for inliers.
+        cloud: a 3D point cloud [N, 3].
 
-        max_iterations: a maximum number of RANSAC iterations.
+        config: RANSAC configuration.
 
-        iterations_per_batch: a number of iterations per batch.
+        normals: unit normals of the points [N, 3]: an inlier normal must be aligned
+            with the plane normal.
 
     Returns:
-        list of tuples with coefficients of the plane equation ax + by + cz + d = 0
+        planes with coefficients of the plane equation ax + by + cz + d = 0
         and inliers point coordinates.
     """
-    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-    result = []
+    rng = np.random.default_rng(config.seed)
+    remaining = np.asarray(cloud, dtype=np.float64)
+    remaining_normals = np.asarray(normals, dtype=np.float64) if normals is not None else None
+    result: list[PlaneWithPoints] = []
 
-    while cloud.shape[0] >= 3:
-        coefficients, inlier_points = detect_plane(
-            cloud,
-            thresh=thresh,
-            max_iterations=max_iterations,
-            iterations_per_batch=iterations_per_batch,
-            device=device,
-        )
+    while remaining.shape[0] >= max(3, config.min_plane_points):
+        if len(result) >= config.max_planes:
+            break
 
-        plane_with_points = PlaneWithPoints(coefficients, inlier_points)
+        coefficients, mask = detect_plane(remaining, config, rng, remaining_normals)
 
-        result.append(plane_with_points)
+        if np.count_nonzero(mask) < config.min_plane_points:
+            break
 
-        inlier_indices = np.isin(cloud, inlier_points).all(axis=1)
-        cloud = cloud[~inlier_indices]
+        result.append(PlaneWithPoints(coefficients, remaining[mask]))
+        remaining = remaining[~mask]
+        if remaining_normals is not None:
+            remaining_normals = remaining_normals[~mask]
 
     return result
 
@@ -146,22 +266,39 @@ def find_max_clique(planes_with_points: Sequence[PlaneWithPoints], eps: float =
     return cliques[max_ind]
 
 
-def extract_orthogonal_subsets(pcd: Cloud, eps: float = 1e-1) -> list[MatrixNx3]:
-    """Extracts point clouds which mean norman vectors are mutually orthogonal.
+def extract_orthogonal_subsets(
+    pc: Cloud, normals_config: BaseConfig, ransac_config: RansacConfig
+) -> list[MatrixNx3]:
+    """Extracts point clouds of planes which normal vectors are mutually orthogonal.
+
+    Has the same interface as hdbscan_planes.extract_orthogonal_subsets: the points
+    with planar neighbourhood are kept as for HDBSCAN, then the planes are detected
+    with RANSAC instead of clustering the normals.
 
     Args:
-        pcd: point cloud.
+        pc: a point cloud.
 
-        eps: orthogonality threshold value.
+        normals_config: a configuration for normals estimation algorithm.
+
+        ransac_config: a configuration for RANSAC.
 
     Returns:
-        orthogonal clouds , normals, clique normals.
+        arrays with orthogonal point clouds.
+
+    Raises:
+        ValueError: if no orthogonal subsets exist.
     """
-    points = np.array(pcd.points)
-    planes_with_points = detect_multiple_planes(points)
+    pc_cut = estimate_normals(
+        pc, normals_config.knn_rad, normals_config.max_nn, normals_config.eigen_scale
+    )
+    points = np.asarray(pc_cut.points)
+    normals = np.asarray(pc_cut.normals)
+
+    planes_with_points = detect_multiple_planes(points, ransac_config, normals)
 
-    max_clique = find_max_clique(planes_with_points, eps=eps)
+    if len(planes_with_points) < 3:
+        raise ValueError("No cliques of size > 2 found.")
 
-    orth_subset = [planes_with_points[i].points for i in max_clique]
+    max_clique = find_max_clique(planes_with_points, eps=normals_config.orthogonality_trh)
 
-    return orth_subset
+    return [planes_with_points[i].points for i in max_clique]
@@ -0,0 +1,290 @@
+"""Spatial indices of point maps and batched neighbourhood statistics for MOM-family
+metrics.
+
+Radius queries return neighbourhoods in the compressed (CSR) form: offsets [Q + 1] and
+flat indices of the map points, so the statistics of all neighbourhoods are computed
+with array operations.
+"""
+
+from typing import Protocol
+
+import numpy as np
+from scipy.spatial import cKDTree
+from sklearn.neighbors import NearestNeighbors
+
+from moduslam.custom_types.numpy import MatrixNx3, VectorN
+
+
+class SpatialIndex(Protocol):
+    """Index for radius queries in a point map."""
+
+    def radius_neighbors(self, queries: MatrixNx3) -> tuple[VectorN, VectorN]:
+        """Finds map points within the radius of every query point.
+
+        Args:
+            queries: query points [Q, 3].
+
+        Returns:
+            offsets [Q + 1] and flat indices of the map points: neighbours of the i-th
+            query are indices[offsets[i] : offsets[i + 1]].
+        """
+
+
+class SklearnIndex:
+    """Radius queries with sklearn NearestNeighbors."""
+
+    def __init__(self, points: MatrixNx3, radius: float):
+        self._radius = radius
+        self._model = NearestNeighbors(radius=radius)
+        self._model.fit(points)
+
+    def radius_neighbors(self, queries: MatrixNx3) -> tuple[VectorN, VectorN]:
+        neighbours = self._model.radius_neighbors(queries, self._radius, return_distance=False)
+        return to_csr(list(neighbours))
+
+
+class KDTreeIndex:
+    """Radius queries with scipy cKDTree."""
+
+    def __init__(self, points: MatrixNx3, radius: float):
+        self._radius = radius
+        self._tree = cKDTree(points)
+
+    def radius_neighbors(self, queries: MatrixNx3) -> tuple[VectorN, VectorN]:
+        neighbours = self._tree.query_ball_point(queries, self._radius, workers=-1)
+        return to_csr(list(neighbours))
+
+
+class VoxelHashIndex:
+    """Radius queries with a voxel hash: the voxel size equals the radius, so the
+    neighbours of a point are in the 27 voxels around the voxel of the point.
+
+    Points are sorted by packed voxel keys; voxels are found with binary search.
+    """
+
+    _shifts = np.array(np.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1])).reshape(3, -1).T
+
+    def __init__(self, points: MatrixNx3, radius: float):
+        self._points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        self._radius = radius
+
+        voxels = np.floor(self._points / radius).astype(np.int64)
+        self._origin = voxels.min(axis=0, initial=0)
+        self._dims = voxels.max(axis=0, initial=0) - self._origin + 1
+
+        keys = self._pack(voxels - self._origin)
+        self._order = np.argsort(keys, kind="stable")
+        self._keys, self._starts, self._counts = np.unique(
+            keys[self._order], return_index=True, return_counts=True
+        )
+
+    def radius_neighbors(self, queries: MatrixNx3) -> tuple[VectorN, VectorN]:
+        queries = np.asarray(queries, dtype=np.float64)
+        num_queries = queries.shape[0]
+        offsets = np.zeros(num_queries + 1, dtype=np.int64)
+
+        if len(self._keys) == 0:
+            return offsets, np.empty(0, dtype=np.int64)
+
+        voxels = np.floor(queries / self._radius).astype(np.int64) - self._origin
+        cells = voxels[:, None, :] + self._shifts[None, :, :]
+        inside = np.all((cells >= 0) & (cells < self._dims), axis=2)
+
+        keys = self._pack(np.where(inside[..., None], cells, 0))
+        positions = np.searchsorted(self._keys, keys).clip(max=len(self._keys) - 1)
+        found = inside & (self._keys[positions] == keys)
+
+        counts = np.where(found, self._counts[positions], 0).ravel()
+        starts = np.where(found, self._starts[positions], 0).ravel()
+
+        cell_offsets = np.cumsum(counts) - counts
+        candidates = np.repeat(starts - cell_offsets, counts) + np.arange(counts.sum())
+        candidates = self._order[candidates]
+        owners = np.repeat(np.arange(num_queries), self._shifts.shape[0])
+        owners = np.repeat(owners, counts)
+
+        differences = self._points[candidates] - queries[owners]
+        within = np.einsum("ij,ij->i", differences, differences) <= self._radius**2
+
+        owners, candidates = owners[within], candidates[within]
+        np.cumsum(np.bincount(owners, minlength=num_queries), out=offsets[1:])
+        return offsets, candidates
+
+    def _pack(self, voxels: np.ndarray) -> np.ndarray:
+        """Packs non-negative voxel coordinates into unique integer keys."""
+        _, dy, dz = (int(d) for d in self._dims)
+        return (voxels[..., 0] * dy + voxels[..., 1]) * dz + voxels[..., 2]
+
+
+backends: dict[str, type[SklearnIndex | KDTreeIndex | VoxelHashIndex]] = {
+    "sklearn": SklearnIndex,
+    "kdtree": KDTreeIndex,
+    "voxel": VoxelHashIndex,
+}
+
+
+class MetricsContext:
+    """Aggregated map with spatial indices.
+
+    One index is built per radius and reused by all queries: the metrics of the same map
+    (MOM, MME, MPV) share the indices when they are given the same context.
+    """
+
+    def __init__(self, points: MatrixNx3, backend: str = "sklearn", chunk_size: int = 8192):
+        """
+        Args:
+            points: points of the aggregated map [N, 3].
+
+            backend: spatial index: "sklearn", "kdtree" or "voxel".
+
+            chunk_size: max number of query points processed at once.
+
+        Raises:
+            ValueError: if the backend is unknown.
+        """
+        if backend not in backends:
+            raise ValueError(f"Unknown spatial index backend: {backend}.")
+
+        self._points = np.asarray(points, dtype=np.float64)
+        self._backend = backend
+        self._chunk_size = chunk_size
+        self._indices: dict[float, SpatialIndex] = {}
+
+    @property
+    def points(self) -> MatrixNx3:
+        """Points of the aggregated map."""
+        return self._points
+
+    def get_index(self, radius: float) -> SpatialIndex:
+        """Gets the index for radius queries (built on the first call).
+
+        Args:
+            radius: radius of the queries.
+
+        Returns:
+            spatial index.
+        """
+        index = self._indices.get(radius)
+
+        if index is None:
+            index = backends[self._backend](self._points, radius)
+            self._indices[radius] = index
+
+        return index
+
+    def covariances(self, queries: MatrixNx3, radius: float, min_nn: int) -> np.ndarray:
+        """Computes covariance matrices of the map points within the radius of the
+        queries. Neighbourhoods with min_nn points or fewer are skipped.
+
+        Args:
+            queries: query points [Q, 3].
+
+            radius: radius of the neighbourhoods.
+
+            min_nn: the number of points in a neighbourhood must be greater.
+
+        Returns:
+            covariance matrices [M, 3, 3] in the order of the queries.
+        """
+        queries = np.asarray(queries, dtype=np.float64)
+        index = self.get_index(radius)
+        result = [np.empty((0, 3, 3))]
+
+        for start in range(0, queries.shape[0], self._chunk_size):
+            chunk = queries[start : start + self._chunk_size]
+            offsets, indices = index.radius_neighbors(chunk)
+            result.append(neighbourhood_covariances(self._points, chunk, offsets, indices, min_nn))
+
+        return np.concatenate(result)
+
+
+def to_csr(neighbours: list) -> tuple[VectorN, VectorN]:
+    """Converts neighbourhoods to the compressed form.
+
+    Args:
+        neighbours: arrays (lists) of indices for every query.
+
+    Returns:
+        offsets [Q + 1] and flat indices.
+    """
+    lengths = np.fromiter((len(n) for n in neighbours), dtype=np.int64, count=len(neighbours))
+    offsets = np.zeros(len(neighbours) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    if offsets[-1] == 0:
+        return offsets, np.empty(0, dtype=np.int64)
+
+    return offsets, np.concatenate([np.asarray(n, dtype=np.int64) for n in neighbours])
+
+
+def neighbourhood_covariances(
+    points: MatrixNx3, centers: MatrixNx3, offsets: VectorN, indices: VectorN, min_nn: int
+) -> np.ndarray:
+    """Computes sample covariances (as np.cov) of the neighbourhoods in compressed form.
+
+    The points are centered at the query points to avoid the loss of precision.
+
+    Args:
+        points: map points [N, 3].
+
+        centers: query points [Q, 3].
+
+        offsets: offsets of the neighbourhoods [Q + 1].
+
+        indices: flat indices of the map points.
+
+        min_nn: the number of points in a neighbourhood must be greater.
+
+    Returns:
+        covariance matrices [M, 3, 3] of the neighbourhoods with more than min_nn points.
+    """
+    counts = np.diff(offsets)
+    valid = counts > min_nn
+    num = int(np.count_nonzero(valid))
+
+    if num == 0:
+        return np.empty((0, 3, 3))
+
+    owners = np.repeat(np.arange(len(counts)), counts)
+    mask = valid[owners]
+    segments = np.cumsum(valid) - 1
+    owners = owners[mask]
+    local = points[indices[mask]] - centers[owners]
+    segments = segments[owners]
+
+    n = counts[valid].astype(np.float64)
+    sums = np.stack([np.bincount(segments, local[:, i], num) for i in range(3)], axis=1)
+    products = np.empty((num, 3, 3))
+    for i in range(3):
+        for j in range(i, 3):
+            products[:, i, j] = np.bincount(segments, local[:, i] * local[:, j], num)
+            products[:, j, i] = products[:, i, j]
+
+    outer = sums[:, :, None] * sums[:, None, :] / n[:, None, None]
+    return (products - outer) / (n - 1)[:, None, None]
+
+
+def plane_variances(covariances: np.ndarray) -> VectorN:
+    """Computes plane variances (the smallest eigenvalues) of the covariance matrices.
+
+    Args:
+        covariances: covariance matrices [M, 3, 3].
+
+    Returns:
+        plane variances [M].
+    """
+    return np.linalg.eigvalsh(covariances)[:, 0]
+
+
+def entropies(covariances: np.ndarray) -> VectorN:
+    """Computes differential entropies of the covariance matrices with positive
+    determinants (as compute_entropy()).
+
+    Args:
+        covariances: covariance matrices [M, 3, 3].
+
+    Returns:
+        entropies [K], K <= M.
+    """
+    determinants = np.linalg.det(2 * np.pi * np.e * covariances)
+    return 0.5 * np.log(determinants[determinants > 0])
@@ -0,0 +1,172 @@
+"""Cache of orthogonal plane subsets of lidar scans.
+
+Plane membership of the points does not change under rigid transforms. The subsets are
+extracted once per scan in the sensor frame, and candidates only transform them with
+their relative poses.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+import numpy as np
+
+from moduslam.custom_types.numpy import Matrix4x4, MatrixNx3
+from moduslam.data_manager.batch_factory.data_objects import Element
+from moduslam.external.metrics.modified_mom import ransac_planes
+from moduslam.external.metrics.modified_mom.config import (
+    BaseConfig,
+    HdbscanConfig,
+    RansacConfig,
+)
+from moduslam.external.metrics.modified_mom.hdbscan_planes import (
+    Cloud,
+    extract_orthogonal_subsets,
+)
+from moduslam.map_manager.factories.lidar_map.config import (
+    LidarPointCloudConfig,
+)
+from moduslam.map_manager.factories.lidar_map.utils import (
+    create_point_cloud_from_element,
+)
+
+# deterministic failures of the extraction: no cliques, HDBSCAN and open3d errors.
+cached_errors: tuple[type[Exception], ...] = (ValueError, RuntimeError)
+
+
+class OrthogonalSubsetsCache:
+    """Bounded LRU cache of orthogonal subsets keyed by the element location and the
+    configurations.
+
+    Deterministic failures of the extraction are cached as well: a new exception caused
+    by the cached one is raised for the same scan. Errors of loading the scan are not
+    cached.
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        Args:
+            max_size: max number of scans in the cache.
+        """
+        self._max_size = max_size
+        self._items: OrderedDict[Hashable, list[MatrixNx3] | Exception] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def hits(self) -> int:
+        """Number of scans taken from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of scans processed."""
+        return self._misses
+
+    def get(
+        self,
+        element: Element,
+        cloud_config: LidarPointCloudConfig,
+        normals_config: BaseConfig,
+        cluster_config: HdbscanConfig | RansacConfig,
+    ) -> list[MatrixNx3]:
+        """Gets orthogonal subsets of the lidar scan in the sensor frame.
+
+        Args:
+            element: an element with the lidar scan.
+
+            cloud_config: a configuration for point cloud creation.
+
+            normals_config: a configuration for normals estimation algorithm.
+
+            cluster_config: a configuration for clustering algorithm: HDBSCAN of normals
+                or multi-plane RANSAC.
+
+        Returns:
+            arrays with orthogonal point clouds.
+
+        Raises:
+            ValueError: if no orthogonal subsets exist for the scan.
+
+            RuntimeError: if open3d failed to process the scan.
+
+            Exception: any error of loading the scan (not cached).
+        """
+        key = (element.location, config_key(cloud_config, normals_config, cluster_config))
+        item = self._items.get(key)
+
+        if item is None:
+            self._misses += 1
+            cloud = create_point_cloud_from_element(element, cloud_config)
+
+            try:
+                subsets = self._extract(cloud, normals_config, cluster_config)
+            except cached_errors as e:
+                error_type = next(t for t in cached_errors if isinstance(e, t))
+                self._put(key, error_type(str(e)))
+                raise
+
+            self._put(key, subsets)
+            return subsets
+
+        self._hits += 1
+        self._items.move_to_end(key)
+
+        if isinstance(item, Exception):
+            msg = f"Orthogonal subsets extraction has failed for {element.location}: {item}"
+            raise type(item)(msg) from item
+
+        return item
+
+    def clear(self) -> None:
+        """Removes the subsets and resets the counters."""
+        self._items.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def _put(self, key: Hashable, item: list[MatrixNx3] | Exception) -> None:
+        """Adds the item to the cache and evicts the least recently used one."""
+        self._items[key] = item
+
+        if len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+
+    @staticmethod
+    def _extract(
+        cloud: Cloud,
+        normals_config: BaseConfig,
+        cluster_config: HdbscanConfig | RansacConfig,
+    ) -> list[MatrixNx3]:
+        if isinstance(cluster_config, RansacConfig):
+            return ransac_planes.extract_orthogonal_subsets(cloud, normals_config, cluster_config)
+        return extract_orthogonal_subsets(cloud, normals_config, cluster_config)
+
+
+def config_key(*configs: Any) -> str:
+    """Creates the key from the content of the configurations.
+
+    Args:
+        *configs: dataclass configurations.
+
+    Returns:
+        key.
+    """
+    return repr(configs)
+
+
+def transform_subsets(subsets: list[MatrixNx3], tf: Matrix4x4) -> list[MatrixNx3]:
+    """Applies the rigid transform to the subsets.
+
+    Args:
+        subsets: arrays with [Nx3] points.
+
+        tf: SE(3) transformation matrix.
+
+    Returns:
+        transformed subsets.
+    """
+    rotation, translation = tf[:3, :3], tf[:3, 3]
+    return [np.asarray(subset) @ rotation.T + translation for subset in subsets]
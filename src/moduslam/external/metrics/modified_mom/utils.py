@@ -6,21 +6,28 @@ import numpy as np
 import open3d as o3d
 
 from moduslam.custom_types.numpy import MatrixNx3, VectorN
+from moduslam.external.metrics.modified_mom.map_aggregator import MapAggregator
 from moduslam.external.metrics.modified_mom.normals_filter import filter_normals
+from moduslam.external.metrics.modified_mom.spatial_index import (
+    MetricsContext,
+    plane_variances,
+)
 
 Cloud: TypeAlias = o3d.geometry.PointCloud
 
 
-def aggregate_map(pcs: list[Cloud], ts: list[np.ndarray]) -> Cloud:
-    """Builds a map from point clouds with their poses.
+def aggregate_map(pcs: list[Cloud], ts: list[np.ndarray], voxel_size: float = 0.0) -> MatrixNx3:
+    """Builds a map from point clouds with their poses in the frame of the first pose.
 
     Args:
         pcs: point clouds obtained from sensors.
 
         ts: SE(3) transformation matrices (i.e., Point Cloud poses).
 
+        voxel_size: size of the voxel to keep one point per voxel; 0 keeps all points.
+
     Returns:
-        pc_map: a map aggregated from point clouds.
+        points of the map [N, 3].
 
     Raises:
         ValueError: the number of point clouds does not match the number of poses.
@@ -28,15 +35,15 @@ def aggregate_map(pcs: list[Cloud], ts: list[np.ndarray]) -> Cloud:
     if len(pcs) != len(ts):
         raise ValueError("Number of point clouds does not match number of poses")
 
-    pc_map = o3d.geometry.PointCloud()
-
-    first_ts_inv = np.linalg.inv(ts[0])
-    new_ts = [first_ts_inv @ T for T in ts]
+    clouds = [np.asarray(cloud.points) for cloud in pcs]
+    aggregator = MapAggregator(sum(len(cloud) for cloud in clouds), voxel_size)
 
-    for cloud, ts in zip(pcs, new_ts):
-        pc_map += cloud.transform(ts)
+    if ts:
+        first_ts_inv = np.linalg.inv(ts[0])
+        for cloud, tf in zip(clouds, ts):
+            aggregator.add(cloud, first_ts_inv @ tf)
 
-    return pc_map
+    return aggregator.points
 
 
 def compute_plane_variance(points: np.ndarray) -> float:
@@ -70,15 +77,15 @@ def compute_entropy(points: np.ndarray) -> float | None:
     return None
 
 
-def compute_variances(target_points, source_points, nn_model, knn_rad: float, min_nn: int):
+def compute_variances(
+    target_points: MatrixNx3, context: MetricsContext, knn_rad: float, min_nn: int
+) -> float:
     """Computes plane variances of the clouds made of neighbouring points.
 
     Args:
         target_points: target points to find neighbours of.
 
-        source_points: all points.
-
-        nn_model: nearest neighbors model.
+        context: a context with the map points and their spatial index.
 
         knn_rad: k-nearest neighbors radius.
 
@@ -86,17 +93,13 @@ def compute_variances(target_points, source_points, nn_model, knn_rad: float, mi
 
     Returns:
         median of plane variances.
-
-    TODO: add type hints.
     """
-    indices = nn_model.radius_neighbors(target_points, radius=knn_rad, return_distance=False)
+    covariances = context.covariances(target_points, knn_rad, min_nn)
 
-    valid_indices = [idx for idx in indices if len(idx) > min_nn]
-    if not valid_indices:
+    if covariances.shape[0] == 0:
         return np.median([])
 
-    metrics = np.array([compute_plane_variance(source_points[idx]) for idx in valid_indices])
-    return np.median(metrics)
+    return np.median(plane_variances(covariances))
 
 
 def estimate_normals(pc: Cloud, knn_rad: float, max_nn: int, eigen_scale: float) -> Cloud:
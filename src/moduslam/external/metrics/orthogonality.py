@@ -9,15 +9,24 @@ from moduslam.custom_types.numpy import MatrixNx3
 from moduslam.data_manager.batch_factory.data_objects import Element
 from moduslam.data_manager.batch_factory.factory import BatchFactory
 from moduslam.external.metrics.base import Metrics
-from moduslam.external.metrics.modified_mom.config import HdbscanConfig, LidarConfig
-from moduslam.external.metrics.modified_mom.hdbscan_planes import (
-    extract_orthogonal_subsets,
+from moduslam.external.metrics.modified_mom.config import (
+    HdbscanConfig,
+    LidarConfig,
+    RansacConfig,
+)
+from moduslam.external.metrics.modified_mom.map_aggregator import MapAggregator
+from moduslam.external.metrics.modified_mom.metrics import create_context, mom
+from moduslam.external.metrics.modified_mom.subsets_cache import (
+    OrthogonalSubsetsCache,
+    transform_subsets,
 )
-from moduslam.external.metrics.modified_mom.metrics import mom
 from moduslam.external.metrics.utils import median
 from moduslam.frontend_manager.main_graph.data_classes import GraphElement
 from moduslam.frontend_manager.main_graph.edges.base import Edge
 from moduslam.frontend_manager.main_graph.edges.pose_odometry import PoseOdometry
+from moduslam.frontend_manager.main_graph.vertices.backend_values import (
+    stack_values,
+)
 from moduslam.frontend_manager.main_graph.vertices.base import Vertex
 from moduslam.frontend_manager.main_graph.vertices.custom import Pose
 from moduslam.map_manager.factories.lidar_map.config import (
@@ -42,17 +51,26 @@ class PlaneOrthogonality(Metrics):
     https://www.researchgate.net/publication/352572583_Be_your_own_Benchmark_No-Reference_Trajectory_Metric_on_Registered_Point_Clouds.
     """
 
-    def __init__(self, point_cloud_config: LidarPointCloudConfig, batch_factory: BatchFactory):
+    def __init__(
+        self,
+        point_cloud_config: LidarPointCloudConfig,
+        batch_factory: BatchFactory,
+        plane_detection_config: HdbscanConfig | RansacConfig | None = None,
+    ):
         """
         Args:
             point_cloud_config: a configuration for processing point clouds.
 
             batch_factory: a factory to create elements with raw lidar measurements.
+
+            plane_detection_config: a configuration for plane detection: HDBSCAN of
+                normals (default) or multi-plane RANSAC.
         """
         self._point_cloud_config = point_cloud_config
         self._mom_config = LidarConfig()
-        self._plane_detection_config = HdbscanConfig()
+        self._plane_detection_config = plane_detection_config or HdbscanConfig()
         self._batch_factory = batch_factory
+        self._subsets_cache = OrthogonalSubsetsCache()
 
     def compute(
         self, connections: dict[Vertex, set[Edge]], graph_elements: list[GraphElement]
@@ -70,7 +88,7 @@ class PlaneOrthogonality(Metrics):
         new_edges = [el.edge for el in graph_elements]
         poses = self._get_poses(new_edges)
 
-        pose_arrays = [np.array(p.value) for p in poses]
+        pose_arrays = list(stack_values(Pose, list(poses)))
 
         poses_with_edges = {p: connections[p] for p in poses}
 
@@ -79,37 +97,48 @@ class PlaneOrthogonality(Metrics):
         )
 
         clouds = self._create_clouds_to_evaluate(poses_with_elements)
-        cloud = self._create_central_cloud(poses_with_elements)
+
+        try:
+            subsets = self._get_orthogonal_subsets(poses_with_elements)
+        except Exception as e:
+            raise ExternalModuleException(e)
 
         value = self._compute_mom(
-            pose_arrays, clouds, cloud, self._mom_config, self._plane_detection_config
+            pose_arrays, clouds, subsets, self._mom_config, self._plane_detection_config
         )
 
         return value
 
-    def _create_central_cloud(self, table: dict[Pose, list[Element]]) -> Cloud:
-        """Creates a point cloud of 1 lidar measurement for the pose with central index.
+    def _get_orthogonal_subsets(self, table: dict[Pose, list[Element]]) -> list[MatrixNx3]:
+        """Gets orthogonal subsets of 1 lidar measurement for the pose with central index
+        in the frame of the first pose.
+
+        The subsets are extracted in the sensor frame once per scan and cached.
 
         Args:
             table: a table with poses and the corresponding raw lidar measurements.
 
         Returns:
-            a 3D point cloud.
+            arrays with orthogonal point clouds.
+
+        Raises:
+            ValueError: if no orthogonal subsets exist for the scan.
+
+            Exception: any error of the external modules while extracting the subsets.
         """
         items = list(table.items())
         pose_0, _ = items[0]
         pose_i, elements = median(items)
-        element = elements[0]
-
-        current_pose = np.array(pose_i.value)
-        first_pose = np.array(pose_0.value)
 
-        tf = np.linalg.inv(first_pose) @ current_pose
-
-        cloud = create_point_cloud_from_element(element, self._point_cloud_config)
-        cloud.transform(tf)
+        subsets = self._subsets_cache.get(
+            elements[0],
+            self._point_cloud_config,
+            self._mom_config,
+            self._plane_detection_config,
+        )
 
-        return cloud
+        tf = np.linalg.inv(np.asarray(pose_0.value)) @ np.asarray(pose_i.value)
+        return transform_subsets(subsets, tf)
 
     def _create_clouds_to_evaluate(self, table: dict[Pose, list[Element]]) -> list[Cloud]:
         """Creates a list of 3D point clouds to evaluate.
@@ -142,13 +171,16 @@ class PlaneOrthogonality(Metrics):
         Returns:
             a 3D point cloud.
         """
-        o3d_cloud = Cloud()
+        clouds = [create_point_cloud_from_element(element, config) for element in elements]
 
-        for element in elements:
-            cloud = create_point_cloud_from_element(element, config)
-            o3d_cloud += cloud
+        if len(clouds) == 1:
+            return clouds[0]
 
-        return o3d_cloud
+        aggregator = MapAggregator(sum(len(cloud.points) for cloud in clouds))
+        for cloud in clouds:
+            aggregator.add(np.asarray(cloud.points))
+
+        return Cloud(o3d.utility.Vector3dVector(aggregator.points))
 
     @staticmethod
     def _get_poses(edges: Sequence[Edge]) -> OrderedSet[Pose]:
@@ -201,24 +233,23 @@ class PlaneOrthogonality(Metrics):
     def _compute_mom(
         poses: list[NumpyMatrix4x4],
         point_clouds: list[MatrixNx3],
-        evaluation_cloud: MatrixNx3,
+        orth_subsets: list[MatrixNx3],
         mom_config: LidarConfig,
-        plane_detection_config: HdbscanConfig,
+        plane_detection_config: HdbscanConfig | RansacConfig,
     ) -> float:
-        """Computes the MOM metrics:
-        1. Extracts orthogonal subsets from evaluation point cloud.
-        2. Computes mom value for the given point clouds and poses.
-
+        """Computes mom value for the given point clouds and poses.
 
         Args:
             poses: SE(3) poses.
 
             point_clouds: a list of arrays with [Nx3] point clouds.
 
-            evaluation_cloud: a [Nx3] point cloud to extract orthogonal planes from.
+            orth_subsets: arrays with orthogonal point clouds.
 
             mom_config: a configuration for MOM metric.
 
+            plane_detection_config: a configuration for plane detection.
+
         Returns:
             MOM metric value.
 
@@ -226,18 +257,10 @@ class PlaneOrthogonality(Metrics):
             ExternalModuleException: if the external MOM module fails to compute the metric.
         """
         try:
-            # o3d.visualization.draw_geometries(point_clouds)
-            # o3d.visualization.draw_geometries([evaluation_cloud])
-            orth_subsets = extract_orthogonal_subsets(
-                evaluation_cloud, mom_config, plane_detection_config
+            context = create_context(point_clouds, poses, mom_config)
+            value = mom(
+                point_clouds, poses, mom_config, plane_detection_config, orth_subsets, context
             )
-
-            # cloud = o3d.geometry.PointCloud()
-            # for pcd in point_clouds:
-            #     cloud += pcd
-            # visualize_point_cloud_with_subsets(evaluation_cloud, orth_subsets)
-
-            value = mom(point_clouds, poses, mom_config, plane_detection_config, orth_subsets)
             return value
 
         except Exception as e:
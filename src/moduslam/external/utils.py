@@ -1,10 +1,10 @@
 from bisect import bisect_left, bisect_right
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from typing import TypeVar
 
 from moduslam.bridge.auxiliary_dataclasses import ClustersWithLeftovers, Connection
-from moduslam.measurement_storage.cluster import MeasurementCluster
+from moduslam.measurement_storage.cluster import ClusterView, MeasurementCluster
 from moduslam.measurement_storage.group import MeasurementGroup
 from moduslam.measurement_storage.measurements.auxiliary import SplitPoseOdometry
 from moduslam.measurement_storage.measurements.base import Measurement
@@ -82,12 +82,88 @@ def create_copy(
     return clusters_copy, connections_copy
 
 
+def create_views(
+    clusters: list[MeasurementCluster], connections: list[Connection]
+) -> tuple[list[MeasurementCluster], list[Connection]]:
+    """Creates views of the clusters and connections between them.
+
+    Args:
+        clusters: clusters to view.
+
+        connections: connections between the clusters.
+
+    Returns:
+        views of the clusters and connections between the views.
+    """
+    views: list[MeasurementCluster] = [ClusterView(c) for c in clusters]
+    mapping = {id(original): view for original, view in zip(clusters, views)}
+
+    connections_views = [
+        Connection(mapping[id(connection.cluster1)], mapping[id(connection.cluster2)])
+        for connection in connections
+    ]
+
+    return views, connections_views
+
+
+def get_range_signature(items: Sequence[Measurement]) -> tuple[int, int, int]:
+    """Gets the signature of a contiguous sub-sequence of a sorted sequence: the
+    sub-sequence is defined by the first item and the number of items.
+
+    Args:
+        items: a contiguous sub-sequence.
+
+    Returns:
+        id of the first item, id of the last item, number of items.
+    """
+    if not items:
+        return 0, 0, 0
+    return id(items[0]), id(items[-1]), len(items)
+
+
+def get_signature(variant: ClustersWithLeftovers, bits: dict[int, int]) -> tuple:
+    """Gets the canonical signature of the variant in O(measurements in clusters).
+
+    A cluster is represented with the bitmask of its discrete measurements and the
+    sorted range signatures of its continuous measurements. The items of continuous
+    measurements and the leftovers must be contiguous sub-sequences of the same sorted
+    sequence of discrete measurements (as created by the connections factory).
+
+    Args:
+        variant: clusters with leftovers.
+
+        bits: table of "measurement id -> bit index" shared by the compared variants:
+            new measurements are added to it.
+
+    Returns:
+        signature.
+    """
+    clusters = []
+
+    for cluster in variant.clusters:
+        mask = 0
+        ranges = []
+
+        for m in cluster.measurements:
+            if isinstance(m, ContinuousMeasurement):
+                ranges.append(get_range_signature(m.items))
+            else:
+                mask |= 1 << bits.setdefault(id(m), len(bits))
+
+        ranges.sort()
+        clusters.append((mask, tuple(ranges)))
+
+    return tuple(clusters), get_range_signature(variant.leftovers)
+
+
 def remove_duplicates(
     clusters_with_leftovers_list: list[ClustersWithLeftovers],
 ) -> list[ClustersWithLeftovers]:
     """Remove duplicate clusters with leftovers.
     Duplicate: clusters with the same measurements and the same leftovers.
 
+    The variants are compared by their canonical signatures (see get_signature).
+
     Args:
         clusters_with_leftovers_list: clusters with leftovers.
 
@@ -95,26 +171,11 @@ def remove_duplicates(
         unique clusters with leftovers.
     """
     seen = set()
+    bits: dict[int, int] = {}
     unique_clusters_with_leftovers = []
 
     for clusters_with_leftovers in clusters_with_leftovers_list:
-
-        leftovers = tuple(clusters_with_leftovers.leftovers)
-
-        measurements_list = []
-        for cluster in clusters_with_leftovers.clusters:
-            current_measurements: list[Measurement] = []
-
-            for m in cluster.measurements:
-                if isinstance(m, ContinuousMeasurement):
-                    current_measurements += m.items
-                else:
-                    current_measurements.append(m)
-
-            measurements_list.append(tuple(current_measurements))
-
-        measurements = tuple(measurements_list)
-        key = (measurements, leftovers)
+        key = get_signature(clusters_with_leftovers, bits)
 
         if key not in seen:
             seen.add(key)
@@ -0,0 +1,19 @@
+from typing import cast
+
+from hydra import compose, initialize
+from hydra.core.config_store import ConfigStore
+
+from moduslam.frontend_manager.configs import FrontendManagerConfig
+
+
+def get_config() -> FrontendManagerConfig:
+    """Reads and validates the config file for Frontend Manager."""
+
+    cs = ConfigStore.instance()
+    cs.store(name="base_frontend_manager", node=FrontendManagerConfig)
+
+    with initialize(version_base=None, config_path="configs"):
+        cfg = compose(config_name="config")
+        config = cast(FrontendManagerConfig, cfg)
+
+    return config
@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+
+from moduslam.frontend_manager.graph_builders.configs import (
+    GraphBuilderConfig,
+    SuboptimalBuilderConfig,
+)
+
+
+@dataclass
+class ReplayConfig:
+    """Recording and replay of the measurements created by the handlers."""
+
+    enabled: bool = False
+    directory: str = field(
+        default="replay",
+        metadata={"help": "Directory with the logs (relative to the working directory)."},
+    )
+
+
+@dataclass
+class DispatcherConfig:
+    """Distribution of the elements to the handlers."""
+
+    concurrent: bool = field(
+        default=False,
+        metadata={"help": "Process the elements ahead in per-handler worker threads."},
+    )
+    read_ahead: int = field(
+        default=1024, metadata={"help": "Max number of elements processed ahead."}
+    )
+
+
+@dataclass
+class FrontendManagerConfig:
+    """Frontend manager configuration."""
+
+    dispatcher: DispatcherConfig = field(default_factory=DispatcherConfig)
+    replay: ReplayConfig = field(default_factory=ReplayConfig)
+    graph_builder: GraphBuilderConfig = field(default_factory=GraphBuilderConfig)
+    suboptimal_builder: SuboptimalBuilderConfig = field(default_factory=SuboptimalBuilderConfig)
@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+
+from moduslam.frontend_manager.storage_analyzers.configs import (
+    AnalyzerConfig,
+    double_pose_odometry,
+    single_pose_odometry,
+)
+
+
+@dataclass
+class GraphBuilderConfig:
+    """Graph builder configuration."""
+
+    analyzer: AnalyzerConfig = field(default_factory=single_pose_odometry)
+
+
+@dataclass
+class SuboptimalBuilderConfig:
+    """Suboptimal graph builder configuration."""
+
+    num_local_clusters: int | None = field(
+        default=10,
+        metadata={
+            "help": "Number of the latest clusters to solve for every candidate "
+            "(None: solve the whole graph)."
+        },
+    )
+    analyzer: AnalyzerConfig = field(default_factory=double_pose_odometry)
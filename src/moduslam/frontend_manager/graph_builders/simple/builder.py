@@ -3,15 +3,20 @@ import logging
 from moduslam.backend_manager.graph_solver import GraphSolver
 from moduslam.bridge.auxiliary_dataclasses import CandidateWithClusters
 from moduslam.data_manager.batch_factory.batch import DataBatch
-from moduslam.external.handlers_factory.handlers.handler_protocol import Handler
+from moduslam.external.handlers_factory.concurrent_dispatcher import (
+    ConcurrentDispatcher,
+)
+from moduslam.external.handlers_factory.dispatcher import Dispatcher
+from moduslam.external.handlers_factory.replay import ReplayDispatcher
 from moduslam.external.metrics.factory import MetricsFactory
 from moduslam.external.metrics.storage import MetricsStorage
+from moduslam.frontend_manager.graph_builders.configs import GraphBuilderConfig
 from moduslam.frontend_manager.graph_builders.simple.graph_factory import (
     Factory as GraphFactory,
 )
 from moduslam.frontend_manager.main_graph.graph import Graph
 from moduslam.frontend_manager.storage_analyzers.analyzers import (
-    SinglePoseOdometry,
+    ConditionsAnalyzer,
 )
 from moduslam.frontend_manager.utils import fill_storage
 from moduslam.logger.logging_config import frontend_manager
@@ -24,13 +29,23 @@ logger = logging.getLogger(frontend_manager)
 class Builder:
     """Builds sub-graph by connecting core measurements with IMU sequentially."""
 
-    def __init__(self, handlers: set[Handler]):
+    def __init__(
+        self,
+        dispatcher: Dispatcher | ConcurrentDispatcher | ReplayDispatcher,
+        storage: MeasurementStorage,
+        config: GraphBuilderConfig = GraphBuilderConfig(),
+    ):
         """
         Args:
-            handlers: handlers for creating measurements.
+            dispatcher: a dispatcher of elements to handlers creating measurements.
+
+            storage: a storage for the measurements created by the handlers.
+
+            config: builder configuration.
         """
-        self._handlers = handlers
-        self._analyzer = SinglePoseOdometry()
+        self._dispatcher = dispatcher
+        self._storage = storage
+        self._analyzer = ConditionsAnalyzer(config.analyzer)
         self._factory = GraphFactory()
         self._metrics_factory = MetricsFactory()
         self._metrics_storage = MetricsStorage()
@@ -47,11 +62,11 @@ class Builder:
         Returns:
             a new graph.
         """
-        storage = MeasurementStorage
+        storage = self._storage
         total_shift = 0
 
         while not data_batch.empty:
-            fill_storage(storage, data_batch, self._handlers, self._analyzer)
+            fill_storage(storage, data_batch, self._dispatcher, self._analyzer)
 
             data = storage.data()
             can_with_clusters = self._factory.create_candidate_with_clusters(graph, data)
@@ -2,11 +2,15 @@ import logging
 
 from moduslam.bridge.optimal_candidate_factory import Factory
 from moduslam.data_manager.batch_factory.batch import DataBatch
-from moduslam.external.handlers_factory.handlers.handler_protocol import Handler
+from moduslam.external.handlers_factory.concurrent_dispatcher import (
+    ConcurrentDispatcher,
+)
+from moduslam.external.handlers_factory.dispatcher import Dispatcher
 from moduslam.external.metrics.factory import MetricsResult
+from moduslam.frontend_manager.graph_builders.configs import SuboptimalBuilderConfig
 from moduslam.frontend_manager.main_graph.graph import Graph
 from moduslam.frontend_manager.storage_analyzers.analyzers import (
-    DoublePoseOdometry,
+    ConditionsAnalyzer,
 )
 from moduslam.frontend_manager.utils import fill_storage
 from moduslam.logger.logging_config import frontend_manager
@@ -19,14 +23,24 @@ logger = logging.getLogger(frontend_manager)
 class Builder:
     """Creates multiple edges combinations and chooses the best one."""
 
-    def __init__(self, handlers: set[Handler]):
+    def __init__(
+        self,
+        dispatcher: Dispatcher | ConcurrentDispatcher,
+        storage: MeasurementStorage,
+        config: SuboptimalBuilderConfig = SuboptimalBuilderConfig(),
+    ):
         """
         Args:
-            handlers: handlers for creating measurements.
+            dispatcher: a dispatcher of elements to handlers creating measurements.
+
+            storage: a storage for the measurements created by the handlers.
+
+            config: builder configuration.
         """
-        self._handlers = handlers
-        self._analyzer = DoublePoseOdometry()
-        self._candidate_factory = Factory()
+        self._dispatcher = dispatcher
+        self._storage = storage
+        self._analyzer = ConditionsAnalyzer(config.analyzer)
+        self._candidate_factory = Factory(config.num_local_clusters)
 
     def create_graph(self, graph: Graph, data_batch: DataBatch) -> Graph:
         """Creates graph candidate using the measurements from the data batch.
@@ -39,13 +53,13 @@ class Builder:
         Returns:
             a new graph.
         """
-        storage = MeasurementStorage
+        storage = self._storage
 
         total_metrics = MetricsResult()
 
         while not data_batch.empty:
 
-            fill_storage(storage, data_batch, self._handlers, self._analyzer)
+            fill_storage(storage, data_batch, self._dispatcher, self._analyzer)
 
             data = storage.data()
             candidate, new_metrics = self._candidate_factory.create_candidate(graph, data)
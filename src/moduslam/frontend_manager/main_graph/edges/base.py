@@ -40,9 +40,10 @@ class Edge(ABC):
         return self._index
 
     @index.setter
-    def index(self, value: int) -> None:
+    def index(self, value: int | None) -> None:
         """Attention:
-        the index is being set automatically when the corresponding edge is added to the graph.
+        the index is being set automatically when the corresponding edge is added to the graph
+        and reset to None when the edge is removed from the graph.
         Do not set it manually elsewhere.
 
         Args:
@@ -51,7 +52,7 @@ class Edge(ABC):
         Raises:
             ValueError: if the index is negative.
         """
-        if value < 0:
+        if value is not None and value < 0:
             raise ValueError("Index should be non-negative.")
 
         self._index = value
@@ -1,9 +1,120 @@
+"""Noise models for the edges.
+
+GTSAM noise models are immutable and can be shared by many factors. Sensor covariances
+are usually constant, so the models are interned in the cache keyed by the content of
+their parameters: the matrices and the factorization are computed once per unique
+covariance.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
 import gtsam
 import numpy as np
 
 from moduslam.custom_types.aliases import Matrix3x3, Vector3, Vector6, VectorN
 from moduslam.custom_types.numpy import Matrix6x6
 
+M = TypeVar("M", bound=gtsam.noiseModel.Base)
+
+
+class NoiseModelCache:
+    """Bounded LRU cache of noise models with hit-rate counters."""
+
+    def __init__(self, max_size: int = 4096):
+        """
+        Args:
+            max_size: max number of noise models in the cache.
+        """
+        self._max_size = max_size
+        self._models: OrderedDict[Hashable, gtsam.noiseModel.Base] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    @property
+    def max_size(self) -> int:
+        """Max number of noise models in the cache."""
+        return self._max_size
+
+    @property
+    def hits(self) -> int:
+        """Number of noise models taken from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of created noise models."""
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of requests served from the cache."""
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
+
+    def get(self, key: Hashable, create: Callable[[], M]) -> M:
+        """Gets the noise model for the key or creates and caches a new one.
+
+        Args:
+            key: content key of the noise model.
+
+            create: function to create the noise model.
+
+        Returns:
+            noise model.
+        """
+        model = self._models.get(key)
+
+        if model is not None:
+            self._hits += 1
+            self._models.move_to_end(key)
+            return model  # type: ignore
+
+        self._misses += 1
+        new_model = create()
+        self._models[key] = new_model
+
+        if len(self._models) > self._max_size:
+            self._models.popitem(last=False)
+
+        return new_model
+
+    def clear(self) -> None:
+        """Removes the noise models and resets the counters."""
+        self._models.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+noise_model_cache = NoiseModelCache()
+
+
+def content_key(name: str, *params: Any) -> tuple:
+    """Creates the cache key from the content of the noise model parameters.
+
+    Args:
+        name: name of the noise model kind.
+
+        *params: scalars, vectors or matrices.
+
+    Returns:
+        hashable key.
+    """
+    key: list[Hashable] = [name]
+
+    for param in params:
+        if isinstance(param, int | float):
+            key.append(float(param))
+        else:
+            array = np.asarray(param, dtype=np.float64)
+            key.append((array.shape, array.tobytes()))
+
+    return tuple(key)
+
 
 def block_diagonal_matrix_6x6(block1: Matrix3x3, block2: Matrix3x3) -> Matrix6x6:
     """Numpy block-diagonal matrix with two 3x3 blocks.
@@ -36,9 +147,10 @@ def covariance3x3_noise_model(covariance: Matrix3x3) -> gtsam.noiseModel.Gaussia
     Returns:
         gtsam noise model.
     """
-    array = np.array(covariance)
-    noise = gtsam.noiseModel.Gaussian.Covariance(array)
-    return noise
+    key = content_key("covariance3x3", covariance)
+    return noise_model_cache.get(
+        key, lambda: gtsam.noiseModel.Gaussian.Covariance(np.array(covariance))
+    )
 
 
 def diagonal3x3_noise_model(variances: Vector3) -> gtsam.noiseModel.Diagonal.Variances:
@@ -50,9 +162,10 @@ def diagonal3x3_noise_model(variances: Vector3) -> gtsam.noiseModel.Diagonal.Var
     Returns:
         gtsam noise model.
     """
-    array = np.array(variances)
-    noise = gtsam.noiseModel.Diagonal.Variances(array)
-    return noise
+    key = content_key("diagonal3x3", variances)
+    return noise_model_cache.get(
+        key, lambda: gtsam.noiseModel.Diagonal.Variances(np.array(variances))
+    )
 
 
 def huber_diagonal_noise_model(
@@ -68,11 +181,8 @@ def huber_diagonal_noise_model(
     Returns:
         gtsam noise model.
     """
-    array = np.array(variances)
-    base = gtsam.noiseModel.Diagonal.Variances(array)
-    loss = gtsam.noiseModel.mEstimator.Huber(threshold)
-    robust = gtsam.noiseModel.Robust.Create(loss, base)
-    return robust
+    key = content_key("huber_diagonal", variances, threshold)
+    return noise_model_cache.get(key, lambda: _create_huber(variances, threshold))
 
 
 def se3_isotropic_noise_model(variance: float) -> gtsam.noiseModel.Isotropic.Variance:
@@ -84,8 +194,8 @@ def se3_isotropic_noise_model(variance: float) -> gtsam.noiseModel.Isotropic.Var
     Returns:
         gtsam noise model.
     """
-    noise = gtsam.noiseModel.Isotropic.Variance(6, variance)
-    return noise
+    key = content_key("se3_isotropic", variance)
+    return noise_model_cache.get(key, lambda: gtsam.noiseModel.Isotropic.Variance(6, variance))
 
 
 def pose_block_diagonal_noise_model(
@@ -101,9 +211,13 @@ def pose_block_diagonal_noise_model(
     Returns:
         gtsam noise model.
     """
-    matrix = block_diagonal_matrix_6x6(orientation_covariance, position_covariance)
-    noise = gtsam.noiseModel.Gaussian.Covariance(matrix)
-    return noise
+    key = content_key("pose_block_diagonal", position_covariance, orientation_covariance)
+    return noise_model_cache.get(
+        key,
+        lambda: gtsam.noiseModel.Gaussian.Covariance(
+            block_diagonal_matrix_6x6(orientation_covariance, position_covariance)
+        ),
+    )
 
 
 def diagonal2x2_noise_model(variance: tuple[float, float]) -> gtsam.noiseModel.Diagonal.Sigmas:
@@ -115,9 +229,8 @@ def diagonal2x2_noise_model(variance: tuple[float, float]) -> gtsam.noiseModel.D
     Returns:
         gtsam noise model.
     """
-    array = np.array(variance)
-    noise = gtsam.noiseModel.Diagonal.Sigmas(array)
-    return noise
+    key = content_key("diagonal2x2", variance)
+    return noise_model_cache.get(key, lambda: gtsam.noiseModel.Diagonal.Sigmas(np.array(variance)))
 
 
 def isotropic_3d_noise_model(variance: float) -> gtsam.noiseModel.Isotropic.Variance:
@@ -129,8 +242,8 @@ def isotropic_3d_noise_model(variance: float) -> gtsam.noiseModel.Isotropic.Vari
     Returns:
         gtsam noise model.
     """
-    noise = gtsam.noiseModel.Isotropic.Variance(3, variance)
-    return noise
+    key = content_key("isotropic_3d", variance)
+    return noise_model_cache.get(key, lambda: gtsam.noiseModel.Isotropic.Variance(3, variance))
 
 
 def isotropic_n_dim(noise_dim: int, variance: float) -> gtsam.noiseModel.Isotropic.Variance:
@@ -144,8 +257,10 @@ def isotropic_n_dim(noise_dim: int, variance: float) -> gtsam.noiseModel.Isotrop
     Returns:
         gtsam noise model.
     """
-    noise = gtsam.noiseModel.Isotropic.Variance(noise_dim, variance)
-    return noise
+    key = content_key("isotropic_n_dim", noise_dim, variance)
+    return noise_model_cache.get(
+        key, lambda: gtsam.noiseModel.Isotropic.Variance(noise_dim, variance)
+    )
 
 
 def variance_6d(variance: Vector6) -> gtsam.noiseModel.Diagonal.Variances:
@@ -157,6 +272,14 @@ def variance_6d(variance: Vector6) -> gtsam.noiseModel.Diagonal.Variances:
     Returns:
         gtsam noise model.
     """
-    array = np.array(variance)
-    noise = gtsam.noiseModel.Diagonal.Variances(array)
-    return noise
+    key = content_key("variance_6d", variance)
+    return noise_model_cache.get(
+        key, lambda: gtsam.noiseModel.Diagonal.Variances(np.array(variance))
+    )
+
+
+def _create_huber(variances: VectorN, threshold: float) -> gtsam.noiseModel.Robust:
+    """Creates robust diagonal noise model with Huber loss."""
+    base = gtsam.noiseModel.Diagonal.Variances(np.array(variances))
+    loss = gtsam.noiseModel.mEstimator.Huber(threshold)
+    return gtsam.noiseModel.Robust.Create(loss, base)
@@ -1,3 +1,4 @@
+import heapq
 import logging
 from collections.abc import Iterable
 
@@ -11,7 +12,13 @@ from moduslam.frontend_manager.main_graph.edges.base import Edge
 from moduslam.frontend_manager.main_graph.vertex_storage.storage import (
     VertexStorage,
 )
-from moduslam.frontend_manager.main_graph.vertices.base import Vertex
+from moduslam.frontend_manager.main_graph.vertices.backend_values import (
+    BackendValues,
+)
+from moduslam.frontend_manager.main_graph.vertices.base import (
+    OptimizableVertex,
+    Vertex,
+)
 from moduslam.frontend_manager.utils import get_vertices_with_measurement_timestamps
 from moduslam.logger.logging_config import frontend_manager
 from moduslam.measurement_storage.measurements.base import Measurement
@@ -27,19 +34,40 @@ logger = logging.getLogger(frontend_manager)
 
 
 class Graph:
-    """High-level Graph with gtsam.NonlinearFactorGraph."""
+    """High-level Graph with gtsam.NonlinearFactorGraph.
+
+    Slots of the removed factors are reused by the new ones. If the share of empty
+    slots exceeds the fragmentation threshold, the factor graph is compacted.
+    """
+
+    def __init__(self, fragmentation_threshold: float = 0.5, min_compaction_size: int = 64):
+        """
+        Args:
+            fragmentation_threshold: max ratio of empty slots to the size of the factor
+                graph before compaction.
 
-    def __init__(self) -> None:
+            min_compaction_size: min size of the factor graph to be compacted.
+        """
+        self._fragmentation_threshold = fragmentation_threshold
+        self._min_compaction_size = min_compaction_size
+        self._free_slots: list[int] = []
         self._factor_graph = gtsam.NonlinearFactorGraph()
         self._vertex_storage = VertexStorage()
         self._edges = OrderedSet[Edge]()
         self._connections: dict[Vertex, set[Edge]] = {}
+        self._backend_values = BackendValues()
 
     @property
     def factor_graph(self) -> gtsam.NonlinearFactorGraph:
         """Backend Factor Graph."""
         return self._factor_graph
 
+    @property
+    def fragmentation(self) -> float:
+        """Ratio of empty slots to the size of the factor graph."""
+        size = self._factor_graph.size()
+        return len(self._free_slots) / size if size else 0.0
+
     @property
     def vertex_storage(self) -> VertexStorage:
         """Storage for the vertices of the graph."""
@@ -58,15 +86,13 @@ class Graph:
     def get_backend_instances(self) -> gtsam.Values:
         """Gets backend instances for optimizable vertices.
 
+        The values are maintained incrementally and shared with the vertices: they must
+        not be modified outside the graph.
+
         Returns:
             GTSAM backend instances.
         """
-        values = gtsam.Values()
-
-        for vertex in self._vertex_storage.optimizable_vertices:
-            values.insert(vertex.backend_index, vertex.backend_instance)
-
-        return values
+        return self._backend_values.values
 
     def get_connected_edges(self, vertex: Vertex) -> set[Edge]:
         """Gets all edges connected to the vertex.
@@ -101,10 +127,16 @@ class Graph:
 
         edge.index = self._generate_index()
         self.edges.add(edge)
-        self.factor_graph.add(edge.factor)
+
+        if edge.index < self._factor_graph.size():
+            self._factor_graph.replace(edge.index, edge.factor)
+        else:
+            self._factor_graph.add(edge.factor)
 
         for new_v in new_vertices:
             self._vertex_storage.add(new_v)
+            if isinstance(new_v.instance, OptimizableVertex):
+                self._backend_values.add(new_v.instance)
 
         for v in edge.vertices:
             self._add_connection(v, edge)
@@ -139,9 +171,13 @@ class Graph:
 
         self._edges.remove(edge)
         self._factor_graph.remove(edge.index)
+        heapq.heappush(self._free_slots, edge.index)
+        edge.index = None  # the slot might be reused by another edge.
 
         for v, t in table.items():
             self._vertex_storage.remove_vertex_timestamp(v, t)
+            if v not in self._vertex_storage and isinstance(v, OptimizableVertex):
+                self._backend_values.remove(v)
 
         for vertex in edge.vertices:
             self._connections[vertex].remove(edge)
@@ -149,6 +185,9 @@ class Graph:
             if not self._connections[vertex]:
                 del self._connections[vertex]
 
+        if self._needs_compaction():
+            self.compact()
+
     def replace_edge(self, existing: Edge, new: Edge) -> None:
         """Replaces an existing edge with a new one of the same type.
 
@@ -194,33 +233,57 @@ class Graph:
         for edge in edges.copy():  # copy to avoid set changes during iterations.
             self.remove_edge(edge)
 
+    def compact(self) -> None:
+        """Rebuilds the factor graph without empty slots and re-maps indices of the
+        edges keeping the order of the factors.
+        """
+        factor_graph = gtsam.NonlinearFactorGraph()
+        edges = sorted(self._edges, key=lambda e: e.index)  # type: ignore
+
+        for new_index, edge in enumerate(edges):
+            factor_graph.add(edge.factor)
+            edge.index = new_index
+
+        logger.debug(
+            f"Factor graph compacted: {self._factor_graph.size()} -> {factor_graph.size()}."
+        )
+        self._factor_graph = factor_graph
+        self._free_slots.clear()
+
     def update_vertices(self, values: gtsam.Values) -> None:
         """Updates the graph vertices with the new values.
 
+        The values are merged into the backend values of the graph and their keys are
+        marked as dirty: the vertices convert the new values when they are accessed.
+
         Args:
-            values: GTSAM values.
+            values: GTSAM values with the keys of the graph vertices.
 
         TODO: add update for non-optimizable vertices.
         """
-        for vertex in self._vertex_storage.optimizable_vertices:
-            vertex.update(values)
+        self._backend_values.merge(values)
 
     def _generate_index(self) -> int:
-        """Gets a unique index for the new edge based on the size of the factor graph.
-        Gtsam Factor Graph sets a unique index to every factor being added to it. This
-        guarantees the uniqueness of the index. However, the size of the factor graph is
-        not equal to the number of factors in the graph, because the factor graph may
-        contain empty slots (null ptr objects). When the factor is removed, the size of
-        the factor graph does not change but a Null ptr is added to the corresponding
-        factor.
+        """Gets a unique index for the new edge: the lowest empty slot of the factor graph
+        or the size of the factor graph if there are no empty slots.
 
-        *P.S.
-            To reduce the size of the factor graph, use the resize() method.
+        When the factor is removed, the size of the GTSAM factor graph does not change:
+        a Null ptr is set to the corresponding slot. The slot is reused by the next
+        added factor.
 
         Returns:
             unique index.
         """
-        return self.factor_graph.size()
+        if self._free_slots:
+            return heapq.heappop(self._free_slots)
+        return self._factor_graph.size()
+
+    def _needs_compaction(self) -> bool:
+        """Checks if the factor graph is fragmented enough to be compacted."""
+        size = self._factor_graph.size()
+        return (
+            size >= self._min_compaction_size and self.fragmentation > self._fragmentation_threshold
+        )
 
     def _validate_graph_element(self, element: GraphElement) -> None:
         """Validates a new graph element before adding.
@@ -244,7 +307,7 @@ class Graph:
         if edge in self._edges:
             raise ItemExistsError(f"Edge {edge} already exists.")
 
-        if edge.index and self._factor_graph.exists(edge.index):
+        if edge.index is not None and self._factor_graph.exists(edge.index):
             raise ItemExistsError(f"Factor {edge.factor} already exists in the factor graph.")
 
         for vertex in new_vertices_set:
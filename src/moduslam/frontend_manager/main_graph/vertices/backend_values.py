@@ -0,0 +1,170 @@
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import gtsam
+import numpy as np
+
+from moduslam.frontend_manager.main_graph.vertices.value_store import ValueStore
+
+if TYPE_CHECKING:
+    from moduslam.frontend_manager.main_graph.vertices.base import (
+        GtsamInstance,
+        OptimizableVertex,
+    )
+
+
+class BackendValues:
+    """GTSAM values of the optimizable vertices shared by the graph and its vertices.
+
+    Besides GTSAM values, the values of the vertices are kept in contiguous NumPy
+    arrays: one value store per vertex type. Keys changed by the solver are marked as
+    dirty and are converted to NumPy only when they are accessed.
+    """
+
+    def __init__(self):
+        self.values = gtsam.Values()
+        self.dirty: set[int] = set()
+        self._vertices: dict[int, "OptimizableVertex"] = {}
+        self._stores: dict[type["OptimizableVertex"], ValueStore] = {}
+
+    def __len__(self) -> int:
+        return self.values.size()
+
+    def __contains__(self, key: int) -> bool:
+        return self.values.exists(key)
+
+    def add(self, vertex: "OptimizableVertex") -> None:
+        """Adds the vertex and attaches it to the values.
+
+        Args:
+            vertex: a new vertex.
+        """
+        key = vertex.backend_index
+        self.values.insert(key, vertex.backend_instance)
+        self._get_store(type(vertex)).set(vertex.index, vertex.row)
+        self._vertices[key] = vertex
+        vertex.attach(self)
+
+    def remove(self, vertex: "OptimizableVertex") -> None:
+        """Detaches the vertex keeping its latest value and removes it.
+
+        Args:
+            vertex: an existing vertex.
+        """
+        key = vertex.backend_index
+        vertex.detach()
+        self.values.erase(key)
+        self._stores[type(vertex)].discard(vertex.index)
+        self.dirty.discard(key)
+        del self._vertices[key]
+
+    def set(self, vertex: "OptimizableVertex", instance: "GtsamInstance") -> None:
+        """Sets the new backend instance of the vertex.
+
+        Args:
+            vertex: an existing vertex.
+
+            instance: new backend instance.
+        """
+        key = vertex.backend_index
+        self.values.update(key, instance)
+        self._stores[type(vertex)].set(vertex.index, vertex.to_row(instance))
+        self.dirty.discard(key)
+
+    def merge(self, values: gtsam.Values) -> None:
+        """Merges the new values (e.g. solver results): their keys become dirty.
+
+        Args:
+            values: GTSAM values with the keys of the existing vertices.
+        """
+        self.values.update(values)
+        self.dirty.update(values.keys())
+
+    def get_row(self, vertex: "OptimizableVertex") -> np.ndarray:
+        """Gets the value of the vertex as a read-only view into the value store.
+
+        Args:
+            vertex: an existing vertex.
+
+        Returns:
+            value of the vertex.
+        """
+        key = vertex.backend_index
+
+        if key in self.dirty:
+            self.dirty.discard(key)
+            self._write(vertex)
+
+        return self._stores[type(vertex)].row(vertex.index)
+
+    def get_rows(
+        self, vertex_type: type["OptimizableVertex"], indices: Sequence[int]
+    ) -> np.ndarray:
+        """Gets the values of the vertices of the given type.
+
+        Args:
+            vertex_type: type of the vertices.
+
+            indices: indices of the vertices.
+
+        Returns:
+            values: N x row shape.
+        """
+        self.flush()
+        return self._get_store(vertex_type).rows(indices)
+
+    def get_store(self, vertex_type: type["OptimizableVertex"]) -> ValueStore:
+        """Gets the up-to-date value store for the vertices of the given type.
+
+        Args:
+            vertex_type: type of the vertices.
+
+        Returns:
+            value store.
+        """
+        self.flush()
+        return self._get_store(vertex_type)
+
+    def flush(self) -> None:
+        """Converts the dirty values to NumPy: O(number of dirty keys)."""
+        for key in self.dirty:
+            self._write(self._vertices[key])
+        self.dirty.clear()
+
+    def _write(self, vertex: "OptimizableVertex") -> None:
+        row = vertex.to_row(vertex.read(self.values))
+        self._stores[type(vertex)].set(vertex.index, row)
+
+    def _get_store(self, vertex_type: type["OptimizableVertex"]) -> ValueStore:
+        if vertex_type not in self._stores:
+            self._stores[vertex_type] = ValueStore(vertex_type.row_shape)
+        return self._stores[vertex_type]
+
+
+def stack_values(
+    vertex_type: type["OptimizableVertex"], vertices: Sequence["OptimizableVertex"]
+) -> np.ndarray:
+    """Stacks the values of the vertices into one array.
+
+    If all vertices belong to the same graph, the values are taken from its value store
+    with a single indexing operation.
+
+    Args:
+        vertex_type: type of the vertices.
+
+        vertices: vertices of the given type.
+
+    Returns:
+        values: N x row shape of the vertex type.
+    """
+    if not vertices:
+        return np.empty((0, *vertex_type.row_shape))
+
+    shared = vertices[0].backend_values
+
+    if shared is not None and all(
+        v.backend_values is shared and type(v) is vertex_type for v in vertices
+    ):
+        return shared.get_rows(vertex_type, [v.index for v in vertices])
+
+    return np.stack([v.row for v in vertices])
@@ -2,8 +2,10 @@ from abc import ABC, abstractmethod
 from typing import Any, TypeVar, Union
 
 import gtsam
+import numpy as np
 
 from moduslam.custom_types.aliases import Vector3
+from moduslam.frontend_manager.main_graph.vertices.backend_values import BackendValues
 
 GtsamInstance = Union[gtsam.Pose3, gtsam.Rot3, Vector3, gtsam.NavState, gtsam.imuBias.ConstantBias]
 
@@ -49,18 +51,122 @@ class NonOptimizableVertex(Vertex):
 
 class OptimizableVertex(Vertex):
     """Base abstract optimizable vertex of the Graph with GTSAM properties and is
-    included in GTSAM factor graph as a variable."""
+    included in GTSAM factor graph as a variable.
+
+    When the vertex is added to the graph, it becomes a view into the backend values of
+    the graph: its row is a row of the contiguous array shared by all vertices of its
+    type, its value is a copy of the row. The solver results are converted only for the
+    vertices being accessed.
+    """
+
+    row_shape: tuple[int, ...] = ()
+    """Shape of the value as a NumPy row."""
+
+    def __init__(self, index: int, value: Any = None):
+        super().__init__(index, value)
+        self._backend_instance = self._create_instance(value)
+        self._shared: BackendValues | None = None
+
+    @property
+    def value(self) -> Any:
+        """Value of the vertex (a copy: it is not changed by the graph updates)."""
+        if self._shared is None:
+            return self._value
+        return self.from_row(self._shared.get_row(self).copy())
+
+    @property
+    def row(self) -> np.ndarray:
+        """Value of the vertex as a NumPy row of shape row_shape (a view into the backend
+        values of the graph)."""
+        if self._shared is None:
+            return self.to_row(self._backend_instance)
+        return self._shared.get_row(self)
 
     @property
-    @abstractmethod
     def backend_instance(self) -> GtsamInstance:
         """External backend instance of the vertex."""
+        if self._shared is None:
+            return self._backend_instance
+        return self.read(self._shared.values)
+
+    @property
+    def backend_values(self) -> BackendValues | None:
+        """Backend values of the graph with the vertex or None."""
+        return self._shared
 
     @property
     @abstractmethod
     def backend_index(self) -> int:
         """Unique external backend index of an instance."""
 
+    def update(self, value: gtsam.Values) -> None:
+        """Updates the vertex with the new value.
+
+        Args:
+            value: GTSAM values.
+        """
+        instance = self.read(value)
+
+        if self._shared is None:
+            self._backend_instance = instance
+            self._value = self.from_row(self.to_row(instance))
+        else:
+            self._shared.set(self, instance)
+
+    def attach(self, shared: BackendValues) -> None:
+        """Binds the vertex to the backend values which contain its value.
+
+        Args:
+            shared: backend values of the graph.
+        """
+        self._shared = shared
+
+    def detach(self) -> None:
+        """Unbinds the vertex from the backend values keeping its latest value."""
+        if self._shared is None:
+            return
+
+        self._backend_instance = self.read(self._shared.values)
+        self._value = self.from_row(self._shared.get_row(self).copy())
+        self._shared = None
+
+    @abstractmethod
+    def read(self, values: gtsam.Values) -> GtsamInstance:
+        """Reads the backend instance of the vertex from the values.
+
+        Args:
+            values: GTSAM values with the vertex key.
+
+        Returns:
+            backend instance.
+        """
+
+    @abstractmethod
+    def to_row(self, instance: GtsamInstance) -> np.ndarray:
+        """Converts the backend instance to the NumPy row.
+
+        Args:
+            instance: backend instance.
+
+        Returns:
+            row of shape row_shape.
+        """
+
+    @abstractmethod
+    def from_row(self, row: np.ndarray) -> Any:
+        """Converts the NumPy row to the value (views into the row).
+
+        Args:
+            row: row of shape row_shape.
+
+        Returns:
+            value.
+        """
+
+    @abstractmethod
+    def _create_instance(self, value: Any) -> GtsamInstance:
+        """Converts the value to the backend instance."""
+
 
 V = TypeVar("V", bound=Vertex)
 """TypeVar for the Graph vertices."""
@@ -1,6 +1,7 @@
 """TODO: check & correct MyPy types for numpy arrays."""
 
 import gtsam
+import numpy as np
 from gtsam.symbol_shorthand import B, L, N, P, V, X
 
 from moduslam.custom_types.aliases import Matrix3x3, Matrix4x4, Vector3
@@ -14,6 +15,8 @@ from moduslam.utils.auxiliary_objects import identity4x4, zero_vector3
 class Pose(OptimizableVertex):
     """Pose vertex in Graph."""
 
+    row_shape = (4, 4)
+
     def __init__(self, index: int, value: Matrix4x4 = identity4x4):
         """
         Args:
@@ -22,7 +25,6 @@ class Pose(OptimizableVertex):
             value: SE(3) pose.
         """
         super().__init__(index, value)
-        self._backend_instance = gtsam.Pose3(value)
 
     @property
     def backend_index(self) -> int:
@@ -32,31 +34,34 @@ class Pose(OptimizableVertex):
     @property
     def backend_instance(self) -> gtsam.Pose3:
         """GTSAM pose."""
-        return self._backend_instance
+        return super().backend_instance
 
     @property
     def value(self) -> Matrix4x4:
         """Pose SE(3) matrix."""
-        return self._value
+        return super().value
 
     @property
     def position(self) -> Vector3:
         """Translation part of the pose: x, y, z."""
-        return self._backend_instance.translation()
+        return self.backend_instance.translation()
 
     @property
     def rotation(self) -> Matrix3x3:
         """Rotation part of the pose: SO(3) matrix."""
-        return self._backend_instance.rotation().matrix()
+        return self.backend_instance.rotation().matrix()
 
-    def update(self, value: gtsam.Values) -> None:
-        """Updates the pose with the new value.
+    def read(self, values: gtsam.Values) -> gtsam.Pose3:
+        return values.atPose3(self.backend_index)
 
-        Args:
-            value: GTSAM values.
-        """
-        self._backend_instance = value.atPose3(self.backend_index)
-        self._value = self._backend_instance.matrix()
+    def _create_instance(self, value: Matrix4x4) -> gtsam.Pose3:
+        return gtsam.Pose3(value)
+
+    def to_row(self, instance: gtsam.Pose3) -> np.ndarray:
+        return instance.matrix()
+
+    def from_row(self, row: np.ndarray) -> Matrix4x4:
+        return row
 
 
 class PoseLandmark(Pose):
@@ -71,6 +76,8 @@ class PoseLandmark(Pose):
 class LinearVelocity(OptimizableVertex):
     """Linear velocity vertex in Graph."""
 
+    row_shape = (3,)
+
     def __init__(self, index: int, value: Vector3 = zero_vector3):
         """
         Args:
@@ -83,31 +90,40 @@ class LinearVelocity(OptimizableVertex):
     @property
     def value(self) -> Vector3:
         """Linear velocity: Vx, Vy, Vz."""
-        return self._value
+        return super().value
 
     @property
     def backend_instance(self) -> Vector3:
         """Linear velocity: Vx, Vy, Vz.
         Identical to the value property, as GTSAM does not have a separate class for linear velocity.
         """
-        return self._value
+        return super().value
 
     @property
     def backend_index(self) -> int:
         """GTSAM instance index."""
         return V(self._index)
 
-    def update(self, value: gtsam.Values) -> None:
-        """Updates the linear velocity with the new value.
+    def read(self, values: gtsam.Values) -> Vector3:
+        return values.atVector(self.backend_index)
 
-        Args:
-            value: GTSAM values.
-        """
-        self._value = value.atVector(self.backend_index)
+    def _create_instance(self, value: Vector3) -> Vector3:
+        return value
+
+    def to_row(self, instance: Vector3) -> np.ndarray:
+        return np.asarray(instance, dtype=float)
+
+    def from_row(self, row: np.ndarray) -> Vector3:
+        return row
 
 
 class NavState(OptimizableVertex):
-    """Navigation state vertex in Graph: pose & velocity."""
+    """Navigation state vertex in Graph: pose & velocity.
+
+    The row is a flattened SE(3) matrix followed by the velocity vector.
+    """
+
+    row_shape = (19,)
 
     def __init__(self, index: int, value: tuple[Matrix4x4, Vector3] = (identity4x4, zero_vector3)):
         """
@@ -117,48 +133,50 @@ class NavState(OptimizableVertex):
             value: SE(3) pose, x,y,z velocity vector.
         """
         super().__init__(index, value)
-        pose, velocity = gtsam.Pose3(value[0]), value[1]
-        self._backend_instance = gtsam.NavState(pose, velocity)
 
     @property
     def value(self) -> tuple[Matrix4x4, Vector3]:
         """NavState as SE(3) pose matrix and [Vx,Vy,Vz] vector."""
-        return self._value
+        return super().value
 
     @property
     def pose(self) -> Pose:
         """Pose part of the NavState: SE(3) matrix."""
-        return self._value[0]
+        return self.value[0]
 
     @property
     def linear_velocity(self) -> Vector3:
         """Linear velocity part of the NavState: Vx, Vy, Vz."""
-        return self._value[1]
+        return self.value[1]
 
     @property
     def backend_instance(self) -> gtsam.NavState:
         """GTSAM NavState instance."""
-        return self._backend_instance
+        return super().backend_instance
 
     @property
     def backend_index(self) -> int:
         """GTSAM instance index."""
         return N(self._index)
 
-    def update(self, value: gtsam.Values) -> None:
-        """Updates the NavState with the new value.
+    def read(self, values: gtsam.Values) -> gtsam.NavState:
+        return values.atNavState(self.backend_index)
 
-        Args:
-            value: GTSAM values.
-        """
-        self._backend_instance = value.atNavState(self.backend_index)
-        self._value = (
-            self._backend_instance.transformation().matrix(),
-            self._backend_instance.velocity(),
-        )
+    def _create_instance(self, value: tuple[Matrix4x4, Vector3]) -> gtsam.NavState:
+        return gtsam.NavState(gtsam.Pose3(value[0]), value[1])
+
+    def to_row(self, instance: gtsam.NavState) -> np.ndarray:
+        return np.concatenate((instance.pose().matrix().ravel(), instance.velocity()))
+
+    def from_row(self, row: np.ndarray) -> tuple[Matrix4x4, Vector3]:
+        return row[:16].reshape(4, 4), row[16:]
 
 
 class Point3D(OptimizableVertex):
+    """Point in 3D vertex in Graph."""
+
+    row_shape = (3,)
+
     def __init__(self, index: int, value: Vector3 = zero_vector3):
         """
         Args:
@@ -171,30 +189,39 @@ class Point3D(OptimizableVertex):
     @property
     def value(self) -> Vector3:
         """Position of the point: x, y, z."""
-        return self._value
+        return super().value
 
     @property
     def backend_instance(self) -> Vector3:
         """Identical to the value property, as GTSAM does not have a separate class for
         point in 3D."""
-        return self._value
+        return super().value
 
     @property
     def backend_index(self) -> int:
         """GTSAM instance index."""
         return P(self._index)
 
-    def update(self, value: gtsam.Values) -> None:
-        """Updates the point with the new value.
+    def read(self, values: gtsam.Values) -> Vector3:
+        return values.atPoint3(self.backend_index)
 
-        Args:
-            value: GTSAM values.
-        """
-        self._value = value.atPoint3(self.backend_index)
+    def _create_instance(self, value: Vector3) -> Vector3:
+        return value
+
+    def to_row(self, instance: Vector3) -> np.ndarray:
+        return np.asarray(instance, dtype=float)
+
+    def from_row(self, row: np.ndarray) -> Vector3:
+        return row
 
 
 class ImuBias(OptimizableVertex):
-    """Imu bias in Graph."""
+    """Imu bias in Graph.
+
+    The row is the accelerometer bias followed by the gyroscope bias.
+    """
+
+    row_shape = (6,)
 
     def __init__(self, index: int, value: tuple[Vector3, Vector3] = (zero_vector3, zero_vector3)):
         """
@@ -204,41 +231,43 @@ class ImuBias(OptimizableVertex):
             value: accelerometer bias, gyroscope bias.
         """
         super().__init__(index, value)
-        self._backend_instance = gtsam.imuBias.ConstantBias(value[0], value[1])
 
     @property
     def value(self) -> tuple[Vector3, Vector3]:
         """Accelerometer and gyroscope biases: (Ax, Ay, Az), (Gx, Gy, Gz)."""
-        return self._value
+        return super().value
 
     @property
     def accelerometer_bias(self) -> Vector3:
         """Accelerometer bias: Bx, By, Bz."""
-        return self._value[0]
+        return self.value[0]
 
     @property
     def gyroscope_bias(self) -> Vector3:
         """Gyroscope bias: Bx, By, Bz."""
-        return self._value[1]
+        return self.value[1]
 
     @property
     def backend_instance(self) -> gtsam.imuBias.ConstantBias:
         """GTSAM instance."""
-        return self._backend_instance
+        return super().backend_instance
 
     @property
     def backend_index(self) -> int:
         """GTSAM instance index."""
         return B(self._index)
 
-    def update(self, value: gtsam.Values) -> None:
-        """Updates the Imu bias with the new value.
+    def read(self, values: gtsam.Values) -> gtsam.imuBias.ConstantBias:
+        return values.atConstantBias(self.backend_index)
 
-        Args:
-            value: GTSAM values.
-        """
-        self._backend_instance = value.atConstantBias(self.backend_index)
-        self._value = self._backend_instance.accelerometer(), self._backend_instance.gyroscope()
+    def _create_instance(self, value: tuple[Vector3, Vector3]) -> gtsam.imuBias.ConstantBias:
+        return gtsam.imuBias.ConstantBias(value[0], value[1])
+
+    def to_row(self, instance: gtsam.imuBias.ConstantBias) -> np.ndarray:
+        return instance.vector()
+
+    def from_row(self, row: np.ndarray) -> tuple[Vector3, Vector3]:
+        return row[:3], row[3:]
 
 
 class Feature3D(NonOptimizableVertex):
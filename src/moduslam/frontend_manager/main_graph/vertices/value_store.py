@@ -0,0 +1,117 @@
+"""Contiguous storage of vertex values: row i holds the value of the vertex with index
+i.
+
+Complexity:
+O(1): set, discard, row, contains
+O(K): rows(indices) with K - number of indices.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+
+class ValueStore:
+    """Struct-of-arrays storage for the values of the vertices of one type."""
+
+    def __init__(self, row_shape: tuple[int, ...], capacity: int = 64):
+        """
+        Args:
+            row_shape: shape of the value of one vertex.
+
+            capacity: initial number of rows.
+        """
+        self._row_shape = row_shape
+        self._data = np.zeros((capacity, *row_shape))
+        self._valid = np.zeros(capacity, dtype=bool)
+
+    def __contains__(self, index: int) -> bool:
+        return 0 <= index < len(self._valid) and bool(self._valid[index])
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._valid))
+
+    @property
+    def row_shape(self) -> tuple[int, ...]:
+        """Shape of the value of one vertex."""
+        return self._row_shape
+
+    @property
+    def indices(self) -> np.ndarray:
+        """Sorted indices of the stored vertices."""
+        return np.flatnonzero(self._valid)
+
+    @property
+    def array(self) -> np.ndarray:
+        """Values of the stored vertices sorted by indices: N x row shape (copy)."""
+        return self._data[self._valid]
+
+    def set(self, index: int, row: np.ndarray) -> None:
+        """Sets the value of the vertex.
+
+        Args:
+            index: index of the vertex.
+
+            row: value of the vertex.
+        """
+        if index >= len(self._valid):
+            self._grow(index + 1)
+
+        self._data[index] = row
+        self._valid[index] = True
+
+    def discard(self, index: int) -> None:
+        """Removes the value of the vertex if present.
+
+        Args:
+            index: index of the vertex.
+        """
+        if index in self:
+            self._valid[index] = False
+
+    def row(self, index: int) -> np.ndarray:
+        """Gets the value of the vertex.
+
+        Args:
+            index: index of the vertex.
+
+        Returns:
+            read-only view of the value.
+
+        Raises:
+            KeyError: if there is no value for the index.
+        """
+        if index not in self:
+            raise KeyError(f"No value for the vertex with index {index}.")
+
+        view = self._data[index]
+        view.flags.writeable = False
+        return view
+
+    def rows(self, indices: Sequence[int]) -> np.ndarray:
+        """Gets the values of the vertices.
+
+        Args:
+            indices: indices of the vertices.
+
+        Returns:
+            values: N x row shape (copy).
+
+        Raises:
+            KeyError: if there is no value for some index.
+        """
+        array = np.asarray(indices, dtype=np.int64)
+
+        if len(array) and (array.max() >= len(self._valid) or not self._valid[array].all()):
+            raise KeyError("No values for some of the vertices.")
+
+        return self._data[array]
+
+    def _grow(self, size: int) -> None:
+        """Reallocates the arrays to have at least the given number of rows."""
+        capacity = max(size, 2 * len(self._valid))
+        data = np.zeros((capacity, *self._row_shape))
+        valid = np.zeros(capacity, dtype=bool)
+        data[: len(self._data)] = self._data
+        valid[: len(self._valid)] = self._valid
+        self._data, self._valid = data, valid
@@ -1,13 +1,22 @@
 import logging
+from pathlib import Path
 
 from moduslam.data_manager.batch_factory.batch import DataBatch
+from moduslam.data_manager.batch_factory.configs import DatasetConfig
+from moduslam.external.handlers_factory.concurrent_dispatcher import (
+    ConcurrentDispatcher,
+)
+from moduslam.external.handlers_factory.dispatcher import Dispatcher
 from moduslam.external.handlers_factory.factory import Factory
+from moduslam.external.handlers_factory.replay import ReplayDispatcher, create_key
+from moduslam.frontend_manager.config_factory import get_config as get_manager_config
 from moduslam.frontend_manager.graph_builders.simple.builder import Builder
 from moduslam.frontend_manager.graph_initializer.config_factory import get_config
 from moduslam.frontend_manager.graph_initializer.initializer import GraphInitializer
 from moduslam.frontend_manager.main_graph.graph import Graph
 from moduslam.logger.logging_config import frontend_manager
 from moduslam.measurement_storage.measurements.base import Measurement
+from moduslam.measurement_storage.storage import MeasurementStorage
 
 logger = logging.getLogger(frontend_manager)
 
@@ -15,11 +24,31 @@ logger = logging.getLogger(frontend_manager)
 class FrontendManager:
     """Manager for suboptimal graph construction."""
 
-    def __init__(self):
+    def __init__(self, dataset: DatasetConfig | None = None):
+        """
+        Args:
+            dataset: configuration of the dataset being processed: if replay is enabled
+                in the config, the measurements of the handlers are replayed from the log
+                of the previous run with the same dataset and handlers (or recorded).
+        """
+        config = get_manager_config()
         Factory.init_handlers()
-        handlers = Factory.get_handlers()
+        dispatcher: Dispatcher | ConcurrentDispatcher | ReplayDispatcher = Factory.get_dispatcher()
+        self._closable: list[ConcurrentDispatcher | ReplayDispatcher] = []
+
+        if config.dispatcher.concurrent:
+            dispatcher = ConcurrentDispatcher(dispatcher, config.dispatcher.read_ahead)
+            self._closable.append(dispatcher)
+
+        if config.replay.enabled and dataset is not None:
+            key = create_key((dataset, Factory.get_config()))
+            directory = Path(config.replay.directory)
+            dispatcher = ReplayDispatcher(dispatcher, directory, key)
+            self._closable.append(dispatcher)
+
         self._graph = Graph()
-        self._builder = Builder(handlers)
+        self._storage = MeasurementStorage()
+        self._builder = Builder(dispatcher, self._storage, config.graph_builder)
         logger.debug("Frontend Manager has been configured.")
 
     @property
@@ -27,6 +56,11 @@ class FrontendManager:
         """Main graph."""
         return self._graph
 
+    @property
+    def storage(self) -> MeasurementStorage:
+        """Storage for the measurements being added to the graph."""
+        return self._storage
+
     @staticmethod
     def create_prior_measurements() -> list[Measurement]:
         """Create prior measurements.
@@ -46,3 +80,9 @@ class FrontendManager:
             batch: data batch with elements.
         """
         self._graph = self._builder.create_graph(self._graph, batch)
+
+    def close(self) -> None:
+        """Completes the log of the handlers measurements if it is being recorded and
+        stops the worker threads of the handlers."""
+        for dispatcher in reversed(self._closable):
+            dispatcher.close()
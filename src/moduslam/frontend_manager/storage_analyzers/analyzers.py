@@ -1,87 +1,139 @@
+import importlib
+import logging
+import pkgutil
+from functools import cache
+
+from moduslam.frontend_manager.storage_analyzers.configs import (
+    AnalyzerConfig,
+    double_pose_odometry,
+    pose_odometry_with_gps,
+    quatro_pose_odometry,
+    single_pose_odometry,
+)
 from moduslam.frontend_manager.storage_analyzers.protocol import (
     StorageAnalyzer,
 )
-from moduslam.measurement_storage.measurements.pose_odometry import OdometryWithElements
-from moduslam.measurement_storage.measurements.position import Position
+from moduslam.logger.logging_config import frontend_manager
+from moduslam.measurement_storage import measurements
+from moduslam.measurement_storage.measurements.base import Measurement
 from moduslam.measurement_storage.storage import MeasurementStorage
+from moduslam.utils.exceptions import ConfigurationError
 
+logger = logging.getLogger(frontend_manager)
 
-class SinglePoseOdometry(StorageAnalyzer):
 
-    @staticmethod
-    def check_storage(storage: type[MeasurementStorage]) -> bool:
-        """Checks measurements storage if the criterion is satisfied.
+@cache
+def get_measurement_types() -> dict[str, type[Measurement]]:
+    """Gets all measurement types of the measurements package by their names.
 
-        Criterion:
-            1 pose odometry.
+    Returns:
+        table "type name -> type".
+    """
+    for module in pkgutil.iter_modules(measurements.__path__):
+        importlib.import_module(f"{measurements.__name__}.{module.name}")
 
-        Returns:
-            check status.
-        """
-        data = storage.data()
-        if OdometryWithElements in data:
-            return True
+    types: dict[str, type[Measurement]] = {}
+    bases: list[type[Measurement]] = [Measurement]
 
-        return False
+    while bases:
+        for subclass in bases.pop().__subclasses__():
+            types[subclass.__name__] = subclass
+            bases.append(subclass)
 
+    return types
 
-class DoublePoseOdometry(StorageAnalyzer):
 
-    @staticmethod
-    def check_storage(storage: type[MeasurementStorage]) -> bool:
-        """Checks measurements storage if the criterion is satisfied.
+class ConditionsAnalyzer(StorageAnalyzer):
+    """Keeps counters of measurements of the conditioned types and re-evaluates the
+    conditions only when a measurement of these types is added or removed."""
 
-        Criterion:
-            2 pose odometries.
+    def __init__(self, config: AnalyzerConfig):
+        """
+        Args:
+            config: trigger conditions.
 
-        Returns:
-            check status.
+        Raises:
+            ConfigurationError: if a measurement type is not supported.
         """
-        data = storage.data()
-        if OdometryWithElements in data and len(data[OdometryWithElements]) == 2:
-            return True
+        self._limits: dict[type[Measurement], tuple[int, int | None]] = {}
 
-        return False
+        for condition in config.conditions:
+            try:
+                m_type = get_measurement_types()[condition.measurement_type_name]
+            except KeyError:
+                msg = f"Unsupported measurement type: {condition.measurement_type_name}."
+                logger.error(msg)
+                raise ConfigurationError(msg)
 
+            self._limits[m_type] = (condition.min_count, condition.max_count)
 
-class QuatroPoseOdometry(StorageAnalyzer):
+        self._time_window = config.time_window
+        self._counts = dict.fromkeys(self._limits, 0)
+        self._satisfied = False
 
-    @staticmethod
-    def check_storage(storage: type[MeasurementStorage]) -> bool:
-        """Checks measurements storage if the criterion is satisfied.
+    @property
+    def satisfied(self) -> bool:
+        """Checks if all conditions are satisfied."""
+        return self._satisfied
 
-        Criterion:
-            2 pose odometries.
+    def on_add(self, storage: MeasurementStorage, measurement: Measurement) -> None:
+        m_type = type(measurement)
+        if m_type in self._counts:
+            self._counts[m_type] += 1
+            self._satisfied = self._evaluate(storage)
 
-        Returns:
-            check status.
-        """
-        data = storage.data()
-        if OdometryWithElements in data and len(data[OdometryWithElements]) == 4:
-            return True
+    def on_remove(self, storage: MeasurementStorage, measurement: Measurement) -> None:
+        m_type = type(measurement)
+        if m_type in self._counts:
+            self._counts[m_type] -= 1
+            self._satisfied = self._evaluate(storage)
 
-        return False
+    def on_clear(self, storage: MeasurementStorage) -> None:
+        self._counts = dict.fromkeys(self._limits, 0)
+        self._satisfied = self._evaluate(storage)
 
+    def _evaluate(self, storage: MeasurementStorage) -> bool:
+        """Evaluates the conditions with the counters and the time span of the
+        conditioned measurements."""
+        for m_type, (min_count, max_count) in self._limits.items():
+            count = self._counts[m_type]
+            if count < min_count or (max_count is not None and count > max_count):
+                return False
 
-class PoseOdometryWithGps(StorageAnalyzer):
+        if self._time_window is not None:
+            data = storage.data()
+            timelines = [data[m_type] for m_type in self._limits if m_type in data]
+            if timelines:
+                start = min(timeline.start for timeline in timelines)
+                stop = max(timeline.stop for timeline in timelines)
+                return stop - start <= self._time_window
 
-    @staticmethod
-    def check_storage(storage: type[MeasurementStorage]) -> bool:
-        """Checks measurements storage if the criterion is satisfied.
+        return True
 
-        Criterion:
-            1 pose odometry and GPS measurements.
 
-        Returns:
-            check status.
-        """
-        data = storage.data()
-        if (
-            OdometryWithElements in data
-            and Position in data
-            and len(data[OdometryWithElements]) == 1
-            and len(data[Position]) == 1
-        ):
-            return True
-
-        return False
+class SinglePoseOdometry(ConditionsAnalyzer):
+    """Criterion: at least 1 pose odometry."""
+
+    def __init__(self):
+        super().__init__(single_pose_odometry())
+
+
+class DoublePoseOdometry(ConditionsAnalyzer):
+    """Criterion: 2 pose odometries."""
+
+    def __init__(self):
+        super().__init__(double_pose_odometry())
+
+
+class QuatroPoseOdometry(ConditionsAnalyzer):
+    """Criterion: 4 pose odometries."""
+
+    def __init__(self):
+        super().__init__(quatro_pose_odometry())
+
+
+class PoseOdometryWithGps(ConditionsAnalyzer):
+    """Criterion: 1 pose odometry and 1 GPS measurement."""
+
+    def __init__(self):
+        super().__init__(pose_odometry_with_gps())
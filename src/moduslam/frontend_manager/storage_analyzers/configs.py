@@ -0,0 +1,44 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ConditionConfig:
+    """Number of measurements of the type required in the storage."""
+
+    measurement_type_name: str
+    min_count: int = 1
+    max_count: int | None = None  # no upper limit if None.
+
+
+@dataclass
+class AnalyzerConfig:
+    """Trigger condition of a storage analyzer: all conditions must be satisfied."""
+
+    conditions: list[ConditionConfig] = field(default_factory=list)
+
+    # max time span of the measurements of conditioned types [ns], no limit if None.
+    time_window: int | None = None
+
+
+def single_pose_odometry() -> AnalyzerConfig:
+    """At least 1 pose odometry."""
+    return AnalyzerConfig([ConditionConfig("OdometryWithElements", min_count=1)])
+
+
+def double_pose_odometry() -> AnalyzerConfig:
+    """2 pose odometries."""
+    return AnalyzerConfig([ConditionConfig("OdometryWithElements", min_count=2, max_count=2)])
+
+
+def quatro_pose_odometry() -> AnalyzerConfig:
+    """4 pose odometries."""
+    return AnalyzerConfig([ConditionConfig("OdometryWithElements", min_count=4, max_count=4)])
+
+
+def pose_odometry_with_gps() -> AnalyzerConfig:
+    """1 pose odometry and 1 GPS measurement."""
+    conditions = [
+        ConditionConfig("OdometryWithElements", min_count=1, max_count=1),
+        ConditionConfig("Position", min_count=1, max_count=1),
+    ]
+    return AnalyzerConfig(conditions)
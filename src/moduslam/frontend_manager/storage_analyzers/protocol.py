@@ -1,14 +1,12 @@
 from typing import Protocol
 
-from moduslam.measurement_storage.storage import MeasurementStorage
+from moduslam.measurement_storage.storage import StorageListener
 
 
-class StorageAnalyzer(Protocol):
+class StorageAnalyzer(StorageListener, Protocol):
+    """Listens to the storage events and decides if the storage has enough
+    measurements."""
 
-    @staticmethod
-    def check_storage(storage: type[MeasurementStorage]) -> bool:
-        """Checks if a storage has enough measurements.
-
-        Args:
-            storage: a storage to check.
-        """
+    @property
+    def satisfied(self) -> bool:
+        """Checks if the storage has enough measurements."""
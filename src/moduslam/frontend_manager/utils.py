@@ -1,7 +1,9 @@
-from collections.abc import Iterable
-
-from moduslam.data_manager.batch_factory.batch import DataBatch, Element
-from moduslam.external.handlers_factory.handlers.handler_protocol import Handler
+from moduslam.data_manager.batch_factory.batch import DataBatch
+from moduslam.external.handlers_factory.concurrent_dispatcher import (
+    ConcurrentDispatcher,
+)
+from moduslam.external.handlers_factory.dispatcher import Dispatcher
+from moduslam.external.handlers_factory.replay import ReplayDispatcher
 from moduslam.frontend_manager.main_graph.edges.base import (
     BinaryEdge,
     Edge,
@@ -13,7 +15,6 @@ from moduslam.frontend_manager.main_graph.edges.combined_imu_odometry import (
 from moduslam.frontend_manager.main_graph.edges.imu_odometry import ImuOdometry
 from moduslam.frontend_manager.main_graph.vertices.base import Vertex
 from moduslam.frontend_manager.storage_analyzers.protocol import StorageAnalyzer
-from moduslam.measurement_storage.measurements.base import Measurement
 from moduslam.measurement_storage.measurements.imu import ContinuousImu
 from moduslam.measurement_storage.measurements.imu_bias import Bias
 from moduslam.measurement_storage.measurements.linear_velocity import Velocity
@@ -24,64 +25,63 @@ from moduslam.measurement_storage.storage import MeasurementStorage
 from moduslam.utils.exceptions import NotEnoughMeasurementsError
 
 
-def distribute_element(handlers: Iterable[Handler], element: Element) -> Measurement | None:
-    """Processes an element with the appropriate handler.
-
-    Args:
-        handlers:
-
-        element: element to be distributed and processed.
+def fill_storage(
+    storage: MeasurementStorage,
+    data: DataBatch,
+    dispatcher: Dispatcher | ConcurrentDispatcher | ReplayDispatcher,
+    analyzer: StorageAnalyzer,
+) -> None:
+    """Fills the storage with the measurements created by handlers using the given data.
+    The storage is filled based on the analyzer`s decision.
 
-    Returns:
-        new measurement or None.
-    """
-    sensor = element.measurement.sensor
+    The elements are removed from the data batch only when their measurements are
+    used.
 
-    for handler in handlers:
-        if handler.sensor_type == type(sensor) and handler.sensor_name == sensor.name:
+    Args:
+        storage: a storage to fill in.
 
-            new_measurement = handler.process(element)
+        data: a data batch with elements.
 
-            if new_measurement:
-                return new_measurement
+        dispatcher: a dispatcher of elements to handlers.
 
-            break
+        analyzer: an analyzer to decide if the storage is filled: it is subscribed to the
+            storage events while filling.
 
-    return None
+    Raises:
+        NotEnoughMeasurementsError: not enough data to fill the storage.
+    """
+    storage.subscribe(analyzer)
+    try:
+        fill_until_satisfied(storage, data, dispatcher, analyzer)
+    finally:
+        storage.unsubscribe(analyzer)
 
 
-def fill_storage(
-    storage: type[MeasurementStorage],
+def fill_until_satisfied(
+    storage: MeasurementStorage,
     data: DataBatch,
-    handlers: Iterable[Handler],
+    dispatcher: Dispatcher | ConcurrentDispatcher | ReplayDispatcher,
     analyzer: StorageAnalyzer,
 ) -> None:
-    """Fills the storage with the measurements created by handlers using the given data.
-    The storage is filled based on the analyzer`s decision.
+    """Adds measurements to the storage until the subscribed analyzer is satisfied.
 
     Args:
         storage: a storage to fill in.
 
         data: a data batch with elements.
 
-        handlers: handlers to create measurements.
+        dispatcher: a dispatcher of elements to handlers.
 
-        analyzer: an analyzer to decide if the storage is filled.
+        analyzer: an analyzer subscribed to the storage.
 
     Raises:
         NotEnoughMeasurementsError: not enough data to fill the storage.
     """
-    enough_measurements = False
-
-    while not enough_measurements and not data.empty:
-        element = data.first
-        data.remove_first()
-        new_measurement = distribute_element(handlers, element)
-
-        storage.add(new_measurement) if new_measurement else None
+    for new_measurement in dispatcher.measurements(data):
+        if new_measurement:
+            storage.add(new_measurement)
 
-        enough_measurements = analyzer.check_storage(storage)
-        if enough_measurements:
+        if analyzer.satisfied:
             return
 
     raise NotEnoughMeasurementsError
@@ -6,7 +6,6 @@ from moduslam.data_manager.manager import DataManager
 from moduslam.frontend_manager.manager import FrontendManager
 from moduslam.logger.logging_config import main_manager
 from moduslam.map_manager.manager import MapManager
-from moduslam.measurement_storage.storage import MeasurementStorage
 
 logger = logging.getLogger(main_manager)
 
@@ -16,7 +15,7 @@ class MainManager:
 
     def __init__(self) -> None:
         self._data_manager = DataManager()
-        self._frontend_manager = FrontendManager()
+        self._frontend_manager = FrontendManager(self._data_manager.dataset)
         self._backend_manager = BackendManager()
         self._map_manager = MapManager()
         self._trajectory_file = Path(__file__).parent / "trajectory.txt"
@@ -26,12 +25,13 @@ class MainManager:
         """Builds the map using data from the data manager."""
         priors = self._frontend_manager.create_prior_measurements()
         for measurement in priors:
-            MeasurementStorage.add(measurement)
+            self._frontend_manager.storage.add(measurement)
 
         self._data_manager.make_batch_sequentially()
         data = self._data_manager.batch_factory.batch
 
         self._frontend_manager.create_graph(data)
+        self._frontend_manager.close()
 
         graph = self._frontend_manager.graph
         self._backend_manager.solve(graph)
@@ -1,12 +1,14 @@
 import logging
 from typing import TypeAlias
 
-import numpy as np
 import open3d
 
 from moduslam.data_manager.batch_factory.batch import Element
 from moduslam.data_manager.batch_factory.factory import BatchFactory
 from moduslam.frontend_manager.main_graph.graph import Graph
+from moduslam.frontend_manager.main_graph.vertices.backend_values import (
+    stack_values,
+)
 from moduslam.frontend_manager.main_graph.vertices.custom import Pose
 from moduslam.logger.logging_config import map_manager
 from moduslam.map_manager.factories.lidar_map.config import (
@@ -70,10 +72,9 @@ class LidarMapFactory(MapFactory):
             TypeError: if the sensor is not of type Lidar3D.
         """
         points_map = Cloud()
+        pose_arrays = stack_values(Pose, list(pose_elements_table.keys()))
 
-        for pose, elements in pose_elements_table.items():
-            pose_array = np.array(pose.value)
-
+        for pose_array, elements in zip(pose_arrays, pose_elements_table.values()):
             for element in elements:
                 cloud = create_point_cloud_from_element(element, config)
                 cloud.transform(pose_array)
@@ -7,6 +7,9 @@ from moduslam.custom_types.aliases import Matrix4x4
 from moduslam.frontend_manager.main_graph.vertex_storage.cluster import (
     VertexCluster,
 )
+from moduslam.frontend_manager.main_graph.vertices.backend_values import (
+    stack_values,
+)
 from moduslam.frontend_manager.main_graph.vertices.custom import Pose
 from moduslam.utils.auxiliary_methods import str_to_float, str_to_int
 
@@ -22,18 +25,17 @@ def get_trajectory(clusters: Iterable[VertexCluster]) -> Trajectory:
     Returns:
         timestamps with SE(3) poses.
     """
-    trajectory: Trajectory = []
+    timestamps: list[int] = []
+    poses: list[Pose] = []
 
     for cluster in clusters:
-        poses = cluster.get_vertices_of_type(Pose)
-
-        for pose in poses:
-            timestamps = cluster.get_timestamps(pose)
+        for pose in cluster.get_vertices_of_type(Pose):
+            for t in cluster.get_timestamps(pose):
+                timestamps.append(t)
+                poses.append(pose)
 
-            for t in timestamps:
-                trajectory.append((t, pose.value))
-
-    return trajectory
+    matrices = stack_values(Pose, poses)
+    return list(zip(timestamps, matrices))
 
 
 def save_trajectory_to_txt(file_path: Path, trajectory: Trajectory) -> None:
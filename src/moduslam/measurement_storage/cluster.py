@@ -208,3 +208,79 @@ class MeasurementCluster:
             return TimeRange(start, stop)
         else:
             return None
+
+
+class ClusterView(MeasurementCluster):
+    """Read-only view of a cluster with an overlay of added continuous measurements.
+
+    The discrete measurements and the time properties are shared with the viewed
+    cluster: the view is created without re-adding and sorting the measurements. The
+    viewed cluster must not be modified while the view is in use.
+    """
+
+    def __init__(self, cluster: MeasurementCluster):
+        """
+        Args:
+            cluster: a cluster to view.
+        """
+        super().__init__()
+        self._cluster = cluster
+        self._core_measurements = cluster._core_measurements
+        self._timestamp = cluster._timestamp
+        self._time_range = cluster._time_range
+        for measurement in cluster._continuous_measurements:
+            self._continuous_measurements.add(measurement)
+
+    def __repr__(self):
+        number = len(self._core_measurements) + len(self._continuous_measurements)
+        return f"Cluster view with {number} measurements."
+
+    @property
+    def cluster(self) -> MeasurementCluster:
+        """Viewed cluster."""
+        return self._cluster
+
+    def add(self, measurement: Measurement) -> None:
+        """Adds new continuous measurement to the overlay of the view.
+
+        Args:
+            measurement: continuous measurement to add.
+
+        Raises:
+            ValidationError: if measurement is not continuous or is already present in
+                the view.
+        """
+        if not isinstance(measurement, ContinuousMeasurement):
+            raise ValidationError("Only continuous measurements can be added to a cluster view.")
+
+        super().add(measurement)
+
+    def remove(self, measurement: Measurement) -> None:
+        """Removes the continuous measurement from the view.
+
+        Args:
+            measurement: continuous measurement to remove.
+
+        Raises:
+            ValidationError: if measurement is not continuous or is not present in the
+                view.
+        """
+        if not isinstance(measurement, ContinuousMeasurement):
+            msg = "Only continuous measurements can be removed from a cluster view."
+            raise ValidationError(msg)
+
+        super().remove(measurement)
+
+    def materialize(self) -> MeasurementCluster:
+        """Creates an independent cluster with the measurements of the view.
+
+        Returns:
+            new cluster.
+        """
+        cluster = MeasurementCluster()
+        cluster._core_measurements = {t: set(ms) for t, ms in self._core_measurements.items()}
+        cluster._timestamp = self._timestamp
+        cluster._time_range = self._time_range
+        for measurement in self._continuous_measurements:
+            cluster._continuous_measurements.add(measurement)
+        return cluster
@@ -1,8 +1,16 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TypeVar
 
+import numpy as np
+
 from moduslam.custom_types.aliases import Matrix3x3, Matrix4x4, Vector3
-from moduslam.measurement_storage.measurements.base import Measurement
+from moduslam.custom_types.numpy import MatrixNx3, VectorN
+from moduslam.measurement_storage.measurements.base import (
+    Measurement,
+    TimeRangeMeasurement,
+)
 from moduslam.measurement_storage.measurements.continuous import ContinuousMeasurement
 from moduslam.utils.auxiliary_dataclasses import TimeRange
 
@@ -64,6 +72,7 @@ class ProcessedImu(Imu):
             tf_base_sensor: transformation from base to IMU sensor.
         """
         super().__init__(timestamp, data)
+        self._covariance = covariance
         self._acceleration_covariance = covariance.acceleration
         self._angular_velocity_covariance = covariance.angular_velocity
         self._integration_noise_covariance = covariance.integration_noise
@@ -75,6 +84,11 @@ class ProcessedImu(Imu):
     def tf_base_sensor(self) -> Matrix4x4:
         return self._tf
 
+    @property
+    def covariance(self) -> ImuCovariance:
+        """All noise covariances of the measurement."""
+        return self._covariance
+
     @property
     def acceleration_covariance(self) -> Matrix3x3:
         """Noise covariance matrix of the acceleration part."""
@@ -101,6 +115,107 @@ class ProcessedImu(Imu):
         return self._gyroscope_bias_covariance
 
 
+class ImuBlock(TimeRangeMeasurement):
+    """Columnar IMU measurements of one sensor: timestamps, accelerations and angular
+    velocities as contiguous arrays."""
+
+    def __init__(
+        self,
+        timestamps: VectorN,
+        accelerations: MatrixNx3,
+        angular_velocities: MatrixNx3,
+        covariance: ImuCovariance,
+        tf_base_sensor: Matrix4x4,
+    ):
+        """
+        Args:
+            timestamps: sorted timestamps [N].
+
+            accelerations: linear accelerations [N, 3].
+
+            angular_velocities: angular velocities [N, 3].
+
+            covariance: IMU covariance shared by all measurements.
+
+            tf_base_sensor: transformation from base to IMU sensor.
+
+        Raises:
+            ValueError: if the block is empty or the arrays have different lengths.
+        """
+        num = len(timestamps)
+
+        if num == 0 or len(accelerations) != num or len(angular_velocities) != num:
+            raise ValueError("IMU block must have non-empty arrays of the same length.")
+
+        self._timestamps = np.ascontiguousarray(timestamps, dtype=np.int64)
+        self._accelerations = np.ascontiguousarray(accelerations, dtype=np.float64)
+        self._angular_velocities = np.ascontiguousarray(angular_velocities, dtype=np.float64)
+        self._covariance = covariance
+        self._tf = tf_base_sensor
+        self._time_range = TimeRange(int(self._timestamps[0]), int(self._timestamps[-1]))
+
+    @classmethod
+    def from_measurements(cls, measurements: Sequence["ProcessedImu"]) -> "ImuBlock":
+        """Creates the block from processed IMU measurements of one sensor. The
+        covariance and the transformation are taken from the 1-st measurement.
+
+        Args:
+            measurements: sorted by timestamp IMU measurements.
+
+        Returns:
+            IMU block.
+        """
+        first = measurements[0]
+        return cls(
+            np.fromiter((m.timestamp for m in measurements), np.int64, len(measurements)),
+            np.array([m.linear_acceleration for m in measurements], dtype=np.float64),
+            np.array([m.angular_velocity for m in measurements], dtype=np.float64),
+            first.covariance,
+            first.tf_base_sensor,
+        )
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def __repr__(self) -> str:
+        return f"IMU block with: {len(self)} items."
+
+    @property
+    def timestamp(self) -> int:
+        """Timestamp of the last measurement."""
+        return self._time_range.stop
+
+    @property
+    def time_range(self) -> TimeRange:
+        """Timestamps of the first and the last measurements."""
+        return self._time_range
+
+    @property
+    def timestamps(self) -> VectorN:
+        """Timestamps [N]."""
+        return self._timestamps
+
+    @property
+    def accelerations(self) -> MatrixNx3:
+        """Linear accelerations [N, 3]."""
+        return self._accelerations
+
+    @property
+    def angular_velocities(self) -> MatrixNx3:
+        """Angular velocities [N, 3]."""
+        return self._angular_velocities
+
+    @property
+    def covariance(self) -> ImuCovariance:
+        """IMU covariance."""
+        return self._covariance
+
+    @property
+    def tf_base_sensor(self) -> Matrix4x4:
+        """Transformation from base to IMU sensor."""
+        return self._tf
+
+
 I = TypeVar("I", bound=Imu)
 
 
@@ -129,3 +244,8 @@ class ContinuousImu(ContinuousMeasurement[I]):
 
     def __repr__(self):
         return f"Continuous IMU with: {len(self._items)} items."
+
+    @cached_property
+    def block(self) -> ImuBlock:
+        """Columnar representation of the processed IMU items (created once)."""
+        return ImuBlock.from_measurements(self._items)  # type: ignore[arg-type]
@@ -1,8 +1,9 @@
 import logging
+from typing import Protocol
 
 from moduslam.logger.logging_config import frontend_manager
 from moduslam.measurement_storage.measurements.base import Measurement
-from moduslam.measurement_storage.measurements.time_limits_updater import Updater
+from moduslam.measurement_storage.timeline import Timeline
 from moduslam.utils.auxiliary_dataclasses import TimeRange
 from moduslam.utils.exceptions import (
     EmptyStorageError,
@@ -10,60 +11,111 @@ from moduslam.utils.exceptions import (
     ItemNotExistsError,
     ValidationError,
 )
-from moduslam.utils.ordered_set import OrderedSet
 
 logger = logging.getLogger(frontend_manager)
 
 
+class StorageListener(Protocol):
+    """Receives events of the measurement storage."""
+
+    def on_add(self, storage: "MeasurementStorage", measurement: Measurement) -> None:
+        """Is called after the measurement has been added to the storage."""
+
+    def on_remove(self, storage: "MeasurementStorage", measurement: Measurement) -> None:
+        """Is called after the measurement has been removed from the storage."""
+
+    def on_clear(self, storage: "MeasurementStorage") -> None:
+        """Is called after the storage has been cleared."""
+
+
 class MeasurementStorage:
-    """Global Storage for the processed measurements."""
+    """Storage for the processed measurements: a timestamp-sorted timeline per
+    measurement type.
+
+    Time range and recent measurement are computed from the extrema of the timelines:
+    O(T), with T - number of measurement types.
+    """
 
-    _data: dict[type[Measurement], OrderedSet[Measurement]] = {}
-    _start_timestamp: int | None = None
-    _stop_timestamp: int | None = None
-    _recent_measurement: Measurement | None = None
+    def __init__(self):
+        self._data: dict[type[Measurement], Timeline] = {}
+        self._listeners: list[StorageListener] = []
 
-    @classmethod
-    def data(cls) -> dict[type[Measurement], OrderedSet[Measurement]]:
-        """Dictionary with typed OrderedSets."""
-        return cls._data
+    def data(self) -> dict[type[Measurement], Timeline]:
+        """Dictionary with typed timelines."""
+        return self._data
 
-    @classmethod
-    def recent_measurement(cls) -> Measurement:
-        """A measurement with the latest "stop" timestamp in the storage.
+    def recent_measurement(self) -> Measurement:
+        """A measurement with the latest timestamp in the storage.
 
         Raises:
             EmptyStorageError: recent measurement does not exist in empty storage.
         """
-        if cls._recent_measurement:
-            return cls._recent_measurement
+        if self._data:
+            latest = (timeline.latest() for timeline in self._data.values())
+            return max(latest, key=lambda measurement: measurement.timestamp)
         else:
             msg = "Recent measurement does not exist in empty storage."
             logger.error(msg)
             raise EmptyStorageError(msg)
 
-    @classmethod
-    def time_range(cls) -> TimeRange:
+    def time_range(self) -> TimeRange:
         """Start & stop time margins to cover all measurements in the storage.
 
         Raises:
             EmptyStorageError: time range does not exist for empty storage.
         """
-        if cls._start_timestamp is not None and cls._stop_timestamp is not None:
-            return TimeRange(cls._start_timestamp, cls._stop_timestamp)
+        if self._data:
+            start = min(timeline.start for timeline in self._data.values())
+            stop = max(timeline.stop for timeline in self._data.values())
+            return TimeRange(start, stop)
 
         else:
             msg = "Time range does not exist for empty storage."
             logger.error(msg)
             raise EmptyStorageError(msg)
 
-    @classmethod
-    def empty(cls) -> bool:
+    def empty(self) -> bool:
         """Checks if the storage is empty."""
-        return not bool(cls._data)
+        return not bool(self._data)
+
+    def subscribe(self, listener: StorageListener) -> None:
+        """Subscribes the listener to the storage events. The listener gets the
+        current state as "clear" event followed by "add" events of all measurements.
+
+        Args:
+            listener: a listener to subscribe.
+        """
+        self._listeners.append(listener)
+        listener.on_clear(self)
+        for timeline in self._data.values():
+            for measurement in timeline:
+                listener.on_add(self, measurement)
+
+    def unsubscribe(self, listener: StorageListener) -> None:
+        """Unsubscribes the listener from the storage events.
+
+        Args:
+            listener: a listener to unsubscribe.
+        """
+        self._listeners.remove(listener)
+
+    def range(self, m_type: type[Measurement], start: int, stop: int) -> list[Measurement]:
+        """Gets measurements of the type with timestamps in the range [start, stop].
+
+        Args:
+            m_type: type of measurements.
+
+            start: start of the range.
 
-    @classmethod
-    def add(cls, measurement: Measurement) -> None:
+            stop: stop of the range.
+
+        Returns:
+            measurements sorted by timestamps.
+        """
+        timeline = self._data.get(m_type)
+        return timeline.range(start, stop) if timeline else []
+
+    def add(self, measurement: Measurement) -> None:
         """Adds new measurement to the storage.
 
         Args:
@@ -73,21 +125,18 @@ class MeasurementStorage:
             ValidationError: if measurement is already present in the storage.
         """
         try:
-            cls._validate_new_measurement(measurement)
+            self._validate_new_measurement(measurement)
         except ItemExistsError as e:
             logger.error(e)
             raise ValidationError(e)
 
         m_type = type(measurement)
-        cls._data.setdefault(m_type, OrderedSet()).add(measurement)
+        self._data.setdefault(m_type, Timeline()).add(measurement)
 
-        cls._start_timestamp, cls._stop_timestamp = Updater.update_start_stop_on_adding(
-            measurement, cls._start_timestamp, cls._stop_timestamp
-        )
-        cls._update_recent_measurement(measurement)
+        for listener in self._listeners:
+            listener.on_add(self, measurement)
 
-    @classmethod
-    def remove(cls, measurement: Measurement) -> None:
+    def remove(self, measurement: Measurement) -> None:
         """Removes the measurement from the storage.
 
         Args:
@@ -97,61 +146,28 @@ class MeasurementStorage:
             ValidationError: if measurement is not present in the storage.
         """
         try:
-            cls._validate_removing_measurement(measurement)
+            self._validate_removing_measurement(measurement)
         except ItemNotExistsError as e:
             logger.error(e)
             raise ValidationError(e)
 
         m_type = type(measurement)
-        cls._data[m_type].remove(measurement)
+        self._data[m_type].remove(measurement)
 
-        if not cls._data[m_type]:
-            del cls._data[m_type]
+        if not self._data[m_type]:
+            del self._data[m_type]
 
-        if measurement == cls._recent_measurement:
-            cls._recent_measurement = cls._find_recent_measurement()
+        for listener in self._listeners:
+            listener.on_remove(self, measurement)
 
-        cls._start_timestamp, cls._stop_timestamp = Updater.update_start_stop_on_removing(
-            cls._data, measurement, cls._start_timestamp, cls._stop_timestamp
-        )
-
-    @classmethod
-    def clear(cls) -> None:
+    def clear(self) -> None:
         """Clears the storage."""
-        cls._start_timestamp = None
-        cls._stop_timestamp = None
-        cls._recent_measurement = None
-        cls._data.clear()
+        self._data.clear()
 
-    @classmethod
-    def _update_recent_measurement(cls, measurement: Measurement) -> None:
-        """Updates the recent measurement in the storage by comparing the "stop"
-        timestamp of measurement`s time range.
+        for listener in self._listeners:
+            listener.on_clear(self)
 
-        Args:
-            measurement: new measurement to compare with.
-        """
-        if (
-            cls._recent_measurement is None
-            or measurement.timestamp > cls._recent_measurement.timestamp
-        ):
-            cls._recent_measurement = measurement
-
-    @classmethod
-    def _find_recent_measurement(cls) -> Measurement | None:
-        """Finds the measurement with the latest "stop" timestamp in the storage."""
-        if not cls._data:
-            return None
-
-        recent_measurement = max(
-            (measurement for measurements in cls._data.values() for measurement in measurements),
-            key=lambda measurement: measurement.timestamp,
-            default=None,
-        )
-        return recent_measurement
-
-    @classmethod
-    def _validate_new_measurement(cls, measurement: Measurement) -> None:
+    def _validate_new_measurement(self, measurement: Measurement) -> None:
         """Validates a new measurement before adding.
 
         Args:
@@ -162,11 +178,10 @@ class MeasurementStorage:
         """
         m_type = type(measurement)
 
-        if m_type in cls._data and measurement in cls._data[m_type]:
+        if m_type in self._data and measurement in self._data[m_type]:
             raise ItemExistsError(f"Measurement {measurement} already exists in the storage.")
 
-    @classmethod
-    def _validate_removing_measurement(cls, measurement: Measurement) -> None:
+    def _validate_removing_measurement(self, measurement: Measurement) -> None:
         """Validates a measurement before removing.
 
         Args:
@@ -177,5 +192,5 @@ class MeasurementStorage:
         """
         m_type = type(measurement)
 
-        if m_type not in cls._data or measurement not in cls._data[m_type]:
+        if m_type not in self._data or measurement not in self._data[m_type]:
             raise ItemNotExistsError(f"Measurement {measurement} does not exist in the storage.")
@@ -0,0 +1,186 @@
+"""Timestamp-sorted ordered set of measurements of one type."""
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
+
+from moduslam.measurement_storage.measurements.base import (
+    Measurement,
+    TimeRangeMeasurement,
+)
+from moduslam.utils.ordered_set import OrderedSet
+
+
+class Timeline(OrderedSet[Measurement]):
+    """OrderedSet of measurements sorted by timestamps. Measurements with equal
+    timestamps keep the order of adding.
+
+    Start (stop) timestamps of time range measurements are kept in sorted lists to get
+    the earliest start and the latest stop without iterating over measurements.
+
+    Complexity:
+    O(1): contains, earliest, latest, start, stop
+    O(log N): range(start, stop) + O(K) with K - number of measurements in the range.
+    O(log N) + memory shift of sorted timestamps: add, remove, discard
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._timestamps: list[int] = []
+        self._starts: list[int] = []
+        self._stops: list[int] = []
+
+    @property
+    def start(self) -> int:
+        """The earliest timestamp (or time range start) in the timeline.
+
+        Raises:
+            KeyError: if the timeline is empty.
+        """
+        if not self._starts:
+            raise KeyError("Timeline is empty")
+        return self._starts[0]
+
+    @property
+    def stop(self) -> int:
+        """The latest timestamp (or time range stop) in the timeline.
+
+        Raises:
+            KeyError: if the timeline is empty.
+        """
+        if not self._stops:
+            raise KeyError("Timeline is empty")
+        return self._stops[-1]
+
+    def earliest(self) -> Measurement:
+        """Measurement with the earliest timestamp.
+
+        Raises:
+            KeyError: if the timeline is empty.
+        """
+        return self.first
+
+    def latest(self) -> Measurement:
+        """Measurement with the latest timestamp. If several measurements have the
+        latest timestamp, the first added is returned.
+
+        Raises:
+            KeyError: if the timeline is empty.
+        """
+        if not self._timestamps:
+            raise KeyError("Timeline is empty")
+
+        index = bisect_left(self._timestamps, self._timestamps[-1])
+        return self._items[index]
+
+    def range(self, start: int, stop: int) -> list[Measurement]:
+        """Gets measurements with timestamps in the range [start, stop].
+
+        Args:
+            start: start of the range.
+
+            stop: stop of the range.
+
+        Returns:
+            measurements sorted by timestamps.
+        """
+        first = bisect_left(self._timestamps, start)
+        last = bisect_right(self._timestamps, stop)
+        return self._items[first:last]
+
+    def add(self, item: Measurement | Iterable[Measurement]) -> None:
+        """Adds measurement(s) to the timeline according to their timestamps.
+
+        Args:
+            item: measurement(s) to be added.
+
+        Raises:
+            TypeError: if a measurement is not hashable.
+        """
+        items = item if isinstance(item, Iterable) else (item,)
+
+        for measurement in items:
+            if not self._is_hashable(measurement):
+                raise TypeError("Item is not hashable and cannot be added to Timeline.")
+
+            if measurement in self._items:
+                continue
+
+            t = measurement.timestamp
+            index = bisect_right(self._timestamps, t)
+            self._items.insert(index, measurement)
+            self._timestamps.insert(index, t)
+
+            start, stop = get_start_stop(measurement)
+            insort(self._starts, start)
+            insort(self._stops, stop)
+
+    def insert(self, item: Measurement, index: int) -> None:
+        """Adds the measurement: the position is defined by its timestamp.
+
+        Args:
+            item: a measurement to be added.
+
+            index: ignored.
+        """
+        self.add(item)
+
+    def discard(self, item: Measurement | Iterable[Measurement]) -> None:
+        """Removes measurement(s) from the timeline if present.
+
+        Args:
+            item: measurement(s) to be removed.
+        """
+        items = item if isinstance(item, Iterable) else (item,)
+
+        for measurement in items:
+            if measurement in self._items:
+                self._remove(measurement)
+
+    def remove(self, item: Measurement | Iterable[Measurement]) -> None:
+        """Removes measurement(s) from the timeline.
+
+        Args:
+            item: measurement(s) to be removed.
+
+        Raises:
+            KeyError: if a measurement is not present in the timeline.
+        """
+        items = item if isinstance(item, Iterable) else (item,)
+
+        for measurement in items:
+            if measurement not in self._items:
+                raise KeyError(f"Item not found in Timeline: {measurement}")
+            self._remove(measurement)
+
+    def clear(self) -> None:
+        """Removes all measurements from the timeline."""
+        super().clear()
+        self._timestamps.clear()
+        self._starts.clear()
+        self._stops.clear()
+
+    def _remove(self, measurement: Measurement) -> None:
+        """Removes the existing measurement and its timestamps."""
+        index = self._items.index(measurement)
+        self._items.pop(index)
+        del self._timestamps[index]
+
+        start, stop = get_start_stop(measurement)
+        del self._starts[bisect_left(self._starts, start)]
+        del self._stops[bisect_left(self._stops, stop)]
+
+
+def get_start_stop(measurement: Measurement) -> tuple[int, int]:
+    """Gets start and stop timestamps of the measurement.
+
+    Args:
+        measurement: a measurement.
+
+    Returns:
+        start and stop timestamps.
+    """
+    if isinstance(measurement, TimeRangeMeasurement):
+        return measurement.time_range.start, measurement.time_range.stop
+
+    t = measurement.timestamp
+    return t, t
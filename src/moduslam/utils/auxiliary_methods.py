@@ -18,13 +18,9 @@ from plum import dispatch
 
 from moduslam.custom_types.aliases import Matrix3x3, Matrix4x4, Vector3
 from moduslam.custom_types.numpy import Matrix4x4 as NumpyMatrix4x4
-from moduslam.custom_types.numpy import (
-    MatrixMxN,
-)
+from moduslam.custom_types.numpy import MatrixMxN
 from moduslam.custom_types.numpy import Vector3 as NumpyVector3
-from moduslam.custom_types.numpy import (
-    VectorN,
-)
+from moduslam.custom_types.numpy import VectorN
 from moduslam.logger.logging_config import utils
 from moduslam.utils.exceptions import DimensionalityError
 
@@ -295,6 +291,31 @@ def check_dimensionality(array: np.ndarray, shape: tuple[int, ...]) -> None:
         raise DimensionalityError(msg)
 
 
+def extract_number(file: Path | str) -> int:
+    """Extracts the first number from the file name (without the extension).
+
+    Args:
+        file: file or its name.
+
+    Returns:
+        the number or 0 if the name contains no digits.
+    """
+    match = re.search(r"\d+", Path(file).stem)
+    return str_to_int(match.group()) if match else 0
+
+
+def numeric_sort_key(file: Path | str) -> tuple[int, str]:
+    """Key to sort files numerically: by the number in the name, then by the name.
+
+    Args:
+        file: file or its name.
+
+    Returns:
+        sort key.
+    """
+    return extract_number(file), Path(file).name
+
+
 def sort_files_numerically(files: list[Path]) -> list[Path]:
     """Sorts files numerically.
 
@@ -304,12 +325,7 @@ def sort_files_numerically(files: list[Path]) -> list[Path]:
     Returns:
         sorted list of files.
     """
-
-    def extract_number(file: Path) -> int:
-        match = re.search(r"\d+", file.stem)
-        return str_to_int(match.group()) if match else 0
-
-    return sorted(files, key=extract_number)
+    return sorted(files, key=numeric_sort_key)
 
 
 def matrix_to_vector_list(matrix: MatrixMxN) -> list[VectorN]:
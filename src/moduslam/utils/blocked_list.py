@@ -0,0 +1,356 @@
+"""Blocked list of unique hashable items with order statistics.
+
+Items are stored in blocks of bounded size. A Fenwick tree over the sizes of the blocks
+gives the position of any block in O(log B), where B is the number of blocks, and a
+table "item -> block" gives O(1) membership.
+
+Complexity:
+O(1): contains, len, first, last
+O(log N): getitem(index), index(item), insert, remove, append, pop
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import chain
+from typing import Any, Generic, TypeVar, overload
+
+T = TypeVar("T")
+
+
+class _Block(Generic[T]):
+    """A block of items with ids for fast lookup inside the block."""
+
+    __slots__ = ("items", "ids", "position")
+
+    def __init__(self, items: list[T], position: int = 0):
+        self.items = items
+        self.ids = [id(item) for item in items]
+        self.position = position
+
+    def find(self, item: T) -> int:
+        """Finds the local index of the item: by identity first, by equality otherwise.
+
+        Args:
+            item: an item in the block.
+
+        Returns:
+            local index of the item.
+        """
+        try:
+            return self.ids.index(id(item))
+        except ValueError:
+            return self.items.index(item)
+
+
+class BlockedList(Sequence, Generic[T]):
+    """A sequence of unique hashable items with O(log N) positional access."""
+
+    _load: int = 512  # a block is split when it has more than 2 * load items.
+
+    def __init__(self, items: Iterable[T] = ()):
+        self._blocks: list[_Block[T]] = []
+        self._table: dict[T, _Block[T]] = {}
+        self._tree: list[int] = [0]
+        self._len = 0
+        self.extend(items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._table
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(block.items for block in self._blocks)
+
+    def __reversed__(self) -> Iterator[T]:
+        return chain.from_iterable(reversed(block.items) for block in reversed(self._blocks))
+
+    def __repr__(self) -> str:
+        return f"BlockedList({list(self)})"
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, BlockedList):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+        if isinstance(other, Sequence):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+        return False
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        """Complexity: O(log N) or O(K + log N), with K - number of items in slice.
+
+        Args:
+            index: index of an item or a slice.
+
+        Returns:
+            item or a list of items.
+
+        Raises:
+            IndexError: if index is out of range.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                return self._get_range(start, stop)
+            return [self[i] for i in range(start, stop, step)]
+
+        index = self._normalize(index)
+        block_position, offset = self._locate(index)
+        return self._blocks[block_position].items[offset]
+
+    def index(self, item: Any, start: int = 0, stop: int | None = None) -> int:
+        """Computes the index of the item.
+
+        Args:
+            item: an item to find.
+
+            start: ignored, the item is unique.
+
+            stop: ignored, the item is unique.
+
+        Returns:
+            index of the item.
+
+        Raises:
+            ValueError: if the item is not in the list.
+        """
+        try:
+            block = self._table[item]
+        except KeyError:
+            raise ValueError(f"{item} is not in the list.")
+
+        return self._prefix(block.position) + block.find(item)
+
+    def append(self, item: T) -> None:
+        """Adds the item to the end if it is not present.
+
+        Args:
+            item: an item to add.
+        """
+        if item in self._table:
+            return
+
+        if not self._blocks:
+            self._blocks.append(_Block([item]))
+            self._table[item] = self._blocks[0]
+            self._len = 1
+            self._rebuild_tree()
+            return
+
+        block = self._blocks[-1]
+        block.items.append(item)
+        block.ids.append(id(item))
+        self._table[item] = block
+        self._increase(block, 1)
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Adds the items to the end.
+
+        Args:
+            items: items to add.
+        """
+        for item in items:
+            self.append(item)
+
+    def insert(self, index: int, item: T) -> None:
+        """Inserts the item before the index (as list.insert) if it is not present.
+
+        Args:
+            index: index to insert the item at.
+
+            item: an item to insert.
+        """
+        if item in self._table:
+            return
+
+        if index < 0:
+            index = max(index + self._len, 0)
+
+        if index >= self._len:
+            self.append(item)
+            return
+
+        block_position, offset = self._locate(index)
+        block = self._blocks[block_position]
+        block.items.insert(offset, item)
+        block.ids.insert(offset, id(item))
+        self._table[item] = block
+        self._increase(block, 1)
+
+    def remove(self, item: T) -> None:
+        """Removes the item.
+
+        Args:
+            item: an item to remove.
+
+        Raises:
+            KeyError: if the item is not present.
+        """
+        block = self._table.pop(item)
+        local_index = block.find(item)
+        del block.items[local_index]
+        del block.ids[local_index]
+        self._decrease(block)
+
+    def pop(self, index: int = -1) -> T:
+        """Removes and returns the item at the index.
+
+        Args:
+            index: index of the item.
+
+        Returns:
+            the removed item.
+
+        Raises:
+            IndexError: if the list is empty or index is out of range.
+        """
+        if index == 0 and self._blocks:
+            block, local_index = self._blocks[0], 0
+        elif index == -1 and self._blocks:
+            block = self._blocks[-1]
+            local_index = len(block.items) - 1
+        else:
+            block_position, local_index = self._locate(self._normalize(index))
+            block = self._blocks[block_position]
+
+        item = block.items.pop(local_index)
+        del block.ids[local_index]
+        del self._table[item]
+        self._decrease(block)
+        return item
+
+    def clear(self) -> None:
+        """Removes all items."""
+        self._blocks.clear()
+        self._table.clear()
+        self._tree = [0]
+        self._len = 0
+
+    def _normalize(self, index: int) -> int:
+        """Converts negative index to non-negative one.
+
+        Raises:
+            IndexError: if index is out of range.
+        """
+        if index < 0:
+            index += self._len
+
+        if not 0 <= index < self._len:
+            raise IndexError("Index out of range.")
+
+        return index
+
+    def _get_range(self, start: int, stop: int) -> list[T]:
+        """Gets items in [start, stop) range with step 1."""
+        if start >= stop:
+            return []
+
+        block_position, offset = self._locate(start)
+        result: list[T] = []
+        num = stop - start
+
+        for block in self._blocks[block_position:]:
+            chunk = block.items[offset : offset + num - len(result)]
+            result.extend(chunk)
+            offset = 0
+            if len(result) == num:
+                break
+
+        return result
+
+    def _increase(self, block: _Block[T], delta: int) -> None:
+        """Updates sizes after adding items to the block and splits it if necessary."""
+        self._len += delta
+
+        if len(block.items) > 2 * self._load:
+            half = len(block.items) // 2
+            new_block = _Block(block.items[half:])
+            del block.items[half:]
+            del block.ids[half:]
+            for item in new_block.items:
+                self._table[item] = new_block
+            self._blocks.insert(block.position + 1, new_block)
+            self._rebuild_tree()
+        else:
+            self._update_tree(block.position, delta)
+
+    def _decrease(self, block: _Block[T]) -> None:
+        """Updates sizes after removing an item from the block and deletes or merges it
+        if it is too small."""
+        self._len -= 1
+        position = block.position
+        size = len(block.items)
+
+        if size == 0:
+            del self._blocks[position]
+            self._rebuild_tree()
+
+        elif size < self._load // 4 and position + 1 < len(self._blocks):
+            next_block = self._blocks[position + 1]
+            if size + len(next_block.items) <= self._load:
+                block.items.extend(next_block.items)
+                block.ids.extend(next_block.ids)
+                for item in next_block.items:
+                    self._table[item] = block
+                del self._blocks[position + 1]
+                self._rebuild_tree()
+                return
+
+            self._update_tree(position, -1)
+
+        else:
+            self._update_tree(position, -1)
+
+    def _rebuild_tree(self) -> None:
+        """Rebuilds the Fenwick tree of block sizes and block positions: O(B)."""
+        tree = [0] * (len(self._blocks) + 1)
+
+        for i, block in enumerate(self._blocks):
+            block.position = i
+            node = i + 1
+            tree[node] += len(block.items)
+            parent = node + (node & -node)
+            if parent < len(tree):
+                tree[parent] += tree[node]
+
+        self._tree = tree
+
+    def _update_tree(self, position: int, delta: int) -> None:
+        node = position + 1
+        tree = self._tree
+        while node < len(tree):
+            tree[node] += delta
+            node += node & -node
+
+    def _prefix(self, position: int) -> int:
+        """Computes the number of items in the blocks before the given one."""
+        total = 0
+        node = position
+        tree = self._tree
+        while node > 0:
+            total += tree[node]
+            node -= node & -node
+        return total
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """Finds the block position and the local index for the valid global index."""
+        tree = self._tree
+        position = 0
+        remaining = index
+        bit = 1 << (len(tree) - 1).bit_length()
+
+        while bit:
+            node = position + bit
+            if node < len(tree) and tree[node] <= remaining:
+                position = node
+                remaining -= tree[node]
+            bit >>= 1
+
+        return position, remaining
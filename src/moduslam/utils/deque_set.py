@@ -1,32 +1,32 @@
 """Deque-set data structure implementation."""
 
-from collections import deque
 from collections.abc import Iterable, Sequence
 from typing import Any, Callable, Generic, TypeVar, overload
 
+from moduslam.utils.blocked_list import BlockedList
+
 T = TypeVar("T")
 
 
 class DequeSet(Sequence, Generic[T]):
-    """DequeSet is a combination of set and deque.
+    """DequeSet is a combination of set and deque with indexable positions.
 
     Complexity:
-    O(1): add, contains(item), remove_first, remove_last.
-    O(N): remove(item)
+    O(1): contains(item).
+    O(log N): append, insert, remove(item), remove_first, remove_last, __getitem__(index).
     """
 
     def __init__(self):
-        self._deque = deque[T]()
-        self._set = set[T]()
+        self._items: BlockedList[T] = BlockedList()
 
     def __contains__(self, item) -> bool:
-        return item in self._set
+        return item in self._items
 
     def __len__(self) -> int:
-        return len(self._set)
+        return len(self._items)
 
     def __iter__(self):
-        return iter(self._deque)
+        return iter(self._items)
 
     @overload
     def __getitem__(self, index: int) -> T: ...
@@ -35,7 +35,7 @@ class DequeSet(Sequence, Generic[T]):
     def __getitem__(self, index: slice) -> Sequence[T]: ...
 
     def __getitem__(self, index: int | slice) -> T | Sequence[T]:
-        """Complexity: O(1) or O(K), with K - number of elements in slice.
+        """Complexity: O(log N) or O(K + log N), with K - number of elements in slice.
 
         Args:
             index: index of an item or a slice.
@@ -46,11 +46,7 @@ class DequeSet(Sequence, Generic[T]):
         Raises:
             IndexError: if index is out of range.
         """
-        if isinstance(index, slice):
-            return [self._deque[i] for i in range(*index.indices(len(self._deque)))]
-
-        else:
-            return self._deque[index]
+        return self._items[index]
 
     def __eq__(self, other: Any) -> bool:
         """Compares if this DequeSet is equal to another DequeSet. Two DequeSets are
@@ -63,38 +59,30 @@ class DequeSet(Sequence, Generic[T]):
             equality result.
         """
         if isinstance(other, DequeSet):
-            return self._deque == other._deque and self._set == other._set
+            return self._items == other._items
 
         return False
 
     @property
-    def items(self) -> deque[T]:
+    def items(self) -> Sequence[T]:
         """Items in deque-set."""
-        return self._deque
+        return self._items
 
     @property
     def empty(self) -> bool:
         """Empty status of deque-set."""
-        return not (bool(self._set) and bool(self._deque))
+        return len(self._items) == 0
 
     def append(self, item: T | Iterable[T]) -> None:
-        """
-        Adds new item:
-            1) Add to set to avoid duplicates.\n
-            2) Add to deque for fast front-pop().
+        """Adds new item(s) to the end if not present.
 
         Args:
             item: item(s) to be added.
         """
         if isinstance(item, Iterable):
-            for i in item:
-                if i not in self._set:
-                    self._set.add(i)
-                    self._deque.append(i)
+            self._items.extend(item)
         else:
-            if item not in self._set:
-                self._set.add(item)
-                self._deque.append(item)
+            self._items.append(item)
 
     def insert(self, item: T, index: int):
         """Inserts new item to the given position.
@@ -104,47 +92,51 @@ class DequeSet(Sequence, Generic[T]):
 
             index: index at which to insert the item.
         """
-        if item not in self._set:
-            self._set.add(item)
-            self._deque.insert(index, item)
+        self._items.insert(index, item)
 
     def remove(self, item: T) -> None:
-        """Removes item from set and deque.
+        """Removes item(s) from deque-set.
 
         Args:
             item: item to be removed.
+
+        Raises:
+            KeyError: if an item is not present.
         """
 
         if isinstance(item, Iterable):
             for i in item:
-                self._set.remove(i)
-                self._deque.remove(i)
+                self._items.remove(i)
 
         else:
-            self._set.remove(item)
-            self._deque.remove(item)
+            self._items.remove(item)
 
     def remove_first(self) -> None:
-        """Removes first item from deque-set."""
-        item = self._deque.popleft()
-        self._set.remove(item)
+        """Removes first item from deque-set.
+
+        Raises:
+            IndexError: if deque-set is empty.
+        """
+        self._items.pop(0)
 
     def remove_last(self) -> None:
-        """Removes last item from deque-set."""
-        item = self._deque.pop()
-        self._set.remove(item)
+        """Removes last item from deque-set.
+
+        Raises:
+            IndexError: if deque-set is empty.
+        """
+        self._items.pop()
 
     def sort(self, key: Callable, reverse: bool = False) -> None:
-        """Sorts deque with the given key.
+        """Sorts deque-set with the given key.
 
         Args:
-            key: key function to sort deque.
+            key: key function to sort deque-set.
 
             reverse: reverse sorting order.
         """
-        self._deque = deque(sorted(self._deque, key=key, reverse=reverse))
+        self._items = BlockedList(sorted(self._items, key=key, reverse=reverse))
 
     def clear(self) -> None:
         """Clears deque-set."""
-        self._set.clear()
-        self._deque.clear()
+        self._items.clear()
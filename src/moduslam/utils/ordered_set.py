@@ -1,31 +1,32 @@
 """Ordered-set data structure implementation."""
 
-from collections import OrderedDict
 from collections.abc import Iterable, Iterator, MutableSet, Sequence
 from typing import Any, Generic, TypeVar, overload
 
+from moduslam.utils.blocked_list import BlockedList
+
 T = TypeVar("T")
 
 
 class OrderedSet(MutableSet, Sequence, Generic[T]):
-    """OrderedSet is a combination of set and OrderedDict.
+    """OrderedSet is a combination of set and indexable blocked list.
 
     Complexity:
-    O(1): add, discard, remove, remove_first, remove_last, contains, first, last
-    O(N): __getitem__(index), insert(item, index)
+    O(1): contains, first, last
+    O(log N): add, discard, remove, __getitem__(index), insert(item, index)
     """
 
     def __init__(self):
-        self._items: OrderedDict[T, None] = OrderedDict()
+        self._items: BlockedList[T] = BlockedList()
 
     def __contains__(self, item: object) -> bool:
         return item in self._items
 
     def __iter__(self) -> Iterator[T]:
-        return iter(self._items.keys())
+        return iter(self._items)
 
     def __len__(self) -> int:
-        return len(self._items.keys())
+        return len(self._items)
 
     def __repr__(self) -> str:
         return f"OrderedSet with {len(self._items)} items)"
@@ -40,7 +41,7 @@ class OrderedSet(MutableSet, Sequence, Generic[T]):
     def __getitem__(self, index: slice) -> Sequence[T]: ...
 
     def __getitem__(self, index: int | slice) -> T | Sequence[T]:
-        """Complexity: O(N)
+        """Complexity: O(log N) or O(K + log N), with K - number of items in slice.
 
         Args:
             index: index of an item or a slice.
@@ -52,11 +53,11 @@ class OrderedSet(MutableSet, Sequence, Generic[T]):
             IndexError: if index is out of range.
         """
         if isinstance(index, slice):
-            return [list(self._items.keys())[i] for i in range(*index.indices(len(self._items)))]
+            return self._items[index]
 
         elif isinstance(index, int):
             try:
-                return list(self._items.keys())[index]
+                return self._items[index]
 
             except IndexError:
                 raise IndexError("OrderedSet index out of range")
@@ -74,13 +75,13 @@ class OrderedSet(MutableSet, Sequence, Generic[T]):
             equality status.
         """
         if isinstance(other, OrderedSet):
-            return self._items == other._items
+            return len(self) == len(other) and self._items == other._items
         return False
 
     @property
-    def items(self):
+    def items(self) -> Sequence[T]:
         """All items in OrderedSet."""
-        return self._items.keys()
+        return self._items
 
     @property
     def first(self) -> T:
@@ -91,7 +92,7 @@ class OrderedSet(MutableSet, Sequence, Generic[T]):
         """
         if len(self._items) == 0:
             raise KeyError("OrderedSet is empty")
-        return next(iter(self._items))
+        return self._items[0]
 
     @property
     def last(self) -> T:
@@ -102,7 +103,7 @@ class OrderedSet(MutableSet, Sequence, Generic[T]):
         """
         if len(self._items) == 0:
             raise KeyError("OrderedSet is empty")
-        return next(reversed(self._items))
+        return self._items[-1]
 
     def add(self, item: T | Iterable[T]) -> None:
         """Adds an item to the OrderedSet.
@@ -118,30 +119,27 @@ class OrderedSet(MutableSet, Sequence, Generic[T]):
         if isinstance(item, Iterable):
             for i in item:
                 if self._is_hashable(i):
-                    self._items[i] = None
+                    self._items.append(i)
                 else:
                     raise TypeError(msg)
 
         else:
             if self._is_hashable(item):
-                self._items[item] = None
+                self._items.append(item)
             else:
                 raise TypeError(msg)
 
     def insert(self, item: T, index: int) -> None:
-        """Inserts a new item by index. Identical to insert in a list.
-        Complexity: O(N).
+        """Inserts a new item by index. Identical to insert in a list, does nothing if
+        the item is already present.
+        Complexity: O(log N).
 
         Args:
             item: an item to be inserted.
 
             index: index at which to insert the item.
         """
-        items_list = list(self._items)
-        items_list.insert(index, item)
-        self._items.clear()
-        for item in items_list:
-            self.add(item)
+        self._items.insert(index, item)
 
     def discard(self, item: T | Iterable[T]) -> None:
         """Removes an item from the OrderedSet if it is present.
@@ -153,10 +151,10 @@ class OrderedSet(MutableSet, Sequence, Generic[T]):
         if isinstance(item, Iterable):
             for i in item:
                 if i in self._items:
-                    self._items.pop(i)
+                    self._items.remove(i)
         else:
             if item in self._items:
-                self._items.pop(item)
+                self._items.remove(item)
 
     def remove(self, item: T | Iterable[T]) -> None:
         """Removes an item from the OrderedSet if it is present.
@@ -172,15 +170,19 @@ class OrderedSet(MutableSet, Sequence, Generic[T]):
         if isinstance(item, Iterable):
             for i in item:
                 if i in self._items:
-                    self._items.pop(i)
+                    self._items.remove(i)
                 else:
                     raise KeyError(msg + f" {i}")
         else:
             if item in self._items:
-                self._items.pop(item)
+                self._items.remove(item)
             else:
                 raise KeyError(msg + f" {item}")
 
+    def clear(self) -> None:
+        """Removes all items from the OrderedSet."""
+        self._items.clear()
+
     @staticmethod
     def _is_hashable(item: T) -> bool:
         """Checks if an item is hashable.
@@ -0,0 +1,81 @@
+"""Compares two benchmark reports stage by stage.
+
+Usage:
+    python -m tests.benchmarks.compare before.json after.json [--threshold 0.1]
+"""
+
+import argparse
+from pathlib import Path
+
+from tests.benchmarks.harness import BenchmarkReport
+
+
+def flatten(stage: dict) -> dict[str, float]:
+    """Collects comparable metrics of the stage summary.
+
+    Args:
+        stage: stage summary.
+
+    Returns:
+        "metric name -> value" table.
+    """
+    table = {
+        "wall_time_s": stage["wall_time_s"],
+        "busy_time_s": stage["busy_time_s"],
+        "peak_rss_mb": stage["peak_rss_mb"],
+    }
+    for name, value in stage["latency_ms"].items():
+        table[f"latency_{name}_ms"] = value
+    return table
+
+
+def compare(
+    before: BenchmarkReport, after: BenchmarkReport, threshold: float
+) -> list[tuple[str, str, float, float, float, bool]]:
+    """Compares metrics of the stages existing in both reports.
+
+    Args:
+        before: baseline report.
+
+        after: new report.
+
+        threshold: relative change considered as a regression.
+
+    Returns:
+        rows: stage, metric, old value, new value, relative change, regression flag.
+    """
+    old_stages = {s["name"]: flatten(s) for s in before.stages}
+    rows = []
+
+    for stage in after.stages:
+        old = old_stages.get(stage["name"])
+        if old is None:
+            continue
+
+        for metric, new_value in flatten(stage).items():
+            old_value = old.get(metric)
+            if old_value is None:
+                continue
+
+            change = (new_value - old_value) / old_value if old_value else 0.0
+            rows.append((stage["name"], metric, old_value, new_value, change, change > threshold))
+
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("before", type=Path)
+    parser.add_argument("after", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    before, after = BenchmarkReport.load(args.before), BenchmarkReport.load(args.after)
+
+    if before.parameters != after.parameters:
+        print("Warning: the reports have been created with different parameters.")
+
+    print(f"{before.metadata['commit'][:10]} -> {after.metadata['commit'][:10]}")
+    for name, metric, old, new, change, regression in compare(before, after, args.threshold):
+        flag = "  REGRESSION" if regression else ""
+        print(f"{name:10} {metric:20} {old:12.3f} {new:12.3f} {change:+8.1%}{flag}")
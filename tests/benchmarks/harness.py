@@ -0,0 +1,215 @@
+"""Measurement primitives for the benchmarks: wall time, peak RSS and per-step latency
+of a pipeline stage."""
+
+import json
+import platform
+import resource
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import psutil
+
+percentiles: tuple[int, ...] = (50, 90, 99)
+
+
+@dataclass
+class StageResult:
+    """Measurements of a single pipeline stage.
+
+    Wall time covers the whole stage context, busy time covers its steps only: they
+    differ for interleaved stages (e.g., frontend and backend).
+    """
+
+    name: str
+    wall_time: float = 0.0  # [s].
+    peak_rss: int = 0  # [bytes].
+    latencies: list[float] = field(default_factory=list)  # per-step latencies [s].
+
+    def summary(self) -> dict[str, Any]:
+        """Creates a summary of the stage with latency statistics.
+
+        Returns:
+            the summary.
+        """
+        return {
+            "name": self.name,
+            "wall_time_s": self.wall_time,
+            "busy_time_s": sum(self.latencies),
+            "peak_rss_mb": self.peak_rss / 2**20,
+            "num_steps": len(self.latencies),
+            "latency_ms": latency_statistics(self.latencies),
+        }
+
+
+def latency_statistics(latencies: list[float]) -> dict[str, float]:
+    """Computes latency percentiles, mean and max value in milliseconds.
+
+    Args:
+        latencies: latencies [s].
+
+    Returns:
+        "statistic name -> value [ms]" table.
+    """
+    if not latencies:
+        return {}
+
+    array = np.asarray(latencies) * 1e3
+    table = {f"p{q}": float(np.percentile(array, q)) for q in percentiles}
+    table["mean"] = float(array.mean())
+    table["max"] = float(array.max())
+    return table
+
+
+class RssSampler:
+    """Samples the resident set size of the current process in a background thread."""
+
+    def __init__(self, interval: float = 0.01) -> None:
+        """
+        Args:
+            interval: sampling interval [s].
+        """
+        self._interval = interval
+        self._process = psutil.Process()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._peak = 0
+
+    @property
+    def peak(self) -> int:
+        """Peak RSS [bytes] observed while sampling."""
+        return self._peak
+
+    def __enter__(self) -> "RssSampler":
+        self._peak = self._process.memory_info().rss
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._stop_event.set()
+        self._thread.join()
+        self._sample()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            self._sample()
+
+    def _sample(self) -> None:
+        self._peak = max(self._peak, self._process.memory_info().rss)
+
+
+class Stage:
+    """Measures wall time, peak RSS and per-step latencies of a pipeline stage.
+
+    Usage:
+        with Stage("reading") as stage:
+            for item in items:
+                with stage.step():
+                    process(item)
+        result = stage.result
+    """
+
+    def __init__(self, name: str, sampling_interval: float = 0.01) -> None:
+        """
+        Args:
+            name: name of the stage.
+
+            sampling_interval: RSS sampling interval [s].
+        """
+        self._result = StageResult(name)
+        self._sampler = RssSampler(sampling_interval)
+        self._start = 0.0
+
+    @property
+    def result(self) -> StageResult:
+        """Measurements of the stage."""
+        return self._result
+
+    @contextmanager
+    def step(self) -> Iterator[None]:
+        """Measures latency of a single step of the stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._result.latencies.append(time.perf_counter() - start)
+
+    def __enter__(self) -> "Stage":
+        self._sampler.__enter__()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._result.wall_time = time.perf_counter() - self._start
+        self._sampler.__exit__(*args)
+        self._result.peak_rss = self._sampler.peak
+
+
+@dataclass
+class BenchmarkReport:
+    """Results of a benchmark run with metadata to compare runs of different commits."""
+
+    stages: list[dict[str, Any]]
+    parameters: dict[str, Any]
+    metadata: dict[str, Any] = field(default_factory=lambda: collect_metadata())
+
+    def save(self, path: Path) -> None:
+        """Saves the report to a JSON file.
+
+        Args:
+            path: path to the JSON file.
+        """
+        with open(path, "w", encoding="UTF8") as file:
+            json.dump(asdict(self), file, indent=2, default=str)
+
+    @classmethod
+    def load(cls, path: Path) -> "BenchmarkReport":
+        """Loads the report from a JSON file.
+
+        Args:
+            path: path to the JSON file.
+
+        Returns:
+            the report.
+        """
+        with open(path, encoding="UTF8") as file:
+            data = json.load(file)
+        return cls(**data)
+
+
+def collect_metadata() -> dict[str, Any]:
+    """Collects information about the environment and the current git commit.
+
+    Returns:
+        metadata table.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "unknown"
+
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    scale = 1 if sys.platform == "darwin" else 1024
+
+    return {
+        "commit": commit,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": psutil.cpu_count(),
+        "process_max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2**20,
+    }
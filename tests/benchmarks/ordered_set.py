@@ -0,0 +1,106 @@
+"""Measures per-operation time of OrderedSet and DequeSet for growing sizes and compares
+it with the OrderedDict-based approach (positional access through a list of keys).
+
+Usage:
+    python -m tests.benchmarks.ordered_set --sizes 1000 10000 100000 1000000
+"""
+
+import argparse
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from moduslam.utils.deque_set import DequeSet
+from moduslam.utils.ordered_set import OrderedSet
+
+
+def measure(operation: Callable[[int], object], arguments: list[int]) -> float:
+    """Measures the mean time of the operation.
+
+    Args:
+        operation: an operation with an integer argument.
+
+        arguments: arguments for the consecutive calls.
+
+    Returns:
+        mean time of the call [us].
+    """
+    start = time.perf_counter()
+    for argument in arguments:
+        operation(argument)
+    return (time.perf_counter() - start) / len(arguments) * 1e6
+
+
+def benchmark_ordered_set(size: int, num_operations: int, rng: random.Random) -> dict[str, float]:
+    ordered_set = OrderedSet[int]()
+    start = time.perf_counter()
+    ordered_set.add(range(size))
+    fill = (time.perf_counter() - start) / size * 1e6
+
+    indices = [rng.randrange(size) for _ in range(num_operations)]
+    new_items = list(range(size, size + num_operations))
+
+    return {
+        "add": fill,
+        "contains": measure(ordered_set.__contains__, indices),
+        "getitem": measure(ordered_set.__getitem__, indices),
+        "insert": measure(lambda i: ordered_set.insert(i, i - size), new_items),
+        "remove": measure(ordered_set.discard, indices),
+    }
+
+
+def benchmark_deque_set(size: int, num_operations: int, rng: random.Random) -> dict[str, float]:
+    deque_set = DequeSet[int]()
+    start = time.perf_counter()
+    deque_set.append(range(size))
+    fill = (time.perf_counter() - start) / size * 1e6
+
+    indices = [rng.randrange(size) for _ in range(num_operations)]
+
+    return {
+        "add": fill,
+        "contains": measure(deque_set.__contains__, indices),
+        "getitem": measure(deque_set.__getitem__, indices),
+        "remove": measure(deque_set.remove, list(dict.fromkeys(indices))),
+        "remove_first": measure(lambda _: deque_set.remove_first(), indices),
+    }
+
+
+def benchmark_ordered_dict(size: int, num_operations: int, rng: random.Random) -> dict[str, float]:
+    items = OrderedDict.fromkeys(range(size))
+    indices = [rng.randrange(size) for _ in range(num_operations)]
+    return {"getitem": measure(lambda i: list(items.keys())[i], indices)}
+
+
+def print_table(results: dict[int, dict[str, dict[str, float]]]) -> None:
+    for name in ("OrderedSet", "DequeSet", "OrderedDict"):
+        print(f"\n{name}, mean time per operation [us]")
+        operations = list(next(iter(results.values()))[name])
+        print(f"{'size':>10}" + "".join(f"{op:>14}" for op in operations))
+        for size, result in results.items():
+            values = "".join(f"{result[name][op]:>14.3f}" for op in operations)
+            print(f"{size:>10}{values}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**3, 10**4, 10**5, 10**6])
+    parser.add_argument("--operations", type=int, default=1000)
+    parser.add_argument("--baseline-operations", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    rng = random.Random(args.seed)
+    results = {
+        size: {
+            "OrderedSet": benchmark_ordered_set(size, min(args.operations, size // 4), rng),
+            "DequeSet": benchmark_deque_set(size, min(args.operations, size // 4), rng),
+            "OrderedDict": benchmark_ordered_dict(size, args.baseline_operations, rng),
+        }
+        for size in args.sizes
+    }
+    print_table(results)
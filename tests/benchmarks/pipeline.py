@@ -0,0 +1,207 @@
+"""End-to-end pipeline benchmark on a synthetic dataset: reading, frontend, backend and
+map stages are measured separately."""
+
+from pathlib import Path
+
+from moduslam.backend_manager.graph_solver import GraphSolver
+from moduslam.data_manager.batch_factory.batch import DataBatch
+from moduslam.data_manager.batch_factory.configs import (
+    BatchFactoryConfig,
+    DataRegimeConfig,
+)
+from moduslam.data_manager.batch_factory.data_readers.kaist.configs.base import (
+    KaistConfig,
+)
+from moduslam.data_manager.batch_factory.data_readers.reader_factory import create
+from moduslam.data_manager.batch_factory.factory import BatchFactory
+from moduslam.data_manager.batch_factory.regimes import Stream
+from moduslam.external.handlers_factory.concurrent_dispatcher import (
+    ConcurrentDispatcher,
+)
+from moduslam.external.handlers_factory.dispatcher import Dispatcher
+from moduslam.external.handlers_factory.handlers.handler_protocol import Handler
+from moduslam.external.handlers_factory.handlers.imu.config import (
+    KaistImuHandlerConfig,
+)
+from moduslam.external.handlers_factory.handlers.imu.handler import ImuHandler
+from moduslam.external.handlers_factory.handlers.scan_matcher.config import (
+    KissIcpScanMatcherConfig,
+)
+from moduslam.external.handlers_factory.handlers.scan_matcher.handler import (
+    ScanMatcher,
+)
+from moduslam.frontend_manager.graph_builders.simple.graph_factory import (
+    Factory as GraphFactory,
+)
+from moduslam.frontend_manager.graph_initializer.configs import (
+    PriorLinearVelocity,
+    PriorPose,
+)
+from moduslam.frontend_manager.graph_initializer.initializer import GraphInitializer
+from moduslam.frontend_manager.main_graph.graph import Graph
+from moduslam.frontend_manager.storage_analyzers.analyzers import (
+    SinglePoseOdometry,
+)
+from moduslam.frontend_manager.utils import fill_storage
+from moduslam.map_manager.factories.lidar_map.config import LidarPointCloudConfig
+from moduslam.map_manager.factories.lidar_map.factory import LidarMapFactory
+from moduslam.map_manager.trajectory import get_trajectory
+from moduslam.measurement_storage.storage import MeasurementStorage
+from moduslam.sensors_factory.configs import ImuConfig, Lidar3DConfig
+from moduslam.sensors_factory.factory import SensorsFactory
+from moduslam.utils.exceptions import NotEnoughMeasurementsError
+from tests.benchmarks.harness import BenchmarkReport, Stage, StageResult
+from tests.tests_data_generators.synthetic.config import SyntheticDatasetConfig
+from tests.tests_data_generators.synthetic.kaist import KaistDatasetWriter
+
+
+def read_data(dataset_config: KaistConfig) -> tuple[DataBatch, StageResult]:
+    """Reads all elements of the dataset into a data batch.
+
+    Args:
+        dataset_config: configuration of the dataset.
+
+    Returns:
+        data batch and measurements of the stage.
+    """
+    reader, regime = create(dataset_config, DataRegimeConfig(name=Stream.name))
+    reader.configure(regime, SensorsFactory.get_sensors())
+    batch = DataBatch()
+
+    with Stage("reading") as stage:
+        with reader:
+            while True:
+                with stage.step():
+                    element = reader.get_next_element()
+
+                if element is None:
+                    break
+
+                batch.add(element)
+
+    return batch, stage.result
+
+
+def build_graph(
+    batch: DataBatch,
+    handlers: set[Handler],
+    velocity: tuple[float, float, float],
+    concurrent: bool = False,
+) -> tuple[Graph, StageResult, StageResult]:
+    """Builds the graph: the frontend fills the storage with new measurements and the
+    backend adds and optimizes a new candidate for every filled storage.
+
+    Args:
+        batch: data batch with all elements.
+
+        handlers: handlers to create measurements.
+
+        velocity: initial linear velocity of the platform.
+
+        concurrent: process elements ahead in per-handler worker threads.
+
+    Returns:
+        graph, measurements of the frontend and backend stages.
+    """
+    graph = Graph()
+    dispatcher: Dispatcher | ConcurrentDispatcher = Dispatcher(handlers)
+    if concurrent:
+        dispatcher = ConcurrentDispatcher(dispatcher)
+    storage = MeasurementStorage()
+    analyzer = SinglePoseOdometry()
+    factory = GraphFactory()
+    solver = GraphSolver()
+
+    first = batch.first.timestamp
+    priors = (
+        PriorPose(timestamp=first),
+        PriorLinearVelocity(timestamp=first, measurement=velocity),
+    )
+    for measurement in GraphInitializer.create_measurements(priors):
+        storage.add(measurement)
+
+    frontend, backend = Stage("frontend"), Stage("backend")
+
+    with frontend, backend:
+        while not batch.empty:
+            try:
+                with frontend.step():
+                    fill_storage(storage, batch, dispatcher, analyzer)
+            except NotEnoughMeasurementsError:
+                break
+
+            with backend.step():
+                candidate = factory.create_candidate_with_clusters(graph, storage.data())
+                graph = candidate.candidate.graph
+                values, _ = solver.solve(graph)
+                graph.update_vertices(values)
+
+            storage.clear()
+
+    if isinstance(dispatcher, ConcurrentDispatcher):
+        dispatcher.close()
+
+    return graph, frontend.result, backend.result
+
+
+def create_map(graph: Graph, dataset_config: KaistConfig) -> StageResult:
+    """Creates the trajectory and the lidar map of the graph.
+
+    Args:
+        graph: a graph with optimized vertices.
+
+        dataset_config: configuration of the dataset.
+
+    Returns:
+        measurements of the stage.
+    """
+    config = BatchFactoryConfig(dataset_config, DataRegimeConfig(name=Stream.name))
+    batch_factory = BatchFactory(config)
+    map_factory = LidarMapFactory(LidarPointCloudConfig())
+
+    with Stage("map") as stage:
+        with stage.step():
+            get_trajectory(graph.vertex_storage.clusters)
+        with stage.step():
+            map_factory.create_map(graph, batch_factory)
+
+    return stage.result
+
+
+def run(
+    directory: Path, config: SyntheticDatasetConfig, concurrent: bool = False
+) -> BenchmarkReport:
+    """Generates the dataset and runs all stages of the pipeline.
+
+    Args:
+        directory: a directory for the dataset.
+
+        config: parameters of the synthetic dataset.
+
+        concurrent: run handlers concurrently.
+
+    Returns:
+        benchmark report.
+    """
+    writer = KaistDatasetWriter(directory, config)
+    writer.write()
+    dataset_config = writer.dataset_config
+
+    imu_cfg = ImuConfig(KaistDatasetWriter.imu_name)
+    lidar_cfg = Lidar3DConfig(KaistDatasetWriter.lidar_name)
+    SensorsFactory.init_sensors([imu_cfg, lidar_cfg])
+
+    handlers: set[Handler] = {
+        ImuHandler(KaistImuHandlerConfig(imu_cfg.name)),
+        ScanMatcher(KissIcpScanMatcherConfig(lidar_cfg.name)),
+    }
+
+    batch, reading = read_data(dataset_config)
+    graph, frontend, backend = build_graph(batch, handlers, (config.speed, 0.0, 0.0), concurrent)
+    mapping = create_map(graph, dataset_config)
+
+    stages = [s.summary() for s in (reading, frontend, backend, mapping)]
+    parameters = vars(config).copy()
+    parameters["concurrent"] = concurrent
+    parameters["num_clusters"] = len(graph.vertex_storage.clusters)
+    return BenchmarkReport(stages, parameters)
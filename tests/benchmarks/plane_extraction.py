@@ -0,0 +1,113 @@
+"""Compares the extraction of orthogonal plane subsets with multi-plane RANSAC and with
+HDBSCAN of normals on the lidar test clouds: time, number of points and the quality of
+the subsets (plane variance and orthogonality of the subset normals).
+
+HDBSCAN computes the full distance matrix of the normals, so the clouds are voxel
+down-sampled before the extraction.
+
+Usage:
+    python -m tests.benchmarks.plane_extraction --voxel 0.5 --num-clouds 5
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import open3d as o3d
+
+from moduslam.custom_types.numpy import MatrixNx3
+from moduslam.external.metrics.modified_mom import hdbscan_planes, ransac_planes
+from moduslam.external.metrics.modified_mom.config import (
+    HdbscanConfig,
+    LidarConfig,
+    RansacConfig,
+)
+from moduslam.external.metrics.modified_mom.utils import compute_plane_variance
+from moduslam.map_manager.utils import read_4_channel_bin_pcd
+
+clouds_dir = (
+    Path(__file__).parents[2] / "src/moduslam/external/metrics/modified_mom/tests/data/lidar/pcs"
+)
+
+
+def measure(
+    extract: Callable[[o3d.geometry.PointCloud], list[MatrixNx3]],
+    cloud: o3d.geometry.PointCloud,
+) -> dict[str, float]:
+    """Measures the extraction time and the quality of the subsets.
+
+    Args:
+        extract: a function extracting orthogonal subsets from the cloud.
+
+        cloud: a point cloud.
+
+    Returns:
+        time [s], number of subsets and points, mean plane variance of the subsets,
+        max absolute cosine between the normals of the subsets.
+    """
+    start = time.perf_counter()
+    try:
+        subsets = extract(o3d.geometry.PointCloud(cloud))
+    except (ValueError, TypeError):  # no orthogonal subsets or a failure of clustering.
+        subsets = []
+    duration = time.perf_counter() - start
+
+    if not subsets:
+        return {"time": duration, "subsets": 0, "points": 0, "variance": np.nan, "cos": np.nan}
+
+    normals = np.array([plane_normal(subset) for subset in subsets])
+    cosines = np.abs(normals @ normals.T)
+    np.fill_diagonal(cosines, 0.0)
+
+    return {
+        "time": duration,
+        "subsets": len(subsets),
+        "points": sum(subset.shape[0] for subset in subsets),
+        "variance": float(np.mean([compute_plane_variance(subset) for subset in subsets])),
+        "cos": float(cosines.max()),
+    }
+
+
+def plane_normal(points: MatrixNx3) -> np.ndarray:
+    """Computes the normal of the least squares plane of the points."""
+    _, _, vh = np.linalg.svd(points - points.mean(axis=0), full_matrices=False)
+    return vh[-1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--voxel", type=float, default=0.5, help="voxel size [m]")
+    parser.add_argument("--num-clouds", type=int, default=5)
+    args = parser.parse_args()
+
+    normals_config = LidarConfig()
+    hdbscan_config = HdbscanConfig()
+    ransac_config = RansacConfig()
+
+    methods: dict[str, Callable[[o3d.geometry.PointCloud], list[MatrixNx3]]] = {
+        "ransac": lambda pc: ransac_planes.extract_orthogonal_subsets(
+            pc, normals_config, ransac_config
+        ),
+        "hdbscan": lambda pc: hdbscan_planes.extract_orthogonal_subsets(
+            pc, normals_config, hdbscan_config
+        ),
+    }
+
+    header = f"{'cloud':>12} {'method':>8} {'time, s':>8} {'subsets':>8} {'points':>8}"
+    print(f"{header} {'variance':>10} {'max cos':>8}")
+
+    for file in sorted(clouds_dir.glob("*.bin"))[: args.num_clouds]:
+        cloud = read_4_channel_bin_pcd(file).voxel_down_sample(args.voxel)
+
+        for name, extract in methods.items():
+            r = measure(extract, cloud)
+            print(
+                f"{file.name:>12} {name:>8} {r['time']:>8.2f} {r['subsets']:>8} "
+                f"{r['points']:>8} {r['variance']:>10.2e} {r['cos']:>8.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Runs the pipeline benchmark on a synthetic dataset and saves results to a JSON file.
+
+Usage:
+    python -m tests.benchmarks.run --duration 30 --imu-rate 200 --output before.json
+    python -m tests.benchmarks.compare before.json after.json
+"""
+
+import argparse
+import logging
+import tempfile
+from pathlib import Path
+
+from tests.benchmarks.pipeline import run
+from tests.tests_data_generators.synthetic.config import SyntheticDatasetConfig
+
+
+def parse_args() -> argparse.Namespace:
+    default = SyntheticDatasetConfig()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=default.duration, help="[s]")
+    parser.add_argument("--imu-rate", type=float, default=default.imu_rate, help="[Hz]")
+    parser.add_argument("--lidar-rate", type=float, default=default.lidar_rate, help="[Hz]")
+    parser.add_argument("--points-per-scan", type=int, default=default.points_per_scan)
+    parser.add_argument("--seed", type=int, default=default.seed)
+    parser.add_argument("--concurrent", action="store_true", help="run handlers concurrently")
+    parser.add_argument("--output", type=Path, default=Path("benchmark.json"))
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    logging.disable(logging.INFO)
+    args = parse_args()
+    config = SyntheticDatasetConfig(
+        duration=args.duration,
+        imu_rate=args.imu_rate,
+        lidar_rate=args.lidar_rate,
+        points_per_scan=args.points_per_scan,
+        seed=args.seed,
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        report = run(Path(directory), config, args.concurrent)
+
+    report.save(args.output)
+    print(f"Results have been saved to {args.output}")
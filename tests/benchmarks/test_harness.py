@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks.compare import compare
+from tests.benchmarks.harness import BenchmarkReport, Stage, latency_statistics
+from tests.benchmarks.pipeline import run
+from tests.tests_data_generators.synthetic.config import SyntheticDatasetConfig
+
+
+def test_latency_statistics():
+    latencies = [0.001 * i for i in range(1, 101)]
+
+    result = latency_statistics(latencies)
+
+    assert result["p50"] == pytest.approx(50.5)
+    assert result["p99"] == pytest.approx(99.01)
+    assert result["max"] == pytest.approx(100)
+    assert result["mean"] == pytest.approx(50.5)
+
+
+def test_latency_statistics_empty():
+    assert latency_statistics([]) == {}
+
+
+def test_stage():
+    with Stage("test") as stage:
+        for _ in range(3):
+            with stage.step():
+                pass
+
+    result = stage.result
+    assert len(result.latencies) == 3
+    assert result.wall_time >= sum(result.latencies)
+    assert result.peak_rss > 0
+
+
+def test_report_save_load(tmp_path: Path):
+    with Stage("test") as stage:
+        with stage.step():
+            pass
+
+    report = BenchmarkReport([stage.result.summary()], {"duration": 1.0})
+    file = tmp_path / "report.json"
+
+    report.save(file)
+    loaded = BenchmarkReport.load(file)
+
+    assert loaded == report
+
+
+def test_compare():
+    stage = {"name": "a", "wall_time_s": 1.0, "busy_time_s": 1.0, "peak_rss_mb": 10.0}
+    before = BenchmarkReport([{**stage, "latency_ms": {"p50": 1.0}}], {})
+    after = BenchmarkReport([{**stage, "latency_ms": {"p50": 2.0}}], {})
+
+    rows = compare(before, after, threshold=0.1)
+
+    regressions = [row[1] for row in rows if row[-1]]
+    assert regressions == ["latency_p50_ms"]
+
+
+def test_pipeline(tmp_path: Path):
+    config = SyntheticDatasetConfig(duration=1.0, points_per_scan=1000)
+
+    report = run(tmp_path, config)
+
+    names = [stage["name"] for stage in report.stages]
+    assert names == ["reading", "frontend", "backend", "map"]
+    assert report.stages[0]["num_steps"] == 101 + 11 + 1  # IMU, lidar and the last None.
+    assert report.parameters["num_clusters"] > 1
@@ -0,0 +1,123 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from moduslam.data_manager.batch_factory.configs import DataRegimeConfig
+from moduslam.data_manager.batch_factory.data_readers.reader_factory import create
+from moduslam.data_manager.batch_factory.regimes import Stream
+from moduslam.sensors_factory.configs import (
+    ImuConfig,
+    Lidar3DConfig,
+    SensorConfig,
+    VrsGpsConfig,
+)
+from moduslam.sensors_factory.factory import SensorsFactory
+from tests.tests_data_generators.synthetic.config import SyntheticDatasetConfig
+from tests.tests_data_generators.synthetic.kaist import KaistDatasetWriter
+from tests.tests_data_generators.synthetic.ros2 import Ros2DatasetWriter
+from tests.tests_data_generators.synthetic.sequence import SyntheticSequence
+
+config = SyntheticDatasetConfig(duration=2.0, points_per_scan=512)
+
+
+def count_elements(dataset_config, sensor_configs) -> dict[str, int]:
+    SensorsFactory.init_sensors(sensor_configs)
+    reader, regime = create(dataset_config, DataRegimeConfig(name=Stream.name))
+    reader.configure(regime, SensorsFactory.get_sensors())
+
+    table: dict[str, int] = {}
+    with reader:
+        while element := reader.get_next_element():
+            name = element.measurement.sensor.name
+            table[name] = table.get(name, 0) + 1
+
+    return table
+
+
+def test_deterministic():
+    seq1, seq2 = SyntheticSequence(config), SyntheticSequence(config)
+
+    for chunk1, chunk2 in zip(seq1.imu(), seq2.imu()):
+        np.testing.assert_array_equal(chunk1.accelerations, chunk2.accelerations)
+
+    for (t1, points1), (t2, points2) in zip(seq1.lidar(), seq2.lidar()):
+        assert t1 == t2
+        np.testing.assert_array_equal(points1, points2)
+
+
+def test_imu_is_consistent_with_ground_truth():
+    sequence = SyntheticSequence(config)
+    chunk = next(sequence.imu())
+    dt = 1 / config.imu_rate
+
+    yaw_rate = chunk.angular_velocities[:, 2].mean()
+    timestamps, poses = next(sequence.ground_truth())
+    yaws = np.unwrap(np.arctan2(poses[:, 1, 0], poses[:, 0, 0]))
+
+    assert yaw_rate == pytest.approx(np.diff(yaws).mean() / dt, abs=1e-3)
+
+
+def test_lidar_points_lie_on_room_planes():
+    sequence = SyntheticSequence(config)
+    timestamp, points = next(sequence.lidar())
+    lower, upper = sequence._room.bounds
+
+    distances = np.minimum(np.abs(points[:, :3] - lower), np.abs(points[:, :3] - upper))
+
+    assert timestamp == sequence.lidar_timestamps[0]
+    assert np.all(distances.min(axis=1) < 0.1)
+
+
+def test_odometry_follows_ground_truth():
+    sequence = SyntheticSequence(config)
+    chunk = next(sequence.odometry())
+    t = sequence.to_seconds(chunk.timestamps)
+
+    positions = sequence.trajectory.positions(t)
+
+    np.testing.assert_allclose(chunk.poses[:, :3, 3], positions, atol=0.1)
+
+
+def test_kaist_layout(tmp_path: Path):
+    writer = KaistDatasetWriter(tmp_path, config)
+    writer.write()
+    sensors = [
+        ImuConfig(writer.imu_name),
+        Lidar3DConfig(writer.lidar_name),
+        SensorConfig(writer.encoder_name),
+        SensorConfig(writer.gps_name),
+        VrsGpsConfig(writer.vrs_gps_name),
+    ]
+
+    result = count_elements(writer.dataset_config, sensors)
+
+    s = writer.sequence
+    assert result == {
+        writer.imu_name: len(s.imu_timestamps),
+        writer.lidar_name: len(s.lidar_timestamps),
+        writer.encoder_name: len(s.odometry_timestamps),
+        writer.gps_name: len(s.gps_timestamps),
+        writer.vrs_gps_name: len(s.gps_timestamps),
+    }
+    assert writer.ground_truth_file.exists()
+
+
+def test_ros2_layout(tmp_path: Path):
+    writer = Ros2DatasetWriter(tmp_path / "bag", config)
+    writer.write()
+    sensors = [
+        ImuConfig(writer.imu_name),
+        Lidar3DConfig(writer.lidar_name),
+        SensorConfig(writer.gps_name),
+    ]
+
+    result = count_elements(writer.dataset_config, sensors)
+
+    s = writer.sequence
+    assert result == {
+        writer.imu_name: len(s.imu_timestamps),
+        writer.lidar_name: len(s.lidar_timestamps),
+        writer.gps_name: len(s.gps_timestamps),
+    }
+    assert writer.ground_truth_file.exists()
@@ -20,7 +20,6 @@ from moduslam.measurement_storage.measurements.imu import (
 )
 from moduslam.measurement_storage.measurements.pose import Pose as PoseMeasurement
 from moduslam.measurement_storage.measurements.pose_odometry import Odometry
-from moduslam.measurement_storage.storage import MeasurementStorage
 from moduslam.utils.auxiliary_objects import identity3x3 as i3x3
 from moduslam.utils.auxiliary_objects import identity4x4 as i4x4
 from moduslam.utils.auxiliary_objects import one_vector3
@@ -32,12 +31,6 @@ def add_factory_to_table():
     distribution_table.update({Odometry: Factory})
 
 
-@pytest.fixture()
-def clean_storage() -> None:
-    """Clears the measurement storage."""
-    MeasurementStorage.clear()
-
-
 @pytest.fixture
 def graph0() -> Graph:
     """Empty graph."""
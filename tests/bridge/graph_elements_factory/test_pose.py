@@ -1,5 +1,7 @@
 """Tests create_graph_element() method with pose measurements."""
 
+import numpy as np
+
 from moduslam.bridge.candidates_factory import create_graph_elements
 from moduslam.frontend_manager.main_graph.graph import Graph
 from moduslam.frontend_manager.main_graph.vertices.custom import Pose
@@ -45,7 +47,8 @@ def test_2_measurements(graph0: Graph):
     assert v2.instance.index == 1
     assert e1.vertex is v1.instance
     assert e2.vertex is v2.instance
-    assert v1.instance.value == v2.instance.value == i4x4
+    assert np.array_equal(v1.instance.value, i4x4)
+    assert np.array_equal(v2.instance.value, i4x4)
     assert elem1.vertex_timestamp_table == {v1.instance: t1}
     assert elem2.vertex_timestamp_table == {v2.instance: t2}
 
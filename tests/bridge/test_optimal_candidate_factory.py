@@ -0,0 +1,66 @@
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from moduslam.bridge import optimal_candidate_factory
+from moduslam.bridge.auxiliary_dataclasses import CandidateWithClusters
+from moduslam.bridge.optimal_candidate_factory import Factory
+from moduslam.frontend_manager.main_graph.graph import GraphCandidate
+
+
+@pytest.fixture
+def solver(monkeypatch) -> MagicMock:
+    solver = MagicMock()
+    solver.solve_local.return_value = ("local values", 1.0)
+    solver.solve.return_value = ("global values", 2.0)
+    monkeypatch.setattr(optimal_candidate_factory, "GraphSolver", lambda: solver)
+    return solver
+
+
+@pytest.fixture
+def candidates(monkeypatch) -> list[GraphCandidate]:
+    """Candidates with MOM values 3, 1, 2: the second one is the best."""
+    candidates = [GraphCandidate(MagicMock(), [], 0, []) for _ in range(3)]
+    moms = dict(zip(candidates, (3.0, 1.0, 2.0)))
+
+    metrics = MagicMock()
+    metrics.compute_connectivity.return_value = True
+    metrics.compute_timeshift.return_value = 0
+    metrics.compute_mom.side_effect = lambda candidate: moms[candidate]
+    monkeypatch.setattr(optimal_candidate_factory, "MetricsFactory", lambda: metrics)
+
+    items = [CandidateWithClusters(candidate, []) for candidate in candidates]
+    monkeypatch.setattr(
+        optimal_candidate_factory, "create_candidates_with_clusters", lambda graph, data: items
+    )
+    return candidates
+
+
+def test_local_mode(solver: MagicMock, candidates: list[GraphCandidate]):
+    factory = Factory(num_local_clusters=5)
+
+    best, metrics = factory.create_candidate(MagicMock(), {})
+
+    assert best is candidates[1]
+    assert solver.solve_local.call_args_list == [call(c.graph, 5) for c in candidates]
+    solver.solve.assert_called_once_with(best.graph)
+    assert best.graph.update_vertices.call_args_list == [
+        call("local values"),
+        call("global values"),
+    ]
+    for candidate in (candidates[0], candidates[2]):
+        candidate.graph.update_vertices.assert_called_once_with("local values")
+    assert metrics.solver_error == 2.0
+    assert metrics.mom == 1.0
+
+
+def test_global_mode(solver: MagicMock, candidates: list[GraphCandidate]):
+    factory = Factory()
+
+    best, metrics = factory.create_candidate(MagicMock(), {})
+
+    assert best is candidates[1]
+    solver.solve_local.assert_not_called()
+    assert solver.solve.call_args_list == [call(c.graph) for c in candidates]
+    best.graph.update_vertices.assert_called_once_with("global values")
+    assert metrics.solver_error == 2.0
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from moduslam.data_manager.batch_factory.data_objects import Element, RawMeasurement
+from moduslam.data_manager.batch_factory.data_readers.locations import Location
+from moduslam.external.handlers_factory.handlers.imu.config import (
+    KaistImuHandlerConfig,
+    TumVieImuHandlerConfig,
+)
+from moduslam.external.handlers_factory.handlers.imu.handler import ImuHandler
+from moduslam.external.handlers_factory.handlers.imu.parsers import parse_batch
+from moduslam.sensors_factory.configs import ImuConfig, SensorConfig
+from moduslam.sensors_factory.sensors import Encoder, Imu
+
+
+def create_elements(num: int, line_length: int) -> list[Element]:
+    imu = Imu(ImuConfig("imu"))
+    rng = np.random.default_rng(0)
+    elements = []
+    for t in range(num):
+        values = tuple(str(v) for v in rng.normal(size=line_length))
+        elements.append(Element(t, RawMeasurement(imu, values), Location()))
+    return elements
+
+
+@pytest.mark.parametrize(
+    "config, line_length",
+    [(KaistImuHandlerConfig("imu"), 16), (TumVieImuHandlerConfig("imu"), 7)],
+)
+def test_process_batch_matches_process(config, line_length: int):
+    handler = ImuHandler(config)
+    elements = create_elements(10, line_length)
+
+    measurements = handler.process_batch(elements)
+
+    assert len(measurements) == len(elements)
+    for element, measurement in zip(elements, measurements):
+        expected = handler.process(element)
+        assert measurement.timestamp == expected.timestamp
+        assert measurement.angular_velocity == expected.angular_velocity
+        assert measurement.linear_acceleration == expected.linear_acceleration
+        assert measurement.covariance is expected.covariance
+
+
+def test_process_batch_wrong_sensor():
+    handler = ImuHandler(KaistImuHandlerConfig("imu"))
+    encoder = Encoder(SensorConfig("encoder"))
+    element = Element(0, RawMeasurement(encoder, ("0.0",) * 16), Location())
+
+    with pytest.raises(TypeError):
+        handler.process_batch([element])
+
+
+def test_parse_batch():
+    values = [("1", "2", "3", "4", "5", "6", "7"), ("8", "9", "10", "11", "12", "13", "14")]
+
+    data = parse_batch(values, (1, 2, 3, 4, 5, 6))
+
+    assert data.dtype == np.float64
+    assert np.array_equal(data, [[2, 3, 4, 5, 6, 7], [9, 10, 11, 12, 13, 14]])
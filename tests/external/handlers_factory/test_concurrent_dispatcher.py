@@ -0,0 +1,126 @@
+import time
+
+import pytest
+
+from moduslam.data_manager.batch_factory.batch import DataBatch
+from moduslam.external.handlers_factory.concurrent_dispatcher import (
+    ConcurrentDispatcher,
+)
+from moduslam.external.handlers_factory.dispatcher import Dispatcher
+from moduslam.frontend_manager.utils import fill_storage
+from moduslam.measurement_storage.measurements.auxiliary import FakeMeasurement
+from moduslam.measurement_storage.measurements.base import Measurement
+from moduslam.measurement_storage.storage import MeasurementStorage
+from moduslam.sensors_factory.configs import SensorConfig
+from moduslam.sensors_factory.sensors import Encoder, Fog, Lidar2D
+from moduslam.utils.exceptions import NotEnoughMeasurementsError, ValidationError
+from tests.external.handlers_factory.test_dispatcher import (
+    FakeBatchHandler,
+    FakeHandler,
+    create_element,
+)
+
+
+class StatefulHandler(FakeHandler):
+    """Creates a measurement for every 2-nd element: the result depends on the order."""
+
+    def process(self, element):
+        time.sleep(1e-4)
+        self.num_calls += 1
+        if self.num_calls % 2 == 0:
+            return FakeMeasurement(element.timestamp * 10 + self.num_calls)
+        return None
+
+
+class EveryThirdMeasurement:
+    """Is satisfied after every 3-rd added measurement."""
+
+    def __init__(self):
+        self._count = 0
+
+    @property
+    def satisfied(self) -> bool:
+        return self._count > 0 and self._count % 3 == 0
+
+    def on_add(self, storage: MeasurementStorage, measurement: Measurement) -> None:
+        self._count += 1
+
+    def on_remove(self, storage: MeasurementStorage, measurement: Measurement) -> None:
+        pass
+
+    def on_clear(self, storage: MeasurementStorage) -> None:
+        self._count = 0
+
+
+def create_batch() -> DataBatch:
+    sensors = [
+        Encoder(SensorConfig("encoder")),
+        Fog(SensorConfig("fog")),
+        Lidar2D(SensorConfig("lidar")),
+    ]
+    batch = DataBatch()
+    for t in range(300):
+        batch.add(create_element(t, sensors[(t * 7) % 5 % 3]))
+    return batch
+
+
+def create_dispatcher() -> Dispatcher:
+    handlers = [
+        FakeBatchHandler(Encoder, "encoder"),
+        StatefulHandler(Fog, "fog"),
+        StatefulHandler(Lidar2D, "lidar"),
+    ]
+    return Dispatcher(handlers)
+
+
+def fill_all(dispatcher: Dispatcher | ConcurrentDispatcher) -> list[list[int]]:
+    batch = create_batch()
+    storage = MeasurementStorage()
+    analyzer = EveryThirdMeasurement()
+    results = []
+
+    while not batch.empty:
+        try:
+            fill_storage(storage, batch, dispatcher, analyzer)
+        except NotEnoughMeasurementsError:
+            break
+        results.append([m.timestamp for timeline in storage.data().values() for m in timeline])
+        storage.clear()
+
+    return results
+
+
+def test_measurements_are_identical_to_sequential():
+    sequential = fill_all(create_dispatcher())
+
+    with ConcurrentDispatcher(create_dispatcher(), read_ahead=16) as dispatcher:
+        concurrent = fill_all(dispatcher)
+
+    assert len(sequential) > 10
+    assert concurrent == sequential
+
+
+def test_modified_batch_raises_validation_error():
+    batch = create_batch()
+
+    with ConcurrentDispatcher(create_dispatcher(), read_ahead=16) as dispatcher:
+        next(dispatcher.measurements(batch))
+        batch.remove_first()
+
+        with pytest.raises(ValidationError):
+            next(dispatcher.measurements(batch))
+
+
+def test_batch_handler_processes_chunks():
+    encoder, fog = Encoder(SensorConfig("encoder")), Fog(SensorConfig("fog"))
+    batch_handler = FakeBatchHandler(Encoder, "encoder")
+    batch = DataBatch()
+    for t in range(10):
+        batch.add(create_element(t, encoder if t != 5 else fog))
+
+    with ConcurrentDispatcher(Dispatcher([batch_handler, FakeHandler(Fog, "fog")])) as dispatcher:
+        measurements = list(dispatcher.measurements(batch))
+
+    assert [m.timestamp for m in measurements] == list(range(10))
+    assert batch_handler.num_calls == 2  # 2 chunks: [0, 4] and [6, 9].
+    assert batch.empty
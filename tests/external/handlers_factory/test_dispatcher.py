@@ -0,0 +1,84 @@
+from collections.abc import Sequence
+
+import pytest
+
+from moduslam.data_manager.batch_factory.data_objects import Element, RawMeasurement
+from moduslam.data_manager.batch_factory.data_readers.locations import Location
+from moduslam.external.handlers_factory.dispatcher import Dispatcher
+from moduslam.measurement_storage.measurements.auxiliary import FakeMeasurement
+from moduslam.sensors_factory.configs import SensorConfig
+from moduslam.sensors_factory.sensors import Encoder, Fog, Sensor
+from moduslam.utils.exceptions import ValidationError
+
+
+class FakeHandler:
+    def __init__(self, sensor_type: type[Sensor], sensor_name: str):
+        self._sensor_type = sensor_type
+        self._sensor_name = sensor_name
+        self.num_calls = 0
+
+    @property
+    def sensor_name(self) -> str:
+        return self._sensor_name
+
+    @property
+    def sensor_type(self) -> type[Sensor]:
+        return self._sensor_type
+
+    def process(self, element: Element) -> FakeMeasurement | None:
+        self.num_calls += 1
+        return FakeMeasurement(element.timestamp)
+
+
+class FakeBatchHandler(FakeHandler):
+    def process_batch(self, elements: Sequence[Element]) -> list[FakeMeasurement | None]:
+        self.num_calls += 1
+        return [FakeMeasurement(element.timestamp) for element in elements]
+
+
+def create_element(t: int, sensor: Sensor) -> Element:
+    return Element(t, RawMeasurement(sensor, None), Location())
+
+
+def test_process():
+    encoder, fog = Encoder(SensorConfig("encoder")), Fog(SensorConfig("fog"))
+    handler = FakeHandler(Encoder, "encoder")
+    dispatcher = Dispatcher([handler])
+
+    assert dispatcher.get_handler(encoder) is handler
+    assert dispatcher.get_handler(fog) is None
+    assert dispatcher.process(create_element(0, fog)) is None
+    assert dispatcher.process(create_element(1, encoder)).timestamp == 1
+
+
+def test_handler_with_different_sensor_type_is_not_used():
+    encoder = Encoder(SensorConfig("sensor"))
+    dispatcher = Dispatcher([FakeHandler(Fog, "sensor")])
+
+    assert dispatcher.get_handler(encoder) is None
+
+
+def test_duplicate_handlers_raise_validation_error():
+    with pytest.raises(ValidationError):
+        Dispatcher([FakeHandler(Encoder, "encoder"), FakeHandler(Encoder, "encoder")])
+
+
+def test_process_batch_groups_consecutive_elements():
+    encoder, fog, other = (
+        Encoder(SensorConfig("encoder")),
+        Fog(SensorConfig("fog")),
+        Fog(SensorConfig("other")),
+    )
+    encoder_handler = FakeBatchHandler(Encoder, "encoder")
+    fog_handler = FakeHandler(Fog, "fog")
+    dispatcher = Dispatcher([encoder_handler, fog_handler])
+    sensors = [encoder, encoder, encoder, fog, fog, other, encoder, encoder]
+    elements = [create_element(t, sensor) for t, sensor in enumerate(sensors)]
+
+    results = dispatcher.process_batch(elements)
+
+    assert dispatcher.supports_batch(encoder) is True
+    assert dispatcher.supports_batch(fog) is False
+    assert [m.timestamp if m else None for m in results] == [0, 1, 2, 3, 4, None, 6, 7]
+    assert encoder_handler.num_calls == 2
+    assert fog_handler.num_calls == 2
@@ -0,0 +1,213 @@
+import pickle
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from moduslam.data_manager.batch_factory.batch import DataBatch, Element
+from moduslam.external.handlers_factory.concurrent_dispatcher import (
+    ConcurrentDispatcher,
+)
+from moduslam.external.handlers_factory.dispatcher import Dispatcher
+from moduslam.external.handlers_factory.replay import (
+    ReplayDispatcher,
+    code_directories,
+    code_version,
+    create_key,
+    read_log,
+)
+from moduslam.measurement_storage.measurements.pose_odometry import (
+    OdometryWithElements,
+)
+from moduslam.sensors_factory.configs import SensorConfig
+from moduslam.sensors_factory.sensors import Encoder, Fog, Sensor
+from moduslam.utils.auxiliary_dataclasses import TimeRange
+from moduslam.utils.exceptions import ValidationError
+from tests.external.handlers_factory.test_dispatcher import create_element
+
+
+class OdometryHandler:
+    """Creates odometry between consecutive elements of the sensor."""
+
+    def __init__(self, sensor_type: type[Sensor], sensor_name: str):
+        self._sensor_type = sensor_type
+        self._sensor_name = sensor_name
+        self._previous: Element | None = None
+        self.num_calls = 0
+
+    @property
+    def sensor_name(self) -> str:
+        return self._sensor_name
+
+    @property
+    def sensor_type(self) -> type[Sensor]:
+        return self._sensor_type
+
+    def process(self, element: Element) -> OdometryWithElements | None:
+        self.num_calls += 1
+        previous, self._previous = self._previous, element
+        if previous is None:
+            return None
+
+        tf = np.eye(4)
+        tf[0, 3] = element.timestamp
+        t1, t2 = previous.timestamp, element.timestamp
+        return OdometryWithElements(
+            t2, TimeRange(t1, t2), tf, np.eye(3), np.eye(3), [previous, element]
+        )
+
+
+class Unpicklable:
+    def __reduce__(self):
+        raise pickle.PicklingError("Can not be pickled.")
+
+
+class UnpicklableHandler(OdometryHandler):
+    """Creates a measurement which can not be pickled for the given timestamp."""
+
+    def __init__(self, timestamp: int):
+        super().__init__(Encoder, "encoder")
+        self._timestamp = timestamp
+
+    def process(self, element: Element):
+        measurement = super().process(element)
+        return Unpicklable() if element.timestamp == self._timestamp else measurement
+
+
+@dataclass
+class HandlerConfig:
+    sensor_name: str = "encoder"
+    max_range: float = 10.0
+
+
+def create_batch() -> DataBatch:
+    encoder, fog = Encoder(SensorConfig("encoder")), Fog(SensorConfig("fog"))
+    batch = DataBatch()
+    for t in range(20):
+        batch.add(create_element(t, encoder if t % 3 else fog))
+    return batch
+
+
+def collect(dispatcher: ReplayDispatcher, batch: DataBatch) -> list:
+    elements = list(batch.data)
+    return list(zip(elements, dispatcher.measurements(batch)))
+
+
+def test_record_and_replay(tmp_path):
+    handler = OdometryHandler(Encoder, "encoder")
+    with ReplayDispatcher(Dispatcher([handler]), tmp_path, "key") as dispatcher:
+        assert not dispatcher.replaying
+        recorded = collect(dispatcher, create_batch())
+    assert (tmp_path / "key.log").exists()
+
+    handler = OdometryHandler(Encoder, "encoder")
+    with ReplayDispatcher(Dispatcher([handler]), tmp_path, "key") as dispatcher:
+        assert dispatcher.replaying
+        replayed = collect(dispatcher, create_batch())
+
+    assert handler.num_calls == 0
+    assert len(replayed) == len(recorded)
+    for (element, measurement), (_, expected) in zip(replayed, recorded):
+        if expected is None:
+            assert measurement is None
+            continue
+        assert measurement.timestamp == expected.timestamp
+        assert measurement.time_range == expected.time_range
+        assert np.array_equal(measurement.transformation, expected.transformation)
+        assert measurement.elements[1] is element
+        assert measurement.elements[0].timestamp == expected.elements[0].timestamp
+
+
+def test_log_is_incomplete_until_closed(tmp_path):
+    dispatcher = ReplayDispatcher(Dispatcher([]), tmp_path, "key")
+    collect(dispatcher, create_batch())
+
+    assert not (tmp_path / "key.log").exists()
+    dispatcher.close()
+    assert len(read_log(tmp_path / "key.log", "key")) == 20
+
+
+def test_missing_record_invalidates_log(tmp_path):
+    with ReplayDispatcher(Dispatcher([]), tmp_path, "key") as dispatcher:
+        collect(dispatcher, create_batch())
+
+    handler = OdometryHandler(Encoder, "encoder")
+    batch = create_batch()
+    batch.add(create_element(100, Encoder(SensorConfig("encoder"))))
+    with ReplayDispatcher(Dispatcher([handler]), tmp_path, "key") as dispatcher:
+        with pytest.raises(ValidationError):
+            collect(dispatcher, batch)
+
+    assert handler.num_calls == 0
+    assert not (tmp_path / "key.log").exists()
+
+    with ReplayDispatcher(Dispatcher([handler]), tmp_path, "key") as dispatcher:
+        assert not dispatcher.replaying
+
+
+def test_unpicklable_measurement_stops_recording(tmp_path):
+    handler = UnpicklableHandler(timestamp=5)
+    with ReplayDispatcher(Dispatcher([handler]), tmp_path, "key") as dispatcher:
+        measurements = [measurement for _, measurement in collect(dispatcher, create_batch())]
+        assert not dispatcher.replaying
+
+    assert handler.num_calls == 20 - 7
+    assert sum(isinstance(measurement, Unpicklable) for measurement in measurements) == 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_concurrent_dispatcher(tmp_path):
+    handler = OdometryHandler(Encoder, "encoder")
+    with ConcurrentDispatcher(Dispatcher([handler])) as concurrent:
+        with ReplayDispatcher(concurrent, tmp_path, "key") as dispatcher:
+            recorded = collect(dispatcher, create_batch())
+
+    handler = OdometryHandler(Encoder, "encoder")
+    with ConcurrentDispatcher(Dispatcher([handler])) as concurrent:
+        with ReplayDispatcher(concurrent, tmp_path, "key") as dispatcher:
+            replayed = collect(dispatcher, create_batch())
+
+    assert handler.num_calls == 0
+    assert len(replayed) == len(recorded)
+    assert [m is None for _, m in replayed] == [m is None for _, m in recorded]
+
+
+def test_truncated_log(tmp_path):
+    with ReplayDispatcher(Dispatcher([]), tmp_path, "key") as dispatcher:
+        collect(dispatcher, create_batch())
+    file = tmp_path / "key.log"
+    file.write_bytes(file.read_bytes()[:-3])
+
+    assert len(read_log(file, "key")) == 19
+
+
+def test_wrong_key(tmp_path):
+    with ReplayDispatcher(Dispatcher([]), tmp_path, "key1") as dispatcher:
+        collect(dispatcher, create_batch())
+    (tmp_path / "key1.log").rename(tmp_path / "key2.log")
+
+    with pytest.raises(ValidationError):
+        ReplayDispatcher(Dispatcher([]), tmp_path, "key2")
+
+
+def test_create_key():
+    key = create_key([HandlerConfig()], version="1")
+
+    assert key == create_key([HandlerConfig()], version="1")
+    assert key != create_key([HandlerConfig(max_range=5.0)], version="1")
+    assert key != create_key([HandlerConfig()], version="2")
+
+
+def test_code_version(tmp_path):
+    handlers, measurements = tmp_path / "handlers", tmp_path / "measurements"
+    handlers.mkdir()
+    measurements.mkdir()
+    (handlers / "handler.py").write_text("x = 1")
+    (measurements / "measurement.py").write_text("y = 1")
+    version = code_version((handlers, measurements))
+
+    (measurements / "measurement.py").write_text("y = 2")
+
+    assert version != code_version((handlers, measurements))
+    assert any(directory.name == "measurements" for directory in code_directories)
+    assert any(directory.name == "data_readers" for directory in code_directories)
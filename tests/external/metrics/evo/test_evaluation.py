@@ -0,0 +1,194 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+from evo.core import filters
+from evo.core.metrics import PoseRelation, Unit
+from evo.core.trajectory import PoseTrajectory3D
+from scipy.spatial.transform import Rotation
+
+from moduslam.external.metrics.evo.evaluation import (
+    compute_ape,
+    compute_rpe,
+    evaluate_ape,
+    evaluate_rpe,
+    get_pairs,
+    load_gt_array,
+)
+
+relations = [
+    PoseRelation.translation_part,
+    PoseRelation.rotation_part,
+    PoseRelation.full_transformation,
+    PoseRelation.rotation_angle_rad,
+    PoseRelation.rotation_angle_deg,
+]
+
+
+def create_trajectory(num: int, seed: int, noise: float = 0.0) -> PoseTrajectory3D:
+    """Creates a random walk trajectory with timestamps in nanoseconds."""
+    rng = np.random.default_rng(seed)
+    poses = np.tile(np.eye(4), (num, 1, 1))
+    poses[:, :3, :3] = Rotation.from_rotvec(np.cumsum(rng.normal(0, 0.05, (num, 3)), 0)).as_matrix()
+    poses[:, :3, 3] = np.cumsum(rng.uniform(0.0, 1.0, (num, 3)), axis=0)
+
+    if noise:
+        poses[:, :3, :3] = (
+            Rotation.from_rotvec(rng.normal(0, noise, (num, 3))).as_matrix() @ poses[:, :3, :3]
+        )
+        poses[:, :3, 3] += rng.normal(0, noise, (num, 3))
+
+    timestamps = np.cumsum(rng.integers(50_000_000, 150_000_000, num)).astype(np.float64)
+    return PoseTrajectory3D(timestamps=timestamps, poses_se3=poses)
+
+
+@pytest.fixture
+def trajectories() -> tuple[PoseTrajectory3D, PoseTrajectory3D]:
+    ref = create_trajectory(300, seed=0)
+    est = create_trajectory(300, seed=0, noise=0.05)
+    return ref, est
+
+
+def assert_statistics_equal(actual: dict[str, float], expected: dict[str, float]):
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        assert actual[key] == pytest.approx(value, rel=1e-9, abs=1e-12)
+
+
+@pytest.mark.parametrize("relation", relations)
+def test_ape_matches_evo(trajectories, relation):
+    ref, est = trajectories
+
+    actual = evaluate_ape(ref, est, relation)
+
+    expected = evaluate_ape(ref, est, relation, exact=True)
+    assert_statistics_equal(actual, expected)
+
+
+@pytest.mark.parametrize("relation", relations)
+@pytest.mark.parametrize("all_pairs", [False, True])
+@pytest.mark.parametrize("delta, unit", [(1, Unit.frames), (7, Unit.frames), (10.0, Unit.meters)])
+def test_rpe_matches_evo(trajectories, relation, all_pairs, delta, unit):
+    ref, est = trajectories
+
+    actual = evaluate_rpe(ref, est, relation, delta, unit, all_pairs)
+
+    expected = evaluate_rpe(ref, est, relation, delta, unit, all_pairs, exact=True)
+    assert_statistics_equal(actual, expected)
+
+
+@pytest.mark.parametrize("all_pairs", [False, True])
+def test_pairs_by_path_match_evo(trajectories, all_pairs):
+    ref, _ = trajectories
+    poses = np.asarray(ref.poses_se3)
+
+    first, second = get_pairs(poses, ref.timestamps, 5.0, Unit.meters, all_pairs)
+
+    expected = filters.filter_pairs_by_path(list(poses), 5.0, 0.5, all_pairs)
+    assert list(zip(first.tolist(), second.tolist())) == expected
+
+
+def test_pairs_by_time():
+    timestamps = np.arange(0, 10_000_000_000, 100_000_000)
+    poses = np.tile(np.eye(4), (len(timestamps), 1, 1))
+
+    first, second = get_pairs(poses, timestamps, 1.0, Unit.seconds)
+    assert np.array_equal(first, np.arange(0, 90, 10))
+    assert np.array_equal(second, np.arange(10, 100, 10))
+
+    first, second = get_pairs(poses, timestamps, 1.0, Unit.seconds, True, rel_tol=0.05)
+    assert np.array_equal(first, np.arange(90))
+    assert np.array_equal(second, np.arange(10, 100))
+
+
+def test_no_pairs():
+    poses = np.tile(np.eye(4), (3, 1, 1))
+
+    with pytest.raises(ValueError):
+        get_pairs(poses, np.arange(3), 5, Unit.frames)
+
+
+def test_unsupported_unit():
+    poses = np.tile(np.eye(4), (3, 1, 1))
+
+    with pytest.raises(ValueError):
+        get_pairs(poses, np.arange(3), 5, Unit.degrees)
+
+
+def test_chunked_evaluation(trajectories):
+    ref, est = trajectories
+    ref_poses, est_poses = np.asarray(ref.poses_se3), np.asarray(est.poses_se3)
+    pairs = get_pairs(ref_poses, ref.timestamps, 1, Unit.frames, all_pairs=True)
+    relation = PoseRelation.full_transformation
+
+    assert np.allclose(
+        compute_ape(ref_poses, est_poses, relation, chunk_size=7),
+        compute_ape(ref_poses, est_poses, relation),
+    )
+    assert np.allclose(
+        compute_rpe(ref_poses, est_poses, pairs, relation, chunk_size=7),
+        compute_rpe(ref_poses, est_poses, pairs, relation),
+    )
+
+
+def test_different_lengths():
+    poses = np.tile(np.eye(4), (3, 1, 1))
+
+    with pytest.raises(ValueError):
+        compute_ape(poses, poses[:2], PoseRelation.rotation_part)
+
+
+def write_csv(file: Path, timestamps: np.ndarray, poses: np.ndarray) -> None:
+    with file.open("w") as f:
+        for t, pose in zip(timestamps, poses):
+            values = ",".join(repr(float(v)) for v in pose[:3, :].ravel())
+            f.write(f"{t},{values}\n")
+
+
+def test_load_gt_array(tmp_path):
+    ref = create_trajectory(20, seed=1)
+    timestamps = 1544590798702752000 + np.arange(20, dtype=np.int64)
+    file = tmp_path / "global_pose.csv"
+    write_csv(file, timestamps, ref.poses_se3)
+
+    loaded_timestamps, poses = load_gt_array(file)
+
+    assert loaded_timestamps.dtype == np.int64
+    assert np.array_equal(loaded_timestamps, timestamps)
+    assert np.array_equal(poses, ref.poses_se3)
+    assert (tmp_path / "global_pose.csv.npz").exists()
+
+
+def test_load_gt_array_uses_cache(tmp_path):
+    ref = create_trajectory(5, seed=1)
+    file = tmp_path / "global_pose.csv"
+    write_csv(file, np.arange(5), ref.poses_se3)
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    load_gt_array(file, cache_dir)
+
+    cache_file = cache_dir / "global_pose.csv.npz"
+    with np.load(cache_file) as cache:
+        content = dict(cache)
+    content["timestamps"] = content["timestamps"] + 100
+    np.savez(cache_file, **content)
+
+    timestamps, _ = load_gt_array(file, cache_dir)
+
+    assert np.array_equal(timestamps, np.arange(100, 105))
+
+
+def test_load_gt_array_invalidates_cache(tmp_path):
+    ref = create_trajectory(5, seed=1)
+    file = tmp_path / "global_pose.csv"
+    write_csv(file, np.arange(5), ref.poses_se3)
+    load_gt_array(file)
+
+    write_csv(file, np.arange(10, 15), ref.poses_se3)
+    stat = file.stat()
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    timestamps, _ = load_gt_array(file)
+
+    assert np.array_equal(timestamps, np.arange(10, 15))
@@ -0,0 +1,103 @@
+import numpy as np
+import open3d as o3d
+import pytest
+
+from moduslam.external.metrics.modified_mom.map_aggregator import MapAggregator
+from moduslam.external.metrics.modified_mom.utils import aggregate_map
+
+
+def test_add_without_voxels():
+    aggregator = MapAggregator(capacity=4)
+    points1 = np.arange(9, dtype=float).reshape(3, 3)
+    points2 = np.ones((3, 3))
+
+    aggregator.add(points1)
+    aggregator.add(points2)
+
+    assert len(aggregator) == 6
+    assert np.array_equal(aggregator.points, np.vstack((points1, points2)))
+    assert aggregator.points.flags.c_contiguous
+
+
+def test_add_with_transformation():
+    aggregator = MapAggregator()
+    tf = np.eye(4)
+    tf[:3, :3] = [[0, -1, 0], [1, 0, 0], [0, 0, 1]]
+    tf[:3, 3] = [1, 2, 3]
+
+    aggregator.add(np.array([[1.0, 0.0, 0.0]]), tf)
+
+    assert np.allclose(aggregator.points, [[1.0, 3.0, 3.0]])
+
+
+def test_points_are_read_only():
+    aggregator = MapAggregator()
+    aggregator.add(np.zeros((2, 3)))
+
+    with pytest.raises(ValueError):
+        aggregator.points[0, 0] = 1.0
+
+
+def test_voxel_deduplication_keeps_first_point_per_voxel():
+    aggregator = MapAggregator(voxel_size=1.0)
+
+    aggregator.add(np.array([[0.1, 0.1, 0.1], [0.9, 0.9, 0.9], [1.5, 0.1, 0.1]]))
+    aggregator.add(np.array([[0.5, 0.5, 0.5], [-0.5, 0.1, 0.1], [1.2, 0.2, 0.2]]))
+
+    expected = [[0.1, 0.1, 0.1], [1.5, 0.1, 0.1], [-0.5, 0.1, 0.1]]
+    assert np.array_equal(aggregator.points, expected)
+
+
+def test_voxel_deduplication_matches_unique_voxels():
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-10.0, 10.0, size=(5000, 3))
+    aggregator = MapAggregator(voxel_size=0.5)
+
+    for chunk in np.array_split(points, 7):
+        aggregator.add(chunk)
+
+    voxels = np.floor(points / 0.5)
+    _, first = np.unique(voxels, axis=0, return_index=True)
+    assert np.array_equal(np.sort(aggregator.points, axis=0), np.sort(points[first], axis=0))
+
+
+def test_voxel_deduplication_out_of_range():
+    aggregator = MapAggregator(voxel_size=1e-6)
+
+    with pytest.raises(ValueError):
+        aggregator.add(np.array([[1e3, 0.0, 0.0]]))
+
+
+def test_clear():
+    aggregator = MapAggregator(voxel_size=1.0)
+    aggregator.add(np.zeros((1, 3)))
+
+    aggregator.clear()
+    aggregator.add(np.zeros((1, 3)))
+
+    assert len(aggregator) == 1
+
+
+def test_aggregate_map():
+    cloud1 = o3d.geometry.PointCloud(o3d.utility.Vector3dVector(np.zeros((2, 3))))
+    cloud2 = o3d.geometry.PointCloud(o3d.utility.Vector3dVector(np.zeros((1, 3))))
+    pose1, pose2 = np.eye(4), np.eye(4)
+    pose1[0, 3], pose2[0, 3] = 1.0, 3.0
+
+    points = aggregate_map([cloud1, cloud2], [pose1, pose2])
+
+    assert np.allclose(points, [[0, 0, 0], [0, 0, 0], [2, 0, 0]])
+    assert np.allclose(np.asarray(cloud2.points), 0.0)
+
+
+def test_aggregate_map_with_voxels():
+    cloud = o3d.geometry.PointCloud(o3d.utility.Vector3dVector(np.zeros((2, 3))))
+
+    points = aggregate_map([cloud, cloud], [np.eye(4), np.eye(4)], voxel_size=0.1)
+
+    assert points.shape == (1, 3)
+
+
+def test_aggregate_map_wrong_number_of_poses():
+    with pytest.raises(ValueError):
+        aggregate_map([o3d.geometry.PointCloud()], [])
@@ -0,0 +1,126 @@
+import numpy as np
+import open3d as o3d
+import pytest
+
+from moduslam.external.metrics.modified_mom.config import LidarConfig, RansacConfig
+from moduslam.external.metrics.modified_mom.ransac_planes import (
+    detect_multiple_planes,
+    detect_plane,
+    extract_orthogonal_subsets,
+    required_iterations,
+)
+
+
+def create_box(num_points: int = 2000, noise: float = 0.005, seed: int = 0) -> np.ndarray:
+    """Creates points of 3 mutually orthogonal planes: x = 0, y = 0, z = 0."""
+    rng = np.random.default_rng(seed)
+    planes = []
+
+    for axis in range(3):
+        points = rng.uniform(0.5, 5.0, size=(num_points, 3))
+        points[:, axis] = rng.normal(0.0, noise, num_points)
+        planes.append(points)
+
+    return np.vstack(planes)
+
+
+def test_required_iterations():
+    assert required_iterations(1.0, 0.99) == 1
+    assert required_iterations(0.0, 0.99) == np.iinfo(np.int64).max
+    assert required_iterations(0.5, 0.99) == 35
+    assert required_iterations(0.1, 0.99) > required_iterations(0.5, 0.99)
+
+
+def test_detect_plane():
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-5.0, 5.0, size=(1000, 3))
+    points[:700, 2] = 1.0
+    config = RansacConfig(distance_threshold=0.01)
+
+    coefficients, mask = detect_plane(points, config, rng)
+
+    normal, d = np.array(coefficients[:3]), coefficients[3]
+    assert abs(abs(normal[2]) - 1.0) < 1e-3
+    assert abs(abs(d) - 1.0) < 1e-3
+    assert np.count_nonzero(mask[:700]) == 700
+    assert np.count_nonzero(mask[700:]) < 10
+
+
+def test_detect_plane_with_normals():
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-5.0, 5.0, size=(1000, 3))
+    points[:, 2] = 0.0
+    normals = np.tile([0.0, 0.0, 1.0], (1000, 1))
+    normals[500:] = [1.0, 0.0, 0.0]
+    config = RansacConfig(distance_threshold=0.01)
+
+    _, mask = detect_plane(points, config, rng, normals)
+
+    assert np.all(mask[:500])
+    assert not np.any(mask[500:])
+
+
+def test_detect_multiple_planes():
+    points = create_box()
+    config = RansacConfig(distance_threshold=0.02, min_plane_points=100)
+
+    planes = detect_multiple_planes(points, config)
+
+    assert len(planes) == 3
+    normals = np.abs([plane.coefficients[:3] for plane in planes])
+    assert np.allclose(np.sort(np.argmax(normals, axis=1)), [0, 1, 2])
+    assert all(plane.points.shape[0] > 1900 for plane in planes)
+
+    inliers = np.vstack([plane.points for plane in planes])
+    assert np.unique(inliers, axis=0).shape[0] == inliers.shape[0]
+
+
+def test_detect_multiple_planes_max_planes():
+    points = create_box()
+    config = RansacConfig(distance_threshold=0.02, max_planes=2)
+
+    planes = detect_multiple_planes(points, config)
+
+    assert len(planes) == 2
+
+
+def test_detect_multiple_planes_is_deterministic():
+    points = create_box(noise=0.05)
+    config = RansacConfig(distance_threshold=0.05, seed=42)
+
+    planes1 = detect_multiple_planes(points, config)
+    planes2 = detect_multiple_planes(points, config)
+
+    assert len(planes1) == len(planes2)
+    for plane1, plane2 in zip(planes1, planes2):
+        assert plane1.coefficients == plane2.coefficients
+        assert np.array_equal(plane1.points, plane2.points)
+
+
+def test_detect_multiple_planes_small_cloud():
+    points = np.zeros((2, 3))
+
+    assert detect_multiple_planes(points, RansacConfig()) == []
+
+
+def test_extract_orthogonal_subsets():
+    points = create_box(num_points=3000, noise=0.0)
+    cloud = o3d.geometry.PointCloud(o3d.utility.Vector3dVector(points))
+    normals_config = LidarConfig(knn_rad=0.5, max_nn=30)
+    config = RansacConfig(distance_threshold=0.02)
+
+    subsets = extract_orthogonal_subsets(cloud, normals_config, config)
+
+    assert len(subsets) == 3
+    assert all(subset.shape[0] > 1000 for subset in subsets)
+
+
+def test_extract_orthogonal_subsets_no_clique():
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-5.0, 5.0, size=(3000, 3))
+    points[:, 2] = 0.0
+    cloud = o3d.geometry.PointCloud(o3d.utility.Vector3dVector(points))
+    normals_config = LidarConfig(knn_rad=0.5, max_nn=30)
+
+    with pytest.raises(ValueError):
+        extract_orthogonal_subsets(cloud, normals_config, RansacConfig())
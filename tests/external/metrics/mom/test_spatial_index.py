@@ -0,0 +1,154 @@
+import numpy as np
+import open3d as o3d
+import pytest
+
+from moduslam.external.metrics.modified_mom import spatial_index
+from moduslam.external.metrics.modified_mom.config import BaseConfig, HdbscanConfig
+from moduslam.external.metrics.modified_mom.metrics import (
+    create_context,
+    mme,
+    mom,
+    mpv,
+)
+from moduslam.external.metrics.modified_mom.spatial_index import (
+    KDTreeIndex,
+    MetricsContext,
+    SklearnIndex,
+    VoxelHashIndex,
+    entropies,
+    plane_variances,
+)
+from moduslam.external.metrics.modified_mom.utils import (
+    compute_entropy,
+    compute_plane_variance,
+)
+
+index_types = [SklearnIndex, KDTreeIndex, VoxelHashIndex]
+
+
+def brute_force_neighbours(points: np.ndarray, queries: np.ndarray, radius: float) -> list:
+    distances = np.linalg.norm(queries[:, None, :] - points[None, :, :], axis=2)
+    return [np.flatnonzero(row <= radius) for row in distances]
+
+
+def create_clouds(seed: int = 0) -> tuple[list[o3d.geometry.PointCloud], list[np.ndarray]]:
+    rng = np.random.default_rng(seed)
+    clouds, poses = [], []
+
+    for i in range(2):
+        points = rng.uniform(-3.0, 3.0, size=(300, 3))
+        points[:150, 2] = rng.normal(0.0, 0.01, 150)
+        clouds.append(o3d.geometry.PointCloud(o3d.utility.Vector3dVector(points)))
+        pose = np.eye(4)
+        pose[0, 3] = 0.1 * i
+        poses.append(pose)
+
+    return clouds, poses
+
+
+@pytest.mark.parametrize("index_type", index_types)
+def test_radius_neighbors(index_type):
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-5.0, 5.0, size=(500, 3))
+    queries = np.vstack((points[:50], rng.uniform(-8.0, 8.0, size=(50, 3))))
+    radius = 1.3
+    index = index_type(points, radius)
+
+    offsets, indices = index.radius_neighbors(queries)
+
+    expected = brute_force_neighbours(points, queries, radius)
+    assert offsets.shape == (101,)
+    for i, neighbours in enumerate(expected):
+        actual = indices[offsets[i] : offsets[i + 1]]
+        assert np.array_equal(np.sort(actual), neighbours)
+
+
+@pytest.mark.parametrize("index_type", index_types)
+def test_radius_neighbors_no_neighbours(index_type):
+    points = np.zeros((3, 3))
+    index = index_type(points, 0.5)
+
+    offsets, indices = index.radius_neighbors(np.full((2, 3), 10.0))
+
+    assert np.array_equal(offsets, [0, 0, 0])
+    assert indices.size == 0
+
+
+@pytest.mark.parametrize("backend", ["sklearn", "kdtree", "voxel"])
+def test_covariances(backend):
+    rng = np.random.default_rng(1)
+    points = rng.uniform(0.0, 3.0, size=(400, 3)) + 1000.0
+    context = MetricsContext(points, backend, chunk_size=64)
+    radius, min_nn = 0.8, 5
+
+    covariances = context.covariances(points, radius, min_nn)
+
+    expected = [
+        np.cov(points[idx].T)
+        for idx in brute_force_neighbours(points, points, radius)
+        if len(idx) > min_nn
+    ]
+    assert covariances.shape == (len(expected), 3, 3)
+    assert np.allclose(covariances, expected, atol=1e-12)
+
+
+def test_get_index_is_shared():
+    context = MetricsContext(np.zeros((5, 3)))
+
+    assert context.get_index(1.0) is context.get_index(1.0)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        MetricsContext(np.zeros((5, 3)), "octree")
+
+
+def test_entropies_and_plane_variances():
+    rng = np.random.default_rng(2)
+    clouds = [rng.normal(size=(20, 3)), np.column_stack((rng.normal(size=(20, 2)), np.zeros(20)))]
+    covariances = np.array([np.cov(cloud.T) for cloud in clouds])
+
+    assert np.allclose(plane_variances(covariances), [compute_plane_variance(c) for c in clouds])
+    assert np.allclose(entropies(covariances), [compute_entropy(clouds[0])])
+
+
+def test_mpv_and_mme_match_per_point_computation():
+    config = BaseConfig(knn_rad=1.0, min_knn=3)
+    clouds, poses = create_clouds()
+    points = np.vstack([np.asarray(cloud.points) for cloud in clouds])
+    points[300:, 0] += 0.1
+
+    variances, entropy_values = [], []
+    for idx in brute_force_neighbours(points, points, config.knn_rad):
+        if len(idx) > config.min_knn:
+            variances.append(compute_plane_variance(points[idx]))
+            entropy = compute_entropy(points[idx])
+            if entropy is not None:
+                entropy_values.append(entropy)
+
+    clouds, poses = create_clouds()
+    context = create_context(clouds, poses, config, "voxel")
+
+    assert np.isclose(mpv(clouds, poses, config, context), np.mean(variances))
+    assert np.isclose(mme(clouds, poses, config, context), np.mean(entropy_values))
+    assert np.isclose(mpv(*create_clouds(), config), np.mean(variances))
+
+
+def test_metrics_share_context(monkeypatch):
+    config = BaseConfig(knn_rad=1.0, min_knn=3)
+    clouds, poses = create_clouds()
+    context = create_context(clouds, poses, config)
+    radii = []
+
+    def create_index(points: np.ndarray, radius: float) -> SklearnIndex:
+        radii.append(radius)
+        return SklearnIndex(points, radius)
+
+    monkeypatch.setitem(spatial_index.backends, "sklearn", create_index)
+    subsets = [context.points[:100]]
+
+    mom(clouds, poses, config, HdbscanConfig(), subsets, context)
+    mme(clouds, poses, config, context)
+    mpv(clouds, poses, config, context)
+
+    assert radii == [config.knn_rad]
@@ -0,0 +1,142 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from moduslam.data_manager.batch_factory.data_objects import Element, RawMeasurement
+from moduslam.data_manager.batch_factory.data_readers.locations import (
+    BinaryDataLocation,
+)
+from moduslam.external.metrics.modified_mom import subsets_cache
+from moduslam.external.metrics.modified_mom.config import HdbscanConfig, LidarConfig
+from moduslam.external.metrics.modified_mom.subsets_cache import (
+    OrthogonalSubsetsCache,
+    transform_subsets,
+)
+from moduslam.map_manager.factories.lidar_map.config import (
+    LidarPointCloudConfig,
+)
+from moduslam.sensors_factory.configs import Lidar3DConfig
+from moduslam.sensors_factory.sensors import Lidar3D
+
+
+@pytest.fixture
+def calls(monkeypatch) -> list[int]:
+    """Replaces the extraction with a function returning all points as 1 subset."""
+    calls: list[int] = []
+
+    def extract(cloud, normals_config, cluster_config):
+        calls.append(1)
+        return [np.asarray(cloud.points)]
+
+    monkeypatch.setattr(subsets_cache, "extract_orthogonal_subsets", extract)
+    return calls
+
+
+def create_element(file: str) -> Element:
+    lidar = Lidar3D(Lidar3DConfig("lidar"))
+    points = np.array([[10.0, 0.0, 0.0, 1.0], [0.0, 10.0, 0.0, 1.0], [0.0, 0.0, 10.0, 1.0]])
+    values = tuple(points.ravel())
+    return Element(0, RawMeasurement(lidar, values), BinaryDataLocation(Path(file)))
+
+
+def test_same_scan_is_extracted_once(calls: list[int]):
+    cache = OrthogonalSubsetsCache()
+    element = create_element("scan_0.bin")
+    configs = LidarPointCloudConfig(), LidarConfig(), HdbscanConfig()
+
+    subsets1 = cache.get(element, *configs)
+    subsets2 = cache.get(create_element("scan_0.bin"), *configs)
+
+    assert len(calls) == 1
+    assert subsets1 is subsets2
+    assert cache.hits == 1 and cache.misses == 1
+
+
+def test_key_contains_location_and_configs(calls: list[int]):
+    cache = OrthogonalSubsetsCache()
+    configs = LidarPointCloudConfig(), LidarConfig(), HdbscanConfig()
+
+    cache.get(create_element("scan_0.bin"), *configs)
+    cache.get(create_element("scan_1.bin"), *configs)
+    cache.get(
+        create_element("scan_0.bin"),
+        LidarPointCloudConfig(),
+        LidarConfig(knn_rad=2.0),
+        HdbscanConfig(),
+    )
+
+    assert len(calls) == 3
+
+
+def test_bounded_size(calls: list[int]):
+    cache = OrthogonalSubsetsCache(max_size=2)
+    configs = LidarPointCloudConfig(), LidarConfig(), HdbscanConfig()
+
+    for file in ("scan_0.bin", "scan_1.bin", "scan_2.bin", "scan_0.bin"):
+        cache.get(create_element(file), *configs)
+
+    assert len(cache) == 2
+    assert len(calls) == 4
+
+
+@pytest.mark.parametrize(
+    "error", [ValueError("No cliques of size > 2 found."), RuntimeError("open3d failed.")]
+)
+def test_failure_is_cached(monkeypatch, error: Exception):
+    calls = []
+
+    def extract(cloud, normals_config, cluster_config):
+        calls.append(1)
+        raise error
+
+    monkeypatch.setattr(subsets_cache, "extract_orthogonal_subsets", extract)
+    cache = OrthogonalSubsetsCache()
+    configs = LidarPointCloudConfig(), LidarConfig(), HdbscanConfig()
+
+    with pytest.raises(type(error)):
+        cache.get(create_element("scan_0.bin"), *configs)
+    with pytest.raises(type(error)) as first_hit:
+        cache.get(create_element("scan_0.bin"), *configs)
+    with pytest.raises(type(error)) as second_hit:
+        cache.get(create_element("scan_0.bin"), *configs)
+
+    assert len(calls) == 1
+    assert first_hit.value is not second_hit.value
+    assert first_hit.value.__cause__ is second_hit.value.__cause__
+    assert first_hit.value.__cause__.__traceback__ is None
+
+
+@pytest.mark.parametrize("error", [OSError("Scan is not readable."), MemoryError()])
+def test_loading_failure_is_not_cached(monkeypatch, calls: list[int], error: Exception):
+    failures = [error]
+    create_cloud = subsets_cache.create_point_cloud_from_element
+
+    def create(element, config):
+        if failures:
+            raise failures.pop()
+        return create_cloud(element, config)
+
+    monkeypatch.setattr(subsets_cache, "create_point_cloud_from_element", create)
+    cache = OrthogonalSubsetsCache()
+    configs = LidarPointCloudConfig(), LidarConfig(), HdbscanConfig()
+
+    with pytest.raises(type(error)):
+        cache.get(create_element("scan_0.bin"), *configs)
+    subsets = cache.get(create_element("scan_0.bin"), *configs)
+
+    assert len(subsets) == 1
+    assert len(calls) == 1
+    assert cache.misses == 2
+
+
+def test_transform_subsets():
+    tf = np.eye(4)
+    tf[:3, :3] = [[0.0, -1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]]
+    tf[:3, 3] = [1.0, 2.0, 3.0]
+    subsets = [np.array([[1.0, 0.0, 0.0]]), np.array([[0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])]
+
+    result = transform_subsets(subsets, tf)
+
+    assert np.allclose(result[0], [[1.0, 3.0, 3.0]])
+    assert np.allclose(result[1], [[0.0, 2.0, 3.0], [1.0, 2.0, 4.0]])
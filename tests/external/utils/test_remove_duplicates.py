@@ -1,7 +1,7 @@
 import pytest
 
 from moduslam.bridge.auxiliary_dataclasses import ClustersWithLeftovers
-from moduslam.external.utils import remove_duplicates
+from moduslam.external.utils import get_signature, remove_duplicates
 from moduslam.measurement_storage.cluster import MeasurementCluster
 from moduslam.measurement_storage.measurements.auxiliary import PseudoMeasurement
 from moduslam.measurement_storage.measurements.continuous import ContinuousMeasurement
@@ -132,3 +132,36 @@ def test_remove_duplicates_identical_continuous_different_core_measurements(data
 
     expected_result = [item1, item2]
     assert result == expected_result
+
+
+def test_remove_duplicates_copied_clusters_with_equal_continuous(data: ImuData):
+    imus = [Imu(t, data) for t in range(5)]
+    core = PseudoMeasurement(5, "a")
+    clusters = []
+    for _ in range(2):
+        cluster = MeasurementCluster()
+        cluster.add(core)
+        cluster.add(ContinuousMeasurement(measurements=imus[0:3]))
+        clusters.append(cluster)
+
+    item1 = ClustersWithLeftovers(clusters=[clusters[0]], leftovers=imus[3:])
+    item2 = ClustersWithLeftovers(clusters=[clusters[1]], leftovers=imus[3:])
+    item3 = ClustersWithLeftovers(clusters=[clusters[1]], leftovers=imus[4:])
+
+    result = remove_duplicates([item1, item2, item3])
+
+    assert result == [item1, item3]
+
+
+def test_get_signature(data: ImuData):
+    imus = [Imu(t, data) for t in range(4)]
+    cluster = MeasurementCluster()
+    cluster.add(PseudoMeasurement(5, "a"))
+    cluster.add(ContinuousMeasurement(measurements=imus[:2]))
+    bits: dict[int, int] = {}
+
+    clusters, leftovers = get_signature(ClustersWithLeftovers([cluster], imus[2:]), bits)
+
+    assert clusters == (((1, ((id(imus[0]), id(imus[1]), 2),)),))
+    assert leftovers == (id(imus[2]), id(imus[3]), 2)
+    assert len(bits) == 1
@@ -0,0 +1,81 @@
+import pytest
+
+from moduslam.bridge.auxiliary_dataclasses import Connection
+from moduslam.external.utils import create_views
+from moduslam.measurement_storage.cluster import ClusterView, MeasurementCluster
+from moduslam.measurement_storage.measurements.auxiliary import PseudoMeasurement
+from moduslam.measurement_storage.measurements.continuous import ContinuousMeasurement
+from moduslam.utils.auxiliary_dataclasses import TimeRange
+from moduslam.utils.exceptions import ValidationError
+
+
+def create_cluster(*timestamps: int) -> MeasurementCluster:
+    cluster = MeasurementCluster()
+    for t in timestamps:
+        cluster.add(PseudoMeasurement(t))
+    return cluster
+
+
+def test_view_shares_measurements_and_time_properties():
+    cluster = create_cluster(1, 2, 3)
+    continuous = ContinuousMeasurement([PseudoMeasurement(0)])
+    cluster.add(continuous)
+
+    view = ClusterView(cluster)
+
+    assert view.cluster is cluster
+    assert view.measurements == cluster.measurements
+    assert view.timestamp == cluster.timestamp
+    assert view.time_range == TimeRange(1, 3)
+    assert continuous in view
+
+
+def test_continuous_measurements_are_added_to_overlay():
+    cluster = create_cluster(1)
+    view = ClusterView(cluster)
+    continuous = ContinuousMeasurement([PseudoMeasurement(0)])
+
+    view.add(continuous)
+
+    assert continuous in view.continuous_measurements
+    assert continuous not in cluster
+
+    view.remove(continuous)
+    assert continuous not in view
+
+
+def test_discrete_measurements_can_not_be_changed():
+    cluster = create_cluster(1)
+    view = ClusterView(cluster)
+
+    with pytest.raises(ValidationError):
+        view.add(PseudoMeasurement(2))
+
+    with pytest.raises(ValidationError):
+        view.remove(cluster.measurements[0])
+
+
+def test_materialize():
+    cluster = create_cluster(1, 2)
+    view = ClusterView(cluster)
+    continuous = ContinuousMeasurement([PseudoMeasurement(0)])
+    view.add(continuous)
+
+    new_cluster = view.materialize()
+    new_cluster.add(PseudoMeasurement(5))
+
+    assert type(new_cluster) is MeasurementCluster
+    assert continuous in new_cluster
+    assert new_cluster.time_range == TimeRange(1, 5)
+    assert cluster.time_range == TimeRange(1, 2)
+    assert len(cluster.measurements) == 2
+
+
+def test_create_views():
+    cluster1, cluster2 = create_cluster(1), create_cluster(2)
+
+    views, connections = create_views([cluster1, cluster2], [Connection(cluster1, cluster2)])
+
+    assert [view.cluster for view in views] == [cluster1, cluster2]
+    assert connections[0].cluster1 is views[0]
+    assert connections[0].cluster2 is views[1]
@@ -3,6 +3,6 @@ import pytest
 from moduslam.measurement_storage.storage import MeasurementStorage
 
 
-@pytest.fixture(autouse=True, scope="function")
-def clean_storage():
-    MeasurementStorage.clear()
+@pytest.fixture(scope="function")
+def storage() -> MeasurementStorage:
+    return MeasurementStorage()
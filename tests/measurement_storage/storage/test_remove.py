@@ -1,7 +1,7 @@
 import pytest
 
 from moduslam.measurement_storage.measurements.auxiliary import FakeMeasurement
-from moduslam.measurement_storage.storage import MeasurementStorage as Storage
+from moduslam.measurement_storage.storage import MeasurementStorage
 from moduslam.utils.exceptions import EmptyStorageError, ValidationError
 from moduslam.utils.ordered_set import OrderedSet
 
@@ -10,75 +10,75 @@ class DifferentFake(FakeMeasurement):
     pass
 
 
-def test_remove_measurement():
+def test_remove_measurement(storage: MeasurementStorage):
     t = 0
     measurement = FakeMeasurement(t)
 
-    Storage.add(measurement)
-    Storage.remove(measurement)
+    storage.add(measurement)
+    storage.remove(measurement)
 
-    assert measurement not in Storage.data()
-    assert Storage.empty() is True
-    assert Storage.data() == {}
+    assert measurement not in storage.data()
+    assert storage.empty() is True
+    assert storage.data() == {}
 
     with pytest.raises(EmptyStorageError):
-        _ = Storage.time_range()
+        _ = storage.time_range()
 
     with pytest.raises(EmptyStorageError):
-        _ = Storage.recent_measurement()
+        _ = storage.recent_measurement()
 
 
-def test_remove_nonexistent_measurement_raises_validation_error():
+def test_remove_nonexistent_measurement_raises_validation_error(storage: MeasurementStorage):
     measurement = FakeMeasurement(0)
 
     with pytest.raises(ValidationError):
-        Storage.remove(measurement)
+        storage.remove(measurement)
 
 
-def test_remove_updates_recent_measurement_correctly():
+def test_remove_updates_recent_measurement_correctly(storage: MeasurementStorage):
     t1, t2 = 1, 2
     measurement1, measurement2 = FakeMeasurement(t1), FakeMeasurement(t2)
     os = OrderedSet[FakeMeasurement]()
     os.add(measurement1)
 
-    Storage.add(measurement1)
-    Storage.add(measurement2)
+    storage.add(measurement1)
+    storage.add(measurement2)
 
-    assert Storage.recent_measurement() == measurement2
+    assert storage.recent_measurement() == measurement2
 
-    Storage.remove(measurement2)
+    storage.remove(measurement2)
 
-    assert Storage.recent_measurement() == measurement1
+    assert storage.recent_measurement() == measurement1
 
-    assert Storage.empty() is False
-    assert Storage.data() == {FakeMeasurement: os}
+    assert storage.empty() is False
+    assert storage.data() == {FakeMeasurement: os}
 
 
-def test_remove_last_measurement_of_type():
+def test_remove_last_measurement_of_type(storage: MeasurementStorage):
     measurement1, measurement2 = FakeMeasurement(1), FakeMeasurement(2)
 
-    Storage.add(measurement1)
-    Storage.add(measurement2)
+    storage.add(measurement1)
+    storage.add(measurement2)
 
-    Storage.remove(measurement1)
-    Storage.remove(measurement2)
+    storage.remove(measurement1)
+    storage.remove(measurement2)
 
-    assert type(measurement1) not in Storage.data()
-    assert type(measurement2) not in Storage.data()
-    assert Storage.empty() is True
-    assert Storage.data() == {}
+    assert type(measurement1) not in storage.data()
+    assert type(measurement2) not in storage.data()
+    assert storage.empty() is True
+    assert storage.data() == {}
 
 
-def test_remove_nonexistent_type_does_not_alter_storage():
+def test_remove_nonexistent_type_does_not_alter_storage(storage: MeasurementStorage):
     measurement1, measurement2 = FakeMeasurement(0), DifferentFake(0)
 
-    Storage.add(measurement1)
+    storage.add(measurement1)
 
     with pytest.raises(ValidationError):
-        Storage.remove(measurement2)
+        storage.remove(measurement2)
 
-    assert Storage.empty() is False
-    assert type(measurement1) in Storage.data()
-    assert measurement1 in Storage.data()[type(measurement1)]
-    assert type(measurement2) not in Storage.data()
-    assert Storage.recent_measurement() is measurement1
+    assert storage.empty() is False
+    assert type(measurement1) in storage.data()
+    assert measurement1 in storage.data()[type(measurement1)]
+    assert type(measurement2) not in storage.data()
+    assert storage.recent_measurement() is measurement1
@@ -0,0 +1,90 @@
+import gtsam
+import numpy as np
+import pytest
+
+from moduslam.bridge.edge_factories.imu_odometry.utils import (
+    compute_covariance,
+    integrate_measurements,
+)
+from moduslam.measurement_storage.measurements.imu import (
+    ContinuousImu,
+    ImuBlock,
+    ImuCovariance,
+    ImuData,
+    ProcessedImu,
+)
+from moduslam.utils.auxiliary_objects import identity3x3, identity4x4
+
+
+def create_measurements(num: int) -> list[ProcessedImu]:
+    covariance = ImuCovariance(identity3x3, identity3x3, identity3x3, identity3x3, identity3x3)
+    rng = np.random.default_rng(0)
+    measurements = []
+    for t in range(num):
+        acc, gyro = rng.normal(size=3).tolist(), rng.normal(size=3).tolist()
+        data = ImuData(angular_velocity=tuple(gyro), acceleration=tuple(acc))
+        measurements.append(ProcessedImu(10 * t, data, covariance, identity4x4))
+    return measurements
+
+
+def test_from_measurements():
+    measurements = create_measurements(5)
+
+    block = ImuBlock.from_measurements(measurements)
+
+    assert len(block) == 5
+    assert block.time_range.start == 0
+    assert block.timestamp == block.time_range.stop == 40
+    np.testing.assert_array_equal(block.timestamps, [0, 10, 20, 30, 40])
+    np.testing.assert_array_equal(block.accelerations[2], measurements[2].linear_acceleration)
+    np.testing.assert_array_equal(block.angular_velocities[3], measurements[3].angular_velocity)
+    assert block.covariance is measurements[0].covariance
+
+
+def test_invalid_arrays_raise_value_error():
+    covariance = create_measurements(1)[0].covariance
+
+    with pytest.raises(ValueError):
+        ImuBlock(np.array([]), np.empty((0, 3)), np.empty((0, 3)), covariance, identity4x4)
+
+    with pytest.raises(ValueError):
+        ImuBlock(np.array([0, 1]), np.zeros((1, 3)), np.zeros((2, 3)), covariance, identity4x4)
+
+
+def test_continuous_imu_block_is_created_once():
+    continuous = ContinuousImu(create_measurements(3), start=0, stop=30)
+
+    assert continuous.block is continuous.block
+    assert len(continuous.block) == 3
+
+
+def test_integration_matches_per_sample_integration():
+    measurements = create_measurements(20)
+    block = ImuBlock.from_measurements(measurements)
+    stop, time_scale = 200, 1e-2
+    params = gtsam.PreintegrationParams.MakeSharedU(9.81)
+    bias = gtsam.imuBias.ConstantBias()
+
+    pim = gtsam.PreintegratedImuMeasurements(params, bias)
+    integrate_measurements(pim, block, stop, time_scale)
+
+    expected = gtsam.PreintegratedImuMeasurements(params, bias)
+    timestamps = [m.timestamp for m in measurements] + [stop]
+    for i, m in enumerate(measurements):
+        dt = (timestamps[i + 1] - timestamps[i]) * time_scale
+        acc, gyro = np.array(m.linear_acceleration), np.array(m.angular_velocity)
+        expected.integrateMeasurement(acc, gyro, dt)
+
+    np.testing.assert_allclose(pim.preintegrated(), expected.preintegrated())
+    np.testing.assert_allclose(pim.deltaTij(), expected.deltaTij())
+
+    acc_cov, gyro_cov = compute_covariance(block)
+    np.testing.assert_allclose(acc_cov, np.cov(block.accelerations, rowvar=False))
+
+
+def test_zero_time_difference_raises_value_error():
+    block = ImuBlock.from_measurements(create_measurements(3))
+    pim = gtsam.PreintegratedImuMeasurements(gtsam.PreintegrationParams.MakeSharedU(9.81))
+
+    with pytest.raises(ValueError):
+        integrate_measurements(pim, block, 20, 1.0)
@@ -0,0 +1,76 @@
+import pytest
+
+from moduslam.measurement_storage.measurements.auxiliary import FakeMeasurement
+from moduslam.measurement_storage.measurements.pose_odometry import Odometry
+from moduslam.measurement_storage.timeline import Timeline
+from moduslam.utils.auxiliary_dataclasses import TimeRange
+from moduslam.utils.auxiliary_objects import identity3x3, identity4x4
+
+
+def create_odometry(start: int, stop: int) -> Odometry:
+    return Odometry(stop, TimeRange(start, stop), identity4x4, identity3x3, identity3x3)
+
+
+def test_add_keeps_timestamps_order():
+    measurements = [FakeMeasurement(t) for t in (5, 1, 3, 1)]
+    timeline = Timeline()
+
+    timeline.add(measurements)
+
+    assert list(timeline) == [measurements[1], measurements[3], measurements[2], measurements[0]]
+    assert timeline.earliest() is measurements[1]
+    assert timeline.latest() is measurements[0]
+
+
+def test_range():
+    measurements = [FakeMeasurement(t) for t in range(10)]
+    timeline = Timeline()
+    timeline.add(measurements)
+
+    assert timeline.range(2, 5) == measurements[2:6]
+    assert timeline.range(-10, 0) == measurements[:1]
+    assert timeline.range(10, 20) == []
+    assert timeline.range(5, 2) == []
+
+
+def test_start_stop_of_time_range_measurements():
+    odometry1, odometry2 = create_odometry(0, 10), create_odometry(5, 7)
+    timeline = Timeline()
+
+    timeline.add([odometry1, odometry2])
+
+    assert list(timeline) == [odometry2, odometry1]
+    assert timeline.start == 0
+    assert timeline.stop == 10
+
+    timeline.remove(odometry1)
+
+    assert timeline.start == 5
+    assert timeline.stop == 7
+
+
+def test_remove_and_discard():
+    measurement1, measurement2 = FakeMeasurement(1), FakeMeasurement(2)
+    timeline = Timeline()
+    timeline.add([measurement1, measurement2])
+
+    timeline.discard(FakeMeasurement(3))
+    timeline.remove(measurement1)
+
+    assert list(timeline) == [measurement2]
+    assert timeline.range(0, 10) == [measurement2]
+
+    with pytest.raises(KeyError):
+        timeline.remove(measurement1)
+
+
+def test_empty_timeline():
+    timeline = Timeline()
+
+    with pytest.raises(KeyError):
+        _ = timeline.start
+
+    with pytest.raises(KeyError):
+        timeline.latest()
+
+    assert timeline.range(0, 1) == []
@@ -0,0 +1,113 @@
+import gtsam
+import numpy as np
+import pytest
+
+from moduslam.backend_manager.graph_solver import (
+    GraphSolver,
+    create_fixing_prior,
+    get_window_vertices,
+)
+from moduslam.frontend_manager.main_graph.data_classes import (
+    GraphElement,
+    NewVertex,
+)
+from moduslam.frontend_manager.main_graph.edges.pose import Pose as PriorPose
+from moduslam.frontend_manager.main_graph.edges.pose_odometry import PoseOdometry
+from moduslam.frontend_manager.main_graph.graph import Graph
+from moduslam.frontend_manager.main_graph.vertex_storage.cluster import (
+    VertexCluster,
+)
+from moduslam.frontend_manager.main_graph.vertices.custom import (
+    ImuBias,
+    LinearVelocity,
+    NavState,
+    Point3D,
+)
+from moduslam.frontend_manager.main_graph.vertices.custom import Pose as PoseVertex
+from moduslam.measurement_storage.measurements.pose import Pose as PoseMeasurement
+from moduslam.measurement_storage.measurements.pose_odometry import Odometry
+from moduslam.utils.auxiliary_dataclasses import TimeRange
+from moduslam.utils.auxiliary_objects import identity3x3 as i3x3
+
+noise = gtsam.noiseModel.Isotropic.Sigma(6, 1.0)
+
+
+def translation(x: float) -> np.ndarray:
+    """SE(3) matrix with the translation along x-axis."""
+    matrix = np.eye(4)
+    matrix[0, 3] = x
+    return matrix
+
+
+def create_chain(num_poses: int) -> tuple[Graph, list[PoseVertex]]:
+    """Creates the graph with a prior and odometry edges (step 1 m, initial guess 0)."""
+    graph = Graph()
+    vertices = [PoseVertex(t) for t in range(num_poses)]
+    prior = PriorPose(vertices[0], PoseMeasurement(0, np.eye(4), i3x3, i3x3), noise)
+    new_vertex = NewVertex(vertices[0], VertexCluster(), 0)
+    graph.add_element(GraphElement(prior, {vertices[0]: 0}, (new_vertex,)))
+
+    for t in range(1, num_poses):
+        v1, v2 = vertices[t - 1], vertices[t]
+        odometry = Odometry(t, TimeRange(t - 1, t), translation(1.0), i3x3, i3x3)
+        edge = PoseOdometry(v1, v2, odometry, noise)
+        new_vertex = NewVertex(v2, VertexCluster(), t)
+        graph.add_element(GraphElement(edge, {v1: t - 1, v2: t}, (new_vertex,)))
+
+    return graph, vertices
+
+
+def test_window_vertices():
+    graph, vertices = create_chain(5)
+
+    window = get_window_vertices(graph, 2)
+
+    assert set(window) == {vertices[3], vertices[4]}
+
+
+def test_whole_graph_window_equals_global_solve():
+    solver = GraphSolver()
+    graph, vertices = create_chain(5)
+
+    global_values, global_error = solver.solve(graph)
+    local_values, local_error = solver.solve_local(graph, 5)
+
+    assert np.isclose(global_error, local_error)
+    for v in vertices:
+        key = v.backend_index
+        assert global_values.atPose3(key).equals(local_values.atPose3(key), 1e-6)
+
+
+def test_history_is_fixed():
+    solver = GraphSolver()
+    graph, vertices = create_chain(6)
+    values, _ = solver.solve(graph)
+    graph.update_vertices(values)
+
+    shifted = gtsam.Values()
+    shifted.insert(vertices[-1].backend_index, gtsam.Pose3(translation(0.0)))
+    graph.update_vertices(shifted)
+
+    local_values, error = solver.solve_local(graph, 1)
+
+    assert local_values.keys() == [vertices[-1].backend_index]
+    assert np.allclose(local_values.atPose3(vertices[-1].backend_index).translation(), [5, 0, 0])
+    assert error == pytest.approx(0.0, abs=1e-6)
+    assert np.allclose(vertices[-2].position, [4.0, 0.0, 0.0])
+
+
+@pytest.mark.parametrize(
+    "vertex, factor_type",
+    [
+        (PoseVertex(0), gtsam.PriorFactorPose3),
+        (NavState(0), gtsam.PriorFactorNavState),
+        (ImuBias(0), gtsam.PriorFactorConstantBias),
+        (LinearVelocity(0), gtsam.PriorFactorVector),
+        (Point3D(0), gtsam.PriorFactorPoint3),
+    ],
+)
+def test_fixing_prior(vertex, factor_type):
+    factor = create_fixing_prior(vertex)
+
+    assert isinstance(factor, factor_type)
+    assert factor.keys() == [vertex.backend_index]
@@ -0,0 +1,118 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from moduslam.data_manager.batch_factory.data_readers.directory_iterator import (
+    DirectoryIterator,
+    list_directory,
+)
+from moduslam.utils.auxiliary_methods import sort_files_numerically
+
+
+def create_files(directory: Path, names: list[str]) -> None:
+    directory.mkdir(exist_ok=True)
+    for name in names:
+        (directory / name).touch()
+
+
+def test_list_directory(tmp_path):
+    directory = tmp_path / "images"
+    create_files(directory, ["10.png", "9.png", "100.png", "1.txt", "img_5.png"])
+
+    names, timestamps = list_directory(directory, ".png")
+
+    assert names == ["img_5.png", "9.png", "10.png", "100.png"]
+    assert np.array_equal(timestamps, [5, 9, 10, 100])
+    assert (tmp_path / ".images.png.listing.npz").exists()
+
+
+def test_list_directory_uses_cache(tmp_path):
+    directory = tmp_path / "images"
+    create_files(directory, ["1.png", "2.png"])
+    list_directory(directory, ".png")
+
+    cache_file = tmp_path / ".images.png.listing.npz"
+    with np.load(cache_file) as cache:
+        content = dict(cache)
+    content["names"] = np.array(["cached.png"])
+    content["timestamps"] = np.array([7])
+    np.savez(cache_file, **content)
+
+    names, timestamps = list_directory(directory, ".png")
+
+    assert names == ["cached.png"]
+    assert np.array_equal(timestamps, [7])
+
+
+def test_list_directory_invalidates_cache(tmp_path):
+    directory = tmp_path / "images"
+    create_files(directory, ["1.png", "2.png"])
+    list_directory(directory, ".png")
+
+    create_files(directory, ["3.png"])
+    stat = directory.stat()
+    os.utime(directory, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    names, _ = list_directory(directory, ".png")
+
+    assert names == ["1.png", "2.png", "3.png"]
+
+
+def test_iteration(tmp_path):
+    create_files(tmp_path, ["3.bin", "1.bin", "2.bin"])
+    iterator = DirectoryIterator(tmp_path, ".bin")
+
+    assert list(iterator) == [tmp_path / "1.bin", tmp_path / "2.bin", tmp_path / "3.bin"]
+    assert iterator.file == tmp_path / "3.bin"
+    assert iterator.index == 2
+
+
+def test_skip(tmp_path):
+    create_files(tmp_path, ["1.bin", "2.bin", "3.bin"])
+    iterator = DirectoryIterator(tmp_path, ".bin")
+
+    iterator.skip(2)
+
+    assert iterator.file == tmp_path / "2.bin"
+    assert next(iterator) == tmp_path / "3.bin"
+
+    with pytest.raises(StopIteration):
+        iterator.reset_index()
+        iterator.skip(4)
+
+
+def test_seek(tmp_path):
+    create_files(tmp_path, ["100.bin", "200.bin", "300.bin"])
+    iterator = DirectoryIterator(tmp_path, ".bin")
+
+    iterator.seek(200)
+    assert next(iterator) == tmp_path / "200.bin"
+
+    iterator.seek(150)
+    assert next(iterator) == tmp_path / "200.bin"
+
+    iterator.seek(301)
+    with pytest.raises(StopIteration):
+        next(iterator)
+
+
+def test_empty_directory(tmp_path):
+    iterator = DirectoryIterator(tmp_path, ".bin")
+
+    with pytest.raises(StopIteration):
+        next(iterator)
+
+    with pytest.raises(FileExistsError):
+        _ = iterator.file
+
+
+def test_list_directory_matches_sort_files_numerically(tmp_path):
+    directory = tmp_path / "images"
+    create_files(directory, ["b_10.png", "a_10.png", "2.png", "x.png", "010.png"])
+
+    names, _ = list_directory(directory, ".png")
+
+    files = sort_files_numerically(list(directory.glob("*.png")))
+    assert names == [file.name for file in files]
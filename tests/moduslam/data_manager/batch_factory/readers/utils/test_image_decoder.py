@@ -0,0 +1,159 @@
+from copy import deepcopy
+from io import BytesIO
+
+import numpy as np
+import PIL.Image
+import pytest
+
+from moduslam.data_manager.batch_factory.configs import ImageDecodingConfig
+from moduslam.data_manager.batch_factory.data_readers import image_decoder
+from moduslam.data_manager.batch_factory.data_readers.data_sources import (
+    StereoImageData,
+)
+from moduslam.data_manager.batch_factory.data_readers.image_decoder import (
+    ImageDecoder,
+    decode_image,
+    estimate_image_size,
+)
+from moduslam.data_manager.batch_factory.data_readers.kaist.measurement_collector import (
+    get_stereo_measurement,
+)
+from moduslam.utils.exceptions import ExternalModuleException
+
+
+def create_image(seed: int = 0, size: tuple[int, int] = (64, 48)) -> PIL.Image.Image:
+    rng = np.random.default_rng(seed)
+    data = rng.integers(0, 255, (size[1], size[0], 3), dtype=np.uint8)
+    return PIL.Image.fromarray(data)
+
+
+def test_decode_image(tmp_path):
+    image = create_image()
+    file = tmp_path / "0.png"
+    image.save(file)
+
+    decoded = decode_image(file)
+
+    assert np.array_equal(np.asarray(decoded), np.asarray(image))
+
+
+def test_decode_image_reduced_grayscale():
+    buffer = BytesIO()
+    create_image(size=(200, 100)).save(buffer, format="JPEG")
+    buffer.seek(0)
+    config = ImageDecodingConfig(max_size=50, grayscale=True)
+
+    decoded = decode_image(buffer, config)
+
+    assert decoded.mode == "L"
+    assert max(decoded.size) <= 50
+
+
+def test_decode_image_invalid_file(tmp_path):
+    file = tmp_path / "0.png"
+    file.write_text("not an image")
+
+    with pytest.raises(ExternalModuleException):
+        decode_image(file)
+
+
+def test_estimate_image_size(tmp_path):
+    file = tmp_path / "0.png"
+    create_image(size=(200, 100)).save(file)
+    config = ImageDecodingConfig(max_size=50, grayscale=True)
+
+    assert estimate_image_size(file) == 200 * 100 * 3
+    assert estimate_image_size(file, config) == 50 * 25
+    assert ImageDecoder(config).estimate_size(file) == 50 * 25
+    assert estimate_image_size(tmp_path / "missing.png") == 0
+
+
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_decoder_get(tmp_path, num_workers):
+    files = []
+    for i in range(5):
+        files.append(tmp_path / f"{i}.png")
+        create_image(i).save(files[-1])
+    decoder = ImageDecoder(ImageDecodingConfig(num_workers=num_workers, cache_size=3))
+
+    decoder.prefetch(files)
+    images = [decoder.get(file) for file in files]
+    decoder.close()
+
+    for i, image in enumerate(images):
+        assert np.array_equal(np.asarray(image), np.asarray(create_image(i)))
+
+
+def test_decoder_cache(tmp_path):
+    file = tmp_path / "0.png"
+    create_image().save(file)
+    decoder = ImageDecoder(ImageDecodingConfig(num_workers=0, cache_size=1))
+
+    assert decoder.get(file) is decoder.get(file)
+
+
+def test_stereo_source_prefetches_images(tmp_path):
+    left_dir, right_dir = tmp_path / "left", tmp_path / "right"
+    left_dir.mkdir()
+    right_dir.mkdir()
+    for i in range(4):
+        create_image(i).save(left_dir / f"{i}.png")
+        create_image(10 + i).save(right_dir / f"{i}.png")
+    decoder = ImageDecoder(ImageDecodingConfig(num_workers=2, prefetch=2))
+    source = StereoImageData(left_dir, right_dir, ".png", decoder)
+    source.open()
+
+    left_file, right_file = next(source)
+    right_image = decoder.get(right_file)
+    source.close()
+
+    assert left_file == left_dir / "0.png"
+    assert np.array_equal(np.asarray(right_image), np.asarray(create_image(10)))
+
+
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_lazy_stereo_images_decoded_once(tmp_path, monkeypatch, num_workers):
+    left_dir, right_dir = tmp_path / "left", tmp_path / "right"
+    left_dir.mkdir()
+    right_dir.mkdir()
+    num_pairs = 30
+    for i in range(num_pairs):
+        create_image(i, size=(8, 8)).save(left_dir / f"{i}.png")
+        create_image(100 + i, size=(8, 8)).save(right_dir / f"{i}.png")
+    decoded_files = []
+
+    def counting_decode(source, config=ImageDecodingConfig()):
+        decoded_files.append(source)
+        return decode_image(source, config)
+
+    monkeypatch.setattr(image_decoder, "decode_image", counting_decode)
+    config = ImageDecodingConfig(num_workers=num_workers, prefetch=4, cache_size=16)
+    source = StereoImageData(left_dir, right_dir, ".png", ImageDecoder(config))
+    source.open()
+
+    messages = [get_stereo_measurement(source)[0] for _ in range(num_pairs)]
+    images = [message.data.get() for message in messages]
+    source.close()
+
+    assert len(decoded_files) == 2 * num_pairs
+    assert len(set(decoded_files)) == 2 * num_pairs
+    left, right = images[-1]
+    assert np.array_equal(np.asarray(left), np.asarray(create_image(num_pairs - 1, (8, 8))))
+    assert np.array_equal(np.asarray(right), np.asarray(create_image(99 + num_pairs, (8, 8))))
+
+
+def test_lazy_stereo_images_deepcopy(tmp_path):
+    left_dir, right_dir = tmp_path / "left", tmp_path / "right"
+    left_dir.mkdir()
+    right_dir.mkdir()
+    create_image(0).save(left_dir / "0.png")
+    create_image(1).save(right_dir / "0.png")
+    source = StereoImageData(left_dir, right_dir, ".png", ImageDecoder())
+    source.open()
+
+    message, _ = get_stereo_measurement(source)
+    copied = deepcopy(message.data)
+    source.close()
+
+    left, right = copied.get()
+    assert np.array_equal(np.asarray(right), np.asarray(create_image(1)))
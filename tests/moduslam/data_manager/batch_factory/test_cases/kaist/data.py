@@ -25,6 +25,7 @@ all_sensors = [element.measurement.sensor for element in elements]
 
 full_memory_percent = 100.0
 low_memory_percent = 1.0
+small_batch_size = 1  # [bytes].
 
 imu = data.imu
 lidar2D = data.sick_middle
@@ -67,6 +68,9 @@ batch_factory_config3 = BatchFactoryConfig(dataset_cfg, t_limit_2, full_memory_p
 batch_factory_config4 = BatchFactoryConfig(dataset_cfg, t_limit_3, full_memory_percent)
 batch_factory_config5 = BatchFactoryConfig(dataset_cfg, t_limit_4, full_memory_percent)
 batch_factory_config6 = BatchFactoryConfig(dataset_cfg, stream, low_memory_percent)
+batch_factory_config7 = BatchFactoryConfig(
+    dataset_cfg, stream, full_memory_percent, batch_size_bytes=small_batch_size
+)
 
 empty_batch = DataBatch()
 
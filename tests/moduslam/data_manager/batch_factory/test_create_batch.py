@@ -9,6 +9,7 @@
     1.6 some sensors, time limit includes some of them -> DataBatch
     1.7 some sensors, time limit includes none of them -> Empty DataBatch
     1.8 Memory limit is too low: MemoryError
+    1.9 Batch size limit is too low: MemoryError
 
 2. create_batch (elements: Sequence[Element]):
     2.1 all element -> DataBatch
@@ -67,6 +68,10 @@ from moduslam.sensors_factory.configs import SensorConfig
 from moduslam.sensors_factory.factory import SensorsFactory
 from moduslam.utils.auxiliary_dataclasses import PeriodicDataRequest
 from moduslam.utils.exceptions import UnfeasibleRequestError
+from tests.moduslam.data_manager.batch_factory.test_cases.kaist.data import (
+    batch_factory_config7,
+    sensors_factory_config1,
+)
 from tests.moduslam.data_manager.batch_factory.test_cases.kaist.scenarios import (
     kaist_scenarios1_fail,
     kaist_scenarios1_success,
@@ -149,6 +154,16 @@ def test_create_batch_sequentially_memory_error(
         batch_factory.fill_batch_sequentially()
 
 
+def test_create_batch_sequentially_batch_size_error():
+    SensorsFactory.init_sensors(sensors_factory_config1)
+    batch_factory = BatchFactory(batch_factory_config7)
+
+    with raises(MemoryError):
+        batch_factory.fill_batch_sequentially()
+
+    assert len(batch_factory.batch.data) == 1
+
+
 @mark.parametrize(
     "sensors_configs, batch_factory_config, input_elements, reference_batch",
     [*test_cases_2_success],
@@ -1,7 +1,16 @@
 from unittest.mock import MagicMock
 
+import numpy as np
+import PIL.Image
+import pytest
+
 from moduslam.data_manager.batch_factory.batch import DataBatch
-from moduslam.data_manager.batch_factory.data_objects import Element, RawMeasurement
+from moduslam.data_manager.batch_factory.data_objects import (
+    Element,
+    LazyValues,
+    RawMeasurement,
+    element_overhead,
+)
 from moduslam.data_manager.batch_factory.data_readers.locations import Location
 
 
@@ -14,7 +23,7 @@ def test_is_sorted_empty_batch():
 def test_is_sorted_single_element():
     """Test that a batch with a single element is considered sorted."""
     batch = DataBatch()
-    m1 = MagicMock(spec=RawMeasurement)
+    m1 = MagicMock(spec=RawMeasurement, values=None)
     element = Element(timestamp=1, measurement=m1, location=Location())
     batch.add(element)
     assert batch.is_sorted is True
@@ -23,9 +32,9 @@ def test_is_sorted_single_element():
 def test_is_sorted_sorted_batch():
     """Test that a batch with elements in sorted order is considered sorted."""
     batch = DataBatch()
-    m1 = MagicMock(spec=RawMeasurement)
-    m2 = MagicMock(spec=RawMeasurement)
-    m3 = MagicMock(spec=RawMeasurement)
+    m1 = MagicMock(spec=RawMeasurement, values=None)
+    m2 = MagicMock(spec=RawMeasurement, values=None)
+    m3 = MagicMock(spec=RawMeasurement, values=None)
     elements = [
         Element(timestamp=1, measurement=m1, location=Location()),
         Element(timestamp=2, measurement=m2, location=Location()),
@@ -39,9 +48,9 @@ def test_is_sorted_sorted_batch():
 def test_is_sorted_unsorted_batch():
     """Test that a batch with elements out of order is not considered sorted."""
     batch = DataBatch()
-    m1 = MagicMock(spec=RawMeasurement)
-    m2 = MagicMock(spec=RawMeasurement)
-    m3 = MagicMock(spec=RawMeasurement)
+    m1 = MagicMock(spec=RawMeasurement, values=None)
+    m2 = MagicMock(spec=RawMeasurement, values=None)
+    m3 = MagicMock(spec=RawMeasurement, values=None)
     elements = [
         Element(timestamp=2, measurement=m2, location=Location()),
         Element(timestamp=1, measurement=m1, location=Location()),
@@ -55,8 +64,8 @@ def test_is_sorted_unsorted_batch():
 def test_is_sorted_equal_timestamps():
     """Test that a batch with elements having equal timestamps is considered sorted."""
     batch = DataBatch()
-    m1 = MagicMock(spec=RawMeasurement)
-    m2 = MagicMock(spec=RawMeasurement)
+    m1 = MagicMock(spec=RawMeasurement, values=None)
+    m2 = MagicMock(spec=RawMeasurement, values=None)
     elements = [
         Element(timestamp=1, measurement=m1, location=Location()),
         Element(timestamp=1, measurement=m2, location=Location()),
@@ -64,3 +73,68 @@ def test_is_sorted_equal_timestamps():
     for element in elements:
         batch.add(element)
     assert batch.is_sorted is True
+
+
+def test_size_bytes():
+    """Test that the batch size is updated when elements are added and removed."""
+    batch = DataBatch()
+    sensor = MagicMock()
+    array1, array2 = np.zeros(100), np.zeros((10, 4), dtype=np.float32)
+    el1 = Element(1, RawMeasurement(sensor, array1), Location())
+    el2 = Element(2, RawMeasurement(sensor, array2), Location())
+    size1 = array1.nbytes + element_overhead
+    size2 = array2.nbytes + element_overhead
+
+    batch.add(el1)
+    batch.add(el2)
+    batch.add(el2)
+    assert batch.size_bytes == size1 + size2
+
+    batch.remove_first()
+    assert batch.size_bytes == size2
+
+    batch.remove_last()
+    assert batch.size_bytes == 0
+
+    batch.add(el1)
+    batch.clear()
+    assert batch.size_bytes == 0
+
+
+def test_element_size_bytes_tuple():
+    """Test that the size of a tuple payload grows with the number of values."""
+    sensor = MagicMock()
+    small = Element(1, RawMeasurement(sensor, (1.0,) * 10), Location())
+    large = Element(1, RawMeasurement(sensor, (1.0,) * 1000), Location())
+    empty = Element(1, RawMeasurement(sensor, None), Location())
+
+    assert empty.size_bytes == element_overhead
+    assert element_overhead < small.size_bytes < large.size_bytes
+
+
+@pytest.mark.parametrize(
+    "mode, pixel_size", [("L", 1), ("RGB", 3), ("RGBA", 4), ("I;16", 2), ("I", 4), ("F", 4)]
+)
+def test_element_size_bytes_image(mode: str, pixel_size: int):
+    """Test that the size of an image payload accounts for the bytes per band."""
+    image = PIL.Image.new(mode, (8, 4))
+    element = Element(1, RawMeasurement(MagicMock(), image), Location())
+
+    assert element.size_bytes == element_overhead + 8 * 4 * pixel_size
+
+
+def test_lazy_values_are_decoded_once_on_access():
+    """Test that lazy values are decoded on the first access only."""
+    decoder = MagicMock(side_effect=lambda raw: np.frombuffer(raw, dtype=np.float32))
+    raw = np.arange(4, dtype=np.float32).tobytes()
+    measurement = RawMeasurement(MagicMock(), LazyValues(raw, decoder, len(raw)))
+    element = Element(1, measurement, Location())
+
+    assert element.size_bytes == element_overhead + len(raw)
+    assert hash(measurement) == hash(measurement.sensor)
+    decoder.assert_not_called()
+
+    assert np.array_equal(measurement.values, [0, 1, 2, 3])
+    assert np.array_equal(measurement.values, [0, 1, 2, 3])
+    assert measurement.payload.loaded
+    decoder.assert_called_once_with(raw)
@@ -1,5 +1,12 @@
 """Tests for the MemoryAnalyzer."""
 
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from moduslam.data_manager import memory_analyzer
+from moduslam.data_manager.batch_factory.configs import BatchFactoryConfig
 from moduslam.data_manager.memory_analyzer import MemoryAnalyzer
 
 
@@ -9,3 +16,24 @@ def test_analyzer():
     assert 0 <= analyzer.available_memory_percent <= 100
     assert 0 <= analyzer.used_memory_percent <= 100
     assert 0 <= analyzer.permissible_memory_percent <= 100
+
+
+def test_check_memory_sampling(monkeypatch: pytest.MonkeyPatch):
+    config = BatchFactoryConfig(
+        MagicMock(),
+        MagicMock(),
+        batch_memory_percent=50.0,
+        memory_sampling_interval=3,
+        memory_sampling_period=1e6,
+    )
+    analyzer = MemoryAnalyzer.from_config(config)
+    memory = SimpleNamespace(percent=60.0, total=1, available=0)
+    monkeypatch.setattr(memory_analyzer.psutil, "virtual_memory", lambda: memory)
+
+    assert analyzer.permissible_memory_percent == 50.0
+    assert analyzer.check_memory() is False
+
+    memory.percent = 40.0
+    assert analyzer.check_memory() is False  # the last sample is used.
+    assert analyzer.check_memory() is False
+    assert analyzer.check_memory() is True  # every 3-rd check samples the memory.
@@ -0,0 +1,67 @@
+import gtsam
+import numpy as np
+import pytest
+
+from moduslam.frontend_manager.main_graph.edges.noise_models import (
+    NoiseModelCache,
+    covariance3x3_noise_model,
+    huber_diagonal_noise_model,
+    noise_model_cache,
+    pose_block_diagonal_noise_model,
+)
+from moduslam.utils.auxiliary_objects import identity3x3 as i3x3
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    noise_model_cache.clear()
+    yield
+    noise_model_cache.clear()
+
+
+def test_same_content_same_model():
+    model1 = pose_block_diagonal_noise_model(i3x3, i3x3)
+    model2 = pose_block_diagonal_noise_model(np.eye(3), np.eye(3))
+
+    assert model1 is model2
+    assert noise_model_cache.hits == 1
+    assert noise_model_cache.misses == 1
+    assert noise_model_cache.hit_rate == 0.5
+
+
+def test_different_content_different_models():
+    model1 = covariance3x3_noise_model(i3x3)
+    model2 = covariance3x3_noise_model(2 * np.eye(3))
+
+    assert model1 is not model2
+    assert model1.equals(gtsam.noiseModel.Gaussian.Covariance(np.eye(3)), 1e-9)
+    assert model2.equals(gtsam.noiseModel.Gaussian.Covariance(2 * np.eye(3)), 1e-9)
+
+
+def test_robust_loss_parameters_in_key():
+    model1 = huber_diagonal_noise_model((1.0, 1.0, 1.0), 1.0)
+    model2 = huber_diagonal_noise_model((1.0, 1.0, 1.0), 2.0)
+    model3 = huber_diagonal_noise_model((1.0, 1.0, 1.0), 1.0)
+
+    assert model1 is not model2
+    assert model1 is model3
+
+
+def test_pose_blocks_order_in_key():
+    model1 = pose_block_diagonal_noise_model(i3x3, 2 * np.eye(3))
+    model2 = pose_block_diagonal_noise_model(2 * np.eye(3), i3x3)
+
+    assert model1 is not model2
+
+
+def test_bounded_size():
+    cache = NoiseModelCache(max_size=2)
+
+    for variance in (1.0, 2.0, 1.0, 3.0):
+        cache.get(variance, lambda: gtsam.noiseModel.Isotropic.Variance(3, variance))
+
+    assert len(cache) == 2
+    assert cache.hits == 1
+    assert cache.misses == 3
+    cache.get(2.0, lambda: gtsam.noiseModel.Isotropic.Variance(3, 2.0))
+    assert cache.misses == 4
@@ -0,0 +1,193 @@
+from copy import deepcopy
+
+import gtsam
+import numpy as np
+from gtsam.noiseModel import Isotropic
+
+from moduslam.data_manager.batch_factory.data_objects import (
+    Element,
+    LazyValues,
+    RawMeasurement,
+)
+from moduslam.data_manager.batch_factory.data_readers.locations import Location
+from moduslam.frontend_manager.main_graph.data_classes import (
+    GraphElement,
+    NewVertex,
+)
+from moduslam.frontend_manager.main_graph.edges.pose import Pose as PriorPose
+from moduslam.frontend_manager.main_graph.edges.pose_odometry import PoseOdometry
+from moduslam.frontend_manager.main_graph.graph import Graph
+from moduslam.frontend_manager.main_graph.vertex_storage.cluster import (
+    VertexCluster,
+)
+from moduslam.frontend_manager.main_graph.vertices.backend_values import (
+    stack_values,
+)
+from moduslam.frontend_manager.main_graph.vertices.custom import ImuBias, NavState
+from moduslam.frontend_manager.main_graph.vertices.custom import Pose as PoseVertex
+from moduslam.measurement_storage.measurements.pose import Pose as PoseMeasurement
+from moduslam.measurement_storage.measurements.pose_odometry import (
+    Odometry,
+    OdometryWithElements,
+)
+from moduslam.sensors_factory.sensors import Sensor
+from moduslam.utils.auxiliary_dataclasses import TimeRange
+from moduslam.utils.auxiliary_objects import identity3x3 as i3x3
+from moduslam.utils.auxiliary_objects import identity4x4 as i4x4
+
+
+def create_graph(noise: Isotropic) -> tuple[Graph, PoseVertex, PoseVertex]:
+    """Creates the graph with 2 pose vertices connected with an odometry edge."""
+    t1, t2 = 0, 1
+    graph = Graph()
+    v1, v2 = PoseVertex(0), PoseVertex(1)
+    prior = PoseMeasurement(t1, i4x4, i3x3, i3x3)
+    odometry = Odometry(t2, TimeRange(t1, t2), i4x4, i3x3, i3x3)
+    e1 = PriorPose(v1, prior, noise)
+    e2 = PoseOdometry(v1, v2, odometry, noise)
+
+    graph.add_element(GraphElement(e1, {v1: t1}, (NewVertex(v1, VertexCluster(), t1),)))
+    graph.add_element(GraphElement(e2, {v1: t1, v2: t2}, (NewVertex(v2, VertexCluster(), t2),)))
+    return graph, v1, v2
+
+
+def shifted_values(graph: Graph, shift: float) -> gtsam.Values:
+    """Creates the values with all poses of the graph translated along x-axis."""
+    values = gtsam.Values()
+    pose = gtsam.Pose3(gtsam.Rot3(), np.array([shift, 0.0, 0.0]))
+
+    for key in graph.get_backend_instances().keys():
+        values.insert(key, pose)
+
+    return values
+
+
+def test_values_follow_vertices(noise: Isotropic):
+    graph, v1, v2 = create_graph(noise)
+
+    values = graph.get_backend_instances()
+
+    assert values.size() == 2
+    assert values.exists(v1.backend_index) and values.exists(v2.backend_index)
+
+
+def test_update_vertices_lazy_conversion(noise: Isotropic):
+    graph, v1, v2 = create_graph(noise)
+
+    graph.update_vertices(shifted_values(graph, 1.0))
+
+    assert np.allclose(v1.position, [1.0, 0.0, 0.0])
+    assert np.allclose(v2.value[:3, 3], [1.0, 0.0, 0.0])
+    assert np.allclose(
+        graph.get_backend_instances().atPose3(v1.backend_index).translation(), [1, 0, 0]
+    )
+
+
+def test_update_single_vertex_writes_to_graph_values(noise: Isotropic):
+    graph, v1, _ = create_graph(noise)
+    values = gtsam.Values()
+    values.insert(v1.backend_index, gtsam.Pose3(gtsam.Rot3(), np.array([2.0, 0.0, 0.0])))
+
+    v1.update(values)
+
+    result = graph.get_backend_instances().atPose3(v1.backend_index)
+    assert np.allclose(result.translation(), [2.0, 0.0, 0.0])
+
+
+def test_removed_vertex_keeps_value(noise: Isotropic):
+    graph, v1, v2 = create_graph(noise)
+    graph.update_vertices(shifted_values(graph, 3.0))
+
+    graph.remove_vertex(v2)
+
+    assert not graph.get_backend_instances().exists(v2.backend_index)
+    assert graph.get_backend_instances().exists(v1.backend_index)
+    assert np.allclose(v2.position, [3.0, 0.0, 0.0])
+
+
+def test_solver_result(noise: Isotropic):
+    graph, v1, v2 = create_graph(noise)
+    initial = shifted_values(graph, 5.0)
+    graph.update_vertices(initial)
+
+    optimizer = gtsam.LevenbergMarquardtOptimizer(
+        graph.factor_graph, graph.get_backend_instances(), gtsam.LevenbergMarquardtParams()
+    )
+    graph.update_vertices(optimizer.optimize())
+
+    assert np.allclose(v1.value, i4x4, atol=1e-6)
+    assert np.allclose(v2.value, i4x4, atol=1e-6)
+
+
+def test_deepcopy_is_independent(noise: Isotropic):
+    graph, v1, _ = create_graph(noise)
+    copy = deepcopy(graph)
+    v1_copy = next(v for v in copy.vertex_storage.vertices if v.index == v1.index)
+
+    copy.update_vertices(shifted_values(copy, 4.0))
+
+    assert np.allclose(v1_copy.position, [4.0, 0.0, 0.0])
+    assert np.allclose(v1.position, [0.0, 0.0, 0.0])
+    assert np.allclose(graph.get_backend_instances().atPose3(v1.backend_index).translation(), 0)
+
+
+def test_deepcopy_with_lazy_elements(noise: Isotropic):
+    graph = Graph()
+    v1, v2 = PoseVertex(0), PoseVertex(1)
+    decoded, lazy = (
+        LazyValues(np.arange(3.0).tobytes(), np.frombuffer, size_bytes=24) for _ in range(2)
+    )
+    decoded.get()
+    sensor = Sensor("lidar")
+    elements = [
+        Element(t, RawMeasurement(sensor, v), Location()) for t, v in enumerate((decoded, lazy))
+    ]
+    odometry = OdometryWithElements(1, TimeRange(0, 1), i4x4, i3x3, i3x3, elements)
+    edge = PoseOdometry(v1, v2, odometry, noise)
+    new_vertices = (NewVertex(v1, VertexCluster(), 0), NewVertex(v2, VertexCluster(), 1))
+    graph.add_element(GraphElement(edge, {v1: 0, v2: 1}, new_vertices))
+
+    copy = deepcopy(graph)
+
+    copied = next(iter(copy.edges)).measurement.elements
+    assert [element.measurement.payload.loaded for element in copied] == [True, False]
+    assert np.array_equal(copied[1].measurement.values, [0.0, 1.0, 2.0])
+    assert not lazy.loaded
+
+
+def test_vertex_from_value_is_independent(noise: Isotropic):
+    graph, v1, _ = create_graph(noise)
+    vertex = PoseVertex(2, v1.value)
+    row = v1.row
+
+    graph.update_vertices(shifted_values(graph, 7.0))
+
+    assert np.allclose(v1.value[:3, 3], [7.0, 0.0, 0.0])
+    assert np.allclose(row[:3, 3], [7.0, 0.0, 0.0])
+    assert np.allclose(vertex.value, i4x4)
+    assert np.allclose(vertex.backend_instance.matrix(), i4x4)
+
+
+def test_stack_values(noise: Isotropic):
+    graph, v1, v2 = create_graph(noise)
+    graph.update_vertices(shifted_values(graph, 2.0))
+
+    poses = stack_values(PoseVertex, [v2, v1])
+
+    assert poses.shape == (2, 4, 4)
+    assert np.allclose(poses[:, 0, 3], [2.0, 2.0])
+    assert stack_values(PoseVertex, []).shape == (0, 4, 4)
+
+
+def test_detached_vertices():
+    nav_state = NavState(0, (i4x4, np.array([1.0, 2.0, 3.0])))
+    bias = ImuBias(0, (np.zeros(3), np.ones(3)))
+    values = gtsam.Values()
+    values.insert(bias.backend_index, gtsam.imuBias.ConstantBias(np.ones(3), np.zeros(3)))
+
+    bias.update(values)
+
+    assert np.allclose(nav_state.row[16:], [1.0, 2.0, 3.0])
+    assert np.allclose(bias.accelerometer_bias, np.ones(3))
+    assert np.allclose(bias.gyroscope_bias, np.zeros(3))
+    assert np.allclose(stack_values(ImuBias, [bias]), [[1, 1, 1, 0, 0, 0]])
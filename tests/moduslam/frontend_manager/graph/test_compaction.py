@@ -0,0 +1,163 @@
+import random
+
+import gtsam
+import numpy as np
+from gtsam.noiseModel import Isotropic
+
+from moduslam.frontend_manager.main_graph.data_classes import (
+    GraphElement,
+    NewVertex,
+)
+from moduslam.frontend_manager.main_graph.edges.base import Edge
+from moduslam.frontend_manager.main_graph.edges.pose import Pose as PriorPose
+from moduslam.frontend_manager.main_graph.edges.pose_odometry import PoseOdometry
+from moduslam.frontend_manager.main_graph.graph import Graph
+from moduslam.frontend_manager.main_graph.vertex_storage.cluster import (
+    VertexCluster,
+)
+from moduslam.frontend_manager.main_graph.vertices.custom import Pose as PoseVertex
+from moduslam.measurement_storage.measurements.pose import Pose as PoseMeasurement
+from moduslam.measurement_storage.measurements.pose_odometry import Odometry
+from moduslam.utils.auxiliary_dataclasses import TimeRange
+from moduslam.utils.auxiliary_objects import identity3x3 as i3x3
+
+
+def translation(x: float) -> tuple[tuple[float, ...], ...]:
+    """SE(3) matrix with the translation along x-axis."""
+    matrix = np.eye(4)
+    matrix[0, 3] = x
+    return tuple(tuple(row) for row in matrix)
+
+
+def add_anchors(graph: Graph, num: int, noise: Isotropic) -> list[PoseVertex]:
+    """Adds pose vertices with the prior edges."""
+    vertices = []
+
+    for t in range(num):
+        v = PoseVertex(t)
+        edge = PriorPose(v, PoseMeasurement(t, translation(t), i3x3, i3x3), noise)
+        graph.add_element(GraphElement(edge, {v: t}, (NewVertex(v, VertexCluster(), t),)))
+        vertices.append(v)
+
+    return vertices
+
+
+def add_odometry(graph: Graph, v1: PoseVertex, v2: PoseVertex, noise: Isotropic) -> Edge:
+    """Adds odometry edge between the existing vertices."""
+    t1, t2 = v1.index, v2.index
+    odometry = Odometry(t2, TimeRange(t1, t2), translation(t2 - t1), i3x3, i3x3)
+    edge = PoseOdometry(v1, v2, odometry, noise)
+    graph.add_element(GraphElement(edge, {v1: t1, v2: t2}, ()))
+    return edge
+
+
+def solve(graph: Graph) -> gtsam.Values:
+    values = graph.get_backend_instances()
+    params = gtsam.LevenbergMarquardtParams()
+    return gtsam.LevenbergMarquardtOptimizer(graph.factor_graph, values, params).optimize()
+
+
+def check_consistency(graph: Graph) -> None:
+    """Every edge points to its own factor."""
+    assert graph.factor_graph.nrFactors() == len(graph.edges)
+    for edge in graph.edges:
+        assert graph.factor_graph.at(edge.index) is not None
+        assert graph.factor_graph.at(edge.index).keys() == edge.factor.keys()
+
+
+def test_slots_are_reused(noise: Isotropic):
+    graph = Graph(min_compaction_size=1000)
+    v1, v2 = add_anchors(graph, 2, noise)
+    e1 = add_odometry(graph, v1, v2, noise)
+    index = e1.index
+
+    graph.remove_edge(e1)
+    e2 = add_odometry(graph, v1, v2, noise)
+
+    assert e2.index == index
+    assert graph.factor_graph.size() == 3
+    assert graph.fragmentation == 0.0
+
+
+def test_removed_edge_can_be_added_after_slot_reuse(noise: Isotropic):
+    graph = Graph(min_compaction_size=1000)
+    v1, v2 = add_anchors(graph, 2, noise)
+    e1 = add_odometry(graph, v1, v2, noise)
+    add_odometry(graph, v1, v2, noise)
+
+    graph.remove_edge(e1)
+    e3 = add_odometry(graph, v1, v2, noise)
+    graph.add_element(GraphElement(e1, {v1: v1.index, v2: v2.index}, ()))
+
+    assert e1 in graph.edges
+    assert e1.index != e3.index
+    check_consistency(graph)
+
+
+def test_compaction_remaps_indices(noise: Isotropic):
+    graph = Graph(min_compaction_size=1000)
+    v1, v2, v3 = add_anchors(graph, 3, noise)
+    edges = [add_odometry(graph, v1, v2, noise) for _ in range(4)]
+    e = add_odometry(graph, v2, v3, noise)
+
+    for edge in edges:
+        graph.remove_edge(edge)
+
+    assert graph.fragmentation == 0.5
+
+    graph.compact()
+
+    assert graph.factor_graph.size() == 4
+    assert graph.fragmentation == 0.0
+    assert e.index == 3
+    check_consistency(graph)
+
+
+def test_compaction_is_triggered(noise: Isotropic):
+    graph = Graph(fragmentation_threshold=0.25, min_compaction_size=4)
+    v1, v2 = add_anchors(graph, 2, noise)
+    edges = [add_odometry(graph, v1, v2, noise) for _ in range(3)]
+
+    graph.remove_edge(edges[0])
+    assert graph.factor_graph.size() == 5
+
+    graph.remove_edge(edges[1])
+    assert graph.factor_graph.size() == 3
+    check_consistency(graph)
+
+
+def test_stress_against_uncompacted_graph(noise: Isotropic):
+    rng = random.Random(42)
+    num_vertices, num_operations = 10, 2000
+    compacted = Graph(fragmentation_threshold=0.1, min_compaction_size=8)
+    uncompacted = Graph(fragmentation_threshold=1.0)
+    vertices1 = add_anchors(compacted, num_vertices, noise)
+    vertices2 = add_anchors(uncompacted, num_vertices, noise)
+    edges1: list[Edge] = []
+    edges2: list[Edge] = []
+
+    for _ in range(num_operations):
+        if edges1 and rng.random() < 0.5:
+            position = rng.randrange(len(edges1))
+            compacted.remove_edge(edges1.pop(position))
+            uncompacted.remove_edge(edges2.pop(position))
+        else:
+            i, j = sorted(rng.sample(range(num_vertices), 2))
+            edges1.append(add_odometry(compacted, vertices1[i], vertices1[j], noise))
+            edges2.append(add_odometry(uncompacted, vertices2[i], vertices2[j], noise))
+
+    check_consistency(compacted)
+    check_consistency(uncompacted)
+    assert compacted.factor_graph.size() < uncompacted.factor_graph.size()
+
+    result1, result2 = solve(compacted), solve(uncompacted)
+
+    for v1, v2 in zip(vertices1, vertices2):
+        pose1 = result1.atPose3(v1.backend_index)
+        pose2 = result2.atPose3(v2.backend_index)
+        assert pose1.equals(pose2, 1e-6)
+
+    values1, values2 = compacted.get_backend_instances(), uncompacted.get_backend_instances()
+    assert np.isclose(
+        compacted.factor_graph.error(values1), uncompacted.factor_graph.error(values2)
+    )
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from moduslam.frontend_manager.main_graph.vertices.value_store import ValueStore
+
+
+def test_set_and_row():
+    store = ValueStore((4, 4), capacity=2)
+
+    store.set(0, np.eye(4))
+    store.set(5, 2 * np.eye(4))
+
+    assert 0 in store and 5 in store and 1 not in store
+    assert len(store) == 2
+    assert np.array_equal(store.row(5), 2 * np.eye(4))
+    assert np.array_equal(store.indices, [0, 5])
+    assert store.array.shape == (2, 4, 4)
+
+
+def test_row_is_read_only_view():
+    store = ValueStore((3,))
+    store.set(0, np.zeros(3))
+    row = store.row(0)
+
+    store.set(0, np.ones(3))
+
+    assert np.array_equal(row, np.ones(3))
+    with pytest.raises(ValueError):
+        row[0] = 5.0
+
+
+def test_rows():
+    store = ValueStore((3,))
+    for i in range(10):
+        store.set(i, np.full(3, i))
+
+    rows = store.rows([7, 2, 9])
+
+    assert np.array_equal(rows[:, 0], [7, 2, 9])
+
+
+def test_discard():
+    store = ValueStore((3,))
+    store.set(0, np.zeros(3))
+
+    store.discard(0)
+    store.discard(100)
+
+    assert 0 not in store
+    assert len(store) == 0
+    with pytest.raises(KeyError):
+        store.row(0)
+    with pytest.raises(KeyError):
+        store.rows([0])
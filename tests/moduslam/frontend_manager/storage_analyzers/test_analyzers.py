@@ -0,0 +1,130 @@
+import pytest
+
+from moduslam.frontend_manager.config_factory import get_config
+from moduslam.frontend_manager.storage_analyzers.analyzers import (
+    ConditionsAnalyzer,
+    DoublePoseOdometry,
+    PoseOdometryWithGps,
+    SinglePoseOdometry,
+)
+from moduslam.frontend_manager.storage_analyzers.configs import (
+    AnalyzerConfig,
+    ConditionConfig,
+)
+from moduslam.measurement_storage.measurements.auxiliary import FakeMeasurement
+from moduslam.measurement_storage.measurements.pose_odometry import OdometryWithElements
+from moduslam.measurement_storage.measurements.position import Position
+from moduslam.measurement_storage.storage import MeasurementStorage
+from moduslam.utils.auxiliary_dataclasses import TimeRange
+from moduslam.utils.auxiliary_objects import identity3x3, identity4x4, zero_vector3
+from moduslam.utils.exceptions import ConfigurationError
+
+
+def create_odometry(t: int) -> OdometryWithElements:
+    return OdometryWithElements(t, TimeRange(t, t), identity4x4, identity3x3, identity3x3, [])
+
+
+def create_position(t: int) -> Position:
+    return Position(t, zero_vector3, identity3x3)
+
+
+def test_single_pose_odometry():
+    storage = MeasurementStorage()
+    analyzer = SinglePoseOdometry()
+    storage.subscribe(analyzer)
+
+    storage.add(FakeMeasurement(0))
+    assert analyzer.satisfied is False
+
+    odometry = create_odometry(1)
+    storage.add(odometry)
+    assert analyzer.satisfied is True
+
+    storage.remove(odometry)
+    assert analyzer.satisfied is False
+
+
+def test_double_pose_odometry_requires_exact_number():
+    storage = MeasurementStorage()
+    analyzer = DoublePoseOdometry()
+    storage.subscribe(analyzer)
+
+    storage.add(create_odometry(0))
+    assert analyzer.satisfied is False
+
+    storage.add(create_odometry(1))
+    assert analyzer.satisfied is True
+
+    storage.add(create_odometry(2))
+    assert analyzer.satisfied is False
+
+    storage.clear()
+    assert analyzer.satisfied is False
+
+
+def test_pose_odometry_with_gps():
+    storage = MeasurementStorage()
+    analyzer = PoseOdometryWithGps()
+    storage.subscribe(analyzer)
+
+    storage.add(create_position(0))
+    assert analyzer.satisfied is False
+
+    storage.add(create_odometry(1))
+    assert analyzer.satisfied is True
+
+
+def test_subscribe_counts_existing_measurements():
+    storage = MeasurementStorage()
+    storage.add(create_odometry(0))
+    analyzer = SinglePoseOdometry()
+
+    storage.subscribe(analyzer)
+
+    assert analyzer.satisfied is True
+
+
+def test_time_window():
+    config = AnalyzerConfig(
+        conditions=[
+            ConditionConfig(OdometryWithElements.__name__, min_count=2),
+            ConditionConfig(Position.__name__, min_count=1),
+        ],
+        time_window=10,
+    )
+    storage = MeasurementStorage()
+    analyzer = ConditionsAnalyzer(config)
+    storage.subscribe(analyzer)
+
+    storage.add(create_odometry(0))
+    storage.add(create_odometry(5))
+    storage.add(create_position(20))
+    assert analyzer.satisfied is False
+
+    storage.add(FakeMeasurement(100))  # not conditioned type: no re-evaluation.
+    assert analyzer.satisfied is False
+
+    storage.clear()
+    storage.add(create_odometry(10))
+    storage.add(create_odometry(15))
+    storage.add(create_position(20))
+    assert analyzer.satisfied is True
+
+
+def test_unsupported_type_raises_configuration_error():
+    config = AnalyzerConfig(conditions=[ConditionConfig("Unknown")])
+
+    with pytest.raises(ConfigurationError):
+        ConditionsAnalyzer(config)
+
+
+def test_analyzer_from_frontend_config():
+    config = get_config()
+    analyzer = ConditionsAnalyzer(config.graph_builder.analyzer)
+    storage = MeasurementStorage()
+    storage.subscribe(analyzer)
+
+    storage.add(create_odometry(10))
+
+    assert analyzer.satisfied is True
+    assert config.suboptimal_builder.analyzer.conditions[0].max_count == 2
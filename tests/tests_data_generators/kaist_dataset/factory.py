@@ -1,5 +1,4 @@
 import csv
-from dataclasses import fields
 from pathlib import Path
 from typing import Any, overload
 
@@ -8,6 +7,9 @@ from PIL import Image
 from plum import dispatch
 
 from tests.tests_data_generators.kaist_dataset.data import Data
+from tests.tests_data_generators.kaist_dataset.structure import (
+    create_dataset_structure,
+)
 
 
 class DataFactory:
@@ -86,16 +88,7 @@ class DataFactory:
 
     def create_dataset_structure(self) -> None:
         """Creates Kaist Urban dataset empty directories & files structure."""
-        structure = self._data.dataset
-        for field in fields(structure):
-            field_name: str = field.name
-            field_value: Path | str = getattr(structure, field_name)
-
-            if isinstance(field_value, Path):
-                if field_value.suffix == "":
-                    Path.mkdir(field_value, parents=True, exist_ok=True)
-                else:
-                    Path.touch(field_value)
+        create_dataset_structure(self._data.dataset)
 
     def generate_csv(self):
         for elements, path in self._data.csv_data:
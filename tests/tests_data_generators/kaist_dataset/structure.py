@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 
 from moduslam.data_manager.batch_factory.data_readers.kaist.configs.paths import (
@@ -77,3 +77,19 @@ class DatasetStructure:
             self.dataset_directory / KaistDatasetPathConfig.lidar_3D_right_stamp_file
         )
         self.stereo_stamp_file = self.dataset_directory / KaistDatasetPathConfig.stereo_stamp_file
+
+
+def create_dataset_structure(structure: DatasetStructure) -> None:
+    """Creates Kaist Urban dataset empty directories & files structure.
+
+    Args:
+        structure: paths of the dataset directories & files.
+    """
+    for field_ in fields(structure):
+        field_value: Path | str = getattr(structure, field_.name)
+
+        if isinstance(field_value, Path):
+            if field_value.suffix == "":
+                Path.mkdir(field_value, parents=True, exist_ok=True)
+            else:
+                Path.touch(field_value)
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class SyntheticDatasetConfig:
+    """Parameters of a synthetic dataset of configurable length and sensor rates."""
+
+    duration: float = 10.0  # length of the sequence [s].
+    start_timestamp: int = 1_000_000_000_000_000_000  # timestamp of the 1-st measurement [ns].
+    imu_rate: float = 100.0  # [Hz].
+    lidar_rate: float = 10.0  # [Hz].
+    odometry_rate: float = 50.0  # [Hz].
+    gps_rate: float = 10.0  # [Hz].
+    points_per_scan: int = 2048
+    speed: float = 1.0  # linear speed of the platform [m/s].
+    radius: float = 10.0  # radius of the circular trajectory [m].
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.duration <= 0:
+            raise ValueError(f"Duration must be positive, got {self.duration}.")
+
+        rates = (self.imu_rate, self.lidar_rate, self.odometry_rate, self.gps_rate)
+        if any(rate <= 0 for rate in rates):
+            raise ValueError(f"Sensor rates must be positive, got {rates}.")
+
+        if self.points_per_scan <= 0:
+            raise ValueError(f"Number of points must be positive, got {self.points_per_scan}.")
+
+        if self.speed < 0 or self.radius <= 0:
+            raise ValueError(f"Invalid trajectory: speed={self.speed}, radius={self.radius}.")
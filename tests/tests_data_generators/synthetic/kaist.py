@@ -0,0 +1,195 @@
+import csv
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+
+from moduslam.data_manager.batch_factory.data_readers.kaist.configs.base import (
+    KaistConfig,
+)
+from tests.tests_data_generators.kaist_dataset.structure import (
+    DatasetStructure,
+    create_dataset_structure,
+)
+from tests.tests_data_generators.synthetic.config import SyntheticDatasetConfig
+from tests.tests_data_generators.synthetic.sequence import SyntheticSequence
+
+ground_truth_file = Path("global_pose.csv")
+vrs_fix_status = 4  # RTK fix.
+
+
+class KaistDatasetWriter:
+    """Writes a synthetic sequence in Kaist Urban Dataset layout: IMU, 3D lidar, wheel
+    encoders, GPS, VRS GPS and ground truth poses."""
+
+    imu_name: str = KaistConfig.imu_name
+    lidar_name: str = KaistConfig.lidar_3D_left_name
+    encoder_name: str = KaistConfig.encoder_name
+    gps_name: str = KaistConfig.gps_name
+    vrs_gps_name: str = KaistConfig.vrs_gps_name
+
+    def __init__(self, directory: Path, config: SyntheticDatasetConfig) -> None:
+        """
+        Args:
+            directory: a directory for the dataset.
+
+            config: parameters of the synthetic dataset.
+        """
+        self._structure = DatasetStructure(directory)
+        self._config = config
+        self._sequence = SyntheticSequence(config)
+
+    @property
+    def dataset_config(self) -> KaistConfig:
+        """Configuration for the Kaist Urban reader."""
+        return KaistConfig(directory=self._structure.dataset_directory)
+
+    @property
+    def sequence(self) -> SyntheticSequence:
+        """The sequence being written."""
+        return self._sequence
+
+    @property
+    def ground_truth_file(self) -> Path:
+        """Ground truth poses: timestamp and 3x4 SE(3) matrix in row-major order."""
+        return self._structure.dataset_directory / ground_truth_file
+
+    def write(self) -> None:
+        """Writes all files of the dataset."""
+        create_dataset_structure(self._structure)
+
+        self._write_ground_truth()
+        self._write_imu()
+        self._write_lidar()
+        self._write_encoder()
+        self._write_gps()
+        self._write_placeholders(self._config.start_timestamp - 1)
+        self._write_data_stamp()
+
+    def _write_data_stamp(self) -> None:
+        """Writes timestamps of all measurements in chronological order."""
+        s = self._sequence
+        streams = (
+            (s.imu_timestamps, self.imu_name),
+            (s.lidar_timestamps, self.lidar_name),
+            (s.odometry_timestamps, self.encoder_name),
+            (s.gps_timestamps, self.gps_name),
+            (s.gps_timestamps, self.vrs_gps_name),
+        )
+        names = [name for _, name in streams]
+        timestamps = np.concatenate([stamps for stamps, _ in streams])
+        name_ids = np.concatenate(
+            [np.full(len(stamps), i) for i, (stamps, _) in enumerate(streams)]
+        )
+        order = np.argsort(timestamps, kind="stable")
+
+        rows = ((t, names[i]) for t, i in zip(timestamps[order].tolist(), name_ids[order]))
+        self._write_rows(self._structure.data_stamp_file, rows)
+
+    def _write_ground_truth(self) -> None:
+        rows = (
+            (t, *pose[:3].ravel().tolist())
+            for timestamps, poses in self._sequence.ground_truth()
+            for t, pose in zip(timestamps.tolist(), poses)
+        )
+        self._write_rows(self.ground_truth_file, rows)
+
+    def _write_imu(self) -> None:
+        """Writes Xsens IMU rows: timestamp, quaternion (x, y, z, w), euler angles,
+        gyroscope, accelerometer and magnetometer measurements."""
+
+        def create_rows():
+            for chunk in self._sequence.imu():
+                num = len(chunk.timestamps)
+                values = np.zeros((num, 16))
+                values[:, 0:4] = chunk.quaternions
+                values[:, 6] = 2 * np.arctan2(chunk.quaternions[:, 2], chunk.quaternions[:, 3])
+                values[:, 7:10] = chunk.angular_velocities
+                values[:, 10:13] = chunk.accelerations
+                yield from ((t, *row) for t, row in zip(chunk.timestamps.tolist(), values.tolist()))
+
+        self._write_rows(self._structure.imu_data_file, create_rows())
+
+    def _write_lidar(self) -> None:
+        """Writes point clouds and the corresponding stamp file."""
+        directory = self._structure.lidar_3D_left_dir
+        extension = self._structure.binary_file_extension
+
+        for timestamp, points in self._sequence.lidar():
+            points.tofile(directory / f"{timestamp}{extension}")
+
+        stamps = ((t,) for t in self._sequence.lidar_timestamps.tolist())
+        self._write_rows(self._structure.lidar_3D_left_stamp_file, stamps)
+
+    def _write_encoder(self) -> None:
+        """Writes cumulative ticks of the left and right wheel encoders."""
+        rows = (
+            (t, *counts)
+            for chunk in self._sequence.odometry()
+            for t, counts in zip(chunk.timestamps.tolist(), chunk.encoder_counts.tolist())
+        )
+        self._write_rows(self._structure.encoder_data_file, rows)
+
+    def _write_gps(self) -> None:
+        """Writes GPS rows (timestamp, latitude, longitude, altitude, covariance 3x3) and
+        VRS GPS rows (timestamp, latitude, longitude, x, y, altitude, fix status, number
+        of satellites, horizontal precision, standard deviations of latitude, longitude
+        and altitude, heading flag, heading, speed [knot], speed [km/h], mode).
+
+        Both files are written chunk by chunk while the sequence is generated.
+        """
+        with (
+            open(self._structure.gps_data_file, "w", encoding="UTF8", newline="") as gps_file,
+            open(self._structure.vrs_gps_data_file, "w", encoding="UTF8", newline="") as vrs_file,
+        ):
+            gps_writer, vrs_writer = csv.writer(gps_file), csv.writer(vrs_file)
+
+            for chunk in self._sequence.gps():
+                variance = chunk.std**2
+                covariance = (variance, 0, 0, 0, variance, 0, 0, 0, variance)
+                timestamps = chunk.timestamps.tolist()
+                coordinates = chunk.coordinates.tolist()
+
+                gps_writer.writerows(
+                    (t, lat, lon, alt, *covariance)
+                    for t, (lat, lon, alt) in zip(timestamps, coordinates)
+                )
+                vrs_writer.writerows(
+                    (t, lat, lon, x, y, alt, vrs_fix_status, 12, 1.0, *(chunk.std,) * 3)
+                    + (0, 0.0, 0.0, 0.0, "A")
+                    for t, (lat, lon, alt), (x, y, _) in zip(
+                        timestamps, coordinates, chunk.positions.tolist()
+                    )
+                )
+
+    def _write_placeholders(self, timestamp: int) -> None:
+        """Writes a single row to the files of not simulated sensors: the reader
+        requires all data files to be non-empty.
+
+        Args:
+            timestamp: timestamp of the row (not listed in the data stamp file).
+        """
+        s = self._structure
+        files = (
+            s.fog_data_file,
+            s.altimeter_data_file,
+            s.lidar_2D_back_stamp_file,
+            s.lidar_2D_middle_stamp_file,
+            s.lidar_3D_right_stamp_file,
+            s.stereo_stamp_file,
+        )
+        for file in files:
+            self._write_rows(file, [(timestamp, 0)])
+
+    @staticmethod
+    def _write_rows(path: Path, rows: Iterable[tuple]) -> None:
+        """Writes rows to a CSV file.
+
+        Args:
+            path: file path.
+
+            rows: rows to write.
+        """
+        with open(path, "w", encoding="UTF8", newline="") as outfile:
+            writer = csv.writer(outfile)
+            writer.writerows(rows)
@@ -0,0 +1,227 @@
+import heapq
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+from rosbags.interfaces import Connection
+from rosbags.rosbag2 import Writer
+from rosbags.typesys import Stores, get_typestore
+
+from moduslam.data_manager.batch_factory.data_readers.ros2.configs.base import (
+    Ros2Config,
+)
+from tests.tests_data_generators.synthetic.config import SyntheticDatasetConfig
+from tests.tests_data_generators.synthetic.kaist import ground_truth_file
+from tests.tests_data_generators.synthetic.sequence import SyntheticSequence
+
+Message = tuple[int, Connection, bytes]  # timestamp, connection, serialized message.
+
+frame_id = "base_link"
+imu_type = "sensor_msgs/msg/Imu"
+point_cloud_type = "sensor_msgs/msg/PointCloud2"
+nav_sat_fix_type = "sensor_msgs/msg/NavSatFix"
+odometry_type = "nav_msgs/msg/Odometry"
+
+
+class Ros2DatasetWriter:
+    """Writes a synthetic sequence as a ROS-2 bag: IMU, 3D lidar, wheel odometry and GPS
+    topics."""
+
+    imu_name: str = "imu"
+    lidar_name: str = "lidar"
+    odometry_name: str = "odometry"
+    gps_name: str = "gps"
+
+    topics: dict[str, str] = {
+        imu_name: "/imu/data",
+        lidar_name: "/lidar/points",
+        odometry_name: "/odom",
+        gps_name: "/gps/fix",
+    }
+
+    def __init__(
+        self,
+        directory: Path,
+        config: SyntheticDatasetConfig,
+        ros_distro: Stores = Stores.ROS2_HUMBLE,
+    ) -> None:
+        """
+        Args:
+            directory: a directory for the bag (must not exist).
+
+            config: parameters of the synthetic dataset.
+
+            ros_distro: ROS-2 distribution of the messages.
+        """
+        self._directory = directory
+        self._ros_distro = ros_distro
+        self._typestore = get_typestore(ros_distro)
+        self._sequence = SyntheticSequence(config)
+
+    @property
+    def dataset_config(self) -> Ros2Config:
+        """Configuration for the ROS-2 reader."""
+        return Ros2Config(
+            directory=self._directory,
+            ros_distro=self._ros_distro,
+            sensor_topic_mapping=dict(self.topics),
+        )
+
+    @property
+    def sequence(self) -> SyntheticSequence:
+        """The sequence being written."""
+        return self._sequence
+
+    @property
+    def ground_truth_file(self) -> Path:
+        """Ground truth poses: timestamp and 3x4 SE(3) matrix in row-major order."""
+        return self._directory / ground_truth_file
+
+    def write(self) -> None:
+        """Writes the bag and the ground truth file."""
+        with Writer(self._directory, version=9) as writer:
+            connections = {
+                name: writer.add_connection(self.topics[name], msgtype, typestore=self._typestore)
+                for name, msgtype in (
+                    (self.imu_name, imu_type),
+                    (self.lidar_name, point_cloud_type),
+                    (self.odometry_name, odometry_type),
+                    (self.gps_name, nav_sat_fix_type),
+                )
+            }
+            streams = (
+                self._imu_messages(connections[self.imu_name]),
+                self._lidar_messages(connections[self.lidar_name]),
+                self._odometry_messages(connections[self.odometry_name]),
+                self._gps_messages(connections[self.gps_name]),
+            )
+            for timestamp, connection, data in heapq.merge(*streams, key=lambda m: m[0]):
+                writer.write(connection, timestamp, data)
+
+        with open(self.ground_truth_file, "w", encoding="UTF8") as file:
+            for timestamps, poses in self._sequence.ground_truth():
+                for t, pose in zip(timestamps.tolist(), poses):
+                    file.write(f"{t},{','.join(map(str, pose[:3].ravel().tolist()))}\n")
+
+    def _header(self, timestamp: int):
+        types = self._typestore.types
+        stamp = types["builtin_interfaces/msg/Time"](
+            sec=timestamp // 10**9, nanosec=timestamp % 10**9
+        )
+        return types["std_msgs/msg/Header"](stamp=stamp, frame_id=frame_id)
+
+    def _serialize(self, msg, msgtype: str) -> bytes:
+        return bytes(self._typestore.serialize_cdr(msg, msgtype))
+
+    def _imu_messages(self, connection: Connection) -> Iterator[Message]:
+        types = self._typestore.types
+        quaternion = types["geometry_msgs/msg/Quaternion"]
+        vector = types["geometry_msgs/msg/Vector3"]
+        imu = types[imu_type]
+        covariance = np.zeros(9)
+
+        for chunk in self._sequence.imu():
+            for t, q, w, a in zip(
+                chunk.timestamps.tolist(),
+                chunk.quaternions.tolist(),
+                chunk.angular_velocities.tolist(),
+                chunk.accelerations.tolist(),
+            ):
+                msg = imu(
+                    header=self._header(t),
+                    orientation=quaternion(x=q[0], y=q[1], z=q[2], w=q[3]),
+                    orientation_covariance=covariance,
+                    angular_velocity=vector(x=w[0], y=w[1], z=w[2]),
+                    angular_velocity_covariance=covariance,
+                    linear_acceleration=vector(x=a[0], y=a[1], z=a[2]),
+                    linear_acceleration_covariance=covariance,
+                )
+                yield t, connection, self._serialize(msg, imu_type)
+
+    def _lidar_messages(self, connection: Connection) -> Iterator[Message]:
+        types = self._typestore.types
+        point_field = types["sensor_msgs/msg/PointField"]
+        point_cloud = types[point_cloud_type]
+        float32 = 7
+        fields = [
+            point_field(name=name, offset=4 * i, datatype=float32, count=1)
+            for i, name in enumerate(("x", "y", "z", "intensity"))
+        ]
+
+        for t, points in self._sequence.lidar():
+            msg = point_cloud(
+                header=self._header(t),
+                height=1,
+                width=len(points),
+                fields=fields,
+                is_bigendian=False,
+                point_step=points.itemsize * points.shape[1],
+                row_step=points.nbytes,
+                data=points.view(np.uint8).ravel(),
+                is_dense=True,
+            )
+            yield t, connection, self._serialize(msg, point_cloud_type)
+
+    def _odometry_messages(self, connection: Connection) -> Iterator[Message]:
+        types = self._typestore.types
+        point = types["geometry_msgs/msg/Point"]
+        quaternion = types["geometry_msgs/msg/Quaternion"]
+        vector = types["geometry_msgs/msg/Vector3"]
+        pose = types["geometry_msgs/msg/Pose"]
+        twist = types["geometry_msgs/msg/Twist"]
+        pose_with_covariance = types["geometry_msgs/msg/PoseWithCovariance"]
+        twist_with_covariance = types["geometry_msgs/msg/TwistWithCovariance"]
+        odometry = types[odometry_type]
+        covariance = np.zeros(36)
+
+        for chunk in self._sequence.odometry():
+            yaws = np.arctan2(chunk.poses[:, 1, 0], chunk.poses[:, 0, 0])
+            for t, position, yaw, v, w in zip(
+                chunk.timestamps.tolist(),
+                chunk.poses[:, :3, 3].tolist(),
+                yaws.tolist(),
+                chunk.linear_velocities.tolist(),
+                chunk.angular_velocities.tolist(),
+            ):
+                msg = odometry(
+                    header=self._header(t),
+                    child_frame_id=frame_id,
+                    pose=pose_with_covariance(
+                        pose=pose(
+                            position=point(x=position[0], y=position[1], z=position[2]),
+                            orientation=quaternion(
+                                x=0.0, y=0.0, z=np.sin(yaw / 2), w=np.cos(yaw / 2)
+                            ),
+                        ),
+                        covariance=covariance,
+                    ),
+                    twist=twist_with_covariance(
+                        twist=twist(
+                            linear=vector(x=v[0], y=v[1], z=v[2]),
+                            angular=vector(x=w[0], y=w[1], z=w[2]),
+                        ),
+                        covariance=covariance,
+                    ),
+                )
+                yield t, connection, self._serialize(msg, odometry_type)
+
+    def _gps_messages(self, connection: Connection) -> Iterator[Message]:
+        types = self._typestore.types
+        status = types["sensor_msgs/msg/NavSatStatus"]
+        nav_sat_fix = types[nav_sat_fix_type]
+        fix_status = status(status=2, service=1)  # GBAS fix, GPS service.
+        diagonal_known = 2
+
+        for chunk in self._sequence.gps():
+            covariance = np.diag([chunk.std**2] * 3).ravel()
+            for t, (lat, lon, alt) in zip(chunk.timestamps.tolist(), chunk.coordinates.tolist()):
+                msg = nav_sat_fix(
+                    header=self._header(t),
+                    status=fix_status,
+                    latitude=lat,
+                    longitude=lon,
+                    altitude=alt,
+                    position_covariance=covariance,
+                    position_covariance_type=diagonal_known,
+                )
+                yield t, connection, self._serialize(msg, nav_sat_fix_type)
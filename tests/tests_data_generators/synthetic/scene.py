@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class BoxRoom:
+    """Axis-aligned box room made of 6 planes: 4 walls, a floor and a ceiling."""
+
+    size_x: float = 40.0  # [m].
+    size_y: float = 30.0  # [m].
+    height: float = 6.0  # [m].
+    center_x: float = 0.0  # [m].
+    center_y: float = 0.0  # [m].
+    floor_level: float = -1.5  # z coordinate of the floor [m].
+
+    @property
+    def bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        """Lower and upper corners of the room."""
+        lower = np.array(
+            [self.center_x - self.size_x / 2, self.center_y - self.size_y / 2, self.floor_level]
+        )
+        upper = np.array(
+            [
+                self.center_x + self.size_x / 2,
+                self.center_y + self.size_y / 2,
+                self.floor_level + self.height,
+            ]
+        )
+        return lower, upper
+
+    def cast_rays(self, origin: np.ndarray, directions: np.ndarray) -> np.ndarray:
+        """Computes distances from the origin inside the room to the planes along the
+        rays.
+
+        Args:
+            origin: origin [3] of the rays in the world frame.
+
+            directions: unit directions [N, 3] of the rays in the world frame.
+
+        Returns:
+            distances [N].
+        """
+        lower, upper = self.bounds
+        with np.errstate(divide="ignore"):
+            bound = np.where(directions > 0, upper, lower)
+            distances = (bound - origin) / directions
+
+        distances[directions == 0] = np.inf
+        return distances.min(axis=1)
+
+
+def beam_directions(num_points: int, rng: np.random.Generator, fov: float = 30.0) -> np.ndarray:
+    """Creates random unit directions of lidar beams within the vertical field of view.
+
+    Non-repetitive pattern is used on purpose: rings of a spinning lidar project to
+    concentric circles on the floor which move together with the sensor and make scan
+    matching in the room degenerate.
+
+    Args:
+        num_points: a number of beams.
+
+        rng: a random numbers generator.
+
+        fov: vertical field of view [deg].
+
+    Returns:
+        directions [N, 3] in the sensor frame.
+    """
+    half_fov = np.deg2rad(fov) / 2
+    elevation = rng.uniform(-half_fov, half_fov, num_points)
+    azimuth = rng.uniform(0, 2 * np.pi, num_points)
+
+    return np.column_stack(
+        (
+            np.cos(elevation) * np.cos(azimuth),
+            np.cos(elevation) * np.sin(azimuth),
+            np.sin(elevation),
+        )
+    )
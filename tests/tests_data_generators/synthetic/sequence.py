@@ -0,0 +1,234 @@
+"""Ground truth trajectory with consistent measurements of IMU, 3D lidar, wheel odometry
+and GPS.
+
+Every sensor has its own random numbers generator spawned from the common seed: the
+measurements of one sensor do not depend on the rates of the others. All sensors are
+located in the base frame (identity base->sensor transformations).
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+import numpy as np
+
+from tests.tests_data_generators.synthetic.config import SyntheticDatasetConfig
+from tests.tests_data_generators.synthetic.scene import BoxRoom, beam_directions
+from tests.tests_data_generators.synthetic.trajectory import CircularTrajectory
+
+gyroscope_noise_std = 1e-3  # [rad/s].
+accelerometer_noise_std = 1e-2  # [m/s^2].
+lidar_range_noise_std = 1e-2  # [m].
+gps_noise_std = 2e-2  # [m].
+odometry_noise_std = 1e-2  # [m/s].
+
+encoder_resolution = 4096  # ticks per revolution.
+wheel_diameter = 0.62  # [m].
+wheel_base = 1.52  # [m].
+
+earth_radius = 6378137.0  # [m].
+origin_latitude = 37.5  # [deg].
+origin_longitude = 127.0  # [deg].
+origin_altitude = 20.0  # [m].
+
+chunk_size = 100_000  # a number of measurements generated at once.
+
+
+@dataclass
+class ImuChunk:
+    timestamps: np.ndarray  # [N].
+    quaternions: np.ndarray  # [N, 4]: qx, qy, qz, qw.
+    angular_velocities: np.ndarray  # [N, 3].
+    accelerations: np.ndarray  # [N, 3].
+
+
+@dataclass
+class OdometryChunk:
+    timestamps: np.ndarray  # [N].
+    poses: np.ndarray  # [N, 4, 4] dead-reckoning poses.
+    linear_velocities: np.ndarray  # [N, 3] in the body frame.
+    angular_velocities: np.ndarray  # [N, 3] in the body frame.
+    encoder_counts: np.ndarray  # [N, 2]: left and right wheels ticks.
+
+
+@dataclass
+class GpsChunk:
+    timestamps: np.ndarray  # [N].
+    positions: np.ndarray  # [N, 3] in the local world frame.
+    coordinates: np.ndarray  # [N, 3]: latitude [deg], longitude [deg], altitude [m].
+    std: float  # position standard deviation [m].
+
+
+def create_timestamps(config: SyntheticDatasetConfig, rate: float, offset: int = 0) -> np.ndarray:
+    """Creates equally spaced timestamps.
+
+    Args:
+        config: parameters of the sequence.
+
+        rate: frequency [Hz].
+
+        offset: shift of all timestamps [ns].
+
+    Returns:
+        timestamps [ns].
+    """
+    num = int(config.duration * rate) + 1
+    steps = np.round(np.arange(num) * (1e9 / rate)).astype(np.int64)
+    return config.start_timestamp + offset + steps
+
+
+def chunks(array: np.ndarray) -> Iterator[np.ndarray]:
+    """Splits the array into chunks of the fixed size."""
+    for start in range(0, len(array), chunk_size):
+        yield array[start : start + chunk_size]
+
+
+class SyntheticSequence:
+    """A platform moving in a box room and measuring its motion."""
+
+    def __init__(self, config: SyntheticDatasetConfig) -> None:
+        """
+        Args:
+            config: parameters of the sequence.
+        """
+        self._config = config
+        self._trajectory = CircularTrajectory(config.radius, config.speed)
+        self._room = BoxRoom(center_y=config.radius)
+
+        seeds = np.random.SeedSequence(config.seed).spawn(4)
+        self._imu_rng, self._lidar_rng, self._odometry_rng, self._gps_rng = (
+            np.random.default_rng(seed) for seed in seeds
+        )
+
+        # timestamps of different sensors never coincide with IMU ones.
+        imu_period = round(1e9 / config.imu_rate)
+        self.imu_timestamps = create_timestamps(config, config.imu_rate)
+        self.lidar_timestamps = create_timestamps(config, config.lidar_rate, imu_period // 2)
+        self.odometry_timestamps = create_timestamps(config, config.odometry_rate, imu_period // 4)
+        self.gps_timestamps = create_timestamps(config, config.gps_rate, 3 * imu_period // 4)
+
+    @property
+    def trajectory(self) -> CircularTrajectory:
+        """Ground truth trajectory."""
+        return self._trajectory
+
+    def to_seconds(self, timestamps: np.ndarray) -> np.ndarray:
+        """Converts timestamps [ns] to the time [s] since the beginning of the sequence."""
+        return (timestamps - self._config.start_timestamp) * 1e-9
+
+    def ground_truth(self) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Ground truth poses at IMU timestamps.
+
+        Yields:
+            timestamps [N] and SE(3) poses [N, 4, 4].
+        """
+        for timestamps in chunks(self.imu_timestamps):
+            yield timestamps, self._trajectory.poses(self.to_seconds(timestamps))
+
+    def imu(self) -> Iterator[ImuChunk]:
+        """IMU measurements with white noise."""
+        for timestamps in chunks(self.imu_timestamps):
+            t = self.to_seconds(timestamps)
+            shape = (len(t), 3)
+            gyro = self._trajectory.angular_velocities(t)
+            acc = self._trajectory.specific_forces(t)
+            gyro += self._imu_rng.normal(0, gyroscope_noise_std, shape)
+            acc += self._imu_rng.normal(0, accelerometer_noise_std, shape)
+            yield ImuChunk(timestamps, self._trajectory.quaternions(t), gyro, acc)
+
+    def lidar(self) -> Iterator[tuple[int, np.ndarray]]:
+        """Point clouds of the room.
+
+        Yields:
+            timestamp and points [N, 4] (x, y, z, intensity) in the sensor frame.
+        """
+        num = self._config.points_per_scan
+        for timestamp in self.lidar_timestamps:
+            t = self.to_seconds(np.array([timestamp]))
+            rotation = self._trajectory.rotations(t)[0]
+            origin = self._trajectory.positions(t)[0]
+
+            beams = beam_directions(num, self._lidar_rng)
+            ranges = self._room.cast_rays(origin, beams @ rotation.T)
+            ranges += self._lidar_rng.normal(0, lidar_range_noise_std, num)
+
+            points = np.empty((num, 4), dtype=np.float32)
+            points[:, :3] = beams * ranges[:, None]
+            points[:, 3] = 1.0
+            yield int(timestamp), points
+
+    def odometry(self) -> Iterator[OdometryChunk]:
+        """Wheel odometry: noisy body velocities, dead-reckoning poses and cumulative
+        encoder ticks of the left and right wheels."""
+        period = 1 / self._config.odometry_rate
+        position, yaw, distances = np.zeros(3), 0.0, np.zeros(2)
+
+        for timestamps in chunks(self.odometry_timestamps):
+            num = len(timestamps)
+            t = self.to_seconds(timestamps)
+            linear = np.zeros((num, 3))
+            linear[:, 0] = self._config.speed + self._odometry_rng.normal(
+                0, odometry_noise_std, num
+            )
+            angular = self._trajectory.angular_velocities(t)
+            angular[:, 2] += self._odometry_rng.normal(0, odometry_noise_std, num) / wheel_base
+
+            # the 1-st measurement of the sequence has no motion since the start.
+            dt = np.full(num, period)
+            if t[0] == 0:
+                dt[0] = 0.0
+
+            yaws = yaw + np.cumsum(angular[:, 2] * dt)
+            steps = linear[:, 0] * dt
+            previous_yaws = np.concatenate(([yaw], yaws[:-1]))
+            xy = np.cumsum(
+                np.column_stack((steps * np.cos(previous_yaws), steps * np.sin(previous_yaws))),
+                axis=0,
+            )
+
+            poses = np.zeros((num, 4, 4))
+            c, s = np.cos(yaws), np.sin(yaws)
+            poses[:, 0, 0], poses[:, 0, 1], poses[:, 1, 0], poses[:, 1, 1] = c, -s, s, c
+            poses[:, 2, 2] = poses[:, 3, 3] = 1.0
+            poses[:, :2, 3] = position[:2] + xy
+
+            wheels = np.column_stack(
+                (
+                    steps - angular[:, 2] * dt * wheel_base / 2,
+                    steps + angular[:, 2] * dt * wheel_base / 2,
+                )
+            )
+            wheel_distances = distances + np.cumsum(wheels, axis=0)
+            counts = np.round(wheel_distances / (np.pi * wheel_diameter) * encoder_resolution)
+
+            position, yaw, distances = poses[-1, :3, 3], yaws[-1], wheel_distances[-1]
+            yield OdometryChunk(timestamps, poses, linear, angular, counts.astype(np.int64))
+
+    def gps(self) -> Iterator[GpsChunk]:
+        """GPS positions with white noise in the local frame and as geodetic
+        coordinates."""
+        for timestamps in chunks(self.gps_timestamps):
+            t = self.to_seconds(timestamps)
+            positions = self._trajectory.positions(t)
+            positions += self._gps_rng.normal(0, gps_noise_std, positions.shape)
+            yield GpsChunk(timestamps, positions, local_to_geodetic(positions), gps_noise_std)
+
+
+def local_to_geodetic(positions: np.ndarray) -> np.ndarray:
+    """Converts local ENU positions to geodetic coordinates with the equirectangular
+    approximation around the origin.
+
+    Args:
+        positions: positions [N, 3] in the local frame.
+
+    Returns:
+        latitudes [deg], longitudes [deg] and altitudes [m] as [N, 3] array.
+    """
+    latitude_scale = np.rad2deg(1 / earth_radius)
+    longitude_scale = latitude_scale / np.cos(np.deg2rad(origin_latitude))
+    return np.column_stack(
+        (
+            origin_latitude + positions[:, 1] * latitude_scale,
+            origin_longitude + positions[:, 0] * longitude_scale,
+            origin_altitude + positions[:, 2],
+        )
+    )
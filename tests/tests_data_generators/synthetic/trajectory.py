@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+gravity = 9.81  # [m/s^2].
+
+
+@dataclass(frozen=True)
+class CircularTrajectory:
+    """Planar motion with constant speed along a circle which starts at the origin. The
+    x-axis of the body is directed along the velocity, the z-axis is directed up.
+
+    All methods are vectorized over time.
+    """
+
+    radius: float  # [m].
+    speed: float  # [m/s].
+
+    @property
+    def angular_speed(self) -> float:
+        """Yaw rate [rad/s]."""
+        return self.speed / self.radius
+
+    def yaw(self, t: np.ndarray) -> np.ndarray:
+        """Yaw angles [N] at the given moments [s]."""
+        return self.angular_speed * t
+
+    def positions(self, t: np.ndarray) -> np.ndarray:
+        """Positions [N, 3] in the world frame at the given moments [s]."""
+        theta = self.yaw(t)
+        return np.column_stack(
+            (
+                self.radius * np.sin(theta),
+                self.radius * (1 - np.cos(theta)),
+                np.zeros_like(theta),
+            )
+        )
+
+    def velocities(self, t: np.ndarray) -> np.ndarray:
+        """Linear velocities [N, 3] in the world frame at the given moments [s]."""
+        theta = self.yaw(t)
+        return self.speed * np.column_stack((np.cos(theta), np.sin(theta), np.zeros_like(theta)))
+
+    def rotations(self, t: np.ndarray) -> np.ndarray:
+        """Rotation matrices [N, 3, 3] of the body at the given moments [s]."""
+        theta = self.yaw(t)
+        c, s = np.cos(theta), np.sin(theta)
+        rotations = np.zeros((len(theta), 3, 3))
+        rotations[:, 0, 0], rotations[:, 0, 1] = c, -s
+        rotations[:, 1, 0], rotations[:, 1, 1] = s, c
+        rotations[:, 2, 2] = 1.0
+        return rotations
+
+    def quaternions(self, t: np.ndarray) -> np.ndarray:
+        """Orientations [N, 4] of the body as quaternions (qx, qy, qz, qw)."""
+        half = self.yaw(t) / 2
+        zeros = np.zeros_like(half)
+        return np.column_stack((zeros, zeros, np.sin(half), np.cos(half)))
+
+    def poses(self, t: np.ndarray) -> np.ndarray:
+        """SE(3) poses [N, 4, 4] of the body at the given moments [s]."""
+        poses = np.zeros((len(t), 4, 4))
+        poses[:, :3, :3] = self.rotations(t)
+        poses[:, :3, 3] = self.positions(t)
+        poses[:, 3, 3] = 1.0
+        return poses
+
+    def angular_velocities(self, t: np.ndarray) -> np.ndarray:
+        """Angular velocities [N, 3] in the body frame (ideal gyroscope)."""
+        result = np.zeros((len(t), 3))
+        result[:, 2] = self.angular_speed
+        return result
+
+    def specific_forces(self, t: np.ndarray) -> np.ndarray:
+        """Specific forces [N, 3] in the body frame (ideal accelerometer): centripetal
+        acceleration and the reaction to gravity."""
+        result = np.zeros((len(t), 3))
+        result[:, 1] = self.speed * self.angular_speed
+        result[:, 2] = gravity
+        return result
@@ -0,0 +1,120 @@
+"""Tests for the BlockedList class: random operations are compared with a list."""
+
+import random
+
+import pytest
+
+from moduslam.utils.blocked_list import BlockedList
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    """Small blocks to test splitting and merging."""
+    monkeypatch.setattr(BlockedList, "_load", 4)
+
+
+def test_append_and_getitem(small_blocks):
+    items = list(range(100))
+    blocked = BlockedList(items)
+
+    assert len(blocked) == 100
+    assert list(blocked) == items
+    assert list(reversed(blocked)) == items[::-1]
+    for i in range(-100, 100):
+        assert blocked[i] == items[i]
+
+
+def test_getitem_out_of_range(small_blocks):
+    blocked = BlockedList(range(10))
+
+    with pytest.raises(IndexError):
+        _ = blocked[10]
+
+    with pytest.raises(IndexError):
+        _ = blocked[-11]
+
+    with pytest.raises(IndexError):
+        _ = BlockedList()[0]
+
+
+def test_slices(small_blocks):
+    items = list(range(50))
+    blocked = BlockedList(items)
+
+    for s in (slice(3, 40), slice(None), slice(-10, None), slice(45, 10), slice(1, 49, 3)):
+        assert blocked[s] == items[s]
+    assert blocked[::-1] == items[::-1]
+
+
+def test_duplicates_are_ignored(small_blocks):
+    blocked = BlockedList([1, 2, 3])
+
+    blocked.append(2)
+    blocked.insert(0, 3)
+
+    assert list(blocked) == [1, 2, 3]
+
+
+def test_index(small_blocks):
+    items = list(range(0, 200, 2))
+    blocked = BlockedList(items)
+
+    for i, item in enumerate(items):
+        assert blocked.index(item) == i
+
+    with pytest.raises(ValueError):
+        blocked.index(1)
+
+
+def test_remove_missing():
+    with pytest.raises(KeyError):
+        BlockedList([1]).remove(2)
+
+
+def test_pop_empty():
+    with pytest.raises(IndexError):
+        BlockedList().pop()
+
+    with pytest.raises(IndexError):
+        BlockedList().pop(0)
+
+
+def test_random_operations(small_blocks):
+    rng = random.Random(0)
+    reference: list[int] = []
+    blocked = BlockedList[int]()
+
+    for item in range(3000):
+        operation = rng.random()
+        if operation < 0.4:
+            blocked.append(item)
+            reference.append(item)
+        elif operation < 0.7:
+            index = rng.randint(-len(reference) - 2, len(reference) + 2)
+            blocked.insert(index, item)
+            reference.insert(index, item)
+        elif reference and operation < 0.85:
+            removed = rng.choice(reference)
+            blocked.remove(removed)
+            reference.remove(removed)
+        elif reference:
+            index = rng.choice((0, -1, rng.randrange(len(reference))))
+            assert blocked.pop(index) == reference.pop(index)
+
+        assert len(blocked) == len(reference)
+
+    assert list(blocked) == reference
+    assert all(blocked[i] == item for i, item in enumerate(reference))
+    assert all(blocked.index(item) == i for i, item in enumerate(reference))
+    assert all(item in blocked for item in reference)
+
+
+def test_clear(small_blocks):
+    blocked = BlockedList(range(20))
+
+    blocked.clear()
+
+    assert len(blocked) == 0
+    assert 1 not in blocked
+    blocked.append(1)
+    assert list(blocked) == [1]